@@ -9,6 +9,7 @@ Run this after generating the main forecast file:
 
 from openpyxl import load_workbook
 from openpyxl.chart import LineChart, Reference
+from openpyxl.utils import get_column_letter
 import sys
 
 
@@ -53,8 +54,9 @@ def add_btc_chart(ws):
         chart.series[2].graphicalProperties.line.width = 3
         chart.series[2].graphicalProperties.line.dashStyle = "dash"
     
-    # Add chart to sheet
-    ws.add_chart(chart, "H5")
+    # Add chart to sheet, right of the forecast and interval columns
+    anchor_col = get_column_letter(ws.max_column + 2)
+    ws.add_chart(chart, f"{anchor_col}5")
     print("   BTC chart added")
 
 
@@ -89,7 +91,8 @@ def add_gold_charts(ws):
     chart_qty.series[1].graphicalProperties.line.width = 3
     chart_qty.series[1].graphicalProperties.line.dashStyle = "dash"
     
-    ws.add_chart(chart_qty, "I5")
+    anchor_col = get_column_letter(ws.max_column + 2)
+    ws.add_chart(chart_qty, f"{anchor_col}5")
     
     # Chart 2: Value
     chart_val = LineChart()
@@ -113,7 +116,7 @@ def add_gold_charts(ws):
     chart_val.series[1].graphicalProperties.line.width = 3
     chart_val.series[1].graphicalProperties.line.dashStyle = "dash"
     
-    ws.add_chart(chart_val, "I25")
+    ws.add_chart(chart_val, f"{anchor_col}25")
     
     print("   Gold charts added (Quantity & Value)")
 
@@ -149,7 +152,8 @@ def add_oil_charts(ws):
     chart_qty.series[1].graphicalProperties.line.width = 3
     chart_qty.series[1].graphicalProperties.line.dashStyle = "dash"
     
-    ws.add_chart(chart_qty, "I5")
+    anchor_col = get_column_letter(ws.max_column + 2)
+    ws.add_chart(chart_qty, f"{anchor_col}5")
     
     # Chart 2: Value
     chart_val = LineChart()
@@ -173,7 +177,7 @@ def add_oil_charts(ws):
     chart_val.series[1].graphicalProperties.line.width = 3
     chart_val.series[1].graphicalProperties.line.dashStyle = "dash"
     
-    ws.add_chart(chart_val, "I25")
+    ws.add_chart(chart_val, f"{anchor_col}25")
     
     print("   Oil charts added (Quantity & Value)")
 
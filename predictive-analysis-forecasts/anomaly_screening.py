@@ -0,0 +1,232 @@
+"""
+Anomaly and Outlier Screening
+Screens Comtrade rows before they are summed into bloc totals, so a single
+misreported row (e.g. a qty off by 1000x from a unit error) cannot drive
+the monthly aggregates and the 3-MA forecasts.
+
+Robust z-scores are computed per reporter x commodity x flow group:
+- qty, primaryValue and value_per_unit: 0.6745 * (x - median) / MAD on the
+  log scale
+- qty spikes: month-over-month log changes into and out of a month that
+  are both extreme with opposite signs (an isolated spike, not a level
+  shift), scored against the group's MAD of monthly changes
+
+Group keys are factorized once into integer codes, rows are ordered with
+a single argsort, and all medians come from one groupby().transform() over
+every screened column. 10 million rows take about ten seconds, roughly
+the cost of three plain groupby medians.
+
+Policies:
+- flag:    keep every row, add Anomaly_* columns
+- cap:     clip qty and primaryValue of flagged rows to the group's robust
+           bounds (median +/- threshold MADs on the log scale); flagged
+           rows already within the bounds are kept and reported as
+           'flagged' rather than 'capped'
+- exclude: drop flagged rows
+
+Usage:
+    from anomaly_screening import load_screened_trade_data
+
+    gold_df, report = load_screened_trade_data('Gold_TradeData_Cleaned.csv',
+                                               policy='cap')
+"""
+
+import numpy as np
+import pandas as pd
+
+from polars_backend import DEFAULT_BACKEND, read_trade_csv
+from schema_validation import TRADE_SCHEMA, validate_frame
+
+
+ANOMALY_POLICIES = ('flag', 'cap', 'exclude')
+ANOMALY_POLICY = 'cap'
+
+# |robust z| above this is an anomaly. The textbook 3.5 flags the normal
+# 2021-2025 gold price drift within a reporter, so the default is stricter.
+Z_THRESHOLD = 5.0
+
+# Groups with fewer rows are not screened (too little history for a median)
+MIN_GROUP_SIZE = 6
+
+GROUP_KEYS = ['reporterISO', 'cmdCode', 'flowDesc']
+SCREENED_COLUMNS = ['qty', 'primaryValue', 'value_per_unit']
+
+# MAD of a normal distribution is 0.6745 standard deviations
+MAD_SCALE = 0.6745
+
+# Smallest MAD used on the log scale (about 1% variation)
+MAD_FLOOR = 0.01
+
+
+def _log_positive(values):
+    """Natural log of positive finite values, NaN elsewhere."""
+    values = np.asarray(values, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(np.isfinite(values) & (values > 0), np.log(values), np.nan)
+
+
+def _group_order(df, keys):
+    """
+    Integer group codes and a row order that makes groups contiguous.
+
+    Each key (and the month) is factorized once and combined into a single
+    integer sort key, which is much cheaper than a multi-column sort_values.
+
+    Returns:
+        Tuple of (row order, group code per row in that order)
+    """
+    key_codes = [pd.factorize(df[k])[0] for k in keys]
+    combined = np.ravel_multi_index(key_codes, [c.max() + 1 for c in key_codes])
+    date_codes, dates = pd.factorize(df['refDate'], sort=True)
+    order = np.argsort(combined * len(dates) + date_codes)
+    sorted_codes = combined[order]
+    codes = np.cumsum(np.r_[0, sorted_codes[1:] != sorted_codes[:-1]])
+    return order, codes
+
+
+def _robust_z(values, codes, counts):
+    """
+    Robust z-scores of every column of values within integer-coded groups.
+
+    MADs are floored at MAD_FLOOR so near-constant groups with one
+    deviating row still get a finite score.
+
+    Returns:
+        Tuple of (z-scores, group medians, group MADs) as 2D numpy arrays
+    """
+    frame = pd.DataFrame(values)
+    median = frame.groupby(codes).transform('median').to_numpy()
+    deviation = pd.DataFrame(np.abs(values - median))
+    mad = np.maximum(deviation.groupby(codes).transform('median').to_numpy(), MAD_FLOOR)
+
+    z = MAD_SCALE * (values - median) / mad
+    z[counts < MIN_GROUP_SIZE] = np.nan
+    return z, median, mad
+
+
+def screen_trade_data(trade_df, policy=ANOMALY_POLICY, threshold=Z_THRESHOLD,
+                      group_keys=GROUP_KEYS):
+    """
+    Score every row, apply the outlier policy and build the anomaly report.
+
+    Args:
+        trade_df: Comtrade DataFrame (refDate, reporterISO, cmdCode, qty, ...)
+        policy: 'flag', 'cap' or 'exclude'
+        threshold: |robust z| above which a row is an anomaly
+        group_keys: Columns defining a screening group
+
+    Returns:
+        Tuple of (screened DataFrame, anomaly report DataFrame)
+    """
+    if policy not in ANOMALY_POLICIES:
+        raise ValueError(f"Unknown anomaly policy '{policy}' "
+                         f"(use one of {ANOMALY_POLICIES})")
+
+    keys = [k for k in group_keys if k in trade_df.columns]
+    df = trade_df.copy()
+    if 'value_per_unit' not in df.columns:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            df['value_per_unit'] = df['primaryValue'] / df['qty']
+
+    # Statistics are computed with groups contiguous and months ascending,
+    # then scattered back to the original row order
+    order, codes = _group_order(df, keys)
+    counts = np.bincount(codes)[codes]
+    logged = np.column_stack([_log_positive(df[col].to_numpy()[order])
+                              for col in SCREENED_COLUMNS])
+
+    # Log levels plus the month-over-month qty change within each group
+    log_qty = logged[:, 0]
+    same_prev = np.r_[False, codes[1:] == codes[:-1]]
+    change = np.where(same_prev, log_qty - np.r_[np.nan, log_qty[:-1]], np.nan)
+
+    z, median, mad = _robust_z(np.column_stack([logged, change]), codes, counts)
+    sorted_scores = {col: z[:, i] for i, col in enumerate(SCREENED_COLUMNS)}
+
+    # Isolated qty spikes: extreme change into the month and back out of it
+    change_z = z[:, -1]
+    next_z = np.r_[change_z[1:], np.nan]
+    next_z[~np.r_[same_prev[1:], False]] = np.nan
+    with np.errstate(invalid='ignore'):
+        sorted_scores['qty_spike'] = np.where(
+            np.sign(change_z) == -np.sign(next_z),
+            np.sign(change_z) * np.minimum(np.abs(change_z), np.abs(next_z)), 0.0)
+
+    scores = {}
+    for name, score in sorted_scores.items():
+        scores[name] = np.empty_like(score)
+        scores[name][order] = score
+
+    flags = {name: np.nan_to_num(np.abs(score)) > threshold
+             for name, score in scores.items()}
+    is_anomaly = np.logical_or.reduce(list(flags.values()))
+    for name, score in scores.items():
+        df[f'Anomaly_Z_{name}'] = score
+    df['Is_Anomaly'] = is_anomaly
+
+    report = df.loc[is_anomaly, ['refDate'] + keys + SCREENED_COLUMNS +
+                    [f'Anomaly_Z_{name}' for name in scores]].copy()
+    report['Reasons'] = [
+        ', '.join(name for name in scores if flags[name][i])
+        for i in np.flatnonzero(is_anomaly)]
+    report['Severity'] = np.nanmax(np.abs(np.column_stack(
+        [scores[name][is_anomaly] for name in scores])), axis=1)
+    report['Action'] = {'flag': 'flagged', 'cap': 'capped', 'exclude': 'excluded'}[policy]
+
+    if policy == 'cap':
+        # Clip to median +/- threshold MADs (log scale) of the row's group;
+        # only values outside the bounds change, so rows flagged by the
+        # unit-value or spike checks alone stay as reported
+        changed = np.zeros(len(df), dtype=bool)
+        for i, col in enumerate(['qty', 'primaryValue']):
+            half_width = threshold * mad[:, i] / MAD_SCALE
+            low, high = median[:, i] - half_width, median[:, i] + half_width
+            capped, outside = np.empty(len(df)), np.empty(len(df), dtype=bool)
+            capped[order] = np.exp(np.clip(logged[:, i], low, high))
+            with np.errstate(invalid='ignore'):
+                outside[order] = (logged[:, i] < low) | (logged[:, i] > high)
+            replace = is_anomaly & outside
+            df[col] = np.where(replace, capped, df[col])
+            changed |= replace
+        with np.errstate(invalid='ignore', divide='ignore'):
+            df['value_per_unit'] = df['primaryValue'] / df['qty']
+        report['Action'] = np.where(changed[is_anomaly], 'capped', 'flagged')
+    elif policy == 'exclude':
+        df = df[~is_anomaly].reset_index(drop=True)
+
+    report = report.sort_values('Severity', ascending=False).reset_index(drop=True)
+    return df, report
+
+
+def summarize_anomalies(report):
+    """
+    Count anomalies per reason.
+
+    Args:
+        report: Anomaly report from screen_trade_data()
+
+    Returns:
+        Dict mapping reason to number of flagged rows
+    """
+    reasons = report['Reasons'].str.split(', ').explode()
+    return reasons.value_counts().to_dict()
+
+
+def load_screened_trade_data(trade_path, policy=ANOMALY_POLICY, threshold=Z_THRESHOLD,
+                             backend=DEFAULT_BACKEND):
+    """
+    Read a Comtrade CSV, validate it against TRADE_SCHEMA (which also
+    parses refDate) and screen it before any aggregation.
+
+    Args:
+        trade_path: Path to the cleaned Comtrade CSV
+        policy: 'flag', 'cap' or 'exclude'
+        threshold: |robust z| above which a row is an anomaly
+        backend: CSV reader, 'pandas' or 'polars' (see polars_backend.py)
+
+    Returns:
+        Tuple of (screened DataFrame, anomaly report DataFrame)
+    """
+    trade_df, _ = validate_frame(read_trade_csv(trade_path, backend), TRADE_SCHEMA,
+                                 raise_on_error=True)
+    return screen_trade_data(trade_df, policy=policy, threshold=threshold)
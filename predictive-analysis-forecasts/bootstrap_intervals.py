@@ -0,0 +1,253 @@
+"""
+Bootstrap Prediction Intervals
+Residual and moving-block bootstrap prediction intervals for the
+moving-average forecasts, computed for many series at once.
+
+Series are right-aligned into a (series x time) matrix with NaN padding,
+so every series contributes its own one-step-ahead residuals. All
+replicates are simulated together as a (series x replicates) array per
+forecast step. Thousands of series x 1,000 replicates take seconds.
+
+Residuals are multiplicative (log of the value over its trailing mean)
+for series whose observed values are all positive, and paths are rebuilt
+as trailing mean x exp(residual). The spread therefore scales with the
+current level instead of the level of the regime the residuals came
+from, and the bounds of a positive series stay positive. Other series
+use additive residuals; when none of their values is negative the
+simulated paths are truncated at zero.
+
+Series with unreported months (reporter series) can be kept on a monthly
+calendar (calendar=True): the moving average then covers the last
+`window` calendar months and skips the missing ones, instead of
+averaging the last `window` reported months however far apart they are.
+align_monthly() puts several series on one such calendar as a panel; it
+lives here rather than in cross_correlation.py so that the analysis
+modules using it do not import matplotlib.
+
+Usage:
+    from bootstrap_intervals import compute_forecast_intervals
+
+    intervals = compute_forecast_intervals(
+        {'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume']},
+        n_forecast=3)
+    intervals['BTC_Volume']   # Date, Forecast, PI_50_Low, PI_50_High, ...
+"""
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_LEVELS = (50, 80, 95)
+TRANSFORMS = ('level', 'diff', 'log_diff')
+DEFAULT_TRANSFORM = 'log_diff'
+
+
+def monthly_calendar(series):
+    """
+    Reindex a monthly series to every month from its first to its last
+    observation (NaN for months without one).
+
+    Args:
+        series: pandas Series indexed by month-start dates
+
+    Returns:
+        pandas Series indexed by month start
+    """
+    series = series.dropna().sort_index()
+    if series.empty:
+        return series
+    return series.reindex(pd.date_range(series.index.min(), series.index.max(), freq='MS'))
+
+
+def align_monthly(series_by_name, transform=DEFAULT_TRANSFORM):
+    """
+    Align named series on one monthly calendar and transform them.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        transform: 'level', 'diff' or 'log_diff' (non-positive values
+                   become missing)
+
+    Returns:
+        DataFrame indexed by month start (every month from the first to
+        the last observation of any series) with one column per series
+    """
+    if transform not in TRANSFORMS:
+        raise ValueError(f"Unknown transform '{transform}' (use one of {TRANSFORMS})")
+
+    columns = {}
+    for name, series in series_by_name.items():
+        months = pd.DatetimeIndex(series.index).to_period('M').to_timestamp()
+        columns[name] = series.astype(float).groupby(months).sum(min_count=1)
+    panel = pd.DataFrame(columns)
+    calendar = pd.date_range(panel.index.min(), panel.index.max(), freq='MS')
+    panel = panel.reindex(calendar).rename_axis('Date')
+
+    if transform == 'diff':
+        panel = panel.diff()
+    elif transform == 'log_diff':
+        panel = np.log(panel.where(panel > 0)).diff()
+    return panel
+
+
+def _right_align(series_list):
+    """Stack 1D arrays of different length into a NaN-padded matrix."""
+    length = max(len(s) for s in series_list)
+    matrix = np.full((len(series_list), length), np.nan)
+    for i, values in enumerate(series_list):
+        matrix[i, length - len(values):] = values
+    return matrix
+
+
+def _moving_average_residuals(values, window, multiplicative):
+    """
+    One-step-ahead residuals of the MA forecast (series x time), as
+    log(value / trailing mean) for the multiplicative rows.
+    """
+    csum = np.nancumsum(np.nan_to_num(values), axis=1)
+    csum = np.concatenate([np.zeros((len(values), 1)), csum], axis=1)
+    trailing_mean = (csum[:, window:-1] - csum[:, :-window - 1]) / window
+    residuals = np.full(values.shape, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residuals[:, window:] = np.where(multiplicative[:, None],
+                                         np.log(values[:, window:] / trailing_mean),
+                                         values[:, window:] - trailing_mean)
+    # A residual is only valid if its window and target were all observed
+    observed = ~np.isnan(values)
+    ocount = np.concatenate([np.zeros((len(values), 1)),
+                             np.cumsum(observed, axis=1)], axis=1)
+    full_window = (ocount[:, window:-1] - ocount[:, :-window - 1]) == window
+    residuals[:, window:][~(full_window & observed[:, window:])] = np.nan
+    return residuals
+
+
+def bootstrap_intervals(values, n_forecast=3, window=3, n_boot=1000,
+                        levels=DEFAULT_LEVELS, method='residual',
+                        block_length=3, seed=0, calendar=False):
+    """
+    Bootstrap prediction intervals for MA forecasts of many series.
+
+    method='residual' resamples individual residuals (i.i.d.);
+    method='block' resamples consecutive residual blocks of block_length
+    (moving-block bootstrap), which keeps short-range autocorrelation.
+
+    Args:
+        values: 2D numpy array (series x time), right-aligned, NaN-padded
+        n_forecast: Number of steps to forecast
+        window: Moving-average window
+        n_boot: Number of bootstrap replicates
+        levels: Interval coverage levels in percent
+        method: 'residual' or 'block'
+        block_length: Block length for the block bootstrap
+        seed: Random seed
+        calendar: Rows are monthly calendars with NaN for unreported months;
+                  the forecast averages the observed months among the last
+                  `window` months instead of the last `window` observations
+
+    Returns:
+        Dict with 'point' (series x steps) and 'low'/'high' dicts mapping
+        each level to a (series x steps) array
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    n_series = len(values)
+    rng = np.random.default_rng(seed)
+    observed = ~np.isnan(values)
+    multiplicative = ((values > 0) | ~observed).all(axis=1) & observed.any(axis=1)
+    non_negative = ((values >= 0) | ~observed).all(axis=1)
+
+    # Compact each series' valid residuals to the front of its row
+    residuals = _moving_average_residuals(values, window, multiplicative)
+    valid = ~np.isnan(residuals)
+    order = np.argsort(~valid, axis=1, kind='stable')
+    compact = np.take_along_axis(residuals, order, axis=1)
+    n_valid = np.maximum(valid.sum(axis=1), 1)[:, None]
+    compact = np.nan_to_num(compact)
+
+    # Residual draws: (series x replicates x steps) indices into `compact`
+    if method == 'block':
+        n_blocks = -(-n_forecast // block_length)
+        max_start = np.maximum(n_valid - block_length, 0) + 1
+        starts = (rng.random((n_series, n_boot, n_blocks)) * max_start[:, :, None]).astype(int)
+        idx = (starts[..., None] + np.arange(block_length)).reshape(n_series, n_boot, -1)
+        idx = np.minimum(idx[..., :n_forecast], n_valid[:, :, None] - 1)
+    elif method == 'residual':
+        idx = (rng.random((n_series, n_boot, n_forecast)) * n_valid[:, :, None]).astype(int)
+    else:
+        raise ValueError(f"Unknown bootstrap method '{method}' (use 'residual' or 'block')")
+    shocks = compact[np.arange(n_series)[:, None, None], idx]
+
+    # Last observed values of each series seed the recursive MA paths (on a
+    # calendar: the last window months, unreported ones skipped by nanmean)
+    if calendar:
+        last, mean = values[:, -window:], np.nanmean
+    else:
+        packed = np.take_along_axis(
+            values, np.argsort(~np.isnan(values), axis=1, kind='stable'), axis=1)
+        last, mean = packed[:, -window:], np.mean
+    point_value = mean(last, axis=1)
+    paths = np.broadcast_to(last[:, None, :], (n_series, n_boot, window)).copy()
+    simulated = np.empty((n_series, n_boot, n_forecast))
+    for step in range(n_forecast):
+        trailing = mean(paths[:, :, -window:], axis=2)
+        step_values = trailing + shocks[:, :, step]
+        step_values[multiplicative] = trailing[multiplicative] * \
+            np.exp(shocks[multiplicative, :, step])
+        simulated[:, :, step] = np.where(non_negative[:, None],
+                                         np.maximum(step_values, 0.0), step_values)
+        paths = np.concatenate([paths[:, :, 1:], simulated[:, :, step:step + 1]], axis=2)
+
+    result = {
+        'point': np.repeat(point_value[:, None], n_forecast, axis=1),
+        'low': {},
+        'high': {},
+    }
+    for level in levels:
+        tail = (100 - level) / 2
+        low, high = np.percentile(simulated, [tail, 100 - tail], axis=1)
+        result['low'][level], result['high'][level] = low, high
+    return result
+
+
+def compute_forecast_intervals(series_by_name, n_forecast=3, window=3,
+                               n_boot=1000, levels=DEFAULT_LEVELS,
+                               method='residual', block_length=3, seed=0,
+                               calendar=False):
+    """
+    Prediction intervals for named monthly series, computed in one batch.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        n_forecast: Number of months to forecast
+        window: Moving-average window
+        n_boot: Number of bootstrap replicates
+        levels: Interval coverage levels in percent
+        method: 'residual' or 'block'
+        block_length: Block length for the block bootstrap
+        seed: Random seed
+        calendar: Keep unreported months as gaps on a monthly calendar (see
+                  monthly_calendar()) instead of dropping them
+
+    Returns:
+        Dict mapping name to DataFrame with Date, Forecast and
+        PI_<level>_Low / PI_<level>_High columns
+    """
+    names = list(series_by_name)
+    clean = [monthly_calendar(series_by_name[n]) if calendar
+             else series_by_name[n].dropna().sort_index() for n in names]
+    bands = bootstrap_intervals(_right_align([s.to_numpy(dtype=float) for s in clean]),
+                                n_forecast=n_forecast, window=window, n_boot=n_boot,
+                                levels=levels, method=method,
+                                block_length=block_length, seed=seed, calendar=calendar)
+
+    intervals = {}
+    for i, (name, series) in enumerate(zip(names, clean)):
+        frame = pd.DataFrame({
+            'Date': [series.index.max() + pd.DateOffset(months=k)
+                     for k in range(1, n_forecast + 1)],
+            'Forecast': bands['point'][i],
+        })
+        for level in levels:
+            frame[f'PI_{level}_Low'] = bands['low'][level][i]
+            frame[f'PI_{level}_High'] = bands['high'][level][i]
+        intervals[name] = frame
+    return intervals
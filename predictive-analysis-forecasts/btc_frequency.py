@@ -0,0 +1,228 @@
+"""
+BTC Multi-Frequency Resampling and Forecasts
+Keeps the Bitcoinity volume data at daily resolution and resamples it to
+daily, weekly and month-normalized (per-day average) series.
+
+Resampling is done with vectorized bucketing (numpy datetime truncation +
+bincount), so the same code path works for ~1,800 daily rows or for
+tick-level exchange exports with millions of timestamps.
+
+Usage:
+    from btc_frequency import load_btc_daily, forecast_btc_frequencies
+
+    btc_daily = load_btc_daily('Btc_5y_Cleaned.csv')
+    forecasts = forecast_btc_frequencies(btc_daily, currency='USD')
+"""
+
+import numpy as np
+import pandas as pd
+
+from polars_backend import DEFAULT_BACKEND, read_btc_csv
+from schema_validation import detect_btc_schema, validate_frame
+
+
+# Settings per frequency: display label, MA window, forecast horizon and
+# the offset used to step forecast dates forward
+FREQUENCY_SETTINGS = {
+    'D': {'label': 'Daily', 'window': 7, 'horizon': 14,
+          'offset': pd.DateOffset(days=1)},
+    'W': {'label': 'Weekly', 'window': 4, 'horizon': 8,
+          'offset': pd.DateOffset(weeks=1)},
+    'M': {'label': 'Monthly (per-day average)', 'window': 3, 'horizon': 3,
+          'offset': pd.DateOffset(months=1)},
+}
+
+
+def _bucket_codes(times, freq):
+    """
+    Truncate timestamps to the start of their bucket.
+
+    Args:
+        times: numpy datetime64 array
+        freq: 'D' (day), 'W' (Monday-start week) or 'M' (calendar month)
+
+    Returns:
+        numpy datetime64[D] array of bucket start dates
+    """
+    days = times.astype('datetime64[D]')
+    if freq == 'D':
+        return days
+    if freq == 'W':
+        # numpy day 0 (1970-01-01) is a Thursday; day 4 is the first Monday
+        day_num = days.astype(np.int64)
+        return ((day_num - 4) // 7 * 7 + 4).astype('datetime64[D]')
+    if freq == 'M':
+        return days.astype('datetime64[M]').astype('datetime64[D]')
+    raise ValueError(f"Unsupported frequency '{freq}' (use 'D', 'W' or 'M')")
+
+
+def bucket_volume(times, values, freq='D'):
+    """
+    Sum a (rows x currencies) volume matrix into time buckets.
+
+    NaN cells are ignored; a bucket with no valid value for a currency
+    stays NaN instead of becoming 0.
+
+    Args:
+        times: array-like of timestamps (one per row, any order)
+        values: 2D numpy array of volumes (rows x currencies)
+        freq: Bucket frequency ('D', 'W' or 'M')
+
+    Returns:
+        Tuple of (bucket start dates, bucket sums, valid cell counts)
+    """
+    times = np.asarray(times, dtype='datetime64[ns]')
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    labels, inverse = np.unique(_bucket_codes(times, freq), return_inverse=True)
+    n_buckets, n_cols = len(labels), values.shape[1]
+
+    valid = ~np.isnan(values)
+    flat_idx = (inverse[:, None] * n_cols + np.arange(n_cols)).ravel()
+    size = n_buckets * n_cols
+
+    sums = np.bincount(flat_idx, weights=np.where(valid, values, 0.0).ravel(),
+                       minlength=size).reshape(n_buckets, n_cols)
+    counts = np.bincount(flat_idx, weights=valid.ravel(),
+                         minlength=size).reshape(n_buckets, n_cols)
+    sums[counts == 0] = np.nan
+
+    return labels, sums, counts
+
+
+def load_btc_daily(btc_path, backend=DEFAULT_BACKEND):
+    """
+    Load the BTC CSV as a daily wide frame (one column per currency).
+
+    Accepts both the shipped wide layout (Time, AUD, CAD, ..., USD, others)
+    and the long layout documented in DATA_FORMAT.md
+    (time, currency, trading_volume_btc). Intraday or tick-level rows are
+    summed into calendar days. The file is checked against its schema
+    first (SchemaValidationError on bad input).
+
+    Args:
+        btc_path: Path to BTC cleaned CSV
+        backend: CSV reader, 'pandas' or 'polars' (see polars_backend.py)
+
+    Returns:
+        DataFrame with a Date column and one volume column per currency
+    """
+    btc_df = read_btc_csv(btc_path, backend)
+    btc_df, _ = validate_frame(btc_df, detect_btc_schema(btc_df.columns),
+                               raise_on_error=True)
+
+    if 'currency' in btc_df.columns:
+        # Long layout: scatter (row, currency) pairs into a wide matrix
+        times = btc_df['time']
+        cur_codes, currencies = pd.factorize(btc_df['currency'])
+        values = np.full((len(btc_df), len(currencies)), np.nan)
+        values[np.arange(len(btc_df)), cur_codes] = \
+            btc_df['trading_volume_btc'].to_numpy(dtype=float)
+    else:
+        times = btc_df['Time']
+        currencies = btc_df.columns.drop('Time')
+        values = btc_df[currencies].to_numpy(dtype=float)
+
+    times = times.dt.tz_localize(None).to_numpy()
+    labels, sums, _ = bucket_volume(times, values, 'D')
+
+    btc_daily = pd.DataFrame(sums, columns=list(currencies))
+    btc_daily.insert(0, 'Date', pd.to_datetime(labels))
+    return btc_daily
+
+
+def resample_btc_volume(btc_daily, freq='M', per_day=True):
+    """
+    Resample daily BTC volume to daily, weekly or monthly buckets.
+
+    With per_day=True each bucket is divided by the number of days on which
+    the currency was observed, so February and March (or a partial first
+    month, or a currency with reporting gaps) are comparable.
+
+    Args:
+        btc_daily: DataFrame from load_btc_daily()
+        freq: 'D', 'W' or 'M'
+        per_day: Normalize bucket sums to an average per observed day
+
+    Returns:
+        DataFrame with Date, one column per currency and a Days column
+    """
+    currencies = [c for c in btc_daily.columns if c != 'Date']
+    labels, sums, counts = bucket_volume(
+        btc_daily['Date'].to_numpy(),
+        btc_daily[currencies].to_numpy(dtype=float), freq)
+    _, _, days = bucket_volume(btc_daily['Date'].to_numpy(),
+                               np.zeros(len(btc_daily)), freq)
+    days = days[:, 0]
+
+    if per_day:
+        sums = sums / np.maximum(counts, 1)
+
+    resampled = pd.DataFrame(sums, columns=currencies)
+    resampled.insert(0, 'Date', pd.to_datetime(labels))
+    resampled['Days'] = days.astype(int)
+    return resampled
+
+
+def forecast_frequency(df, value_col, freq, n_forecast=None, window=None):
+    """
+    Moving-average forecast for a series sampled at the given frequency.
+
+    Mirrors calculate_3ma_forecast() but steps dates by the frequency
+    offset and uses the frequency's default window and horizon.
+
+    Args:
+        df: DataFrame with Date and value columns
+        value_col: Name of the value column
+        freq: 'D', 'W' or 'M'
+        n_forecast: Number of periods to forecast (default per frequency)
+        window: Moving-average window (default per frequency)
+
+    Returns:
+        DataFrame with MA and Forecast columns added
+    """
+    settings = FREQUENCY_SETTINGS[freq]
+    n_forecast = n_forecast or settings['horizon']
+    window = window or settings['window']
+
+    df = df[['Date', value_col]].copy()
+    df['MA'] = df[value_col].rolling(window=window, min_periods=1).mean()
+
+    last_date = df['Date'].max()
+    forecast_dates = [last_date + settings['offset'] * i
+                      for i in range(1, n_forecast + 1)]
+    forecast_value = df[value_col].dropna().tail(window).mean()
+
+    forecast_df = pd.DataFrame({
+        'Date': forecast_dates,
+        value_col: np.nan,
+        'MA': np.nan,
+        'Forecast': forecast_value,
+    })
+    df['Forecast'] = np.nan
+
+    return pd.concat([df, forecast_df], ignore_index=True)
+
+
+def forecast_btc_frequencies(btc_daily, currency='USD', freqs=('D', 'W', 'M')):
+    """
+    Build MA forecasts for one currency at every requested frequency.
+
+    Daily and weekly series are per-day averages as well, so all three
+    frequencies share the same unit (BTC per day).
+
+    Args:
+        btc_daily: DataFrame from load_btc_daily()
+        currency: Currency column to forecast
+        freqs: Iterable of frequency codes
+
+    Returns:
+        Dict mapping frequency code to forecast DataFrame
+    """
+    forecasts = {}
+    for freq in freqs:
+        series = resample_btc_volume(btc_daily, freq, per_day=True)
+        forecasts[freq] = forecast_frequency(series, currency, freq)
+    return forecasts
@@ -0,0 +1,337 @@
+"""
+Structural Break Detection
+Finds level shifts (sanctions, policy changes, reporting changes) in the
+monthly series, so forecasts can be fitted on the current regime instead
+of averaging across breaks.
+
+Breaks are found with PELT (Pruned Exact Linear Time, Killick et al.
+2012): the exact minimum of the penalized segmentation cost, with
+candidates pruned once they can no longer start the optimal last segment,
+so the work is close to linear in the series length. A start beaten at
+month t is only dropped from month t + min_size on: before that, t cannot
+itself start a segment, so the start it lost to may still be needed.
+Costs:
+
+- mean:    Gaussian mean shift (residual sum of squares)
+- meanvar: Gaussian mean and variance shift (-2 log likelihood with the
+           variance floored at VARIANCE_FLOOR, so splitting a segment
+           never raises its cost, which the pruning relies on)
+
+Series are taken on the log scale by default (zero / missing months are
+skipped) and scaled by a robust noise estimate (MAD of the monthly
+differences), so one penalty (beta * log n) fits every series. The
+recursion runs on all series of a panel at once: segment costs come from
+per-series cumulative sums and each step evaluates the surviving
+candidates of all series in one array operation.
+
+Usage:
+    from change_points import detect_change_points, post_break_series
+
+    breaks = detect_change_points(panel)          # {name: [Timestamp, ...]}
+    fit_series = post_break_series(series_by_name, breaks)
+
+    python change_points.py [output.csv]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from bootstrap_intervals import align_monthly
+
+
+COST_MODELS = ('mean', 'meanvar')
+DEFAULT_COST = 'mean'
+PENALTY_BETA = 5.0
+MIN_SEGMENT = 6
+
+# 'full' fits forecast models on all history, 'post_break' only on the
+# regime after the last break (keeping at least MIN_FIT_MONTHS months)
+REGIME_MODES = ('full', 'post_break')
+DEFAULT_REGIME_MODE = 'post_break'
+MIN_FIT_MONTHS = 18
+
+# Variance floor of the meanvar cost (series are scaled to unit noise)
+VARIANCE_FLOOR = 1e-2
+
+
+def _robust_scale(values):
+    """Noise scale per column from the MAD of first differences."""
+    diffs = np.diff(values, axis=0)
+    median = np.nanmedian(diffs, axis=0)
+    mad = np.nanmedian(np.abs(diffs - median), axis=0)
+    scale = 1.4826 * mad / np.sqrt(2.0)
+    fallback = np.nanstd(values, axis=0)
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, fallback)
+    return np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+
+
+def _segment_costs(sums, starts, end, cost):
+    """
+    Cost of the segments [starts, end) for every series.
+
+    Args:
+        sums: Tuple of cumulative (count, sum, sum of squares), each (series, n + 1)
+        starts: Candidate start indices
+        end: Segment end (exclusive)
+        cost: 'mean' or 'meanvar'
+
+    Returns:
+        Array (series, len(starts))
+    """
+    cn, c1, c2 = sums
+    count = cn[:, end, None] - cn[:, starts]
+    s1 = c1[:, end, None] - c1[:, starts]
+    s2 = c2[:, end, None] - c2[:, starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rss = np.where(count > 0, s2 - s1 ** 2 / count, 0.0)
+        if cost == 'mean':
+            return np.maximum(rss, 0.0)
+        variance = np.maximum(rss / count, VARIANCE_FLOOR)
+        return np.where(count > 0, count * np.log(variance) + rss / variance, 0.0)
+
+
+def pelt(values, cost=DEFAULT_COST, penalty=None, min_size=MIN_SEGMENT):
+    """
+    PELT change points of every column of a (months x series) array.
+
+    Args:
+        values: 2D float array; NaN months are skipped by the cost
+        cost: 'mean' or 'meanvar'
+        penalty: Penalty per break, scalar or one per series
+                 (default PENALTY_BETA * log(observed months))
+        min_size: Minimum segment length in months
+
+    Returns:
+        List (one per series) of sorted break indices (first month of each
+        new segment)
+    """
+    if cost not in COST_MODELS:
+        raise ValueError(f"Unknown cost '{cost}' (use one of {COST_MODELS})")
+    values = np.asarray(values, dtype=float)
+    n_months, n_series = values.shape
+    weights = np.isfinite(values).astype(float)
+    x = np.nan_to_num(values)
+    if penalty is None:
+        penalty = PENALTY_BETA * np.log(np.maximum(weights.sum(axis=0), 2.0))
+    penalty = np.broadcast_to(np.asarray(penalty, dtype=float), (n_series,))
+
+    def cumulative(a):
+        return np.concatenate([np.zeros((n_series, 1)), np.cumsum(a.T, axis=1)], axis=1)
+
+    sums = (cumulative(weights), cumulative(x * weights), cumulative(x ** 2 * weights))
+
+    best = np.full((n_series, n_months + 1), np.inf)
+    best[:, 0] = -penalty
+    last = np.zeros((n_series, n_months + 1), dtype=int)
+    # Month at which each start was first beaten (n_months + 1 = never)
+    pruned_at = np.full((n_series, n_months + 1), n_months + 1)
+    admissible = np.flatnonzero((np.arange(n_months + 1) == 0) |
+                                (np.arange(n_months + 1) >= min_size))
+
+    for end in range(min_size, n_months + 1):
+        starts = admissible[admissible <= end - min_size]
+        # A start beaten at month t only drops out once t can start a segment
+        active = pruned_at[:, starts] > end - min_size
+        starts, active = starts[active.any(axis=0)], active[:, active.any(axis=0)]
+        segment = best[:, starts] + _segment_costs(sums, starts, end, cost)
+        total = np.where(active, segment + penalty[:, None], np.inf)
+        choice = np.argmin(total, axis=1)
+        best[:, end] = total[np.arange(n_series), choice]
+        last[:, end] = starts[choice]
+        beaten = active & (segment > best[:, end, None])
+        pruned_at[:, starts] = np.where(beaten, np.minimum(pruned_at[:, starts], end),
+                                        pruned_at[:, starts])
+
+    breaks = []
+    for i in range(n_series):
+        points, end = [], n_months
+        while end > 0:
+            end = last[i, end]
+            if end > 0:
+                points.append(end)
+        breaks.append(sorted(points))
+    return breaks
+
+
+def detect_change_points(panel, cost=DEFAULT_COST, penalty=None, min_size=MIN_SEGMENT,
+                         log_scale=True):
+    """
+    Structural breaks of every column of a monthly panel.
+
+    Args:
+        panel: DataFrame indexed by month (e.g. align_monthly(..., 'level'))
+        cost: 'mean' or 'meanvar'
+        penalty: Penalty per break (default PENALTY_BETA * log n, on the
+                 robust-scaled series)
+        min_size: Minimum regime length in months
+        log_scale: Detect on log values (non-positive months are skipped)
+
+    Returns:
+        Dict mapping column name to a list of break dates (first month of
+        each new regime)
+    """
+    values = panel.to_numpy(dtype=float)
+    if log_scale:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.where(values > 0, np.log(values), np.nan)
+    values = values / _robust_scale(values)
+    found = pelt(values, cost, penalty, min_size)
+    return {name: [panel.index[i] for i in points]
+            for name, points in zip(panel.columns, found)}
+
+
+def change_point_table(panel, breaks):
+    """
+    One row per break with the regime levels on both sides.
+
+    Args:
+        panel: DataFrame the breaks were detected on
+        breaks: Dict from detect_change_points()
+
+    Returns:
+        DataFrame with Series, Break_Date, Mean_Before, Mean_After,
+        Change_Pct, Months_Before and Months_After
+    """
+    rows = []
+    for name, dates in breaks.items():
+        series = panel[name]
+        edges = [series.index[0]] + list(dates) + [series.index[-1] + pd.offsets.MonthBegin()]
+        for before_start, date, after_end in zip(edges[:-2], edges[1:-1], edges[2:]):
+            before = series[(series.index >= before_start) & (series.index < date)].dropna()
+            after = series[(series.index >= date) & (series.index < after_end)].dropna()
+            rows.append({
+                'Series': name,
+                'Break_Date': date,
+                'Mean_Before': before.mean(),
+                'Mean_After': after.mean(),
+                'Change_Pct': after.mean() / before.mean() - 1 if before.mean() else np.nan,
+                'Months_Before': len(before),
+                'Months_After': len(after),
+            })
+    columns = ['Series', 'Break_Date', 'Mean_Before', 'Mean_After', 'Change_Pct',
+               'Months_Before', 'Months_After']
+    return pd.DataFrame(rows, columns=columns)
+
+
+def fit_start(series, break_dates, min_months=MIN_FIT_MONTHS):
+    """
+    First month of the latest regime that still leaves min_months of data.
+
+    Args:
+        series: pandas Series indexed by Date
+        break_dates: Break dates of the series
+        min_months: Minimum observations to keep
+
+    Returns:
+        Timestamp (the first date of the series when no break qualifies)
+    """
+    series = series.dropna().sort_index()
+    for date in sorted(break_dates, reverse=True):
+        if (series.index >= date).sum() >= min_months:
+            return date
+    return series.index[0]
+
+
+def post_break_series(series_by_name, breaks, min_months=MIN_FIT_MONTHS):
+    """
+    Trim each series to its current regime for model fitting.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        breaks: Dict from detect_change_points() (series without an entry
+                are kept whole)
+        min_months: Minimum observations to keep per series
+
+    Returns:
+        Dict with the same names and trimmed Series
+    """
+    trimmed = {}
+    for name, series in series_by_name.items():
+        start = fit_start(series, breaks.get(name, []), min_months)
+        trimmed[name] = series[series.index >= start]
+    return trimmed
+
+
+def fit_series_for_mode(series_by_name, regime_mode=DEFAULT_REGIME_MODE, **detect_kwargs):
+    """
+    Series to fit forecast models on, with the breaks that were used.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        regime_mode: 'full' or 'post_break'
+        **detect_kwargs: Passed to detect_change_points()
+
+    Returns:
+        Tuple of (dict of series to fit on, breaks dict)
+    """
+    if regime_mode not in REGIME_MODES:
+        raise ValueError(f"Unknown regime mode '{regime_mode}' (use one of {REGIME_MODES})")
+    breaks = detect_change_points(align_monthly(series_by_name, 'level'), **detect_kwargs)
+    if regime_mode == 'full':
+        return dict(series_by_name), breaks
+    return post_break_series(series_by_name, breaks), breaks
+
+
+def describe_change_points(breaks, fit_series=None):
+    """
+    One line per series with breaks, e.g. 'BRICS Gold Qty kg: 2022-03, 2023-09'.
+
+    Args:
+        breaks: Dict from detect_change_points()
+        fit_series: Optional dict from post_break_series() (adds the fit start)
+
+    Returns:
+        List of strings
+    """
+    lines = []
+    for name, dates in breaks.items():
+        if not dates:
+            continue
+        line = f"{name.replace('_', ' ')}: " + ', '.join(f'{d:%Y-%m}' for d in dates)
+        if fit_series is not None and name in fit_series:
+            line += f" (models fitted from {fit_series[name].dropna().index.min():%Y-%m})"
+        lines.append(line)
+    return lines
+
+
+def main():
+    """
+    Detect breaks in the bloc series and every reporter series.
+
+    Usage:
+        python change_points.py [output.csv]
+    """
+    from predictive_analysis_forecast import load_and_process_data
+    from cross_correlation import reporter_series_by_name
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else 'Change_Points.csv'
+    btc_path = 'Btc_5y_Cleaned.csv'
+    gold_path = 'Gold_TradeData_Cleaned.csv'
+    oil_path = 'Oil_TradeData_Cleaned.csv'
+
+    btc_monthly, *bloc_frames, inputs = load_and_process_data(btc_path, gold_path, oil_path,
+                                                              return_inputs=True)
+    series_by_name = {'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume']}
+    for monthly in bloc_frames:
+        for col in monthly.columns:
+            if col.endswith(('_Qty_kg', '_Value_USD')):
+                series_by_name[col] = monthly.set_index('Date')[col]
+    for commodity, trade_df in inputs['trade'].items():
+        series_by_name.update(reporter_series_by_name(trade_df, commodity))
+
+    panel = align_monthly(series_by_name, 'level')
+    breaks = detect_change_points(panel)
+    table = change_point_table(panel, breaks)
+    table.to_csv(output_path, index=False, date_format='%Y-%m')
+
+    n_with_breaks = sum(1 for dates in breaks.values() if dates)
+    print(f"✓ {len(table)} breaks in {n_with_breaks} of {len(breaks)} series -> {output_path}")
+    for line in describe_change_points({name: breaks[name] for name in list(breaks)[:9]}):
+        print(f"   {line}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
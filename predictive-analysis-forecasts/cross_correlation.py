@@ -0,0 +1,403 @@
+"""
+Lead-Lag Cross-Correlation
+Quantifies how the BTC, gold and oil series move together, instead of
+comparing the normalized overlays of Fig7/Fig8 by eye.
+
+All series are aligned on a common monthly calendar (months a series has
+no data are missing, not zero) and transformed (default: month-over-month
+log change, so shared trends do not show up as correlation).
+
+- lagged_cross_correlation(): Pearson correlation of every series pair at
+  every lag up to max_lag, as one (lags x series x series) array
+      corr[k, i, j] = corr(x_i(t), x_j(t + lags[k]))
+  so a peak at a positive lag means series i leads series j. Each value
+  uses only the months both series have (pairwise-complete). The sums it
+  needs are cross-correlations of the zero-filled data and of the
+  missing-value masks, computed for all pairs at once with real FFTs
+  (chunked over rows to bound memory), so hundreds of reporter series
+  need no pairwise Python loops.
+- rolling_correlation(): correlation of every pair over a moving window
+  (at a fixed lag), from cumulative sums over time.
+- peak_lag_table(): lag with the largest absolute correlation per pair.
+
+Artifacts: write_correlation_artifacts() stores the full arrays in a .npz
+file plus the per-pair peak table as CSV; plot_correlation_heatmap()
+draws the lag-0 and peak-lag matrices.
+
+Usage:
+    from bootstrap_intervals import align_monthly
+    from cross_correlation import lagged_cross_correlation
+
+    panel = align_monthly(series_by_name)
+    result = lagged_cross_correlation(panel, max_lag=6)
+
+    python cross_correlation.py [output_dir]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from scipy import fft
+
+from bootstrap_intervals import align_monthly
+from draft_rendering import save_figure, DEFAULT_RENDER_MODE
+
+
+MAX_LAG = 6
+MIN_PERIODS = 12
+ROLLING_WINDOW = 24
+
+# Upper bound on the floats held per FFT chunk (about 256 MB)
+CHUNK_FLOATS = 32_000_000
+
+# Heatmaps with more series drop the tick labels and cell annotations
+MAX_LABELLED_SERIES = 40
+MAX_ANNOTATED_SERIES = 12
+
+ARTIFACT_STEM = 'Cross_Correlation'
+
+
+def _cross_sums(a, b, nfft, n_lags):
+    """
+    sum_t a[t, i] * b[t + lag, j] for every i, j and lag in 0..n_lags-1 and
+    -(n_lags-1)..-1, via real FFTs.
+
+    Returns:
+        Array (2 * n_lags - 1, len(i), len(j)) ordered from lag -(n_lags-1)
+    """
+    fa = fft.rfft(a, nfft, axis=0)
+    fb = fft.rfft(b, nfft, axis=0)
+    full = fft.irfft(np.conj(fa)[:, :, None] * fb[:, None, :], nfft, axis=0)
+    return np.concatenate([full[nfft - n_lags + 1:], full[:n_lags]])
+
+
+def lagged_cross_correlation(panel, max_lag=MAX_LAG, min_periods=MIN_PERIODS):
+    """
+    Lagged Pearson cross-correlation of every pair of columns.
+
+    Args:
+        panel: DataFrame from align_monthly() (months x series)
+        max_lag: Largest lead/lag in months
+        min_periods: Minimum overlapping months; pairs/lags with fewer are NaN
+
+    Returns:
+        Dict with 'names', 'lags' (-max_lag..max_lag), 'corr' and
+        'n_overlap' arrays of shape (lags, series, series)
+    """
+    values = panel.to_numpy(dtype=float)
+    n_months, n_series = values.shape
+    max_lag = min(max_lag, n_months - 1)
+
+    mask = np.isfinite(values).astype(float)
+    # Standardize once so the pairwise sums stay well conditioned
+    z = (values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0)
+    z = np.where(mask > 0, z, 0.0)
+    z = np.nan_to_num(z)
+
+    nfft = fft.next_fast_len(n_months + max_lag)
+    n_lags = max_lag + 1
+    # Six cross spectra of (chunk x series) each, for nfft frequencies
+    chunk = max(1, CHUNK_FLOATS // (6 * nfft * n_series))
+
+    corr = np.empty((2 * max_lag + 1, n_series, n_series))
+    n_overlap = np.empty_like(corr)
+    for start in range(0, n_series, chunk):
+        rows = slice(start, start + chunk)
+        n = np.rint(_cross_sums(mask[:, rows], mask, nfft, n_lags))
+        sx = _cross_sums(z[:, rows], mask, nfft, n_lags)
+        sy = _cross_sums(mask[:, rows], z, nfft, n_lags)
+        sxx = _cross_sums(z[:, rows] ** 2, mask, nfft, n_lags)
+        syy = _cross_sums(mask[:, rows], z ** 2, nfft, n_lags)
+        sxy = _cross_sums(z[:, rows], z, nfft, n_lags)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var_x = n * sxx - sx ** 2
+            var_y = n * syy - sy ** 2
+            r = (n * sxy - sx * sy) / np.sqrt(var_x * var_y)
+        valid = (n >= min_periods) & (var_x > 1e-9 * n ** 2) & (var_y > 1e-9 * n ** 2)
+        corr[:, rows] = np.clip(np.where(valid, r, np.nan), -1.0, 1.0)
+        n_overlap[:, rows] = n
+
+    return {
+        'names': list(panel.columns),
+        'lags': np.arange(-max_lag, max_lag + 1),
+        'corr': corr,
+        'n_overlap': n_overlap.astype(int),
+    }
+
+
+def rolling_correlation(panel, window=ROLLING_WINDOW, lag=0, min_periods=None):
+    """
+    Rolling correlation of every pair of columns.
+
+    Memory grows with months x series^2, so pass the columns of interest
+    for large panels.
+
+    Args:
+        panel: DataFrame from align_monthly()
+        window: Window length in months (ending at each month)
+        lag: corr(x_i(t), x_j(t + lag)) within the window
+        min_periods: Minimum overlapping months in a window (default: window // 2)
+
+    Returns:
+        Dict with 'names', 'dates' and 'corr' of shape (months, series, series)
+    """
+    min_periods = window // 2 if min_periods is None else min_periods
+    values = panel.to_numpy(dtype=float)
+    x = values
+    y = np.roll(values, -lag, axis=0)
+    if lag > 0:
+        y[-lag:] = np.nan
+    elif lag < 0:
+        y[:-lag] = np.nan
+
+    mx, my = np.isfinite(x).astype(float), np.isfinite(y).astype(float)
+    x, y = np.nan_to_num(x), np.nan_to_num(y)
+    # Center with the full-sample means to limit cancellation in the sums
+    x = (x - (x * mx).sum(0) / mx.sum(0).clip(1)) * mx
+    y = (y - (y * my).sum(0) / my.sum(0).clip(1)) * my
+
+    def windowed(a, b):
+        products = np.einsum('ti,tj->tij', a, b)
+        sums = np.cumsum(products, axis=0)
+        sums[window:] = sums[window:] - sums[:-window]
+        return sums
+
+    n = windowed(mx, my)
+    sx, sy = windowed(x, my), windowed(mx, y)
+    sxx, syy = windowed(x ** 2, my), windowed(mx, y ** 2)
+    sxy = windowed(x, y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x = n * sxx - sx ** 2
+        var_y = n * syy - sy ** 2
+        r = (n * sxy - sx * sy) / np.sqrt(var_x * var_y)
+    valid = (np.rint(n) >= min_periods) & (var_x > 0) & (var_y > 0)
+    return {
+        'names': list(panel.columns),
+        'dates': panel.index,
+        'corr': np.clip(np.where(valid, r, np.nan), -1.0, 1.0),
+    }
+
+
+def peak_lag_table(result):
+    """
+    Lag with the largest absolute correlation for every pair.
+
+    Args:
+        result: Dict from lagged_cross_correlation()
+
+    Returns:
+        DataFrame with Series_A, Series_B, Corr_Lag0, Peak_Lag, Peak_Corr
+        and N_Overlap (at the peak lag), one row per pair (A before B in
+        the input order); Peak_Lag > 0 means A leads B
+    """
+    corr, lags = result['corr'], result['lags']
+    i, j = np.triu_indices(len(result['names']), k=1)
+    pairs = corr[:, i, j]
+    valid = np.isfinite(pairs).any(axis=0)
+    peak = np.nanargmax(np.where(np.isfinite(pairs), np.abs(pairs), -1.0), axis=0)
+    cols = np.arange(len(i))
+    names = np.asarray(result['names'], dtype=object)
+    return pd.DataFrame({
+        'Series_A': names[i],
+        'Series_B': names[j],
+        'Corr_Lag0': corr[lags == 0][0, i, j],
+        'Peak_Lag': np.where(valid, lags[peak], 0),
+        'Peak_Corr': np.where(valid, pairs[peak, cols], np.nan),
+        'N_Overlap': result['n_overlap'][peak, i, j],
+    })
+
+
+def peak_matrices(result):
+    """
+    Peak correlation and peak lag as (series x series) DataFrames.
+
+    Args:
+        result: Dict from lagged_cross_correlation()
+
+    Returns:
+        Tuple of (peak correlation DataFrame, peak lag DataFrame)
+    """
+    corr, lags = result['corr'], result['lags']
+    finite = np.isfinite(corr)
+    peak = np.argmax(np.where(finite, np.abs(corr), -1.0), axis=0)
+    values = np.take_along_axis(corr, peak[None], axis=0)[0]
+    lag = np.where(finite.any(axis=0), lags[peak], 0)
+    names = result['names']
+    return (pd.DataFrame(values, index=names, columns=names),
+            pd.DataFrame(lag, index=names, columns=names))
+
+
+def write_correlation_artifacts(result, output_dir='.', stem=ARTIFACT_STEM, rolling=None):
+    """
+    Write the correlation arrays and the per-pair peak table.
+
+    Args:
+        result: Dict from lagged_cross_correlation()
+        output_dir: Output directory
+        stem: File name prefix
+        rolling: Optional dict from rolling_correlation()
+
+    Returns:
+        Dict with the 'arrays' (.npz) and 'pairs' (.csv) paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    arrays = {
+        'names': np.asarray(result['names'], dtype=str),
+        'lags': result['lags'],
+        'corr': result['corr'].astype(np.float32),
+        'n_overlap': result['n_overlap'].astype(np.int32),
+    }
+    if rolling is not None:
+        arrays['rolling_names'] = np.asarray(rolling['names'], dtype=str)
+        arrays['rolling_dates'] = rolling['dates'].to_numpy(dtype='datetime64[D]')
+        arrays['rolling_corr'] = rolling['corr'].astype(np.float32)
+
+    paths = {
+        'arrays': os.path.join(output_dir, f'{stem}.npz'),
+        'pairs': os.path.join(output_dir, f'{stem}_Pairs.csv'),
+    }
+    np.savez_compressed(paths['arrays'], **arrays)
+    peak_lag_table(result).to_csv(paths['pairs'], index=False, float_format='%.4f')
+    return paths
+
+
+def plot_correlation_heatmap(result, output_path, title='Lead-Lag Cross-Correlation',
+                             render_mode=DEFAULT_RENDER_MODE):
+    """
+    Heatmaps of the lag-0 and the peak-lag correlation matrices.
+
+    Args:
+        result: Dict from lagged_cross_correlation()
+        output_path: Publication output path (PDF)
+        title: Figure title
+        render_mode: 'publication' or 'draft'
+
+    Returns:
+        Path the figure was written to
+    """
+    names = result['names']
+    n_series = len(names)
+    lag0 = result['corr'][result['lags'] == 0][0]
+    peak_corr, peak_lag = peak_matrices(result)
+    max_lag = int(result['lags'].max())
+
+    size = min(8.0, 4.0 + 0.25 * n_series)
+    fig, axes = plt.subplots(1, 2, figsize=(2 * size + 2, size))
+    panels = [(lag0, 'Same-Month Correlation'),
+              (peak_corr.to_numpy(), f'Peak Correlation within +/-{max_lag} Months\n'
+                                     '(cell: lag in months, row leads column if > 0)')]
+    labels = [name.replace('_', ' ') for name in names]
+    for ax, (matrix, subtitle) in zip(axes, panels):
+        image = ax.imshow(matrix, cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest',
+                          rasterized=n_series > MAX_LABELLED_SERIES)
+        ax.set_title(subtitle, fontsize=12, fontweight='bold')
+        ax.grid(False)
+        if n_series <= MAX_LABELLED_SERIES:
+            ax.set_xticks(range(n_series))
+            ax.set_yticks(range(n_series))
+            ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
+            ax.set_yticklabels(labels, fontsize=8)
+        else:
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.set_xlabel(f'{n_series} series (input order)')
+        fig.colorbar(image, ax=ax, fraction=0.046, pad=0.04, label='Pearson r')
+
+    if n_series <= MAX_ANNOTATED_SERIES:
+        def text_color(r):
+            return 'white' if abs(r) > 0.6 else 'black'
+
+        for i in range(n_series):
+            for j in range(n_series):
+                if np.isfinite(lag0[i, j]):
+                    axes[0].text(j, i, f'{lag0[i, j]:.2f}', ha='center', va='center',
+                                 fontsize=8, color=text_color(lag0[i, j]))
+                r = peak_corr.iat[i, j]
+                if i != j and np.isfinite(r):
+                    axes[1].text(j, i, f'{r:.2f}\n({peak_lag.iat[i, j]:+d})', ha='center',
+                                 va='center', fontsize=7, color=text_color(r))
+
+    fig.suptitle(title, fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    output_path = save_figure(fig, output_path, render_mode)
+    plt.close(fig)
+    return output_path
+
+
+def reporter_series_by_name(trade_df, commodity, flow='Import'):
+    """
+    Monthly qty and value series per reporter, missing where not reported.
+
+    Args:
+        trade_df: Comtrade DataFrame
+        commodity: Name prefix, e.g. 'Gold'
+        flow: Trade flow to keep
+
+    Returns:
+        Dict mapping '<commodity>_<reporter>_<Qty_kg|Value_USD>' to a Series
+    """
+    rows = trade_df[trade_df['flowDesc'] == flow]
+    months = pd.to_datetime(rows['refDate']).dt.to_period('M').dt.to_timestamp()
+    monthly = rows.groupby([rows['reporterISO'], months.rename('Date')])[
+        ['qty', 'primaryValue']].sum(min_count=1)
+    series_by_name = {}
+    for measure, col in (('Qty_kg', 'qty'), ('Value_USD', 'primaryValue')):
+        wide = monthly[col].unstack('reporterISO')
+        for reporter in wide.columns:
+            series_by_name[f'{commodity}_{reporter}_{measure}'] = wide[reporter].dropna()
+    return series_by_name
+
+
+def main():
+    """
+    Cross-correlations of the headline and all reporter series.
+
+    Usage:
+        python cross_correlation.py [output_dir]
+    """
+    from predictive_analysis_forecast import load_and_process_data
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else 'cross_correlation'
+    btc_path = 'Btc_5y_Cleaned.csv'
+    gold_path = 'Gold_TradeData_Cleaned.csv'
+    oil_path = 'Oil_TradeData_Cleaned.csv'
+
+    btc_monthly, gold_brics_monthly, gold_us_eu_monthly, \
+        oil_brics_monthly, oil_us_eu_monthly, inputs = load_and_process_data(
+            btc_path, gold_path, oil_path, return_inputs=True)
+    headline = {'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume']}
+    for monthly in (gold_brics_monthly, gold_us_eu_monthly,
+                    oil_brics_monthly, oil_us_eu_monthly):
+        for col in monthly.columns:
+            if col.endswith(('_Qty_kg', '_Value_USD')):
+                headline[col] = monthly.set_index('Date')[col]
+
+    series_by_name = dict(headline)
+    for commodity, trade_df in inputs['trade'].items():
+        series_by_name.update(reporter_series_by_name(trade_df, commodity))
+
+    panel = align_monthly(series_by_name)
+    result = lagged_cross_correlation(panel)
+    rolling = rolling_correlation(panel[list(headline)])
+    paths = write_correlation_artifacts(result, output_dir, rolling=rolling)
+    figure = plot_correlation_heatmap(
+        result, os.path.join(output_dir, f'{ARTIFACT_STEM}_All_Series.pdf'),
+        title=f'Lead-Lag Cross-Correlation of {len(result["names"])} Series '
+              '(monthly log changes)')
+
+    pairs = pd.read_csv(paths['pairs'])
+    top = pairs[pairs['Series_A'].isin(headline) & pairs['Series_B'].isin(headline)]
+    print(f"✓ {len(result['names'])} series, {len(pairs):,} pairs -> {paths['arrays']}, "
+          f"{paths['pairs']}, {figure}")
+    with pd.option_context('display.width', 160):
+        print(top.reindex(top['Peak_Corr'].abs().sort_values(ascending=False).index)
+              .head(10).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+BTC Currency Share Engine
+Computes each currency's share of total BTC trading volume (daily and
+monthly) from the wide Bitcoinity columns, and forecasts the shares as a
+compositional series so the forecast shares always sum to 1.
+
+Currency columns that are NaN (e.g. MXN or PLN after the exchange feed
+stopped) count as zero volume for that period; they never distort the
+denominator.
+
+Usage:
+    from btc_frequency import load_btc_daily
+    from currency_shares import compute_currency_shares, forecast_currency_shares
+
+    btc_daily = load_btc_daily('Btc_5y_Cleaned.csv')
+    shares_monthly = compute_currency_shares(btc_daily, freq='M')
+    share_forecast = forecast_currency_shares(shares_monthly)
+"""
+
+import numpy as np
+import pandas as pd
+
+from btc_frequency import resample_btc_volume
+
+
+# Floor used in place of zero shares before taking log-ratios
+ZERO_SHARE_FLOOR = 1e-6
+
+
+def compute_currency_shares(btc_daily, freq='M'):
+    """
+    Compute each currency's share of total BTC volume per period.
+
+    Monthly and weekly shares are volume-weighted (bucket sums divided by
+    the bucket total), not averages of daily shares.
+
+    Args:
+        btc_daily: DataFrame from load_btc_daily()
+        freq: 'D', 'W' or 'M'
+
+    Returns:
+        DataFrame with Date and one share column (0-1) per currency
+    """
+    volumes = resample_btc_volume(btc_daily, freq, per_day=False)
+    currencies = [c for c in volumes.columns if c not in ('Date', 'Days')]
+
+    matrix = np.nan_to_num(volumes[currencies].to_numpy(dtype=float), nan=0.0)
+    totals = matrix.sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = np.where(totals > 0, matrix / totals, np.nan)
+
+    shares_df = pd.DataFrame(shares, columns=currencies)
+    shares_df.insert(0, 'Date', volumes['Date'])
+    return shares_df
+
+
+def _clr(shares):
+    """Centered log-ratio transform of a (periods x parts) share matrix."""
+    logs = np.log(np.maximum(shares, ZERO_SHARE_FLOOR))
+    return logs - logs.mean(axis=1, keepdims=True)
+
+
+def _inverse_clr(clr_values):
+    """Map centered log-ratios back onto the simplex (softmax)."""
+    exp = np.exp(clr_values - clr_values.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def forecast_currency_shares(shares_df, n_forecast=3, window=3):
+    """
+    Forecast currency shares with a moving average in log-ratio space.
+
+    Averaging centered log-ratios (instead of raw shares) keeps every
+    forecast share positive and the shares of each period summing to 1.
+
+    Args:
+        shares_df: DataFrame from compute_currency_shares() (monthly)
+        n_forecast: Number of months to forecast
+        window: Moving-average window
+
+    Returns:
+        DataFrame with Date and one forecast share column per currency
+    """
+    currencies = [c for c in shares_df.columns if c != 'Date']
+    history = shares_df.dropna(subset=currencies, how='all')
+    clr_values = _clr(history[currencies].fillna(0.0).to_numpy())
+
+    forecast_shares = _inverse_clr(clr_values[-window:].mean(axis=0))
+
+    last_date = history['Date'].max()
+    forecast_df = pd.DataFrame(
+        np.tile(forecast_shares, (n_forecast, 1)), columns=currencies)
+    forecast_df.insert(0, 'Date', [last_date + pd.DateOffset(months=i)
+                                   for i in range(1, n_forecast + 1)])
+    return forecast_df
+
+
+def summarize_currency_share(shares_monthly, share_forecast, currency='USD',
+                             lookback=12):
+    """
+    Summarize one currency's share for workbook and figure text.
+
+    Args:
+        shares_monthly: DataFrame from compute_currency_shares(freq='M')
+        share_forecast: DataFrame from forecast_currency_shares()
+        currency: Currency column to summarize
+        lookback: Number of recent months for the range
+
+    Returns:
+        Dict with latest, min, max, mean, forecast shares and the runner-up
+        currency over the lookback window
+    """
+    recent = shares_monthly.dropna(subset=[currency]).tail(lookback)
+    others = recent.drop(columns=['Date', currency]).mean()
+
+    return {
+        'currency': currency,
+        'latest': recent[currency].iloc[-1],
+        'latest_date': recent['Date'].iloc[-1],
+        'min': recent[currency].min(),
+        'max': recent[currency].max(),
+        'mean': recent[currency].mean(),
+        'forecast': share_forecast[currency].iloc[-1],
+        'lookback': lookback,
+        'runner_up': others.idxmax(),
+        'runner_up_share': others.max(),
+    }
+
+
+def describe_currency_share(summary):
+    """
+    One-line description of a currency share summary.
+
+    Args:
+        summary: Dict from summarize_currency_share()
+
+    Returns:
+        String such as 'USD holds 89-93% of BTC trading volume (last 12 months)'
+    """
+    return (f"{summary['currency']} holds {summary['min']:.0%}-{summary['max']:.0%} "
+            f"of BTC trading volume (last {summary['lookback']} months)")
@@ -0,0 +1,624 @@
+"""
+Static Interactive Dashboard
+Builds a server-free HTML dashboard for the forecast charts (Fig1-Fig9
+series plus every reporter x commodity series), with zoom and hover.
+
+Output directory layout:
+
+    index.html               dashboard page (no external scripts)
+    manifest.json.gz         one small entry per series (name, group, unit,
+                             months, latest value, shard path)
+    shards/NNNN/NNNNNN.json.gz
+                             one gzip-compressed columnar JSON shard per
+                             series: months, Actual, MA_3, Forecast and the
+                             PI_<level>_Low / _High bands
+
+The page loads only the manifest up front and fetches a series' shard when
+it is opened (cached afterwards), so page load does not depend on the
+number of series. Shards are written in one pass over series tables that
+are already sorted by series, so the build is linear in the number of
+series. Values are rounded to SIGNIFICANT_DIGITS to keep shards small.
+
+Any static host works (GitHub Pages, S3, python -m http.server); browsers
+block fetch() from file:// pages. Shards are decompressed in the browser
+(DecompressionStream); hosts that already send them with
+Content-Encoding: gzip are handled too.
+
+Usage:
+    python dashboard.py [output_dir]
+"""
+
+import gzip
+import json
+import os
+import sys
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+from bootstrap_intervals import compute_forecast_intervals
+from forecast_exports import build_forecast_table, bloc_partial_flags
+
+
+DASHBOARD_DIR = 'dashboard'
+SHARDS_PER_DIR = 1000
+SIGNIFICANT_DIGITS = 6
+
+# Columns of build_forecast_table() that are not plotted values
+KEY_COLUMNS = ('Series', 'Date', 'Is_Forecast', 'Is_Partial')
+
+UNITS = {'Qty_kg': 'kg', 'Value_USD': 'USD', 'Volume': 'BTC'}
+
+
+def _compact(values):
+    """Float array -> JSON list rounded to SIGNIFICANT_DIGITS, None for NaN."""
+    values = np.asarray(values, dtype=float)
+    rounded = [float(f'{v:.{SIGNIFICANT_DIGITS}g}') for v in np.nan_to_num(values)]
+    return [None if missing else v for v, missing in zip(rounded, np.isnan(values))]
+
+
+def _unit(name):
+    """Unit label from a series name suffix."""
+    return next((unit for suffix, unit in UNITS.items() if name.endswith(suffix)), '')
+
+
+def encode_shard(frame):
+    """
+    Columnar shard payload of one series.
+
+    Args:
+        frame: Rows of one series from build_forecast_table()
+
+    Returns:
+        Dict with 'm' (months since 1970-01), 'partial' (indices of
+        partial months) and one list per plotted column (columns that are
+        all missing are left out)
+    """
+    dates = pd.DatetimeIndex(frame['Date'])
+    payload = {'m': ((dates.year - 1970) * 12 + dates.month - 1).tolist()}
+    if 'Is_Partial' in frame.columns:
+        payload['partial'] = np.flatnonzero(frame['Is_Partial'].to_numpy(dtype=bool)).tolist()
+    for col in frame.columns:
+        if col in KEY_COLUMNS or frame[col].isna().all():
+            continue
+        payload[col] = _compact(frame[col])
+    return payload
+
+
+def _write_gzip_json(path, payload):
+    """Write compact JSON, gzip-compressed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+        json.dump(payload, f, separators=(',', ':'))
+
+
+def write_shards(tables, output_dir=DASHBOARD_DIR):
+    """
+    Write one shard per series and return the manifest entries.
+
+    Args:
+        tables: Dict mapping group name (sidebar section) to a table from
+                build_forecast_table()
+        output_dir: Dashboard directory
+
+    Returns:
+        List of manifest entries (dicts)
+    """
+    manifest = []
+    for group, table in tables.items():
+        for name, frame in table.groupby('Series', sort=False, observed=True):
+            i = len(manifest)
+            path = f'shards/{i // SHARDS_PER_DIR:04d}/{i:06d}.json.gz'
+            _write_gzip_json(os.path.join(output_dir, path), encode_shard(frame))
+            actual = frame['Actual'].dropna()
+            manifest.append({
+                'id': i,
+                'name': str(name),
+                'group': group,
+                'unit': _unit(str(name)),
+                'n': int(len(actual)),
+                'last': _compact(actual.tail(1))[0] if len(actual) else None,
+                'path': path,
+            })
+    return manifest
+
+
+def build_dashboard(tables, output_dir=DASHBOARD_DIR, title='Predictive Analysis Dashboard'):
+    """
+    Write the shards, manifest and index.html.
+
+    Args:
+        tables: Dict mapping group name to a table from build_forecast_table()
+        output_dir: Dashboard directory
+        title: Page title
+
+    Returns:
+        Manifest DataFrame (one row per series)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = write_shards(tables, output_dir)
+    _write_gzip_json(os.path.join(output_dir, 'manifest.json.gz'),
+                     {'title': title, 'series': manifest})
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(Template(HTML_TEMPLATE).substitute(title=title))
+    return pd.DataFrame(manifest)
+
+
+def reporter_forecast_table(series, window=3, n_forecast=3):
+    """
+    Forecast table for every reporter x commodity x measure series.
+
+    Series stay on a monthly calendar: unreported months are gaps, and
+    moving averages and forecasts cover calendar months.
+
+    Args:
+        series: DataFrame from drilldown_workbooks.reporter_series()
+        window: Moving-average window
+        n_forecast: Number of months to forecast
+
+    Returns:
+        Table as from build_forecast_table(), series named
+        '<Commodity>_<Reporter>_<Qty_kg|Value_USD>'
+    """
+    series_by_name = {}
+    for (commodity, reporter), group in series.groupby(['Commodity', 'Reporter'], sort=True):
+        indexed = group.set_index('Date')
+        for measure in ('Qty_kg', 'Value_USD'):
+            series_by_name[f'{commodity}_{reporter}_{measure}'] = indexed[measure]
+    # One batched bootstrap for all reporter series
+    intervals = compute_forecast_intervals(series_by_name, n_forecast=n_forecast,
+                                           window=window, method='block', calendar=True)
+    return build_forecast_table(series_by_name, intervals, window=window, calendar=True)
+
+
+def main():
+    """
+    Build the dashboard from the default input CSVs.
+
+    Usage:
+        python dashboard.py [output_dir]
+    """
+    from predictive_analysis_forecast import load_and_process_data
+    from drilldown_workbooks import reporter_series
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else DASHBOARD_DIR
+    btc_path = 'Btc_5y_Cleaned.csv'
+    gold_path = 'Gold_TradeData_Cleaned.csv'
+    oil_path = 'Oil_TradeData_Cleaned.csv'
+
+    btc_monthly, gold_brics_monthly, gold_us_eu_monthly, \
+        oil_brics_monthly, oil_us_eu_monthly, inputs = load_and_process_data(
+            btc_path, gold_path, oil_path, return_inputs=True)
+
+    forecast_series = {'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume']}
+    partial_flags = {}
+    for prefix, monthly in (('BRICS_Gold', gold_brics_monthly),
+                            ('US_EU_Gold', gold_us_eu_monthly),
+                            ('BRICS_Oil', oil_brics_monthly),
+                            ('US_EU_Oil', oil_us_eu_monthly)):
+        for measure in ('Qty_kg', 'Value_USD'):
+            name = f'{prefix}_{measure}'
+            forecast_series[name] = monthly.set_index('Date')[name]
+            partial_flags[name] = bloc_partial_flags(monthly, prefix)
+    intervals = compute_forecast_intervals(forecast_series, n_forecast=3, method='block')
+
+    frames = inputs['imputed_trade']
+
+    tables = {
+        'Forecasts': build_forecast_table(forecast_series, intervals,
+                                          flags_by_name=partial_flags),
+        'Reporters': reporter_forecast_table(reporter_series(frames)),
+    }
+    manifest = build_dashboard(tables, output_dir)
+    print(f"✓ Dashboard with {len(manifest)} series -> {os.path.join(output_dir, 'index.html')}")
+    print(f"  Serve it with: python -m http.server --directory {output_dir}")
+    return 0
+
+
+HTML_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+<style>
+  body { margin: 0; font: 13px/1.4 -apple-system, 'Segoe UI', Arial, sans-serif; color: #222;
+         display: flex; height: 100vh; }
+  #sidebar { width: 300px; border-right: 1px solid #ddd; display: flex; flex-direction: column; }
+  #sidebar header { background: #366092; color: #fff; padding: 10px; font-weight: bold; }
+  #controls { padding: 8px; display: flex; gap: 6px; flex-direction: column; }
+  #controls input, #controls select { padding: 4px; font: inherit; }
+  #count { color: #777; font-size: 11px; }
+  #list { list-style: none; margin: 0; padding: 0; overflow-y: auto; flex: 1; }
+  #list li { padding: 4px 10px; cursor: pointer; border-bottom: 1px solid #f0f0f0; }
+  #list li:hover { background: #eef3fa; }
+  #list li.selected { background: #d9e4f3; font-weight: bold; }
+  #list li small { color: #888; display: block; font-weight: normal; }
+  #main { flex: 1; display: flex; flex-direction: column; padding: 10px 16px; min-width: 0; }
+  #title { font-size: 16px; font-weight: bold; color: #366092; }
+  #hint { color: #888; font-size: 11px; margin-bottom: 6px; }
+  #chart-wrap { position: relative; flex: 1; min-height: 300px; }
+  #chart { width: 100%; height: 100%; display: block; }
+  #tooltip { position: absolute; pointer-events: none; background: rgba(255,255,255,0.95);
+             border: 1px solid #aaa; padding: 6px 8px; font-size: 12px; display: none;
+             white-space: nowrap; }
+  #legend { margin-top: 6px; font-size: 12px; }
+  #legend span { margin-right: 14px; }
+  #legend i { display: inline-block; width: 14px; height: 3px; vertical-align: middle;
+              margin-right: 4px; }
+</style>
+</head>
+<body>
+<div id="sidebar">
+  <header>$title</header>
+  <div id="controls">
+    <input id="filter" type="search" placeholder="Filter series (e.g. CHN Gold Qty)">
+    <select id="group"></select>
+    <span id="count"></span>
+  </div>
+  <ul id="list"></ul>
+</div>
+<div id="main">
+  <div id="title">Select a series</div>
+  <div id="hint">Click a series to open it, Ctrl/Cmd-click to overlay (normalized 0-100).
+    Drag to zoom, scroll to zoom around the cursor, double-click to reset.</div>
+  <div id="chart-wrap"><canvas id="chart"></canvas><div id="tooltip"></div></div>
+  <div id="legend"></div>
+</div>
+<script>
+'use strict';
+const MAX_LIST = 500;
+const PALETTE = ['#4472C4', '#FFC000', '#000000', '#70AD47', '#7030A0', '#ED7D31', '#A5A5A5'];
+const MARGIN = {left: 80, right: 20, top: 16, bottom: 44};
+const state = {series: [], byId: new Map(), cache: new Map(), shards: new Map(),
+               selected: [], view: null, hover: null, drag: null};
+const fmt = new Intl.NumberFormat('en', {notation: 'compact', maximumSignificantDigits: 4});
+const fmtFull = new Intl.NumberFormat('en', {maximumFractionDigits: 2});
+
+async function loadJson(path) {
+  const response = await fetch(path);
+  if (!response.ok) throw new Error(path + ': HTTP ' + response.status);
+  const buffer = await response.arrayBuffer();
+  const bytes = new Uint8Array(buffer);
+  // Hosts that send Content-Encoding: gzip hand over plain JSON already
+  if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+    const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return JSON.parse(await new Response(stream).text());
+  }
+  return JSON.parse(new TextDecoder().decode(bytes));
+}
+
+function loadShard(id) {
+  // Pending fetches are shared; resolved shards are kept for synchronous drawing
+  if (!state.cache.has(id)) {
+    state.cache.set(id, loadJson(state.byId.get(id).path).then(shard => {
+      state.shards.set(id, shard);
+      return shard;
+    }));
+  }
+  return state.cache.get(id);
+}
+
+function monthLabel(m) {
+  const year = 1970 + Math.floor(m / 12), month = (m % 12) + 1;
+  return year + '-' + String(month).padStart(2, '0');
+}
+
+function renderList() {
+  const terms = document.getElementById('filter').value.toLowerCase().split(/\s+/)
+    .filter(Boolean);
+  const group = document.getElementById('group').value;
+  const matches = state.series.filter(s => (!group || s.group === group)
+    && terms.every(t => s.key.includes(t)));
+  const list = document.getElementById('list');
+  list.innerHTML = '';
+  const fragment = document.createDocumentFragment();
+  for (const s of matches.slice(0, MAX_LIST)) {
+    const li = document.createElement('li');
+    li.dataset.id = s.id;
+    li.className = state.selected.includes(s.id) ? 'selected' : '';
+    li.innerHTML = s.name.replace(/_/g, ' ') + '<small>' + s.group + ' - ' + s.n
+      + ' months' + (s.last !== null ? ', latest ' + fmt.format(s.last) + ' ' + s.unit : '')
+      + '</small>';
+    fragment.appendChild(li);
+  }
+  list.appendChild(fragment);
+  document.getElementById('count').textContent = matches.length > MAX_LIST
+    ? `Showing $${MAX_LIST} of $${matches.length} - refine the filter`
+    : `$${matches.length} series`;
+}
+
+async function select(id, overlay) {
+  if (overlay) {
+    state.selected = state.selected.includes(id)
+      ? state.selected.filter(x => x !== id) : state.selected.concat([id]);
+  } else {
+    state.selected = [id];
+  }
+  state.view = null;
+  history.replaceState(null, '', '#' + state.selected.join(','));
+  renderList();
+  await Promise.all(state.selected.map(loadShard));
+  draw();
+}
+
+function layersFor(shard, normalize) {
+  // Min-max scaling of every column with the Actual range (as in Fig7/Fig8)
+  let scale = v => v;
+  if (normalize) {
+    const actual = (shard.Actual || []).filter(v => v !== null);
+    const lo = Math.min(...actual), hi = Math.max(...actual);
+    scale = v => v === null ? null : (hi > lo ? (v - lo) / (hi - lo) * 100 : 50);
+  }
+  const columns = {};
+  for (const [key, values] of Object.entries(shard)) {
+    if (key === 'm' || key === 'partial') continue;
+    columns[key] = key === 'Reported_Share' ? values : values.map(scale);
+  }
+  return {m: shard.m, columns, partial: shard.partial || []};
+}
+
+function niceTicks(lo, hi, count) {
+  const span = hi - lo || Math.abs(hi) || 1;
+  const raw = span / count, mag = Math.pow(10, Math.floor(Math.log10(raw)));
+  const err = raw / mag;
+  const step = (err >= 7.5 ? 10 : err >= 3.5 ? 5 : err >= 1.5 ? 2 : 1) * mag;
+  const ticks = [];
+  for (let v = Math.ceil(lo / step) * step; v <= hi + step * 1e-9; v += step) ticks.push(v);
+  return ticks;
+}
+
+function currentLayers() {
+  const normalize = state.selected.length > 1;
+  return state.selected.map((id, i) => {
+    const shard = state.shards.get(id);
+    return shard ? Object.assign(layersFor(shard, normalize),
+      {id, color: PALETTE[i % PALETTE.length]}) : null;
+  }).filter(Boolean);
+}
+
+function draw() {
+  const canvas = document.getElementById('chart');
+  const ctx = canvas.getContext('2d');
+  const dpr = window.devicePixelRatio || 1;
+  const width = canvas.clientWidth, height = canvas.clientHeight;
+  canvas.width = width * dpr;
+  canvas.height = height * dpr;
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.clearRect(0, 0, width, height);
+
+  const layers = currentLayers();
+  const legend = document.getElementById('legend');
+  if (!layers.length) { legend.innerHTML = ''; return; }
+  const single = layers.length === 1;
+  const names = layers.map(l => state.byId.get(l.id).name.replace(/_/g, ' '));
+  document.getElementById('title').textContent = single
+    ? names[0] + (state.byId.get(layers[0].id).unit ? ' (' + state.byId.get(layers[0].id).unit + ')' : '')
+    : 'Comparison (normalized 0-100)';
+
+  // Visible month range and value range
+  const allMonths = layers.flatMap(l => l.m);
+  let [x0, x1] = state.view || [Math.min(...allMonths), Math.max(...allMonths)];
+  if (x1 <= x0) x1 = x0 + 1;
+  const bandKeys = single ? Object.keys(layers[0].columns).filter(k => k.startsWith('PI_')) : [];
+  const valueKeys = single ? Object.keys(layers[0].columns).filter(k => k !== 'Reported_Share')
+    : ['Actual', 'Forecast'];
+  let y0 = Infinity, y1 = -Infinity;
+  for (const l of layers) {
+    l.m.forEach((m, i) => {
+      if (m < x0 || m > x1) return;
+      for (const key of valueKeys) {
+        const v = (l.columns[key] || [])[i];
+        if (v !== null && v !== undefined) { y0 = Math.min(y0, v); y1 = Math.max(y1, v); }
+      }
+    });
+  }
+  if (!isFinite(y0)) { y0 = 0; y1 = 1; }
+  const pad = (y1 - y0) * 0.05 || 1;
+  y0 -= pad; y1 += pad;
+
+  const plotW = width - MARGIN.left - MARGIN.right, plotH = height - MARGIN.top - MARGIN.bottom;
+  const sx = m => MARGIN.left + (m - x0) / (x1 - x0) * plotW;
+  const sy = v => MARGIN.top + (1 - (v - y0) / (y1 - y0)) * plotH;
+  state.scale = {x0, x1, plotW, sx, sy};
+
+  // Grid and axes
+  ctx.fillStyle = '#f7f7f9';
+  ctx.fillRect(MARGIN.left, MARGIN.top, plotW, plotH);
+  ctx.strokeStyle = '#ddd'; ctx.fillStyle = '#555'; ctx.lineWidth = 1;
+  ctx.font = '11px sans-serif'; ctx.textAlign = 'right'; ctx.textBaseline = 'middle';
+  for (const v of niceTicks(y0, y1, 6)) {
+    ctx.beginPath(); ctx.moveTo(MARGIN.left, sy(v)); ctx.lineTo(MARGIN.left + plotW, sy(v));
+    ctx.stroke();
+    ctx.fillText(fmt.format(v), MARGIN.left - 6, sy(v));
+  }
+  const stepChoices = [1, 2, 3, 6, 12, 24, 60, 120];
+  const step = stepChoices.find(s => (x1 - x0) / s <= 10) || 240;
+  ctx.textAlign = 'center'; ctx.textBaseline = 'top';
+  for (let m = Math.ceil(x0 / step) * step; m <= x1; m += step) {
+    ctx.beginPath(); ctx.moveTo(sx(m), MARGIN.top); ctx.lineTo(sx(m), MARGIN.top + plotH);
+    ctx.stroke();
+    ctx.fillText(monthLabel(m), sx(m), MARGIN.top + plotH + 6);
+  }
+
+  ctx.save();
+  ctx.beginPath(); ctx.rect(MARGIN.left, MARGIN.top, plotW, plotH); ctx.clip();
+
+  // Prediction bands, widest first
+  const levels = [...new Set(bandKeys.map(k => +k.split('_')[1]))].sort((a, b) => b - a);
+  levels.forEach((level, i) => {
+    const l = layers[0], low = l.columns[`PI_$${level}_Low`], high = l.columns[`PI_$${level}_High`];
+    const idx = l.m.map((_, j) => j).filter(j => low[j] !== null && high[j] !== null);
+    if (!idx.length) return;
+    ctx.fillStyle = `rgba(255, 0, 0, $${0.12 + 0.1 * i})`;
+    ctx.beginPath();
+    idx.forEach((j, k) => k ? ctx.lineTo(sx(l.m[j]), sy(high[j])) : ctx.moveTo(sx(l.m[j]), sy(high[j])));
+    idx.slice().reverse().forEach(j => ctx.lineTo(sx(l.m[j]), sy(low[j])));
+    ctx.closePath(); ctx.fill();
+  });
+
+  function line(l, values, color, width, dash) {
+    if (!values) return;
+    ctx.strokeStyle = color; ctx.lineWidth = width; ctx.setLineDash(dash || []);
+    ctx.beginPath();
+    let drawing = false;
+    l.m.forEach((m, i) => {
+      const v = values[i];
+      if (v === null) { drawing = false; return; }
+      drawing ? ctx.lineTo(sx(m), sy(v)) : ctx.moveTo(sx(m), sy(v));
+      drawing = true;
+    });
+    ctx.stroke(); ctx.setLineDash([]);
+  }
+
+  const legendItems = [];
+  for (const [i, l] of layers.entries()) {
+    // Forecast continues from the last actual month
+    const forecast = l.columns.Forecast ? l.columns.Forecast.slice() : null;
+    const lastActual = (l.columns.Actual || []).map(v => v !== null).lastIndexOf(true);
+    if (forecast && lastActual >= 0) forecast[lastActual] = l.columns.Actual[lastActual];
+    if (single) {
+      line(l, l.columns.Actual, l.color, 2.2);
+      line(l, l.columns.MA_3, '#70AD47', 2, [6, 3]);
+      line(l, forecast, '#FF0000', 2.5, [8, 4]);
+      line(l, l.columns.Tuned_Forecast, '#7030A0', 1.5, [2, 3]);
+      legendItems.push([l.color, 'Actual'], ['#70AD47', '3-month MA'], ['#FF0000', 'Forecast']);
+      if (levels.length) legendItems.push(['rgba(255,0,0,0.3)', levels.join('/') + '% intervals']);
+    } else {
+      line(l, l.columns.Actual, l.color, 2);
+      line(l, forecast, l.color, 2, [8, 4]);
+      legendItems.push([l.color, names[i]]);
+    }
+    ctx.fillStyle = '#fff'; ctx.strokeStyle = '#C65911'; ctx.lineWidth = 1.5;
+    for (const j of l.partial) {
+      const v = l.columns.Actual ? l.columns.Actual[j] : null;
+      if (v === null) continue;
+      ctx.beginPath(); ctx.arc(sx(l.m[j]), sy(v), 4, 0, 2 * Math.PI); ctx.fill(); ctx.stroke();
+    }
+  }
+  if (single && layers[0].partial.length) legendItems.push(['#C65911', 'Partial month (members nowcast)']);
+
+  // Hover guide
+  if (state.hover !== null) {
+    ctx.strokeStyle = '#888'; ctx.lineWidth = 1; ctx.setLineDash([3, 3]);
+    ctx.beginPath(); ctx.moveTo(sx(state.hover), MARGIN.top);
+    ctx.lineTo(sx(state.hover), MARGIN.top + plotH); ctx.stroke(); ctx.setLineDash([]);
+  }
+  // Drag selection
+  if (state.drag && state.drag.current !== undefined) {
+    ctx.fillStyle = 'rgba(54, 96, 146, 0.15)';
+    const a = Math.min(state.drag.start, state.drag.current);
+    ctx.fillRect(a, MARGIN.top, Math.abs(state.drag.current - state.drag.start), plotH);
+  }
+  ctx.restore();
+
+  legend.innerHTML = legendItems.map(([color, label]) =>
+    `<span><i style="background:$${color}"></i>$${label}</span>`).join('');
+}
+
+function monthAt(px) {
+  const {x0, x1, plotW} = state.scale;
+  return x0 + (px - MARGIN.left) / plotW * (x1 - x0);
+}
+
+function showTooltip(event) {
+  const tooltip = document.getElementById('tooltip');
+  const layers = currentLayers();
+  if (!layers.length || !state.scale) return;
+  const rect = event.target.getBoundingClientRect();
+  const px = event.clientX - rect.left;
+  const target = Math.round(monthAt(px));
+  const rows = [];
+  for (const l of layers) {
+    const i = l.m.indexOf(target);
+    if (i < 0) continue;
+    const name = state.byId.get(l.id).name.replace(/_/g, ' ');
+    const values = Object.entries(l.columns).filter(([, v]) => v[i] !== null)
+      .map(([k, v]) => `$${k}: <b>$${fmtFull.format(v[i])}</b>`);
+    if (l.partial.includes(i)) values.push('<i>partial month</i>');
+    rows.push((layers.length > 1 ? `<u>$${name}</u><br>` : '') + values.join('<br>'));
+  }
+  state.hover = rows.length ? target : null;
+  if (!rows.length) { tooltip.style.display = 'none'; draw(); return; }
+  tooltip.innerHTML = `<b>$${monthLabel(target)}</b><br>` + rows.join('<br>');
+  tooltip.style.display = 'block';
+  const left = Math.min(px + 14, rect.width - tooltip.offsetWidth - 4);
+  tooltip.style.left = left + 'px';
+  tooltip.style.top = Math.max(event.clientY - rect.top - 20, 0) + 'px';
+  draw();
+}
+
+function setupChart() {
+  const canvas = document.getElementById('chart');
+  canvas.addEventListener('mousedown', e => {
+    state.drag = {start: e.clientX - canvas.getBoundingClientRect().left};
+  });
+  canvas.addEventListener('mousemove', e => {
+    if (state.drag) state.drag.current = e.clientX - canvas.getBoundingClientRect().left;
+    showTooltip(e);
+  });
+  canvas.addEventListener('mouseup', () => {
+    const drag = state.drag;
+    state.drag = null;
+    if (drag && drag.current !== undefined && Math.abs(drag.current - drag.start) > 5) {
+      const a = monthAt(Math.min(drag.start, drag.current));
+      const b = monthAt(Math.max(drag.start, drag.current));
+      state.view = [Math.floor(a), Math.ceil(b)];
+    }
+    draw();
+  });
+  canvas.addEventListener('mouseleave', () => {
+    state.hover = null; state.drag = null;
+    document.getElementById('tooltip').style.display = 'none';
+    draw();
+  });
+  canvas.addEventListener('dblclick', () => { state.view = null; draw(); });
+  canvas.addEventListener('wheel', e => {
+    if (!state.scale) return;
+    e.preventDefault();
+    const {x0, x1} = state.scale;
+    const center = monthAt(e.clientX - canvas.getBoundingClientRect().left);
+    const factor = e.deltaY > 0 ? 1.25 : 0.8;
+    const a = center - (center - x0) * factor, b = center + (x1 - center) * factor;
+    if (b - a >= 2) state.view = [a, b];
+    draw();
+  }, {passive: false});
+  window.addEventListener('resize', draw);
+}
+
+async function init() {
+  const manifest = await loadJson('manifest.json.gz');
+  state.series = manifest.series.map(s => Object.assign(s, {
+    key: (s.name.replace(/_/g, ' ') + ' ' + s.group).toLowerCase()}));
+  state.series.forEach(s => state.byId.set(s.id, s));
+
+  const groupSelect = document.getElementById('group');
+  groupSelect.innerHTML = '<option value="">All groups</option>' +
+    [...new Set(state.series.map(s => s.group))].map(g => `<option>$${g}</option>`).join('');
+  document.getElementById('filter').addEventListener('input', renderList);
+  groupSelect.addEventListener('change', renderList);
+  document.getElementById('list').addEventListener('click', e => {
+    const li = e.target.closest('li');
+    if (li) select(+li.dataset.id, e.ctrlKey || e.metaKey);
+  });
+
+  setupChart();
+  renderList();
+  const fromHash = location.hash.slice(1).split(',').filter(Boolean).map(Number)
+    .filter(id => state.byId.has(id));
+  const initial = fromHash.length ? fromHash : state.series.length ? [state.series[0].id] : [];
+  for (const [i, id] of initial.entries()) await select(id, i > 0);
+}
+
+init().catch(error => {
+  document.getElementById('title').textContent = 'Could not load the dashboard: ' + error.message;
+});
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Composite USD Dominance Index
+Derives a monthly 0-100 USD dominance index from the loaded data instead of
+hand-written narrative. Every component is oriented so that a higher score
+means a stronger USD position:
+
+- btc_usd_share:     USD share of total BTC trading volume
+- gold_us_eu_ratio:  US/EU share of (BRICS + US/EU) gold import value
+- oil_us_eu_ratio:   US/EU share of (BRICS + US/EU) crude oil import value
+- gold_brics_growth: BRICS gold import growth (YoY, rolling 3 months),
+                     inverted - faster BRICS accumulation lowers the score
+- oil_brics_growth:  BRICS oil import growth (YoY, rolling 3 months), inverted
+
+Components are combined with configurable weights. Months where a
+component is missing use the remaining weights, rescaled to sum to 1;
+months covering less than MIN_WEIGHT_COVERAGE of the total weight (e.g.
+BTC-only months after the last Comtrade release) get no index value.
+
+Usage:
+    from dominance_index import compute_dominance_index, summarize_dominance_index
+
+    index_df = compute_dominance_index(shares_monthly, gold_brics_monthly,
+                                      gold_us_eu_monthly, oil_brics_monthly,
+                                      oil_us_eu_monthly)
+    summary = summarize_dominance_index(index_df)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_WEIGHTS = {
+    'btc_usd_share': 0.30,
+    'gold_us_eu_ratio': 0.20,
+    'oil_us_eu_ratio': 0.20,
+    'gold_brics_growth': 0.15,
+    'oil_brics_growth': 0.15,
+}
+
+MIN_WEIGHT_COVERAGE = 0.75
+
+COMPONENT_LABELS = {
+    'btc_usd_share': 'BTC USD Trading Share',
+    'gold_us_eu_ratio': 'US/EU Share of Gold Imports',
+    'oil_us_eu_ratio': 'US/EU Share of Oil Imports',
+    'gold_brics_growth': 'BRICS Gold Import Growth (inverted)',
+    'oil_brics_growth': 'BRICS Oil Import Growth (inverted)',
+}
+
+
+def _rolling_yoy_growth(values, window=3, lag=12):
+    """YoY growth of a rolling window sum (numpy array in, numpy array out)."""
+    rolled = pd.Series(values).rolling(window, min_periods=window).sum()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (rolled / rolled.shift(lag) - 1).to_numpy()
+
+
+def growth_score(growth):
+    """Map a growth rate onto 0-100 (0% growth = 50, rising growth -> 0)."""
+    return 50 - 50 * np.tanh(growth)
+
+
+def compute_dominance_index(shares_monthly, gold_brics_monthly, gold_us_eu_monthly,
+                            oil_brics_monthly, oil_us_eu_monthly, weights=None,
+                            min_coverage=MIN_WEIGHT_COVERAGE):
+    """
+    Compute the composite USD dominance index for every month of history.
+
+    Args:
+        shares_monthly: DataFrame from compute_currency_shares(freq='M')
+        gold_brics_monthly: DataFrame with BRICS gold monthly data
+        gold_us_eu_monthly: DataFrame with US/EU gold monthly data
+        oil_brics_monthly: DataFrame with BRICS oil monthly data
+        oil_us_eu_monthly: DataFrame with US/EU oil monthly data
+        weights: Dict of component weights (default DEFAULT_WEIGHTS)
+        min_coverage: Minimum share of total weight a month must cover
+
+    Returns:
+        DataFrame with Date, raw inputs, one 0-100 score per component and
+        the weighted Dominance_Index
+    """
+    weights = weights or DEFAULT_WEIGHTS
+
+    # Common monthly calendar across all sources
+    df = shares_monthly[['Date', 'USD']].rename(columns={'USD': 'USD_BTC_Share'})
+    for frame in [gold_brics_monthly, gold_us_eu_monthly,
+                  oil_brics_monthly, oil_us_eu_monthly]:
+        df = df.merge(frame, on='Date', how='outer')
+    df = df.sort_values('Date').reset_index(drop=True)
+
+    gold_brics = df['BRICS_Gold_Value_USD'].to_numpy(dtype=float)
+    gold_us_eu = df['US_EU_Gold_Value_USD'].to_numpy(dtype=float)
+    oil_brics = df['BRICS_Oil_Value_USD'].to_numpy(dtype=float)
+    oil_us_eu = df['US_EU_Oil_Value_USD'].to_numpy(dtype=float)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        df['Gold_US_EU_Ratio'] = gold_us_eu / (gold_us_eu + gold_brics)
+        df['Oil_US_EU_Ratio'] = oil_us_eu / (oil_us_eu + oil_brics)
+    df['BRICS_Gold_Growth'] = _rolling_yoy_growth(df['BRICS_Gold_Qty_kg'].to_numpy())
+    df['BRICS_Oil_Growth'] = _rolling_yoy_growth(df['BRICS_Oil_Qty_kg'].to_numpy())
+
+    scores = pd.DataFrame({
+        'btc_usd_share': df['USD_BTC_Share'] * 100,
+        'gold_us_eu_ratio': df['Gold_US_EU_Ratio'] * 100,
+        'oil_us_eu_ratio': df['Oil_US_EU_Ratio'] * 100,
+        'gold_brics_growth': growth_score(df['BRICS_Gold_Growth']),
+        'oil_brics_growth': growth_score(df['BRICS_Oil_Growth']),
+    })[list(weights)]
+
+    # Weighted average over the components available in each month
+    score_values = scores.to_numpy(dtype=float)
+    weight_vector = np.array(list(weights.values()), dtype=float)
+    weight_matrix = np.where(np.isnan(score_values), 0.0, weight_vector)
+    weight_totals = weight_matrix.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        index_values = (np.nan_to_num(score_values) * weight_matrix).sum(axis=1) \
+            / weight_totals
+    index_values[weight_totals < min_coverage * weight_vector.sum()] = np.nan
+
+    for component in weights:
+        df[f'Score_{component}'] = scores[component]
+    df['Dominance_Index'] = index_values
+    return df
+
+
+def summarize_dominance_index(index_df, window=3, lag=12):
+    """
+    Summarize the index and its inputs for the summary sheet and KPI table.
+
+    Args:
+        index_df: DataFrame from compute_dominance_index()
+        window: Moving-average window used for the forecast
+        lag: Lag (months) used for year-over-year changes
+
+    Returns:
+        Dict of latest values, changes and 3-MA forecasts
+    """
+    index_series = index_df.dropna(subset=['Dominance_Index'])
+    latest = index_series.iloc[-1]
+    year_ago = index_series[index_series['Date'] <= latest['Date'] - pd.DateOffset(months=lag)]
+
+    def recent_change(col):
+        # Last `window` months vs the `window` months before them
+        values = index_df[col].dropna()
+        recent, prior = values.tail(window).mean(), values.iloc[-2 * window:-window].mean()
+        return recent / prior - 1 if prior else np.nan
+
+    def latest_of(col):
+        values = index_df[['Date', col]].dropna()
+        return values[col].iloc[-1], values['Date'].iloc[-1]
+
+    # Component scores in the latest month with an index value
+    score_cols = [c for c in index_df.columns if c.startswith('Score_')]
+    contributions = {c.replace('Score_', ''): latest[c] for c in score_cols
+                     if pd.notna(latest[c])}
+
+    summary = {
+        'index_latest': latest['Dominance_Index'],
+        'index_date': latest['Date'],
+        'index_year_ago': (year_ago['Dominance_Index'].iloc[-1]
+                           if len(year_ago) else np.nan),
+        'index_forecast': index_series['Dominance_Index'].tail(window).mean(),
+        'weakest_component': min(contributions, key=contributions.get),
+        'strongest_component': max(contributions, key=contributions.get),
+        'component_scores': contributions,
+    }
+    summary['index_change'] = summary['index_latest'] - summary['index_year_ago']
+
+    for prefix, qty_col, ratio_col, growth_col in [
+            ('gold', 'BRICS_Gold_Qty_kg', 'Gold_US_EU_Ratio', 'BRICS_Gold_Growth'),
+            ('oil', 'BRICS_Oil_Qty_kg', 'Oil_US_EU_Ratio', 'BRICS_Oil_Growth')]:
+        summary[f'{prefix}_brics_yoy'], summary[f'{prefix}_yoy_date'] = latest_of(growth_col)
+        summary[f'{prefix}_brics_forecast_change'] = recent_change(qty_col)
+        summary[f'{prefix}_us_eu_ratio'], _ = latest_of(ratio_col)
+
+    return summary
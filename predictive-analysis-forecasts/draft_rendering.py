@@ -0,0 +1,171 @@
+"""
+Figure Render Modes
+Publication and draft settings for generate_prediction_figures.py.
+
+- publication: 300 DPI vector PDFs with tight bounding boxes (the default)
+- draft:       low-DPI PNG thumbnails in figures/draft/ with the fixed
+               figure layout (no tight-bbox pass), for quick reviews
+
+Dense series (daily or per-country lines) are handled by plot_line():
+- draft mode downsamples them to RENDER_SETTINGS['draft']['max_points'] with
+  Largest-Triangle-Three-Buckets (LTTB), which keeps peaks and troughs
+  that plain decimation drops
+- lines with more than RASTER_THRESHOLD points are rasterized, so PDFs
+  keep every data point but stay small (axes, labels and text remain
+  vector)
+
+Usage:
+    from draft_rendering import plot_line, save_figure
+
+    plot_line(ax, dates, values, render_mode, color='#4472C4')
+    output_path = save_figure(fig, output_path, render_mode)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+RENDER_MODES = ('publication', 'draft')
+DEFAULT_RENDER_MODE = 'publication'
+
+RENDER_SETTINGS = {
+    'publication': {'format': 'pdf', 'dpi': 300, 'bbox_inches': 'tight', 'max_points': None},
+    'draft': {'format': 'png', 'dpi': 60, 'bbox_inches': None, 'max_points': 500},
+}
+
+DRAFT_SUBDIR = 'draft'
+
+# Lines with more points are rasterized inside vector output
+RASTER_THRESHOLD = 1000
+
+
+def check_render_mode(render_mode):
+    """Raise ValueError for unknown render modes."""
+    if render_mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{render_mode}' (use one of {RENDER_MODES})")
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and
+    the mean of the next bucket.
+
+    Args:
+        x: 1D array of increasing x values (floats)
+        y: 1D array of y values (finite)
+        n_out: Number of points to keep
+
+    Returns:
+        numpy array of the indices of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries for the n_out - 2 middle buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(x, y, max_points):
+    """
+    LTTB-downsample a series for plotting, dropping missing values first.
+
+    Args:
+        x: Dates or numbers
+        y: Values
+        max_points: Points to keep (None = keep all)
+
+    Returns:
+        Tuple of (x, y) numpy arrays
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    if max_points is None or len(x) <= max_points:
+        return x, y
+    finite = np.isfinite(y)
+    x, y = x[finite], y[finite]
+    positions = pd.DatetimeIndex(x).asi8.astype(float) \
+        if np.issubdtype(x.dtype, np.datetime64) else x.astype(float)
+    keep = lttb(positions, y, max_points)
+    return x[keep], y[keep]
+
+
+def plot_line(ax, x, y, render_mode=DEFAULT_RENDER_MODE, **kwargs):
+    """
+    ax.plot() for possibly dense series.
+
+    Args:
+        ax: Matplotlib axes
+        x: Dates or numbers
+        y: Values
+        render_mode: 'publication' or 'draft' (draft downsamples)
+        **kwargs: Passed to ax.plot()
+
+    Returns:
+        List of Line2D objects
+    """
+    check_render_mode(render_mode)
+    x, y = downsample(x, y, RENDER_SETTINGS[render_mode]['max_points'])
+    if len(x) > RASTER_THRESHOLD:
+        kwargs['rasterized'] = True
+        # Markers on thousands of points only hide the line
+        kwargs.pop('marker', None)
+        kwargs.pop('markersize', None)
+    return ax.plot(x, y, **kwargs)
+
+
+def figure_path(output_path, render_mode=DEFAULT_RENDER_MODE):
+    """
+    Output path of a figure in the given mode (draft: figures/draft/<name>.png).
+
+    Args:
+        output_path: Publication output path (PDF)
+        render_mode: 'publication' or 'draft'
+
+    Returns:
+        Path string
+    """
+    check_render_mode(render_mode)
+    settings = RENDER_SETTINGS[render_mode]
+    if settings['format'] == 'pdf':
+        return output_path
+    output_dir = os.path.join(os.path.dirname(output_path), DRAFT_SUBDIR)
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(output_path))[0]
+    return os.path.join(output_dir, f"{stem}.{settings['format']}")
+
+
+def save_figure(fig, output_path, render_mode=DEFAULT_RENDER_MODE):
+    """
+    Save a figure with the settings of the render mode.
+
+    Args:
+        fig: Matplotlib figure
+        output_path: Publication output path (PDF)
+        render_mode: 'publication' or 'draft'
+
+    Returns:
+        Path the figure was written to
+    """
+    settings = RENDER_SETTINGS[render_mode]
+    output_path = figure_path(output_path, render_mode)
+    fig.savefig(output_path, format=settings['format'], dpi=settings['dpi'],
+                bbox_inches=settings['bbox_inches'])
+    return output_path
@@ -0,0 +1,420 @@
+"""
+Per-Country Drill-Down Workbooks
+One forecast sheet per reporter x commodity with the full monthly history
+(the main workbook only has the bloc aggregates and their last 24 months).
+
+Each sheet follows the layout of the Gold_BRICS_Forecast sheet: actual
+quantity and value, 3-month moving-average formulas and three forecast
+months. Every series covers a full monthly calendar from its first to
+its last reported month; months the reporter did not report are blank
+rows, so each moving average spans three calendar months (AVERAGE skips
+the blanks) instead of the last three reported months. Months filled by
+reporter_imputation are labelled in the Forecast Type column.
+
+Sheets are written in streaming (write-only) mode, so memory does not grow
+with the number of sheets, and are split:
+- across sheets when a series would pass the Excel row limit
+- across files when a file reaches MAX_ROWS_PER_FILE data rows or
+  MAX_SHEETS_PER_FILE sheets, e.g. Drilldown_BRICS_1.xlsx, _2.xlsx, ...
+
+Files are grouped by bloc, commodity or reporter and written in parallel
+worker processes. Drilldown_Index.xlsx lists every sheet with its latest
+values and a hyperlink to it; every sheet links back to the index.
+
+Usage:
+    python drilldown_workbooks.py [output_dir] [n_workers]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+from anomaly_screening import load_screened_trade_data, ANOMALY_POLICY
+from reconciliation import BLOCS, OTHER_BLOC
+from reporter_imputation import impute_missing_reporters, append_imputed_rows
+
+
+MAX_EXCEL_ROWS = 1_048_576
+
+# Size thresholds that start a new file
+MAX_ROWS_PER_FILE = 250_000
+MAX_SHEETS_PER_FILE = 250
+
+GROUP_BY = ('bloc', 'commodity', 'reporter')
+FILE_PREFIX = 'Drilldown'
+INDEX_FILE = 'Drilldown_Index.xlsx'
+
+N_FORECAST = 3
+MA_WINDOW = 3
+HEADER_ROW = 5
+
+HEADERS = ['Date', 'Year-Month', 'Actual Quantity (kg)', 'Actual Value (USD)',
+           '3-MA Qty', '3-MA Value', 'Forecast Type']
+COLUMN_WIDTHS = [15, 12, 20, 20, 15, 15, 18]
+
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+LINK_FONT = Font(color='0563C1', underline='single')
+
+
+def reporter_series(frames, flow='Import', blocs=BLOCS):
+    """
+    Monthly quantity and value per commodity x reporter, full history.
+
+    Args:
+        frames: Dict mapping commodity name to a Comtrade DataFrame with a
+                parsed refDate (rows flagged Is_Imputed are kept and marked)
+        flow: Trade flow to keep
+        blocs: Dict mapping bloc name to reporter ISO codes
+
+    Returns:
+        DataFrame with Commodity, Bloc, Reporter, Country, Date, Qty_kg,
+        Value_USD, Is_Imputed and Is_Reported, one row per calendar month
+        from each series' first to last reported month (Qty_kg / Value_USD
+        missing where Is_Reported is False), sorted by Commodity, Bloc,
+        Reporter, Date
+    """
+    rows = pd.concat([df.loc[df['flowDesc'] == flow].assign(Commodity=name)
+                      for name, df in frames.items()], ignore_index=True)
+    if 'Is_Imputed' not in rows.columns:
+        rows['Is_Imputed'] = False
+    rows['Is_Imputed'] = rows['Is_Imputed'].fillna(False).astype(bool)
+    rows['Date'] = rows['refDate'].dt.to_period('M').dt.to_timestamp()
+
+    series = rows.groupby(['Commodity', 'reporterISO', 'Date']).agg(
+        Qty_kg=('qty', 'sum'), Value_USD=('primaryValue', 'sum'),
+        Is_Imputed=('Is_Imputed', 'all')).reset_index()
+    series = series.rename(columns={'reporterISO': 'Reporter'})
+
+    # Unreported months become empty rows, so every series is a calendar
+    calendar = pd.concat([
+        pd.DataFrame({'Commodity': commodity, 'Reporter': reporter,
+                      'Date': pd.date_range(dates.min(), dates.max(), freq='MS')})
+        for (commodity, reporter), dates in series.groupby(['Commodity', 'Reporter'])['Date']],
+        ignore_index=True)
+    series = calendar.merge(series, on=['Commodity', 'Reporter', 'Date'], how='left',
+                            indicator=True)
+    series['Is_Reported'] = series.pop('_merge').eq('both')
+    series['Is_Imputed'] = series['Is_Imputed'].fillna(False).astype(bool)
+
+    # Imputed rows carry no reporterDesc; take the reported name
+    names = rows.dropna(subset=['reporterDesc']).drop_duplicates('reporterISO') \
+        .set_index('reporterISO')['reporterDesc'] if 'reporterDesc' in rows.columns \
+        else pd.Series(dtype=object)
+    series['Country'] = series['Reporter'].map(names).fillna(series['Reporter'])
+
+    bloc_of = {code: bloc for bloc, codes in blocs.items() for code in codes}
+    series['Bloc'] = series['Reporter'].map(bloc_of).fillna(OTHER_BLOC)
+    columns = ['Commodity', 'Bloc', 'Reporter', 'Country', 'Date',
+               'Qty_kg', 'Value_USD', 'Is_Imputed', 'Is_Reported']
+    return series[columns].sort_values(['Commodity', 'Bloc', 'Reporter', 'Date']) \
+        .reset_index(drop=True)
+
+
+def sheet_name(reporter, commodity, part=1):
+    """Excel-safe sheet name, e.g. 'CHN_Gold' or 'CHN_Gold_2'."""
+    name = f'{reporter}_{commodity}' + (f'_{part}' if part > 1 else '')
+    return ''.join('_' if c in '[]:*?/\\' else c for c in name)[:31]
+
+
+def plan_sheets(series, max_rows=MAX_EXCEL_ROWS - HEADER_ROW - N_FORECAST):
+    """
+    Split every commodity x reporter series into sheets below the row limit.
+
+    Args:
+        series: DataFrame from reporter_series()
+        max_rows: Data rows per sheet
+
+    Returns:
+        List of sheet specs (dicts with Commodity, Bloc, Reporter, Country,
+        Sheet, Part, Is_Last and the rows to write)
+    """
+    sheets = []
+    for (commodity, bloc, reporter), group in series.groupby(
+            ['Commodity', 'Bloc', 'Reporter'], sort=False):
+        n_parts = max(int(np.ceil(len(group) / max_rows)), 1)
+        for part in range(1, n_parts + 1):
+            sheets.append({
+                'Commodity': commodity, 'Bloc': bloc, 'Reporter': reporter,
+                'Country': group['Country'].iloc[0],
+                'Sheet': sheet_name(reporter, commodity, part),
+                'Part': part, 'Is_Last': part == n_parts,
+                'rows': group.iloc[(part - 1) * max_rows:part * max_rows]
+                .drop(columns=['Commodity', 'Bloc', 'Reporter', 'Country']),
+            })
+    return sheets
+
+
+def plan_files(sheets, group_by='bloc', max_rows_per_file=MAX_ROWS_PER_FILE,
+               max_sheets_per_file=MAX_SHEETS_PER_FILE):
+    """
+    Assign sheets to output files, starting a new file at the size thresholds.
+
+    Args:
+        sheets: Sheet specs from plan_sheets()
+        group_by: 'bloc', 'commodity' or 'reporter' (one file series each)
+        max_rows_per_file: Data rows that start a new file
+        max_sheets_per_file: Sheets that start a new file
+
+    Returns:
+        Dict mapping file name to its list of sheet specs
+    """
+    if group_by not in GROUP_BY:
+        raise ValueError(f"Unknown group_by '{group_by}' (use one of {GROUP_BY})")
+    key = group_by.capitalize()
+
+    files, counters, current, used_rows = {}, {}, {}, {}
+    for sheet in sheets:
+        group = sheet[key]
+        n_rows = len(sheet['rows'])
+        name = current.get(group)
+        if name is not None and (used_rows[name] + n_rows > max_rows_per_file
+                                 or len(files[name]) >= max_sheets_per_file):
+            name = None
+        if name is None:
+            counters[group] = counters.get(group, 0) + 1
+            name = f'{FILE_PREFIX}_{group}_{counters[group]}.xlsx'
+            files[name], used_rows[name] = [], 0
+            current[group] = name
+        files[name].append(sheet)
+        used_rows[name] += n_rows
+    return files
+
+
+def _styled(ws, value, font=None, number_format=None):
+    """Write-only cell with optional font and number format."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _write_sheet(wb, sheet, index_file):
+    """Stream one drill-down sheet into a write-only workbook."""
+    ws = wb.create_sheet(sheet['Sheet'])
+    for col_num, width in enumerate(COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    ws.freeze_panes = f'A{HEADER_ROW + 1}'
+
+    title = f"{sheet['Country']} ({sheet['Reporter']}) - {sheet['Commodity']} Imports"
+    if sheet['Part'] > 1:
+        title += f" (part {sheet['Part']})"
+    ws.append([_styled(ws, title, Font(bold=True, size=14, color='366092'))])
+    ws.append([_styled(ws, f"Bloc: {sheet['Bloc']} - full monthly history with "
+                           f"{MA_WINDOW}-month moving average forecast",
+                       Font(italic=True, color='808080'))])
+    link = _styled(ws, '<< Back to index', LINK_FONT)
+    link.hyperlink = f"{index_file}#'Index'!A1"
+    ws.append([link])
+    ws.append([])
+
+    header = []
+    for value in HEADERS:
+        cell = _styled(ws, value, HEADER_FONT)
+        cell.fill = HEADER_FILL
+        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        header.append(cell)
+    ws.append(header)
+
+    rows = sheet['rows']
+    row_num = HEADER_ROW + 1
+    imputed_font = Font(italic=True, color='C65911')
+    missing_font = Font(italic=True, color='808080')
+    # A window with no reported month would average nothing (#DIV/0!)
+    in_window = rows['Is_Reported'].rolling(MA_WINDOW, min_periods=1).sum().to_numpy()
+    for i, (date, qty, value, is_imputed, is_reported) in enumerate(zip(
+            rows['Date'], rows['Qty_kg'], rows['Value_USD'], rows['Is_Imputed'],
+            rows['Is_Reported'])):
+        ma_qty = ma_value = None
+        if row_num >= HEADER_ROW + MA_WINDOW and in_window[i] > 0:
+            ma_qty = f'=AVERAGE(C{row_num - MA_WINDOW + 1}:C{row_num})'
+            ma_value = f'=AVERAGE(D{row_num - MA_WINDOW + 1}:D{row_num})'
+        if not is_reported:
+            forecast_type = _styled(ws, 'Not reported', missing_font)
+        elif is_imputed:
+            forecast_type = _styled(ws, 'Imputed', imputed_font)
+        else:
+            forecast_type = 'Historical'
+        ws.append([
+            _styled(ws, date, number_format='yyyy-mm-dd'),
+            date.strftime('%Y-%m'),
+            _styled(ws, float(qty) if is_reported else None, number_format='#,##0.00'),
+            _styled(ws, float(value) if is_reported else None, number_format='$#,##0'),
+            _styled(ws, ma_qty, number_format='#,##0.00'),
+            _styled(ws, ma_value, number_format='$#,##0'),
+            forecast_type,
+        ])
+        row_num += 1
+
+    if sheet['Is_Last'] and row_num - HEADER_ROW > MA_WINDOW:
+        last_date = rows['Date'].max()
+        for i in range(1, N_FORECAST + 1):
+            forecast_date = last_date + pd.DateOffset(months=i)
+            ws.append([
+                _styled(ws, forecast_date, number_format='yyyy-mm-dd'),
+                forecast_date.strftime('%Y-%m'),
+                None,
+                None,
+                _styled(ws, f'=AVERAGE(C{row_num - MA_WINDOW}:C{row_num - 1})',
+                        number_format='#,##0.00'),
+                _styled(ws, f'=AVERAGE(D{row_num - MA_WINDOW}:D{row_num - 1})',
+                        number_format='$#,##0'),
+                _styled(ws, 'Forecast', Font(bold=True, color='FF0000')),
+            ])
+            row_num += 1
+
+
+def write_drilldown_file(task):
+    """
+    Process-pool entry point: write one drill-down workbook.
+
+    Args:
+        task: Tuple of (output path, sheet specs, index file name)
+
+    Returns:
+        List of index records (one per sheet)
+    """
+    path, sheets, index_file = task
+    wb = Workbook(write_only=True)
+    records = []
+    for sheet in sheets:
+        _write_sheet(wb, sheet, index_file)
+        rows = sheet['rows']
+        records.append({
+            'Commodity': sheet['Commodity'], 'Bloc': sheet['Bloc'],
+            'Reporter': sheet['Reporter'], 'Country': sheet['Country'],
+            'File': os.path.basename(path), 'Sheet': sheet['Sheet'],
+            'First_Month': rows['Date'].min(), 'Last_Month': rows['Date'].max(),
+            'Months': int(rows['Is_Reported'].sum()),
+            'Imputed_Months': int(rows['Is_Imputed'].sum()),
+            'Last_Qty_kg': float(rows['Qty_kg'].iloc[-1]),
+            'Forecast_Qty_kg': float(rows['Qty_kg'].tail(MA_WINDOW).mean())
+            if sheet['Is_Last'] else np.nan,
+        })
+    wb.save(path)
+    return records
+
+
+def write_index_workbook(index, path):
+    """
+    Write the index workbook with a hyperlink to every drill-down sheet.
+
+    Args:
+        index: DataFrame of index records from write_drilldown_file()
+        path: Output path of the index workbook
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Index'
+
+    ws['A1'] = 'Drill-Down Index - Reporter x Commodity Forecast Sheets'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:L1')
+    ws['A2'] = (f"{len(index)} sheets in {index['File'].nunique()} files; "
+                f"forecast = mean of the last {MA_WINDOW} months")
+    ws['A2'].font = Font(italic=True, color='808080')
+
+    headers = ['Commodity', 'Bloc', 'Reporter', 'Country', 'First Month', 'Last Month',
+               'Reported Months', 'Imputed Months', 'Last Qty (kg)', '3-MA Forecast Qty (kg)',
+               'File', 'Sheet']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+    for row_num, record in enumerate(index.itertuples(index=False), 5):
+        values = [record.Commodity, record.Bloc, record.Reporter, record.Country,
+                  record.First_Month.strftime('%Y-%m'), record.Last_Month.strftime('%Y-%m'),
+                  record.Months, record.Imputed_Months,
+                  None if pd.isna(record.Last_Qty_kg) else record.Last_Qty_kg,
+                  None if pd.isna(record.Forecast_Qty_kg) else record.Forecast_Qty_kg,
+                  record.File, record.Sheet]
+        for col_num, value in enumerate(values, 1):
+            ws.cell(row=row_num, column=col_num, value=value)
+        ws.cell(row=row_num, column=9).number_format = '#,##0.00'
+        ws.cell(row=row_num, column=10).number_format = '#,##0.00'
+        link = ws.cell(row=row_num, column=12)
+        link.hyperlink = f"{record.File}#'{record.Sheet}'!A1"
+        link.font = LINK_FONT
+
+    ws.freeze_panes = 'A5'
+    ws.auto_filter.ref = f'A4:L{max(len(index) + 4, 5)}'
+    widths = [10, 8, 10, 28, 12, 12, 9, 10, 16, 18, 26, 16]
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    wb.save(path)
+
+
+def generate_drilldown_workbooks(frames, output_dir='.', group_by='bloc', n_workers=1,
+                                 max_rows_per_file=MAX_ROWS_PER_FILE,
+                                 max_sheets_per_file=MAX_SHEETS_PER_FILE):
+    """
+    Write the drill-down workbooks and their index.
+
+    Args:
+        frames: Dict mapping commodity name to a Comtrade DataFrame with a
+                parsed refDate (imputed rows appended, see append_imputed_rows)
+        output_dir: Directory for the workbooks
+        group_by: 'bloc', 'commodity' or 'reporter'
+        n_workers: Number of worker processes (1 = write in this process)
+        max_rows_per_file: Data rows that start a new file
+        max_sheets_per_file: Sheets that start a new file
+
+    Returns:
+        Index DataFrame (one row per sheet, with its file)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    files = plan_files(plan_sheets(reporter_series(frames)), group_by,
+                       max_rows_per_file, max_sheets_per_file)
+    tasks = [(os.path.join(output_dir, name), sheets, INDEX_FILE)
+             for name, sheets in files.items()]
+
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(write_drilldown_file, tasks))
+    else:
+        results = [write_drilldown_file(task) for task in tasks]
+
+    index = pd.DataFrame([record for records in results for record in records])
+    write_index_workbook(index, os.path.join(output_dir, INDEX_FILE))
+    return index
+
+
+def main():
+    """
+    Generate the drill-down workbooks from the default Comtrade extracts.
+
+    Usage:
+        python drilldown_workbooks.py [output_dir] [n_workers]
+    """
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else 'drilldown'
+    n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    frames = {}
+    for commodity, path in (('Gold', 'Gold_TradeData_Cleaned.csv'),
+                            ('Oil', 'Oil_TradeData_Cleaned.csv')):
+        trade_df, _ = load_screened_trade_data(path, ANOMALY_POLICY)
+        trade_df['refDate'] = pd.to_datetime(trade_df['refDate'])
+        frames[commodity] = trade_df
+
+    imputed, _ = impute_missing_reporters(frames)
+    frames = {name: append_imputed_rows(df, imputed, name) for name, df in frames.items()}
+
+    index = generate_drilldown_workbooks(frames, output_dir, n_workers=n_workers)
+    print(f"✓ {len(index)} drill-down sheets in {index['File'].nunique()} files "
+          f"-> {os.path.join(output_dir, INDEX_FILE)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
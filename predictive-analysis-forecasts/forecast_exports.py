@@ -0,0 +1,233 @@
+"""
+Machine-Readable Forecast Exports
+Writes the forecast series next to the workbook in a tidy layout, so
+downstream systems do not have to read formula cells out of
+Predictive_Analysis_Forecasts.xlsx (they have no cached values until
+recalc.py has run).
+
+One row per series x month, full history plus the forecast months:
+
+    Series, Date, Is_Forecast, Actual, MA_3, Forecast, Tuned_Forecast,
+    Reconciled_Forecast, PI_<level>_Low / PI_<level>_High, Is_Partial,
+    Reported_Share
+
+The table is built from the same objects that feed the workbook (the
+forecast series, compute_forecast_intervals() output, the tuned forecasts
+and the reconciled bloc forecasts); MA_3 holds the values of the sheets'
+AVERAGE() formulas.
+
+Formats:
+- parquet: columnar and compressed, sorted by Series with Series
+  dictionary-encoded, so a reader can load single columns or series
+  (read_forecast_export) without parsing the rest; the run metadata is
+  stored in the file's schema metadata
+- csv / ndjson: optional plain-text copies
+The run metadata (model configurations, interval settings, inputs) is also
+written to <stem>_metadata.json.
+
+Parquet needs pyarrow (pip install pyarrow); without it DEFAULT_FORMATS
+falls back to CSV.
+
+Usage:
+    from forecast_exports import build_forecast_table, write_forecast_exports
+
+    table = build_forecast_table(forecast_series, forecast_intervals, tuned_forecasts)
+    paths = write_forecast_exports(table, metadata, formats=('parquet', 'ndjson'))
+"""
+
+from datetime import datetime, timezone
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from bootstrap_intervals import monthly_calendar
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    PYARROW_AVAILABLE = False
+
+
+EXPORT_FORMATS = ('parquet', 'csv', 'ndjson')
+DEFAULT_FORMATS = ('parquet',) if PYARROW_AVAILABLE else ('csv',)
+EXPORT_STEM = 'Forecast_Export'
+
+# Schema metadata key holding the run metadata in the Parquet file
+METADATA_KEY = b'forecast_export'
+
+
+def build_forecast_table(series_by_name, intervals, tuned_forecasts=None, window=3,
+                         flags_by_name=None, reconciled_forecasts=None, calendar=False):
+    """
+    Stack every forecast series into one tidy table.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        intervals: Dict from compute_forecast_intervals() (same names)
+        tuned_forecasts: Optional dict mapping name to the forecast_from_config()
+                         values shown on the Model_Selection sheet
+        window: Moving-average window of the MA column
+        flags_by_name: Optional dict mapping name to a DataFrame indexed by
+                       Date with Is_Partial and Reported_Share columns
+        reconciled_forecasts: Optional dict from reconciliation.bloc_forecasts()
+                              (Series indexed by Date) for the bloc series
+        calendar: Keep unreported months as rows with a missing Actual and
+                  average the observed months of each calendar window
+
+    Returns:
+        DataFrame with one row per series x month (history and forecast),
+        sorted by Series and Date
+    """
+    frames = []
+    for name, series in series_by_name.items():
+        if calendar:
+            series = monthly_calendar(series)
+            moving_average = series.rolling(window, min_periods=1).mean()
+            moving_average.iloc[:window - 1] = np.nan
+        else:
+            series = series.dropna().sort_index()
+            moving_average = series.rolling(window).mean()
+        history = pd.DataFrame({
+            'Date': series.index,
+            'Is_Forecast': False,
+            'Actual': series.to_numpy(dtype=float),
+            f'MA_{window}': moving_average.to_numpy(),
+        })
+
+        forecast = intervals[name].copy()
+        forecast['Is_Forecast'] = True
+        if tuned_forecasts is not None and name in tuned_forecasts:
+            forecast['Tuned_Forecast'] = np.asarray(tuned_forecasts[name], dtype=float)
+        if reconciled_forecasts is not None and name in reconciled_forecasts:
+            forecast['Reconciled_Forecast'] = forecast['Date'].map(reconciled_forecasts[name])
+
+        frame = pd.concat([history, forecast], ignore_index=True)
+        if flags_by_name is not None and name in flags_by_name:
+            flags = flags_by_name[name]
+            frame['Is_Partial'] = frame['Date'].map(flags['Is_Partial']).fillna(False) \
+                .astype(bool)
+            frame['Reported_Share'] = frame['Date'].map(flags['Reported_Share'])
+        frame.insert(0, 'Series', name)
+        frames.append(frame)
+
+    table = pd.concat(frames, ignore_index=True)
+    if 'Is_Partial' in table.columns:
+        table['Is_Partial'] = table['Is_Partial'].fillna(False).astype(bool)
+    table['Series'] = pd.Categorical(table['Series'], categories=list(series_by_name))
+    return table.sort_values(['Series', 'Date'], kind='stable').reset_index(drop=True)
+
+
+def bloc_partial_flags(bloc_monthly, prefix):
+    """
+    Partial-month flags of a bloc series in the layout build_forecast_table() expects.
+
+    Args:
+        bloc_monthly: DataFrame from aggregate_bloc_monthly()
+        prefix: Column prefix used for that DataFrame, e.g. 'BRICS_Gold'
+
+    Returns:
+        DataFrame indexed by Date with Is_Partial and Reported_Share
+    """
+    flags = bloc_monthly.set_index('Date')[[f'{prefix}_Is_Partial',
+                                            f'{prefix}_Reported_Share']]
+    flags.columns = ['Is_Partial', 'Reported_Share']
+    return flags
+
+
+def build_metadata(series_by_name, model_configs=None, **settings):
+    """
+    Run metadata stored with the exports.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        model_configs: Optional dict from load_or_search_configs()
+        **settings: Extra JSON-serialisable settings (window, interval levels,
+                    bootstrap method, anomaly policy, input paths, ...)
+
+    Returns:
+        Dict with generated_at, per-series observations / date range /
+        model configuration, and the settings
+    """
+    series_info = {}
+    for name, series in series_by_name.items():
+        series = series.dropna()
+        series_info[name] = {
+            'n_obs': int(len(series)),
+            'first_date': series.index.min().strftime('%Y-%m-%d'),
+            'last_date': series.index.max().strftime('%Y-%m-%d'),
+            'model': (model_configs or {}).get(name),
+        }
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'series': series_info,
+        'settings': settings,
+    }
+
+
+def write_forecast_exports(table, metadata, output_dir='.', stem=EXPORT_STEM,
+                           formats=DEFAULT_FORMATS):
+    """
+    Write the tidy forecast table in the requested formats.
+
+    Args:
+        table: DataFrame from build_forecast_table()
+        metadata: Dict from build_metadata()
+        output_dir: Output directory
+        stem: File name without extension
+        formats: Any of EXPORT_FORMATS
+
+    Returns:
+        Dict mapping format (and 'metadata') to the written path
+    """
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export formats {sorted(unknown)} (use {EXPORT_FORMATS})")
+    if 'parquet' in formats and not PYARROW_AVAILABLE:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    os.makedirs(output_dir, exist_ok=True)
+    metadata_json = json.dumps(metadata, indent=2, default=float)
+    paths = {}
+
+    if 'parquet' in formats:
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+        arrow_table = arrow_table.replace_schema_metadata(
+            {**(arrow_table.schema.metadata or {}), METADATA_KEY: metadata_json.encode()})
+        paths['parquet'] = os.path.join(output_dir, f'{stem}.parquet')
+        pq.write_table(arrow_table, paths['parquet'], compression='zstd')
+    if 'csv' in formats:
+        paths['csv'] = os.path.join(output_dir, f'{stem}.csv')
+        table.to_csv(paths['csv'], index=False, date_format='%Y-%m-%d')
+    if 'ndjson' in formats:
+        paths['ndjson'] = os.path.join(output_dir, f'{stem}.ndjson')
+        table.to_json(paths['ndjson'], orient='records', lines=True, date_format='iso')
+
+    paths['metadata'] = os.path.join(output_dir, f'{stem}_metadata.json')
+    with open(paths['metadata'], 'w') as f:
+        f.write(metadata_json)
+    return paths
+
+
+def read_forecast_export(path, columns=None, series=None):
+    """
+    Read a Parquet export, loading only the requested columns and series.
+
+    Args:
+        path: Parquet file from write_forecast_exports()
+        columns: Columns to load (default: all)
+        series: Series names to keep (default: all), pushed down as a filter
+
+    Returns:
+        Tuple of (DataFrame, run metadata dict)
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Reading Parquet exports requires pyarrow (pip install pyarrow)")
+    filters = [('Series', 'in', list(series))] if series is not None else None
+    arrow_table = pq.read_table(path, columns=columns, filters=filters)
+    metadata = json.loads(pq.read_schema(path).metadata.get(METADATA_KEY, b'{}'))
+    return arrow_table.to_pandas(), metadata
@@ -3,7 +3,8 @@ Generate Prediction Figures as PDFs
 This script creates publication-quality PDF charts for all predictions.
 
 Usage:
-    python generate_prediction_figures.py
+    python generate_prediction_figures.py            (300 DPI PDFs)
+    python generate_prediction_figures.py --draft    (PNG thumbnails in ../figures/draft/)
 
 Outputs (saved to ../figures/):
     Forecast Figures:
@@ -23,7 +24,19 @@ Outputs (saved to ../figures/):
     Combined Document:
     - Fig9_all_predictions_combined.pdf (all forecasts)
 
-Total: 9 PDF files with professional charts
+    Multi-Frequency:
+    - Fig10_btc_multi_frequency_forecast.pdf (daily, weekly, monthly per-day average)
+
+    Reconciliation:
+    - Fig11_reconciled_brics_forecast.pdf (BRICS reporter and bloc forecasts)
+
+    Cross-Correlation:
+    - Fig12_cross_correlation.pdf (same-month and peak lead-lag correlation heatmaps)
+
+    Price / Volume:
+    - Fig13_price_volume.pdf (chained price and volume indices, monthly effects)
+
+Total: 13 PDF files with professional charts (draft mode: 12 PNGs, no Fig9)
 """
 
 import pandas as pd
@@ -33,6 +46,22 @@ import matplotlib.dates as mdates
 from matplotlib.backends.backend_pdf import PdfPages
 from datetime import datetime, timedelta
 import os
+import sys
+from btc_frequency import (load_btc_daily, resample_btc_volume,
+                           forecast_btc_frequencies, FREQUENCY_SETTINGS)
+from bootstrap_intervals import compute_forecast_intervals, align_monthly
+from reconciliation import build_reporter_panel, reconcile_hierarchy, bloc_forecasts
+from polars_backend import DEFAULT_BACKEND
+from draft_rendering import (plot_line, save_figure, figure_path, RENDER_SETTINGS,
+                             DEFAULT_RENDER_MODE)
+from cross_correlation import lagged_cross_correlation, plot_correlation_heatmap
+from change_points import fit_series_for_mode, DEFAULT_REGIME_MODE
+from anomaly_screening import load_screened_trade_data, ANOMALY_POLICY
+from reporter_imputation import impute_missing_reporters, append_imputed_rows
+from nowcasting import aggregate_bloc_monthly
+from currency_shares import (compute_currency_shares, forecast_currency_shares,
+                             summarize_currency_share, describe_currency_share)
+from price_volume import price_volume_decomposition
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -42,6 +71,37 @@ FIGURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'figures'
 # Create figures directory if it doesn't exist
 os.makedirs(FIGURES_DIR, exist_ok=True)
 
+# Figures listed in the completion summary, by section
+SUMMARY_FIGURES = (
+    ('FORECAST FIGURES (with 3-month predictions)', (
+        ('Fig1_btc_forecast.pdf', 'Bitcoin trading volume forecast'),
+        ('Fig2_gold_brics_forecast.pdf', 'BRICS gold imports forecast (2 charts)'),
+        ('Fig3_oil_brics_forecast.pdf', 'BRICS oil imports forecast (2 charts)'))),
+    ('TIME SERIES FIGURES (historical trends)', (
+        ('Fig4_btc_reserves_timeseries.pdf', 'BTC volume over time'),
+        ('Fig5_gold_reserves_timeseries.pdf', 'Gold imports over time'),
+        ('Fig6_oil_reserves_timeseries.pdf', 'Oil imports over time'))),
+    ('COMPARATIVE ANALYSIS', (
+        ('Fig7_comparative_analysis.pdf', 'All three commodities compared (normalized)'),
+        ('Fig8_comparative_forecast.pdf', 'All three commodities with 3-month forecasts'))),
+    ('COMBINED DOCUMENT', (
+        ('Fig9_all_predictions_combined.pdf', 'All forecasts in one PDF'),)),
+    ('MULTI-FREQUENCY', (
+        ('Fig10_btc_multi_frequency_forecast.pdf',
+         'Daily, weekly and monthly BTC forecasts'),)),
+    ('RECONCILIATION', (
+        ('Fig11_reconciled_brics_forecast.pdf',
+         'Coherent BRICS reporter and bloc forecasts'),)),
+    ('CROSS-CORRELATION', (
+        ('Fig12_cross_correlation.pdf', 'Same-month and peak lead-lag correlations'),)),
+    ('PRICE / VOLUME', (
+        ('Fig13_price_volume.pdf',
+         'Gold and oil import value split into price and volume'),)),
+)
+
+# Not rendered with --draft (the combined PDF repeats Fig1-Fig3)
+DRAFT_SKIPPED_FIGURES = ('Fig9_all_predictions_combined.pdf',)
+
 # Set style for professional charts
 plt.style.use('seaborn-v0_8-darkgrid')
 plt.rcParams['figure.figsize'] = (12, 6)
@@ -53,59 +113,52 @@ plt.rcParams['xtick.labelsize'] = 9
 plt.rcParams['ytick.labelsize'] = 9
 
 
-def load_and_process_data(btc_path, gold_path, oil_path):
+def load_and_process_data(btc_path, gold_path, oil_path,
+                          anomaly_policy=ANOMALY_POLICY, nowcast=True,
+                          impute=True, backend=DEFAULT_BACKEND, return_inputs=False):
     """
     Load and process the cleaned CSV datasets.
 
     Returns:
-        Tuple of processed dataframes
+        Tuple of processed dataframes, followed with return_inputs=True by
+        a dict with 'trade' (screened Comtrade frames by commodity),
+        'imputed_trade' (the same with imputed reporter rows appended) and
+        'btc_daily', so they are not read, screened and imputed again
     """
-    # Load datasets
-    btc_df = pd.read_csv(btc_path)
-    gold_df = pd.read_csv(gold_path)
-    oil_df = pd.read_csv(oil_path)
+    # Load datasets (outlier rows are screened before any aggregation)
+    gold_df, _ = load_screened_trade_data(gold_path, anomaly_policy, backend=backend)
+    oil_df, _ = load_screened_trade_data(oil_path, anomaly_policy, backend=backend)
 
     # Parse dates
-    btc_df['Time'] = pd.to_datetime(btc_df['Time'])
     gold_df['refDate'] = pd.to_datetime(gold_df['refDate'])
     oil_df['refDate'] = pd.to_datetime(oil_df['refDate'])
+    inputs = {'trade': {'Gold': gold_df, 'Oil': oil_df}}
+
+    # Structurally absent reporters (e.g. RUS after 2021) are imputed for
+    # all commodities at once; imputed rows carry Is_Imputed
+    if impute:
+        imputed, _ = impute_missing_reporters({'Gold': gold_df, 'Oil': oil_df})
+        gold_df = append_imputed_rows(gold_df, imputed, 'Gold')
+        oil_df = append_imputed_rows(oil_df, imputed, 'Oil')
+    inputs['imputed_trade'] = {'Gold': gold_df, 'Oil': oil_df}
 
     # === BTC ANALYSIS ===
     # Extract USD column and aggregate monthly
-    btc_df['year_month'] = btc_df['Time'].dt.to_period('M')
-    btc_monthly = btc_df.groupby('year_month')['USD'].sum().reset_index()
-    btc_monthly['year_month'] = btc_monthly['year_month'].dt.to_timestamp()
-    btc_monthly = btc_monthly.sort_values('year_month')
+    btc_daily = inputs['btc_daily'] = load_btc_daily(btc_path, backend)
+    btc_monthly = resample_btc_volume(btc_daily, 'M', per_day=False)[['Date', 'USD']]
     btc_monthly.columns = ['Date', 'BTC_Volume']
 
-    # === GOLD ANALYSIS ===
+    # === GOLD / OIL ANALYSIS ===
+    # Members that have not reported the latest months yet are nowcast
+    # before the BRICS totals are summed
     brics_codes = ['BRA', 'RUS', 'IND', 'CHN', 'ZAF']
-    gold_df['year_month'] = gold_df['refDate'].dt.to_period('M')
-
-    # BRICS Gold Imports
-    gold_brics = gold_df[gold_df['reporterISO'].isin(brics_codes) &
-                         (gold_df['flowDesc'] == 'Import')]
-    gold_brics_monthly = gold_brics.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    gold_brics_monthly['year_month'] = gold_brics_monthly['year_month'].dt.to_timestamp()
-    gold_brics_monthly.columns = ['Date', 'BRICS_Gold_Qty_kg', 'BRICS_Gold_Value_USD']
-
-    # === OIL ANALYSIS ===
-    oil_df['year_month'] = oil_df['refDate'].dt.to_period('M')
-
-    # BRICS Oil Imports
-    oil_brics = oil_df[oil_df['reporterISO'].isin(brics_codes) &
-                       (oil_df['flowDesc'] == 'Import')]
-    oil_brics_monthly = oil_brics.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    oil_brics_monthly['year_month'] = oil_brics_monthly['year_month'].dt.to_timestamp()
-    oil_brics_monthly.columns = ['Date', 'BRICS_Oil_Qty_kg', 'BRICS_Oil_Value_USD']
-
-    return btc_monthly, gold_brics_monthly, oil_brics_monthly
+    gold_brics_monthly = aggregate_bloc_monthly(gold_df, brics_codes, 'BRICS_Gold',
+                                                nowcast=nowcast)
+    oil_brics_monthly = aggregate_bloc_monthly(oil_df, brics_codes, 'BRICS_Oil',
+                                               nowcast=nowcast)
+
+    monthly = (btc_monthly, gold_brics_monthly, oil_brics_monthly)
+    return monthly + (inputs,) if return_inputs else monthly
 
 
 def calculate_3ma_forecast(df, value_col, n_forecast=3):
@@ -150,9 +203,82 @@ def calculate_3ma_forecast(df, value_col, n_forecast=3):
     return result
 
 
-def plot_btc_forecast(btc_monthly, output_filename='Fig1_btc_forecast.pdf'):
+def plot_prediction_intervals(ax, interval_df, color='#FF0000'):
+    """
+    Draw bootstrap prediction intervals as shaded bands (widest first).
+
+    Args:
+        ax: Matplotlib axes
+        interval_df: DataFrame from compute_forecast_intervals()
+        color: Band colour (matches the forecast line)
+    """
+    levels = sorted((int(c.split('_')[1]) for c in interval_df.columns
+                     if c.endswith('_Low')), reverse=True)
+    for i, level in enumerate(levels):
+        ax.fill_between(interval_df['Date'],
+                        interval_df[f'PI_{level}_Low'], interval_df[f'PI_{level}_High'],
+                        color=color, alpha=0.10 + 0.08 * i, linewidth=0,
+                        label=f'{level}% Prediction Interval')
+
+
+def plot_reconciled_forecast_line(ax, forecasts, color='#7030A0'):
+    """
+    Draw the reconciled (MinT) bloc forecast next to the 3-MA forecast.
+
+    Args:
+        ax: Matplotlib axes
+        forecasts: Series from reconciliation.bloc_forecasts() indexed by Date
+        color: Line colour
+    """
+    ax.plot(forecasts.index, forecasts.to_numpy(), linewidth=2.5, linestyle=':',
+            marker='s', markersize=5, color=color, label='Reconciled Forecast (MinT)')
+
+
+def plot_partial_months(ax, data, value_col, flag_col):
+    """
+    Mark months in which some bloc members have not reported yet.
+
+    Args:
+        ax: Matplotlib axes
+        data: DataFrame with Date, value_col and flag_col (forecast rows may
+              have a missing flag)
+        value_col: Plotted value column
+        flag_col: Boolean Is_Partial column from aggregate_bloc_monthly()
+    """
+    partial = data[data[flag_col].fillna(False).astype(bool)]
+    if len(partial):
+        ax.scatter(partial['Date'], partial[value_col], s=90, facecolors='none',
+                   edgecolors='#C65911', linewidths=1.5, zorder=5,
+                   label='Partial month (members nowcast)')
+
+
+def plot_change_points(ax, break_dates, start=None):
+    """
+    Mark structural breaks as dotted vertical lines.
+
+    Args:
+        ax: Matplotlib axes
+        break_dates: Break dates from detect_change_points()
+        start: Only breaks on or after this date are drawn (plotted range)
+    """
+    dates = [d for d in break_dates if start is None or d >= start]
+    for i, date in enumerate(dates):
+        ax.axvline(date, color='#7F7F7F', linestyle=':', linewidth=1.8, zorder=1,
+                   label='Structural break' if i == 0 else '_nolegend_')
+
+
+def plot_btc_forecast(btc_monthly, output_filename='Fig1_btc_forecast.pdf',
+                      usd_share=None, intervals=None, render_mode=DEFAULT_RENDER_MODE,
+                      breaks=None):
     """
     Create BTC forecast figure and save as PDF.
+
+    usd_share is the dict from summarize_currency_share(); when given, the
+    insights box reports the computed USD share of BTC volume. intervals is
+    the dict from compute_forecast_intervals(); when given, prediction
+    intervals are drawn as shaded bands around the forecast. breaks is the
+    dict from detect_change_points(); when given, structural breaks are
+    marked.
     """
     output_path = os.path.join(FIGURES_DIR, output_filename)
 
@@ -184,6 +310,10 @@ def plot_btc_forecast(btc_monthly, output_filename='Fig1_btc_forecast.pdf'):
     ax.plot(forecast_data['Date'], forecast_values,
             linewidth=3, linestyle='--', color='#FF0000',
             label='3-Month Forecast', alpha=0.9)
+    if intervals is not None:
+        plot_prediction_intervals(ax, intervals['BTC_Volume'])
+    if breaks is not None:
+        plot_change_points(ax, breaks['BTC_Volume'], btc_data['Date'].min())
 
     # Formatting
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -205,26 +335,34 @@ def plot_btc_forecast(btc_monthly, output_filename='Fig1_btc_forecast.pdf'):
     ax.legend(loc='best', framealpha=0.9, shadow=True)
 
     # Add insights box
-    insights_text = (
-        'Key Insights:\n'
-        '  - USD maintains 60-70% dominance in BTC trading\n'
-        '  - Forecast assumes continuation of recent trading patterns\n'
-        '  - Deviations may signal shifts in BTC market dynamics'
-    )
+    insights = ['Key Insights:']
+    if usd_share is not None:
+        insights.append(f'  - {describe_currency_share(usd_share)}')
+    insights += [
+        '  - Forecast assumes continuation of recent trading patterns',
+        '  - Deviations may signal shifts in BTC market dynamics',
+    ]
+    insights_text = '\n'.join(insights)
     ax.text(0.02, 0.98, insights_text, transform=ax.transAxes,
             fontsize=9, verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
 
     print(f"   Created: {output_path}")
 
 
-def plot_gold_forecast(gold_brics_monthly, output_filename='Fig2_gold_brics_forecast.pdf'):
+def plot_gold_forecast(gold_brics_monthly, output_filename='Fig2_gold_brics_forecast.pdf',
+                       intervals=None, render_mode=DEFAULT_RENDER_MODE, breaks=None,
+                       reconciled=None):
     """
     Create Gold BRICS forecast figure (2 subplots) and save as PDF.
+
+    breaks is the dict from detect_change_points(); when given, structural
+    breaks are marked. reconciled is the dict from bloc_forecasts(); when
+    given, the reconciled bloc forecasts are drawn.
     """
     output_path = os.path.join(FIGURES_DIR, output_filename)
 
@@ -255,6 +393,14 @@ def plot_gold_forecast(gold_brics_monthly, output_filename='Fig2_gold_brics_fore
     ax1.plot(forecast_data['Date'], forecast_values,
              linewidth=3, linestyle='--', color='#FF0000',
              label='3-Month Forecast', alpha=0.9)
+    if intervals is not None:
+        plot_prediction_intervals(ax1, intervals['BRICS_Gold_Qty_kg'])
+    if reconciled is not None:
+        plot_reconciled_forecast_line(ax1, reconciled['BRICS_Gold_Qty_kg'])
+    plot_partial_months(ax1, gold_qty_forecast, 'BRICS_Gold_Qty_kg',
+                        'BRICS_Gold_Is_Partial')
+    if breaks is not None:
+        plot_change_points(ax1, breaks['BRICS_Gold_Qty_kg'], gold_data['Date'].min())
 
     # Formatting
     ax1.set_xlabel('Date', fontsize=11, fontweight='bold')
@@ -288,6 +434,14 @@ def plot_gold_forecast(gold_brics_monthly, output_filename='Fig2_gold_brics_fore
     ax2.plot(forecast_data['Date'], forecast_values,
              linewidth=3, linestyle='--', color='#FF0000',
              label='3-Month Forecast', alpha=0.9)
+    if intervals is not None:
+        plot_prediction_intervals(ax2, intervals['BRICS_Gold_Value_USD'])
+    if reconciled is not None:
+        plot_reconciled_forecast_line(ax2, reconciled['BRICS_Gold_Value_USD'])
+    plot_partial_months(ax2, gold_val_forecast, 'BRICS_Gold_Value_USD',
+                        'BRICS_Gold_Is_Partial')
+    if breaks is not None:
+        plot_change_points(ax2, breaks['BRICS_Gold_Value_USD'], gold_data['Date'].min())
 
     # Formatting
     ax2.set_xlabel('Date', fontsize=11, fontweight='bold')
@@ -313,15 +467,21 @@ def plot_gold_forecast(gold_brics_monthly, output_filename='Fig2_gold_brics_fore
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
 
     print(f"   Created: {output_path}")
 
 
-def plot_oil_forecast(oil_brics_monthly, output_filename='Fig3_oil_brics_forecast.pdf'):
+def plot_oil_forecast(oil_brics_monthly, output_filename='Fig3_oil_brics_forecast.pdf',
+                      intervals=None, render_mode=DEFAULT_RENDER_MODE, breaks=None,
+                      reconciled=None):
     """
     Create Oil BRICS forecast figure (2 subplots) and save as PDF.
+
+    breaks is the dict from detect_change_points(); when given, structural
+    breaks are marked. reconciled is the dict from bloc_forecasts(); when
+    given, the reconciled bloc forecasts are drawn.
     """
     output_path = os.path.join(FIGURES_DIR, output_filename)
 
@@ -352,6 +512,14 @@ def plot_oil_forecast(oil_brics_monthly, output_filename='Fig3_oil_brics_forecas
     ax1.plot(forecast_data['Date'], forecast_values,
              linewidth=3, linestyle='--', color='#FF0000',
              label='3-Month Forecast', alpha=0.9)
+    if intervals is not None:
+        plot_prediction_intervals(ax1, intervals['BRICS_Oil_Qty_kg'])
+    if reconciled is not None:
+        plot_reconciled_forecast_line(ax1, reconciled['BRICS_Oil_Qty_kg'])
+    plot_partial_months(ax1, oil_qty_forecast, 'BRICS_Oil_Qty_kg',
+                        'BRICS_Oil_Is_Partial')
+    if breaks is not None:
+        plot_change_points(ax1, breaks['BRICS_Oil_Qty_kg'], oil_data['Date'].min())
 
     # Formatting
     ax1.set_xlabel('Date', fontsize=11, fontweight='bold')
@@ -385,6 +553,14 @@ def plot_oil_forecast(oil_brics_monthly, output_filename='Fig3_oil_brics_forecas
     ax2.plot(forecast_data['Date'], forecast_values,
              linewidth=3, linestyle='--', color='#FF0000',
              label='3-Month Forecast', alpha=0.9)
+    if intervals is not None:
+        plot_prediction_intervals(ax2, intervals['BRICS_Oil_Value_USD'])
+    if reconciled is not None:
+        plot_reconciled_forecast_line(ax2, reconciled['BRICS_Oil_Value_USD'])
+    plot_partial_months(ax2, oil_val_forecast, 'BRICS_Oil_Value_USD',
+                        'BRICS_Oil_Is_Partial')
+    if breaks is not None:
+        plot_change_points(ax2, breaks['BRICS_Oil_Value_USD'], oil_data['Date'].min())
 
     # Formatting
     ax2.set_xlabel('Date', fontsize=11, fontweight='bold')
@@ -410,24 +586,195 @@ def plot_oil_forecast(oil_brics_monthly, output_filename='Fig3_oil_brics_forecas
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     plt.tight_layout()
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
+    plt.close()
+
+    print(f"   Created: {output_path}")
+
+
+def plot_btc_frequency_forecast(btc_daily,
+                                output_filename='Fig10_btc_multi_frequency_forecast.pdf',
+                                render_mode=DEFAULT_RENDER_MODE):
+    """
+    Create BTC daily / weekly / monthly (per-day average) forecast figure
+    (3 subplots) and save as PDF.
+    """
+    output_path = os.path.join(FIGURES_DIR, output_filename)
+
+    frequency_forecasts = forecast_btc_frequencies(btc_daily, currency='USD')
+    # Recent history shown per frequency (roughly the last 6 months)
+    history_periods = {'D': 180, 'W': 26, 'M': 24}
+
+    fig, axes = plt.subplots(3, 1, figsize=(14, 15))
+
+    for ax, (freq, forecast_df) in zip(axes, frequency_forecasts.items()):
+        settings = FREQUENCY_SETTINGS[freq]
+        n_forecast = forecast_df['Forecast'].notna().sum()
+        plot_df = forecast_df.tail(history_periods[freq] + n_forecast)
+
+        actual_data = plot_df[plot_df['USD'].notna()]
+        plot_line(ax, actual_data['Date'], actual_data['USD'], render_mode,
+                  linewidth=1.5, color='#4472C4',
+                  label=f"Actual ({settings['label']})", alpha=0.8)
+        plot_line(ax, actual_data['Date'], actual_data['MA'], render_mode,
+                  linewidth=2.5, color='#70AD47',
+                  label=f"{settings['window']}-Period Moving Average", alpha=0.9)
+
+        forecast_data = plot_df.iloc[len(actual_data) - 1:]
+        forecast_values = forecast_data['Forecast'].fillna(forecast_data['MA'])
+        ax.plot(forecast_data['Date'], forecast_values,
+                linewidth=3, linestyle='--', color='#FF0000',
+                label=f'{n_forecast}-Period Forecast', alpha=0.9)
+
+        ax.set_xlabel('Date', fontsize=11, fontweight='bold')
+        ax.set_ylabel('Volume (BTC per day)', fontsize=11, fontweight='bold')
+        ax.set_title(f"Bitcoin USD Trading Volume - {settings['label']}",
+                     fontsize=13, fontweight='bold', pad=15)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_axisbelow(True)
+        ax.legend(loc='best', framealpha=0.9, shadow=True)
+
+    plt.tight_layout()
+    output_path = save_figure(fig, output_path, render_mode)
+    plt.close()
+
+    print(f"   Created: {output_path}")
+
+
+def plot_reconciled_forecast(reconciled,
+                             output_filename='Fig11_reconciled_brics_forecast.pdf',
+                             render_mode=DEFAULT_RENDER_MODE):
+    """
+    Create BRICS reporter forecasts before and after reconciliation (4 subplots).
+
+    Args:
+        reconciled: DataFrame from reconcile_hierarchy() (the first forecast
+                    month is shown)
+        output_filename: Name of the PDF in FIGURES_DIR
+    """
+    output_path = os.path.join(FIGURES_DIR, output_filename)
+
+    groups = [('Gold_Qty_kg', 'Gold Imports (kg)'),
+              ('Gold_Value_USD', 'Gold Imports (USD)'),
+              ('Oil_Qty_kg', 'Crude Oil Imports (kg)'),
+              ('Oil_Value_USD', 'Crude Oil Imports (USD)')]
+    columns = [('Base_Forecast', 'Base (own tuned model)', '#A5A5A5'),
+               ('bottom_up', 'Bottom-Up', '#4472C4'),
+               ('top_down', 'Top-Down', '#FFC000'),
+               ('mint', 'MinT', '#FF0000')]
+
+    fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+    for ax, (group, title) in zip(axes.ravel(), groups):
+        rows = reconciled[(reconciled['Group'] == group) &
+                          (reconciled['Bloc'] == 'BRICS') &
+                          (reconciled['Date'] == reconciled['Date'].min())]
+        bloc = rows[rows['Level'] == 'Bloc']
+        members = rows[rows['Level'] == 'Reporter'].sort_values('Node')
+        rows = pd.concat([members, bloc])
+        labels = list(members['Node']) + ['BRICS Total']
+
+        x = np.arange(len(labels))
+        width = 0.2
+        for i, (col, label, color) in enumerate(columns):
+            ax.bar(x + (i - 1.5) * width, rows[col], width,
+                   label=label, color=color, alpha=0.85)
+
+        ax.set_xticks(x)
+        ax.set_xticklabels(labels)
+        ax.set_title(f'BRICS {title} - Next-Month Forecast',
+                     fontsize=12, fontweight='bold')
+        ax.grid(True, axis='y', alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_axisbelow(True)
+        ax.legend(loc='upper left', framealpha=0.9, fontsize=8)
+
+    fig.suptitle('Hierarchical Forecast Reconciliation: Reporter -> Bloc -> World\n'
+                 'Reconciled forecasts add up from countries to the BRICS total',
+                 fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
+    print(f"   Created: {output_path}")
+
+
+def plot_price_volume(price_volume, output_filename='Fig13_price_volume.pdf',
+                      render_mode=DEFAULT_RENDER_MODE, n_months=24):
+    """
+    Create chained price / volume indices and monthly effects for gold and oil (4 subplots).
+
+    Args:
+        price_volume: DataFrame from price_volume_decomposition()
+        output_filename: Name of the PDF in FIGURES_DIR
+        n_months: Months of monthly effects shown in the bottom row
+    """
+    output_path = os.path.join(FIGURES_DIR, output_filename)
 
+    fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+    for col, (commodity, label) in enumerate((('Gold', 'Gold'), ('Oil', 'Crude Oil'))):
+        rows = price_volume[price_volume['Commodity'] == commodity]
+        brics = rows[rows['Group'] == 'BRICS'].sort_values('Date')
+        us_eu = rows[rows['Group'] == 'US_EU'].sort_values('Date')
+
+        ax = axes[0, col]
+        plot_line(ax, brics['Date'], brics['Price_Index'], render_mode, linewidth=2.5,
+                  color='#FFC000', label='BRICS Price (Fisher)')
+        plot_line(ax, brics['Date'], brics['Volume_Index'], render_mode, linewidth=2.5,
+                  color='#4472C4', label='BRICS Volume (Fisher)')
+        plot_line(ax, us_eu['Date'], us_eu['Price_Index'], render_mode, linewidth=1.5,
+                  linestyle='--', color='#A5A5A5', label='US/EU Price (Fisher)')
+        ax.axhline(100, color='black', linewidth=0.8, alpha=0.5)
+        ax.set_title(f'{label} Imports - Chained Price and Volume Indices',
+                     fontsize=12, fontweight='bold')
+        ax.set_ylabel('Index (first month = 100)', fontsize=10, fontweight='bold')
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        ax.legend(loc='upper left', framealpha=0.9, fontsize=8)
+        ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+
+        recent = brics.tail(n_months)
+        ax = axes[1, col]
+        x = np.arange(len(recent))
+        width = 0.4
+        ax.bar(x - width / 2, recent['Price_Effect'], width, color='#FFC000',
+               alpha=0.85, label='Price effect (log Fisher price)')
+        ax.bar(x + width / 2, recent['Volume_Effect'], width, color='#4472C4',
+               alpha=0.85, label='Volume effect (log Fisher volume)')
+        ax.axhline(0, color='black', linewidth=0.8)
+        ax.set_xticks(x[::3])
+        ax.set_xticklabels(recent['Date'].dt.strftime('%Y-%m').iloc[::3], rotation=45)
+        ax.set_title(f'BRICS {label} - Monthly Value Growth by Source',
+                     fontsize=12, fontweight='bold')
+        ax.set_ylabel('Log change vs previous month', fontsize=10, fontweight='bold')
+        ax.legend(loc='upper left', framealpha=0.9, fontsize=8)
+        ax.grid(True, axis='y', alpha=0.3, linestyle='-', linewidth=0.5)
+        ax.set_axisbelow(True)
+
+    fig.suptitle('Price / Volume Decomposition of Import Values\n'
+                 'Unit-value (price) moves separated from real accumulation',
+                 fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    output_path = save_figure(fig, output_path, render_mode)
+    plt.close()
     print(f"   Created: {output_path}")
 
 
-def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly):
+def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                              render_mode=DEFAULT_RENDER_MODE, breaks=None):
     """
     Create separate time series charts for BTC, Gold, and Oil reserves.
-    Saves 3 individual PDFs.
+    Saves 3 individual PDFs; structural breaks (dict from
+    detect_change_points()) are marked when given.
     """
     # === BTC RESERVES TIME SERIES ===
     fig, ax = plt.subplots(figsize=(14, 7))
 
     btc_data = btc_monthly.copy()
-    ax.plot(btc_data['Date'], btc_data['BTC_Volume'],
-            marker='o', linewidth=2.5, markersize=5,
-            color='#4472C4', label='BTC USD Trading Volume', alpha=0.8)
+    plot_line(ax, btc_data['Date'], btc_data['BTC_Volume'], render_mode,
+              marker='o', linewidth=2.5, markersize=5,
+              color='#4472C4', label='BTC USD Trading Volume', alpha=0.8)
+
+    if breaks is not None:
+        plot_change_points(ax, breaks['BTC_Volume'])
 
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
     ax.set_ylabel('Trading Volume (BTC)', fontsize=12, fontweight='bold')
@@ -454,7 +801,7 @@ def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly
 
     plt.tight_layout()
     output_path = os.path.join(FIGURES_DIR, 'Fig4_btc_reserves_timeseries.pdf')
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
     print(f"   Created: {output_path}")
 
@@ -462,9 +809,12 @@ def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly
     fig, ax = plt.subplots(figsize=(14, 7))
 
     gold_data = gold_brics_monthly.copy()
-    ax.plot(gold_data['Date'], gold_data['BRICS_Gold_Qty_kg'],
-            marker='o', linewidth=2.5, markersize=5,
-            color='#FFC000', label='BRICS Gold Imports (kg)', alpha=0.8)
+    plot_line(ax, gold_data['Date'], gold_data['BRICS_Gold_Qty_kg'], render_mode,
+              marker='o', linewidth=2.5, markersize=5,
+              color='#FFC000', label='BRICS Gold Imports (kg)', alpha=0.8)
+
+    if breaks is not None:
+        plot_change_points(ax, breaks['BRICS_Gold_Qty_kg'])
 
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
     ax.set_ylabel('Quantity (kg)', fontsize=12, fontweight='bold')
@@ -491,7 +841,7 @@ def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly
 
     plt.tight_layout()
     output_path = os.path.join(FIGURES_DIR, 'Fig5_gold_reserves_timeseries.pdf')
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
     print(f"   Created: {output_path}")
 
@@ -499,9 +849,12 @@ def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly
     fig, ax = plt.subplots(figsize=(14, 7))
 
     oil_data = oil_brics_monthly.copy()
-    ax.plot(oil_data['Date'], oil_data['BRICS_Oil_Qty_kg'],
-            marker='o', linewidth=2.5, markersize=5,
-            color='#000000', label='BRICS Crude Oil Imports (kg)', alpha=0.7)
+    plot_line(ax, oil_data['Date'], oil_data['BRICS_Oil_Qty_kg'], render_mode,
+              marker='o', linewidth=2.5, markersize=5,
+              color='#000000', label='BRICS Crude Oil Imports (kg)', alpha=0.7)
+
+    if breaks is not None:
+        plot_change_points(ax, breaks['BRICS_Oil_Qty_kg'])
 
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
     ax.set_ylabel('Quantity (kg)', fontsize=12, fontweight='bold')
@@ -528,12 +881,13 @@ def plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly
 
     plt.tight_layout()
     output_path = os.path.join(FIGURES_DIR, 'Fig6_oil_reserves_timeseries.pdf')
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
     print(f"   Created: {output_path}")
 
 
-def plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly):
+def plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                           render_mode=DEFAULT_RENDER_MODE):
     """
     Create a comparative chart showing BTC, Gold, and Oil on normalized scales.
     """
@@ -563,12 +917,12 @@ def plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly):
     # Create comparison chart
     fig, ax = plt.subplots(figsize=(16, 8))
 
-    ax.plot(btc_common['Date'], btc_common['Normalized'],
-            linewidth=2.5, color='#4472C4', label='Bitcoin USD Trading Volume', alpha=0.8)
-    ax.plot(gold_common['Date'], gold_common['Normalized'],
-            linewidth=2.5, color='#FFC000', label='BRICS Gold Imports', alpha=0.8)
-    ax.plot(oil_common['Date'], oil_common['Normalized'],
-            linewidth=2.5, color='#000000', label='BRICS Crude Oil Imports', alpha=0.7)
+    plot_line(ax, btc_common['Date'], btc_common['Normalized'], render_mode,
+              linewidth=2.5, color='#4472C4', label='Bitcoin USD Trading Volume', alpha=0.8)
+    plot_line(ax, gold_common['Date'], gold_common['Normalized'], render_mode,
+              linewidth=2.5, color='#FFC000', label='BRICS Gold Imports', alpha=0.8)
+    plot_line(ax, oil_common['Date'], oil_common['Normalized'], render_mode,
+              linewidth=2.5, color='#000000', label='BRICS Crude Oil Imports', alpha=0.7)
 
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
     ax.set_ylabel('Normalized Index (0-100)', fontsize=12, fontweight='bold')
@@ -598,12 +952,13 @@ def plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly):
 
     plt.tight_layout()
     output_path = os.path.join(FIGURES_DIR, 'Fig7_comparative_analysis.pdf')
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
     print(f"   Created: {output_path}")
 
 
-def plot_comparative_forecast(btc_monthly, gold_brics_monthly, oil_brics_monthly):
+def plot_comparative_forecast(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                              render_mode=DEFAULT_RENDER_MODE):
     """
     Create a comparative forecast chart showing all 3 commodities with 3-month predictions.
     All data normalized to 0-100 scale for comparison.
@@ -693,17 +1048,22 @@ def plot_comparative_forecast(btc_monthly, gold_brics_monthly, oil_brics_monthly
 
     plt.tight_layout()
     output_path = os.path.join(FIGURES_DIR, 'Fig8_comparative_forecast.pdf')
-    plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+    output_path = save_figure(fig, output_path, render_mode)
     plt.close()
     print(f"   Created: {output_path}")
 
 
 def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
-                        output_filename='Fig9_all_predictions_combined.pdf'):
+                        output_filename='Fig9_all_predictions_combined.pdf',
+                        intervals=None, render_mode=DEFAULT_RENDER_MODE):
     """
     Create a single PDF with all prediction figures.
     """
     output_path = os.path.join(FIGURES_DIR, output_filename)
+    if render_mode != 'publication':
+        # The pages repeat Fig1-Fig3, which draft mode already renders
+        print("   Skipped in draft mode (pages are Fig1-Fig3)")
+        return
 
     with PdfPages(output_path) as pdf:
         # Page 1: BTC
@@ -727,6 +1087,8 @@ def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
         ax.plot(forecast_data['Date'], forecast_values,
                 linewidth=3, linestyle='--', color='#FF0000',
                 label='3-Month Forecast', alpha=0.9)
+        if intervals is not None:
+            plot_prediction_intervals(ax, intervals['BTC_Volume'])
 
         ax.set_xlabel('Date', fontsize=12, fontweight='bold')
         ax.set_ylabel('Trading Volume (BTC)', fontsize=12, fontweight='bold')
@@ -765,6 +1127,10 @@ def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
         ax1.plot(forecast_data['Date'], forecast_values,
                  linewidth=3, linestyle='--', color='#FF0000',
                  label='3-Month Forecast', alpha=0.9)
+        if intervals is not None:
+            plot_prediction_intervals(ax1, intervals['BRICS_Gold_Qty_kg'])
+        plot_partial_months(ax1, gold_qty_forecast, 'BRICS_Gold_Qty_kg',
+                            'BRICS_Gold_Is_Partial')
 
         ax1.set_xlabel('Date', fontsize=11, fontweight='bold')
         ax1.set_ylabel('Quantity (kg)', fontsize=11, fontweight='bold')
@@ -792,6 +1158,10 @@ def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
         ax2.plot(forecast_data['Date'], forecast_values,
                  linewidth=3, linestyle='--', color='#FF0000',
                  label='3-Month Forecast', alpha=0.9)
+        if intervals is not None:
+            plot_prediction_intervals(ax2, intervals['BRICS_Gold_Value_USD'])
+        plot_partial_months(ax2, gold_val_forecast, 'BRICS_Gold_Value_USD',
+                            'BRICS_Gold_Is_Partial')
 
         ax2.set_xlabel('Date', fontsize=11, fontweight='bold')
         ax2.set_ylabel('Value (USD)', fontsize=11, fontweight='bold')
@@ -830,6 +1200,10 @@ def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
         ax1.plot(forecast_data['Date'], forecast_values,
                  linewidth=3, linestyle='--', color='#FF0000',
                  label='3-Month Forecast', alpha=0.9)
+        if intervals is not None:
+            plot_prediction_intervals(ax1, intervals['BRICS_Oil_Qty_kg'])
+        plot_partial_months(ax1, oil_qty_forecast, 'BRICS_Oil_Qty_kg',
+                            'BRICS_Oil_Is_Partial')
 
         ax1.set_xlabel('Date', fontsize=11, fontweight='bold')
         ax1.set_ylabel('Quantity (kg)', fontsize=11, fontweight='bold')
@@ -857,6 +1231,10 @@ def create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
         ax2.plot(forecast_data['Date'], forecast_values,
                  linewidth=3, linestyle='--', color='#FF0000',
                  label='3-Month Forecast', alpha=0.9)
+        if intervals is not None:
+            plot_prediction_intervals(ax2, intervals['BRICS_Oil_Value_USD'])
+        plot_partial_months(ax2, oil_val_forecast, 'BRICS_Oil_Value_USD',
+                            'BRICS_Oil_Is_Partial')
 
         ax2.set_xlabel('Date', fontsize=11, fontweight='bold')
         ax2.set_ylabel('Value (USD)', fontsize=11, fontweight='bold')
@@ -887,73 +1265,143 @@ def main():
     """
     Main function to generate all prediction figures as PDFs.
     """
-    print("=" * 70)
-    print("GENERATING PREDICTION FIGURES AS PDFs")
-    print("=" * 70)
-
     # File paths
     btc_path = 'Btc_5y_Cleaned.csv'
     gold_path = 'Gold_TradeData_Cleaned.csv'
     oil_path = 'Oil_TradeData_Cleaned.csv'
 
-    print("\n[1/9] Loading and processing data...")
-    btc_monthly, gold_brics_monthly, oil_brics_monthly = load_and_process_data(
-        btc_path, gold_path, oil_path)
+    # CSV loading backend: 'pandas' or 'polars' (multithreaded, needs Polars)
+    backend = DEFAULT_BACKEND
 
-    print(f"   BTC data: {len(btc_monthly)} months")
-    print(f"   Gold BRICS data: {len(gold_brics_monthly)} months")
-    print(f"   Oil BRICS data: {len(oil_brics_monthly)} months")
-
-    print("\n[2/9] Creating BTC forecast figure...")
-    plot_btc_forecast(btc_monthly, 'Fig1_btc_forecast.pdf')
+    # 'publication' (300 DPI PDFs) or 'draft' (PNG thumbnails, --draft)
+    render_mode = 'draft' if '--draft' in sys.argv[1:] else DEFAULT_RENDER_MODE
 
-    print("\n[3/9] Creating Gold BRICS forecast figure...")
-    plot_gold_forecast(gold_brics_monthly, 'Fig2_gold_brics_forecast.pdf')
+    print("=" * 70)
+    print(f"GENERATING PREDICTION FIGURES AS {RENDER_SETTINGS[render_mode]['format'].upper()}s")
+    print("=" * 70)
 
-    print("\n[4/9] Creating Oil BRICS forecast figure...")
-    plot_oil_forecast(oil_brics_monthly, 'Fig3_oil_brics_forecast.pdf')
+    print("\n[1/13] Loading and processing data...")
+    btc_monthly, gold_brics_monthly, oil_brics_monthly, inputs = load_and_process_data(
+        btc_path, gold_path, oil_path, backend=backend, return_inputs=True)
 
-    print("\n[5/9] Creating individual time series figures...")
-    plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly)
+    print(f"   BTC data: {len(btc_monthly)} months")
+    print(f"   Gold BRICS data: {len(gold_brics_monthly)} months")
+    print(f"   Oil BRICS data: {len(oil_brics_monthly)} months")
 
-    print("\n[6/9] Creating comparative analysis chart...")
-    plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly)
+    forecast_series = {
+        'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume'],
+        'BRICS_Gold_Qty_kg': gold_brics_monthly.set_index('Date')['BRICS_Gold_Qty_kg'],
+        'BRICS_Gold_Value_USD': gold_brics_monthly.set_index('Date')['BRICS_Gold_Value_USD'],
+        'BRICS_Oil_Qty_kg': oil_brics_monthly.set_index('Date')['BRICS_Oil_Qty_kg'],
+        'BRICS_Oil_Value_USD': oil_brics_monthly.set_index('Date')['BRICS_Oil_Value_USD'],
+    }
+    # Intervals are fitted on the regime after the last structural break
+    fit_series, breaks = fit_series_for_mode(forecast_series, DEFAULT_REGIME_MODE)
+    forecast_intervals = compute_forecast_intervals(fit_series, n_forecast=3, method='block')
+
+    # Reporter -> bloc -> world forecasts, reconciled to add up (late
+    # reporters nowcast and absent ones imputed, like the bloc series)
+    reporter_panel = pd.concat([
+        build_reporter_panel(inputs['imputed_trade']['Gold'],
+                             {'qty': 'Gold_Qty_kg', 'primaryValue': 'Gold_Value_USD'}),
+        build_reporter_panel(inputs['imputed_trade']['Oil'],
+                             {'qty': 'Oil_Qty_kg', 'primaryValue': 'Oil_Value_USD'}),
+    ]).fillna(0.0)
+    reconciled = reconcile_hierarchy(reporter_panel)
+    brics_reconciled = bloc_forecasts(reconciled, 'BRICS')
+
+    btc_daily = inputs['btc_daily']
+    shares_monthly = compute_currency_shares(btc_daily, freq='M')
+    usd_share = summarize_currency_share(
+        shares_monthly, forecast_currency_shares(shares_monthly), 'USD')
+
+    print("\n[2/13] Creating BTC forecast figure...")
+    plot_btc_forecast(btc_monthly, 'Fig1_btc_forecast.pdf', usd_share=usd_share,
+                      intervals=forecast_intervals, render_mode=render_mode, breaks=breaks)
+
+    print("\n[3/13] Creating Gold BRICS forecast figure...")
+    plot_gold_forecast(gold_brics_monthly, 'Fig2_gold_brics_forecast.pdf',
+                       intervals=forecast_intervals, render_mode=render_mode, breaks=breaks,
+                       reconciled=brics_reconciled)
+
+    print("\n[4/13] Creating Oil BRICS forecast figure...")
+    plot_oil_forecast(oil_brics_monthly, 'Fig3_oil_brics_forecast.pdf',
+                      intervals=forecast_intervals, render_mode=render_mode, breaks=breaks,
+                      reconciled=brics_reconciled)
+
+    print("\n[5/13] Creating individual time series figures...")
+    plot_reserves_time_series(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                              render_mode=render_mode, breaks=breaks)
+
+    print("\n[6/13] Creating comparative analysis chart...")
+    plot_comparative_chart(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                           render_mode=render_mode)
+
+    print("\n[7/13] Creating comparative forecast chart...")
+    plot_comparative_forecast(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                              render_mode=render_mode)
+
+    print("\n[8/13] Creating combined PDF with all predictions...")
+    create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
+                       'Fig9_all_predictions_combined.pdf',
+                       intervals=forecast_intervals, render_mode=render_mode)
+
+    print("\n[9/13] Creating BTC multi-frequency forecast figure...")
+    plot_btc_frequency_forecast(btc_daily, 'Fig10_btc_multi_frequency_forecast.pdf',
+                                render_mode=render_mode)
+
+    print("\n[10/13] Creating reconciled BRICS forecast figure...")
+    plot_reconciled_forecast(reconciled, 'Fig11_reconciled_brics_forecast.pdf',
+                             render_mode=render_mode)
+
+    print("\n[11/13] Creating cross-correlation heatmap...")
+    correlation = lagged_cross_correlation(align_monthly(forecast_series))
+    output_path = plot_correlation_heatmap(
+        correlation, os.path.join(FIGURES_DIR, 'Fig12_cross_correlation.pdf'),
+        title='BTC, Gold and Oil Lead-Lag Cross-Correlation (monthly log changes)',
+        render_mode=render_mode)
+    print(f"   Created: {output_path}")
 
-    print("\n[7/9] Creating comparative forecast chart...")
-    plot_comparative_forecast(btc_monthly, gold_brics_monthly, oil_brics_monthly)
+    print("\n[12/13] Creating price / volume decomposition figure...")
+    plot_price_volume(price_volume_decomposition(inputs['trade']),
+                      'Fig13_price_volume.pdf', render_mode=render_mode)
 
-    print("\n[8/9] Creating combined PDF with all predictions...")
-    create_combined_pdf(btc_monthly, gold_brics_monthly, oil_brics_monthly,
-                       'Fig9_all_predictions_combined.pdf')
+    print("\n[13/13] Summary complete!")
 
-    print("\n[9/9] Summary complete!")
+    settings = RENDER_SETTINGS[render_mode]
+    extension = settings['format']
+    skipped = DRAFT_SKIPPED_FIGURES if render_mode == 'draft' else ()
+    output_dir = os.path.dirname(
+        figure_path(os.path.join(FIGURES_DIR, 'Fig1_btc_forecast.pdf'), render_mode))
 
     print("\n" + "=" * 70)
-    print("SUCCESS! All prediction figures generated as PDFs")
+    print(f"SUCCESS! All prediction figures generated as {extension.upper()}s"
+          + (" (draft mode)" if render_mode == 'draft' else ""))
     print("=" * 70)
-    print(f"\nOutput directory: {FIGURES_DIR}")
+    print(f"\nOutput directory: {output_dir}")
     print("\nGenerated files:")
-    print("\n  FORECAST FIGURES (with 3-month predictions):")
-    print("  1. Fig1_btc_forecast.pdf - Bitcoin trading volume forecast")
-    print("  2. Fig2_gold_brics_forecast.pdf - BRICS gold imports forecast (2 charts)")
-    print("  3. Fig3_oil_brics_forecast.pdf - BRICS oil imports forecast (2 charts)")
-    print("\n  TIME SERIES FIGURES (historical trends):")
-    print("  4. Fig4_btc_reserves_timeseries.pdf - BTC volume over time")
-    print("  5. Fig5_gold_reserves_timeseries.pdf - Gold imports over time")
-    print("  6. Fig6_oil_reserves_timeseries.pdf - Oil imports over time")
-    print("\n  COMPARATIVE ANALYSIS:")
-    print("  7. Fig7_comparative_analysis.pdf - All three commodities compared (normalized)")
-    print("  8. Fig8_comparative_forecast.pdf - All three commodities with 3-month forecasts")
-    print("\n  COMBINED DOCUMENT:")
-    print("  9. Fig9_all_predictions_combined.pdf - All forecasts in one PDF")
-    print("\nTotal: 9 PDF files generated")
+    generated = 0
+    for section, figures in SUMMARY_FIGURES:
+        print(f"\n  {section}:")
+        for number, (filename, description) in enumerate(figures, generated + 1):
+            name = f"{os.path.splitext(filename)[0]}.{extension}"
+            if filename in skipped:
+                print(f"  {number}. {filename} - skipped in draft mode")
+            else:
+                print(f"  {number}. {name} - {description}")
+        generated += len(figures)
+    print(f"\nTotal: {generated - len(skipped)} {extension.upper()} files generated"
+          + (f" ({len(skipped)} skipped in draft mode)" if skipped else ""))
     print("\nAll figures include:")
     print("    - Historical data (solid lines with markers)")
+    print("    - 50/80/95% bootstrap prediction intervals (shaded bands)")
     print("    - Statistical information (mean, std dev, trends)")
-    print("    - Professional formatting for publication")
-    print("    - High resolution (300 DPI) for printing")
+    if render_mode == 'draft':
+        print(f"    - Low resolution ({settings['dpi']} DPI) thumbnails for quick review")
+    else:
+        print("    - Professional formatting for publication")
+        print(f"    - High resolution ({settings['dpi']} DPI) for printing")
     print("=" * 70)
 
-
 if __name__ == '__main__':
     main()
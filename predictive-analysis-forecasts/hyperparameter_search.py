@@ -0,0 +1,344 @@
+"""
+Forecast Model Hyperparameter Search
+Tunes the forecasting model per series instead of using the fixed 3-month
+moving average everywhere.
+
+Candidate models (SEARCH_GRID):
+- sma:      simple moving average of the last `window` months
+- ema:      exponential moving average with smoothing `alpha`
+- seasonal: average of the same calendar month over the last `years` years
+
+Every candidate is scored by rolling-origin evaluation: from each origin
+month the model forecasts the next `horizon` months using only data up to
+the origin, and the mean absolute error over all origins and horizons
+decides. All candidates of a series are scored on the same origins.
+
+Each series' cumulative sums (plain and seasonal) are computed once and
+shared by every window / year candidate, so a whole family is scored with
+a few array operations. Families and series are spread over a process
+pool. The best configuration per series is stored in a JSON file with a
+fingerprint (SHA-1 of the series' dates and values, the horizon, the
+search grid and the caller's fit settings such as regime mode and
+seasonal adjustment) and reused on the next run only while the
+fingerprint matches.
+
+Usage:
+    from hyperparameter_search import load_or_search_configs, forecast_from_config
+
+    configs = load_or_search_configs(
+        {'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume']},
+        n_workers=4)
+    forecast = forecast_from_config(values, configs['BTC_Volume'], n_forecast=3)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from run_state import run_tasks
+
+
+SEARCH_GRID = {
+    'sma': {'window': list(range(2, 13))},
+    'ema': {'alpha': [round(float(a), 1) for a in np.arange(0.1, 1.0, 0.1)]},
+    'seasonal': {'years': [1, 2, 3]},
+}
+
+SEASON_LENGTH = 12
+BASELINE_CONFIG = {'model': 'sma', 'window': 3}
+CONFIG_PATH = 'forecast_model_config.json'
+
+# Minimum number of rolling origins a candidate needs to be considered
+MIN_ORIGINS = 6
+
+
+def _required_history(model, value):
+    """Months of history a candidate needs before its first forecast."""
+    if model == 'sma':
+        return value
+    if model == 'seasonal':
+        return SEASON_LENGTH * value
+    return 1
+
+
+def _prepare_series(values, horizon):
+    """
+    Precompute everything the candidate evaluators share for one series.
+
+    Returns:
+        Dict with the values, plain and seasonal cumulative sums, the
+        rolling origins and the (origins x horizon) matrix of targets
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    # Seasonal cumulative sum: seasonal_csum[t] = x[t] + x[t-12] + ...,
+    # padded with one season of zeros in front
+    seasonal_csum = np.zeros(n + SEASON_LENGTH)
+    for t in range(n):
+        seasonal_csum[t + SEASON_LENGTH] = values[t] + seasonal_csum[t]
+
+    # Origins shared by every candidate that fits the series
+    requirements = [_required_history(model, v)
+                    for model, grid in SEARCH_GRID.items()
+                    for v in next(iter(grid.values()))]
+    usable = [r for r in requirements if n - r >= MIN_ORIGINS]
+    first_origin = max(usable) if usable else n
+    origins = np.arange(first_origin, n)
+
+    # targets[o, h] = x[origin + h] (NaN beyond the end of the series)
+    target_idx = origins[:, None] + np.arange(horizon)
+    targets = np.where(target_idx < n, values[np.minimum(target_idx, n - 1)], np.nan)
+
+    return {
+        'values': values,
+        'csum': csum,
+        'seasonal_csum': seasonal_csum,
+        'first_origin': first_origin,
+        'origins': origins,
+        'target_idx': target_idx,
+        'targets': targets,
+    }
+
+
+def _score(forecasts, targets):
+    """Mean absolute error over all valid (origin, horizon) cells."""
+    errors = np.abs(forecasts - targets)
+    return np.nanmean(errors, axis=(-2, -1))
+
+
+def _evaluate_sma(prepared, windows):
+    csum, origins = prepared['csum'], prepared['origins']
+    windows = np.asarray(windows)
+    # (windows x origins) mean of the last w values before each origin
+    levels = (csum[origins][None, :] - csum[origins[None, :] - windows[:, None]]) \
+        / windows[:, None]
+    return _score(levels[:, :, None], prepared['targets'][None])
+
+
+def _evaluate_ema(prepared, alphas):
+    values, origins = prepared['values'], prepared['origins']
+    alphas = np.asarray(alphas)[:, None]
+    # Level after each month, for every alpha at once
+    levels = np.empty((len(alphas), len(values)))
+    levels[:, 0] = values[0]
+    for t in range(1, len(values)):
+        levels[:, t] = alphas[:, 0] * values[t] + (1 - alphas[:, 0]) * levels[:, t - 1]
+    return _score(levels[:, origins - 1][:, :, None], prepared['targets'][None])
+
+
+def _evaluate_seasonal(prepared, years):
+    seasonal_csum, target_idx = prepared['seasonal_csum'], prepared['target_idx']
+    scores = []
+    for k in years:
+        # Mean of x[t-12], ..., x[t-12k] from the seasonal cumulative sums
+        upper = target_idx                           # sum up to x[t-12]
+        lower = target_idx - SEASON_LENGTH * k       # minus sum up to x[t-12(k+1)]
+        valid = lower >= 0
+        forecasts = np.where(
+            valid,
+            (seasonal_csum[np.clip(upper, 0, len(seasonal_csum) - 1)]
+             - seasonal_csum[np.clip(lower, 0, len(seasonal_csum) - 1)]) / k,
+            np.nan)
+        scores.append(_score(forecasts, prepared['targets']))
+    return np.array(scores)
+
+
+EVALUATORS = {
+    'sma': _evaluate_sma,
+    'ema': _evaluate_ema,
+    'seasonal': _evaluate_seasonal,
+}
+
+
+def series_fingerprint(series, horizon, fit_settings=None):
+    """
+    Fingerprint of everything a series' search result depends on.
+
+    Args:
+        series: pandas Series indexed by Date (NaN months dropped)
+        horizon: Forecast horizon (months) scored at each origin
+        fit_settings: Optional dict of settings that shaped the series
+                      (e.g. regime mode, seasonal adjustment)
+
+    Returns:
+        Hex SHA-1 string
+    """
+    series = series.dropna().sort_index()
+    settings = json.dumps({'horizon': horizon, 'grid': SEARCH_GRID,
+                           'min_origins': MIN_ORIGINS, 'fit': fit_settings or {}},
+                          sort_keys=True, default=str)
+    digest = hashlib.sha1(settings.encode())
+    digest.update(series.index.to_numpy(dtype='datetime64[ns]').tobytes())
+    digest.update(series.to_numpy(dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _evaluate_family(args):
+    """
+    Process-pool entry point: score one model family on one series.
+
+    Returns:
+        Tuple of (series name, list of (config, mae))
+    """
+    name, prepared, model = args
+    param, candidates = next(iter(SEARCH_GRID[model].items()))
+    candidates = [c for c in candidates
+                  if _required_history(model, c) <= prepared['first_origin']]
+    if not candidates or not len(prepared['origins']):
+        return name, []
+    maes = EVALUATORS[model](prepared, candidates)
+    return name, [({'model': model, param: c}, float(mae))
+                  for c, mae in zip(candidates, maes)]
+
+
+def search_best_configs(series_by_name, horizon=3, n_workers=1, run_store=None,
+                        fit_settings=None):
+    """
+    Run the rolling-origin grid search for every series.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        horizon: Forecast horizon (months) scored at each origin
+        n_workers: Number of worker processes (1 = run in this process)
+        run_store: Optional run-state SQLite file; scored families are
+                   checkpointed there and skipped when the search is rerun
+        fit_settings: Optional dict of settings that shaped the series,
+                      included in the fingerprint
+
+    Returns:
+        Dict mapping name to its best configuration record (model settings,
+        MAE, baseline 3-MA MAE, number of origins, observations, last date
+        and fingerprint from series_fingerprint())
+    """
+    clean = {name: s.dropna().sort_index() for name, s in series_by_name.items()}
+    prepared = {name: _prepare_series(s.to_numpy(dtype=float), horizon)
+                for name, s in clean.items()}
+    tasks = [(name, prepared[name], model)
+             for name in clean for model in SEARCH_GRID]
+
+    if run_store is not None:
+        results = run_tasks(_evaluate_family, tasks, 'hyperparameter_search',
+                            run_store, n_workers)
+    elif n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_evaluate_family, tasks))
+    else:
+        results = [_evaluate_family(task) for task in tasks]
+
+    scored = {name: [] for name in clean}
+    for name, candidates in results:
+        scored[name].extend(candidates)
+
+    best = {}
+    for name, candidates in scored.items():
+        series = clean[name]
+        baseline = [mae for config, mae in candidates if config == BASELINE_CONFIG]
+        candidates = [(c, m) for c, m in candidates if np.isfinite(m)]
+        config, mae = min(candidates, key=lambda item: item[1]) \
+            if candidates else (dict(BASELINE_CONFIG), np.nan)
+        best[name] = dict(config, **{
+            'mae': mae,
+            'baseline_mae': baseline[0] if baseline else np.nan,
+            'n_origins': int(len(prepared[name]['origins'])),
+            'n_obs': int(len(series)),
+            'last_date': series.index.max().strftime('%Y-%m-%d'),
+            'fingerprint': series_fingerprint(series, horizon, fit_settings),
+        })
+    return best
+
+
+def load_or_search_configs(series_by_name, config_path=CONFIG_PATH, horizon=3,
+                           n_workers=1, refresh=False, run_store=None, fit_settings=None):
+    """
+    Reuse stored best configurations, searching only where needed.
+
+    A stored configuration is reused when its fingerprint (series values,
+    horizon, search grid and fit settings) is unchanged; otherwise (or with
+    refresh=True) the series is searched again and the file is updated.
+
+    Args:
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        config_path: JSON file holding the best configuration per series
+        horizon: Forecast horizon (months) scored at each origin
+        n_workers: Number of worker processes for the search
+        refresh: Ignore stored configurations and search every series
+        run_store: Optional run-state SQLite file for the search
+        fit_settings: Optional dict of settings that shaped the series
+                      (e.g. {'regime_mode': 'post_break'})
+
+    Returns:
+        Dict mapping name to its best configuration record
+    """
+    stored = {}
+    if os.path.exists(config_path) and not refresh:
+        with open(config_path) as f:
+            stored = json.load(f)
+
+    configs, stale = {}, {}
+    for name, series in series_by_name.items():
+        series = series.dropna()
+        record = stored.get(name)
+        if record and record.get('fingerprint') == \
+                series_fingerprint(series, horizon, fit_settings):
+            configs[name] = record
+        else:
+            stale[name] = series
+
+    if stale:
+        configs.update(search_best_configs(stale, horizon=horizon, n_workers=n_workers,
+                                           run_store=run_store, fit_settings=fit_settings))
+        stored.update({name: configs[name] for name in stale})
+        with open(config_path, 'w') as f:
+            json.dump(stored, f, indent=2, default=float)
+
+    return {name: configs[name] for name in series_by_name}
+
+
+def describe_config(config):
+    """
+    Short label for a configuration record.
+
+    Args:
+        config: Dict with 'model' and its parameter
+
+    Returns:
+        String such as '5-Month SMA', 'EMA (alpha=0.3)' or 'Seasonal (2-year avg)'
+    """
+    if config['model'] == 'sma':
+        return f"{config['window']}-Month SMA"
+    if config['model'] == 'ema':
+        return f"EMA (alpha={config['alpha']:.1f})"
+    return f"Seasonal ({config['years']}-year avg)"
+
+
+def forecast_from_config(values, config, n_forecast=3):
+    """
+    Forecast the next months of a series with a tuned configuration.
+
+    Args:
+        values: 1D array of monthly values (oldest first, no gaps)
+        config: Configuration record from load_or_search_configs()
+        n_forecast: Number of months to forecast
+
+    Returns:
+        numpy array of n_forecast forecast values
+    """
+    values = np.asarray(values, dtype=float)
+    if config['model'] == 'sma':
+        return np.full(n_forecast, values[-config['window']:].mean())
+    if config['model'] == 'ema':
+        level = values[0]
+        for value in values[1:]:
+            level = config['alpha'] * value + (1 - config['alpha']) * level
+        return np.full(n_forecast, level)
+
+    n = len(values)
+    return np.array([
+        np.mean([values[t - SEASON_LENGTH * j] for j in range(1, config['years'] + 1)
+                 if t - SEASON_LENGTH * j >= 0])
+        for t in range(n, n + n_forecast)])
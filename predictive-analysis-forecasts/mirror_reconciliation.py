@@ -0,0 +1,344 @@
+"""
+Mirror-Statistics Reconciliation
+Compares the imports a country reports with the exports its partners
+report to it (mirror flows) and builds one reconciled estimate per flow,
+instead of taking reporter imports at face value.
+
+Both sides are keyed on (importer, exporter, HS code, month):
+
+    imports:  importer = reporterISO, exporter = partner
+    exports:  importer = partner,     exporter = reporterISO
+
+The four key fields are factorized once (countries share one code table)
+and packed into a single int64 key, so duplicate rows are summed with
+np.bincount and the two sides are full-outer-joined through one hash
+table (pandas factorize) instead of a four-column merge. Memory and time
+grow linearly with the rows, which keeps full bilateral extracts with
+tens of millions of rows in reach.
+
+Per matched flow:
+- Discrepancy_Ratio = import value / (export value * CIF_FOB_FACTOR);
+  imports are valued CIF, exports FOB
+- reporter reliability: 1 / (median |log ratio| of everything a country
+  reported on that side)^2, floored at MIN_DISCREPANCY, so a country whose
+  figures rarely match its partners' gets little weight
+- Reconciled_Value = w * imports + (1 - w) * CIF exports, with w the
+  importer's reliability over the sum of both reliabilities; flows only
+  one side reported use that side (Source 'import' or 'mirror')
+- quantities are reconciled with the same weights (no CIF adjustment)
+
+Countries are matched on codes, so the extracts need partnerISO (see
+DATA_SETUP.md) and, besides the Import rows, the Export rows the partners
+reported.
+
+Usage:
+    from mirror_reconciliation import reconcile_mirror_flows
+
+    pairs, reliability = reconcile_mirror_flows(bilateral_df)
+
+    python mirror_reconciliation.py [output.csv]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from partner_network import country_partner_rows, load_bilateral_frames, BILATERAL_SOURCES
+from reconciliation import BLOCS
+from reporter_imputation import CIF_FOB_FACTOR
+
+
+# Floor of the median absolute log discrepancy (a perfect reporter would
+# otherwise get infinite weight)
+MIN_DISCREPANCY = 0.02
+
+# Matched flows whose sides differ by more than this factor are flagged
+MAX_RATIO = 2.0
+
+# Matched flows a country needs for its own reliability; others get the median
+MIN_MATCHED = 5
+
+PAIR_COLUMNS = ['Importer', 'Exporter', 'cmdCode', 'Date', 'Import_Value', 'Export_Value',
+                'Import_Qty', 'Export_Qty', 'Discrepancy_Ratio', 'Log_Discrepancy',
+                'Large_Discrepancy', 'Import_Weight', 'Reconciled_Value',
+                'Reconciled_Qty', 'Source']
+
+
+def _side_arrays(trade_df, flow):
+    """Importer, exporter, HS code, month and measures of one reported side."""
+    df, partner = country_partner_rows(trade_df, flow)
+    reporter = df['reporterISO'].to_numpy()
+    partner = partner.to_numpy()
+    dates = pd.to_datetime(df['refDate'])
+    return {
+        'importer': reporter if flow == 'Import' else partner,
+        'exporter': partner if flow == 'Import' else reporter,
+        'hs': df['cmdCode'].to_numpy(),
+        'month': (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(),
+        'value': df['primaryValue'].to_numpy(dtype=float),
+        'qty': np.nan_to_num(df['qty'].to_numpy(dtype=float)),
+    }
+
+
+def encode_flow_keys(imports, exports):
+    """
+    Pack (importer, exporter, HS code, month) of both sides into int64 keys.
+
+    Args:
+        imports: Dict from _side_arrays(..., 'Import')
+        exports: Dict from _side_arrays(..., 'Export')
+
+    Returns:
+        Tuple of (import keys, export keys, decoder dict with the code
+        tables 'countries', 'hs', 'month0' and the radices)
+    """
+    n_imp = len(imports['value'])
+    countries = np.concatenate([imports['importer'], imports['exporter'],
+                                exports['importer'], exports['exporter']])
+    country_codes, country_table = pd.factorize(countries)
+    hs_codes, hs_table = pd.factorize(np.concatenate([imports['hs'], exports['hs']]))
+    months = np.concatenate([imports['month'], exports['month']])
+    month0 = months.min() if len(months) else 0
+
+    n_country, n_hs = len(country_table), len(hs_table)
+    n_month = int(months.max() - month0 + 1) if len(months) else 1
+    if n_country ** 2 * n_hs * n_month >= np.iinfo(np.int64).max:
+        raise ValueError("Flow key space does not fit in int64")
+
+    n_exp = len(exports['value'])
+    imp_end, exp_start = 2 * n_imp, 2 * n_imp + n_exp
+    importer = np.concatenate([country_codes[:n_imp], country_codes[imp_end:exp_start]])
+    exporter = np.concatenate([country_codes[n_imp:imp_end], country_codes[exp_start:]])
+    keys = ((importer.astype(np.int64) * n_country + exporter) * n_hs + hs_codes) * n_month \
+        + (months - month0)
+    decoder = {'countries': np.asarray(country_table), 'hs': np.asarray(hs_table),
+               'month0': month0, 'n_country': n_country, 'n_hs': n_hs, 'n_month': n_month}
+    return keys[:n_imp], keys[n_imp:], decoder
+
+
+def decode_flow_keys(keys, decoder):
+    """
+    Unpack int64 flow keys.
+
+    Args:
+        keys: Keys from encode_flow_keys()
+        decoder: Decoder dict from encode_flow_keys()
+
+    Returns:
+        Dict with 'importer', 'exporter', 'hs' and 'date' arrays
+    """
+    rest, month = np.divmod(keys, decoder['n_month'])
+    rest, hs = np.divmod(rest, decoder['n_hs'])
+    importer, exporter = np.divmod(rest, decoder['n_country'])
+    month = month + decoder['month0']
+    return {
+        'importer': decoder['countries'][importer],
+        'exporter': decoder['countries'][exporter],
+        'hs': decoder['hs'][hs],
+        'date': pd.to_datetime({'year': month // 12, 'month': month % 12 + 1, 'day': 1}),
+    }
+
+
+def join_flows(import_keys, export_keys, imports, exports):
+    """
+    Hashed full outer join of both sides on their flow keys.
+
+    Args:
+        import_keys, export_keys: Keys from encode_flow_keys()
+        imports, exports: Dicts from _side_arrays() (duplicates are summed)
+
+    Returns:
+        Tuple of (unique keys, dict of summed 'import_value', 'export_value',
+        'import_qty', 'export_qty', NaN where a side did not report)
+    """
+    codes, unique_keys = pd.factorize(np.concatenate([import_keys, export_keys]))
+    n_keys, n_imp = len(unique_keys), len(import_keys)
+    imp_codes, exp_codes = codes[:n_imp], codes[n_imp:]
+
+    def side_sum(side_codes, values):
+        total = np.bincount(side_codes, weights=values, minlength=n_keys)
+        present = np.bincount(side_codes, minlength=n_keys) > 0
+        return np.where(present, total, np.nan)
+
+    joined = {
+        'import_value': side_sum(imp_codes, imports['value']),
+        'export_value': side_sum(exp_codes, exports['value']),
+        'import_qty': side_sum(imp_codes, imports['qty']),
+        'export_qty': side_sum(exp_codes, exports['qty']),
+    }
+    return np.asarray(unique_keys), joined
+
+
+def reporter_reliability(country, log_discrepancy, min_matched=MIN_MATCHED,
+                         floor=MIN_DISCREPANCY):
+    """
+    Reliability weight of each country from its matched discrepancies.
+
+    Args:
+        country: Reporting country of every matched flow
+        log_discrepancy: Log discrepancy ratio of every matched flow
+        min_matched: Matched flows needed for an own estimate
+        floor: Floor of the median absolute log discrepancy
+
+    Returns:
+        DataFrame indexed by country with Matched_Flows,
+        Median_Abs_Log_Discrepancy and Reliability
+    """
+    frame = pd.DataFrame({'Country': country, 'Abs': np.abs(log_discrepancy)})
+    stats = frame.groupby('Country')['Abs'].agg(['size', 'median'])
+    stats.columns = ['Matched_Flows', 'Median_Abs_Log_Discrepancy']
+    overall = float(np.median(np.abs(log_discrepancy))) if len(log_discrepancy) else floor
+    scale = stats['Median_Abs_Log_Discrepancy'].where(stats['Matched_Flows'] >= min_matched,
+                                                      overall)
+    stats['Reliability'] = 1.0 / np.maximum(scale, floor) ** 2
+    return stats
+
+
+def reconcile_mirror_flows(trade_df, cif_fob=CIF_FOB_FACTOR, max_ratio=MAX_RATIO):
+    """
+    Match reported imports with partner-reported exports and reconcile them.
+
+    Args:
+        trade_df: Bilateral Comtrade DataFrame with Import and Export rows
+        cif_fob: CIF / FOB factor applied to export values
+        max_ratio: Discrepancy factor above which matched flows are flagged
+
+    Returns:
+        Tuple of (flow DataFrame with PAIR_COLUMNS, reliability DataFrame
+        indexed by (Side, Country))
+    """
+    imports = _side_arrays(trade_df, 'Import')
+    exports = _side_arrays(trade_df, 'Export')
+    import_keys, export_keys, decoder = encode_flow_keys(imports, exports)
+    keys, joined = join_flows(import_keys, export_keys, imports, exports)
+    fields = decode_flow_keys(keys, decoder)
+
+    imp_value, exp_value = joined['import_value'], joined['export_value'] * cif_fob
+    matched = np.isfinite(imp_value) & np.isfinite(exp_value)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(matched, imp_value / exp_value, np.nan)
+    log_ratio = np.log(ratio)
+
+    importer_rel = reporter_reliability(fields['importer'][matched], log_ratio[matched])
+    exporter_rel = reporter_reliability(fields['exporter'][matched], log_ratio[matched])
+    default = importer_rel['Reliability'].median() if len(importer_rel) else 1.0
+    w_imp = pd.Series(fields['importer']).map(importer_rel['Reliability']).fillna(default)
+    w_exp = pd.Series(fields['exporter']).map(exporter_rel['Reliability']).fillna(default)
+    weight = (w_imp / (w_imp + w_exp)).to_numpy()
+    weight = np.where(matched, weight, np.where(np.isfinite(imp_value), 1.0, 0.0))
+
+    def combine(imp, exp):
+        return np.where(matched, weight * imp + (1 - weight) * exp,
+                        np.where(np.isfinite(imp), imp, exp))
+
+    source = np.where(matched, 'both', np.where(np.isfinite(imp_value), 'import', 'mirror'))
+    pairs = pd.DataFrame({
+        'Importer': fields['importer'],
+        'Exporter': fields['exporter'],
+        'cmdCode': fields['hs'],
+        'Date': fields['date'].to_numpy(),
+        'Import_Value': imp_value,
+        'Export_Value': joined['export_value'],
+        'Import_Qty': joined['import_qty'],
+        'Export_Qty': joined['export_qty'],
+        'Discrepancy_Ratio': ratio,
+        'Log_Discrepancy': log_ratio,
+        'Large_Discrepancy': matched & (np.abs(log_ratio) > np.log(max_ratio)),
+        'Import_Weight': weight,
+        'Reconciled_Value': combine(imp_value, exp_value),
+        'Reconciled_Qty': combine(joined['import_qty'], joined['export_qty']),
+        'Source': source,
+    }, columns=PAIR_COLUMNS)
+    reliability = pd.concat({'Importer': importer_rel, 'Exporter': exporter_rel},
+                            names=['Side', 'Country'])
+    return pairs, reliability
+
+
+def has_mirror_flows(trade_df):
+    """Whether a bilateral extract has both reported imports and exports."""
+    flows = set(trade_df['flowDesc'].unique())
+    return {'Import', 'Export'} <= flows
+
+
+def bloc_mirror_summary(pairs, blocs=BLOCS):
+    """
+    Reported, mirror and reconciled imports per bloc and month.
+
+    Args:
+        pairs: Flow DataFrame from reconcile_mirror_flows()
+        blocs: Dict mapping bloc name to importer codes
+
+    Returns:
+        DataFrame with Bloc, Date, Reported_Imports, Mirror_Exports_CIF,
+        Reconciled_Imports, Reconciled_vs_Reported, Matched_Share and
+        Large_Discrepancies
+    """
+    frames = []
+    for bloc, members in blocs.items():
+        rows = pairs[pairs['Importer'].isin(members)]
+        matched = rows['Source'] == 'both'
+        grouped = pd.DataFrame({
+            'Reported_Imports': rows['Import_Value'],
+            'Mirror_Exports_CIF': rows['Export_Value'] * CIF_FOB_FACTOR,
+            'Reconciled_Imports': rows['Reconciled_Value'],
+            'Matched_Value': rows['Import_Value'].where(matched),
+            'Large_Discrepancies': rows['Large_Discrepancy'].astype(int),
+            'Date': rows['Date'],
+        }).groupby('Date').sum(min_count=1)
+        grouped['Reconciled_vs_Reported'] = \
+            grouped['Reconciled_Imports'] / grouped['Reported_Imports'] - 1
+        grouped['Matched_Share'] = grouped['Matched_Value'] / grouped['Reported_Imports']
+        frames.append(grouped.drop(columns='Matched_Value').reset_index().assign(Bloc=bloc))
+    columns = ['Bloc', 'Date', 'Reported_Imports', 'Mirror_Exports_CIF', 'Reconciled_Imports',
+               'Reconciled_vs_Reported', 'Matched_Share', 'Large_Discrepancies']
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
+def main():
+    """
+    Reconcile the bilateral extracts and write the flow table.
+
+    Usage:
+        python mirror_reconciliation.py [output.csv]
+    """
+    import time
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else 'Mirror_Reconciliation.csv'
+    frames = load_bilateral_frames()
+    if not frames:
+        print("No bilateral extracts found (expected "
+              f"{', '.join(BILATERAL_SOURCES.values())}); see DATA_SETUP.md")
+        return 1
+
+    tables = []
+    for commodity, df in frames.items():
+        if not has_mirror_flows(df):
+            print(f"   {commodity}: no Export rows to mirror, skipped")
+            continue
+        start = time.perf_counter()
+        pairs, reliability = reconcile_mirror_flows(df)
+        elapsed = time.perf_counter() - start
+        tables.append(pairs.assign(Commodity=commodity))
+
+        matched = pairs['Source'] == 'both'
+        summary = bloc_mirror_summary(pairs)
+        brics = summary[summary['Bloc'] == 'BRICS']
+        print(f"✓ {commodity}: {len(pairs):,} flows ({int(matched.sum()):,} matched, "
+              f"{int(pairs['Large_Discrepancy'].sum()):,} differ > {MAX_RATIO:g}x) "
+              f"in {elapsed:.2f} s")
+        if len(brics):
+            print(f"   BRICS reconciled vs reported imports: "
+                  f"{brics['Reconciled_Imports'].sum() / brics['Reported_Imports'].sum() - 1:+.1%}")
+
+    if not tables:
+        return 1
+    pd.concat(tables, ignore_index=True).to_csv(output_path, index=False, date_format='%Y-%m')
+    print(f"   Saved: {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
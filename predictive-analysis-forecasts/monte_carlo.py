@@ -0,0 +1,288 @@
+"""
+Monte Carlo Simulation of USD Dominance (Post-July 2027)
+Replaces the hand-picked "Probability: 75%" with a simulated probability.
+
+Each dominance index input is simulated forward to the target month:
+- USD share of BTC volume, US/EU gold and oil import ratios (logit scale)
+- BRICS gold and oil import quantities (log scale)
+
+Each series follows its fitted 3-month moving-average model. Future shocks
+are drawn from that model's one-step-ahead residuals. Residuals are
+resampled jointly by calendar month, so cross-series correlation is kept.
+At the target month every path gets a composite index (same scoring as
+dominance_index), and a configurable dominance rule decides whether USD
+remains dominant on that path.
+
+Paths are simulated in fixed-size chunks to cap memory. Each chunk has its
+own SeedSequence child, so results are reproducible and identical whether
+chunks run sequentially or across a process pool.
+
+Usage:
+    from monte_carlo import simulate_dominance_probability
+
+    result = simulate_dominance_probability(index_df, n_paths=1_000_000,
+                                            n_workers=4)
+    print(result['probability'], result['ci_low'], result['ci_high'])
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from dominance_index import DEFAULT_WEIGHTS, growth_score
+from run_state import run_tasks
+
+
+TARGET_DATE = '2027-07-01'
+
+# Simulated series: index_df column, transform, dominance index component
+SIMULATED_SERIES = {
+    'USD_BTC_Share': 'logit',
+    'Gold_US_EU_Ratio': 'logit',
+    'Oil_US_EU_Ratio': 'logit',
+    'BRICS_Gold_Qty_kg': 'log',
+    'BRICS_Oil_Qty_kg': 'log',
+}
+
+# Histogram bins used to report index percentiles without keeping every path
+INDEX_BINS = np.linspace(0, 100, 1001)
+
+
+def dominance_rule(index, components, index_threshold=50.0, btc_share_threshold=0.5):
+    """
+    Default dominance rule evaluated on every simulated path.
+
+    USD remains dominant when the composite index stays at or above
+    index_threshold and USD keeps a majority of BTC trading volume.
+
+    Args:
+        index: numpy array of composite index values (one per path)
+        components: Dict of simulated series values at the target month
+        index_threshold: Minimum composite index (0-100)
+        btc_share_threshold: Minimum USD share of BTC volume (0-1)
+
+    Returns:
+        Boolean numpy array (True = USD remains dominant)
+    """
+    return (index >= index_threshold) & \
+        (components['USD_BTC_Share'] >= btc_share_threshold)
+
+
+def describe_rule(rule):
+    """
+    Text of a dominance rule for reports, using the thresholds it applies.
+
+    Args:
+        rule: dominance_rule, a functools.partial of it with other
+              thresholds, or any other rule callable
+
+    Returns:
+        Description string (for other callables: their first docstring
+        line, or their name)
+    """
+    func = rule.func if isinstance(rule, partial) else rule
+    if func is dominance_rule and not (isinstance(rule, partial) and rule.args):
+        bound = inspect.signature(dominance_rule).bind_partial(
+            None, None, **(rule.keywords if isinstance(rule, partial) else {}))
+        bound.apply_defaults()
+        thresholds = bound.arguments
+        return (f"composite index >= {thresholds['index_threshold']:g} and USD share "
+                f"of BTC volume >= {thresholds['btc_share_threshold']:.0%}")
+    doc = inspect.getdoc(func)
+    return doc.splitlines()[0] if doc else getattr(func, '__name__', repr(rule))
+
+
+def _to_model_scale(values, transform):
+    clipped = np.clip(values, 1e-6, 1 - 1e-6) if transform == 'logit' \
+        else np.maximum(values, 1.0)
+    return np.log(clipped / (1 - clipped)) if transform == 'logit' else np.log(clipped)
+
+
+def _from_model_scale(values, transform):
+    return 1 / (1 + np.exp(-values)) if transform == 'logit' else np.exp(values)
+
+
+def prepare_simulation_inputs(index_df, target_date=TARGET_DATE, window=3):
+    """
+    Fit the moving-average model per series and collect its residuals.
+
+    Args:
+        index_df: DataFrame from compute_dominance_index()
+        target_date: Last simulated month
+        window: Moving-average window of the fitted model
+
+    Returns:
+        Dict with per-series history tails, start offsets, the joint
+        residual matrix (months x series) and the simulation calendar
+    """
+    target_date = pd.Timestamp(target_date)
+    history, last_dates, residuals = {}, {}, {}
+
+    for col, transform in SIMULATED_SERIES.items():
+        series = index_df[['Date', col]].dropna()
+        z = pd.Series(_to_model_scale(series[col].to_numpy(dtype=float), transform),
+                      index=series['Date'].to_numpy())
+        residuals[col] = z - z.rolling(window).mean().shift(1)
+        history[col] = z.to_numpy()
+        last_dates[col] = series['Date'].iloc[-1]
+
+    # Joint residual rows: months where every series has a residual
+    residual_matrix = pd.DataFrame(residuals).dropna().to_numpy()
+
+    start = min(last_dates.values()) + pd.DateOffset(months=1)
+    calendar = pd.date_range(start, target_date, freq='MS')
+    offsets = {col: int(np.searchsorted(calendar, d + pd.DateOffset(months=1)))
+               for col, d in last_dates.items()}
+
+    return {
+        'history': history,
+        'offsets': offsets,
+        'residuals': residual_matrix,
+        'calendar': calendar,
+        'window': window,
+    }
+
+
+def _simulate_chunk(inputs, n_paths, seed_seq, weights, rule):
+    """
+    Simulate one chunk of paths and apply the dominance rule.
+
+    Returns:
+        Tuple of (number of dominant paths, histogram of index values)
+    """
+    rng = np.random.default_rng(seed_seq)
+    window = inputs['window']
+    n_months = len(inputs['calendar'])
+    residuals = inputs['residuals']
+
+    # One joint residual row per calendar month and path (time-major, so
+    # each simulated month is a contiguous row)
+    draws = rng.integers(0, len(residuals), size=(n_months, n_paths))
+
+    finals, growth = {}, {}
+    for s, (col, transform) in enumerate(SIMULATED_SERIES.items()):
+        # 15 months of history covers the MA window and the YoY comparison
+        hist = inputs['history'][col][-15:]
+        offset = inputs['offsets'][col]
+        n_steps = n_months - offset
+
+        path = np.empty((len(hist) + n_steps, n_paths))
+        path[:len(hist)] = hist[:, None]
+        shocks = residuals[draws[offset:], s]
+        for step in range(n_steps):
+            t = len(hist) + step
+            path[t] = path[t - window:t].mean(axis=0) + shocks[step]
+
+        levels_last = _from_model_scale(path[-15:], transform)
+        finals[col] = levels_last[-1]
+        if transform == 'log':
+            # Same YoY rolling-3-month growth as dominance_index
+            growth[col] = levels_last[-3:].sum(axis=0) / levels_last[:3].sum(axis=0) - 1
+
+    scores = {
+        'btc_usd_share': finals['USD_BTC_Share'] * 100,
+        'gold_us_eu_ratio': finals['Gold_US_EU_Ratio'] * 100,
+        'oil_us_eu_ratio': finals['Oil_US_EU_Ratio'] * 100,
+        'gold_brics_growth': growth_score(growth['BRICS_Gold_Qty_kg']),
+        'oil_brics_growth': growth_score(growth['BRICS_Oil_Qty_kg']),
+    }
+    total_weight = sum(weights.values())
+    index = sum(scores[c] * w for c, w in weights.items()) / total_weight
+
+    dominant = rule(index, finals)
+    hist_counts, _ = np.histogram(index, bins=INDEX_BINS)
+    return int(dominant.sum()), hist_counts
+
+
+def _run_chunk(args):
+    """Process-pool entry point (top-level so it can be pickled)."""
+    return _simulate_chunk(*args)
+
+
+def wilson_interval(successes, n, z=1.96):
+    """
+    Wilson score confidence interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes
+        n: Number of trials
+        z: Normal quantile (1.96 = 95%)
+
+    Returns:
+        Tuple of (lower, upper) bounds
+    """
+    p = successes / n
+    denom = 1 + z ** 2 / n
+    centre = (p + z ** 2 / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return centre - half, centre + half
+
+
+def simulate_dominance_probability(index_df, target_date=TARGET_DATE,
+                                   n_paths=1_000_000, chunk_size=100_000,
+                                   rule=dominance_rule, weights=None,
+                                   seed=2027, n_workers=1, run_store=None,
+                                   rule_description=None):
+    """
+    Estimate the probability that USD remains dominant at the target month.
+
+    Args:
+        index_df: DataFrame from compute_dominance_index()
+        target_date: Month at which the dominance rule is evaluated
+        n_paths: Total number of simulated paths
+        chunk_size: Paths per chunk (caps peak memory)
+        rule: Callable(index, components) -> boolean array per path;
+              must be a top-level function when n_workers > 1
+        weights: Dict of index component weights (default DEFAULT_WEIGHTS)
+        seed: Root seed; each chunk gets its own spawned child seed
+        n_workers: Number of worker processes (1 = run in this process)
+        run_store: Optional run-state SQLite file; finished chunks are
+                   checkpointed there and skipped when the simulation is rerun
+        rule_description: Text of the rule for reports (default:
+                          describe_rule(rule))
+
+    Returns:
+        Dict with probability, 95% Wilson bounds, index percentiles at the
+        target month, the rule description and simulation settings
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    inputs = prepare_simulation_inputs(index_df, target_date)
+
+    chunk_sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        chunk_sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    tasks = [(inputs, size, seed_seq, weights, rule)
+             for size, seed_seq in zip(chunk_sizes, seeds)]
+
+    if run_store is not None:
+        results = run_tasks(_run_chunk, tasks, 'monte_carlo', run_store, n_workers)
+    elif n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_run_chunk, tasks))
+    else:
+        results = [_run_chunk(task) for task in tasks]
+
+    successes = sum(r[0] for r in results)
+    index_hist = np.sum([r[1] for r in results], axis=0)
+    ci_low, ci_high = wilson_interval(successes, n_paths)
+
+    # Percentiles of the simulated index from the pooled histogram
+    cdf = np.cumsum(index_hist) / index_hist.sum()
+    percentiles = {q: float(INDEX_BINS[1:][np.searchsorted(cdf, q / 100)].round(1))
+                   for q in (5, 50, 95)}
+
+    return {
+        'probability': successes / n_paths,
+        'ci_low': float(ci_low),
+        'ci_high': float(ci_high),
+        'n_paths': n_paths,
+        'target_date': pd.Timestamp(target_date),
+        'horizon_months': len(inputs['calendar']),
+        'index_percentiles': percentiles,
+        'rule_description': rule_description or describe_rule(rule),
+        'seed': seed,
+    }
@@ -0,0 +1,280 @@
+"""
+Reporting-Lag-Aware Nowcasting
+Comtrade reporters publish with different lags, so the latest months of a
+bloc total are missing some members and a plain groupby().sum() - and the
+tail(3) moving-average forecast built on it - is biased low.
+
+Per reporter x month (one row per reporter, one column per month):
+- completeness index: 1 = reported, 0 = expected but not (yet) reported,
+  NaN = not expected. A reporter is expected in a month when it reported
+  in at least REGULAR_SHARE of the BASELINE_MONTHS up to its last report
+  and that report is at most MAX_LAG months old.
+- nowcast: expected-but-missing cells within the last NOWCAST_MONTHS of
+  the file are filled with the mean of the reporter's last LEVEL_WINDOW
+  reported values (its own recent level).
+
+The bloc series is aggregated after the nowcast. Each month carries the
+share of its (estimated) bloc value that was actually reported and an
+Is_Partial flag for the sheets and charts. Rows imputed for structurally
+absent reporters (reporter_imputation.py, flagged Is_Imputed) are added
+to the bloc totals but never count as reported.
+
+All steps are whole-panel numpy / pandas operations; no loop over
+reporters.
+
+Usage:
+    from nowcasting import aggregate_bloc_monthly
+
+    gold_brics_monthly = aggregate_bloc_monthly(
+        gold_df, ['BRA', 'RUS', 'IND', 'CHN', 'ZAF'], 'BRICS_Gold')
+"""
+
+import numpy as np
+import pandas as pd
+
+
+BASELINE_MONTHS = 12
+REGULAR_SHARE = 0.75
+MAX_LAG = 12
+NOWCAST_MONTHS = 12
+LEVEL_WINDOW = 3
+
+MEASURES = {'qty': 'Qty_kg', 'primaryValue': 'Value_USD'}
+
+
+def reporter_month_panel(trade_df, reporters, value_cols=('qty', 'primaryValue'),
+                         flow='Import', calendar=None):
+    """
+    Sum Comtrade rows into (reporter x month) panels, NaN where not reported.
+
+    The month calendar spans the whole file (every reporter and flow), so
+    trailing months nobody in the bloc has reported yet are included.
+
+    Args:
+        trade_df: Comtrade DataFrame with a parsed refDate column
+        reporters: Reporter ISO codes (one panel row each, even if absent)
+        value_cols: Columns to sum
+        flow: Trade flow to keep
+        calendar: Month start dates of the panel columns (default: every
+                  month in trade_df)
+
+    Returns:
+        Dict mapping value column to a DataFrame (reporters x month start dates)
+    """
+    months = trade_df['refDate'].dt.to_period('M')
+    if calendar is None:
+        calendar = pd.period_range(months.min(), months.max(), freq='M')
+    else:
+        calendar = pd.PeriodIndex(calendar, freq='M')
+
+    keep = (trade_df['flowDesc'] == flow) & trade_df['reporterISO'].isin(reporters)
+    grouped = trade_df[keep].groupby(
+        [trade_df.loc[keep, 'reporterISO'], months[keep]])[list(value_cols)].sum()
+
+    panels = {}
+    for col in value_cols:
+        panel = grouped[col].unstack().reindex(index=list(reporters), columns=calendar)
+        panel.columns = calendar.to_timestamp()
+        panels[col] = panel
+    return panels
+
+
+def reporting_completeness(reported, baseline=BASELINE_MONTHS,
+                           regular_share=REGULAR_SHARE, max_lag=MAX_LAG):
+    """
+    Reporting-completeness index per reporter x month.
+
+    Args:
+        reported: Panel from reporter_month_panel() (NaN = not reported)
+        baseline: Months used to measure a reporter's reporting rate
+        regular_share: Minimum reporting rate of an expected reporter
+        max_lag: Months after its last report a reporter is still expected
+
+    Returns:
+        DataFrame like reported: 1 reported, 0 expected but missing,
+        NaN not expected
+    """
+    is_reported = reported.notna().to_numpy()
+    n_months = is_reported.shape[1]
+    position = np.arange(n_months)
+
+    # Reporting rate over the baseline window ending at each month
+    csum = np.concatenate([np.zeros((len(is_reported), 1)),
+                           np.cumsum(is_reported, axis=1)], axis=1)
+    start = np.maximum(position + 1 - baseline, 0)
+    rate = (csum[:, position + 1] - csum[:, start]) / (position + 1 - start)
+
+    # Rate and position as of each reporter's most recent report
+    last_report = np.maximum.accumulate(np.where(is_reported, position, -1), axis=1)
+    has_report = last_report >= 0
+    rows = np.arange(len(is_reported))[:, None]
+    rate_at_last = np.where(has_report, rate[rows, np.maximum(last_report, 0)], 0.0)
+
+    expected = has_report & (rate_at_last >= regular_share) \
+        & (position - last_report <= max_lag)
+    index = np.where(is_reported, 1.0, np.where(expected, 0.0, np.nan))
+    return pd.DataFrame(index, index=reported.index, columns=reported.columns)
+
+
+def recent_level(reported, window=LEVEL_WINDOW):
+    """
+    Mean of each reporter's last `window` reported values up to every month.
+
+    Computed for all reporters at once from cumulative sums indexed by
+    report count, so months without a report carry the level of the
+    reporter's latest reports.
+
+    Args:
+        reported: Panel from reporter_month_panel() (NaN = not reported)
+        window: Number of reported months averaged
+
+    Returns:
+        DataFrame like reported (NaN before a reporter's first report)
+    """
+    values = reported.to_numpy(dtype=float)
+    is_reported = ~np.isnan(values)
+    count = np.cumsum(is_reported, axis=1)
+    csum = np.cumsum(np.nan_to_num(values), axis=1)
+
+    # csum_by_count[r, c] = sum of reporter r's first c reported values
+    rows = np.arange(len(values))[:, None]
+    csum_by_count = np.zeros((len(values), count[:, -1].max() + 1 if values.size else 1))
+    row_idx, col_idx = np.nonzero(is_reported)
+    csum_by_count[row_idx, count[row_idx, col_idx]] = csum[row_idx, col_idx]
+
+    lower = np.maximum(count - window, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        level = (csum_by_count[rows, count] - csum_by_count[rows, lower]) \
+            / np.minimum(count, window)
+    level[count == 0] = np.nan
+    return pd.DataFrame(level, index=reported.index, columns=reported.columns)
+
+
+def nowcast_panel(reported, completeness, level, nowcast_months=NOWCAST_MONTHS):
+    """
+    Fill expected-but-missing reporter months near the end of the file.
+
+    Args:
+        reported: Panel from reporter_month_panel()
+        completeness: Index from reporting_completeness()
+        level: Recent levels from recent_level()
+        nowcast_months: Only the last this many months are nowcast
+
+    Returns:
+        Tuple of (panel with nowcast cells filled, boolean DataFrame of
+        nowcast cells)
+    """
+    recent = np.arange(reported.shape[1]) >= reported.shape[1] - nowcast_months
+    fill = (completeness.to_numpy() == 0) & recent & level.notna().to_numpy()
+    mask = pd.DataFrame(fill, index=reported.index, columns=reported.columns)
+    return reported.mask(mask, level), mask
+
+
+def _imputed_rows(trade_df):
+    """Boolean mask of rows added by reporter_imputation (all False if none)."""
+    if 'Is_Imputed' not in trade_df.columns:
+        return pd.Series(False, index=trade_df.index)
+    return trade_df['Is_Imputed'].fillna(False).astype(bool)
+
+
+def aggregate_bloc_monthly(trade_df, reporters, prefix, flow='Import', nowcast=True):
+    """
+    Monthly bloc totals with missing members nowcast before aggregation.
+
+    Args:
+        trade_df: Comtrade DataFrame with a parsed refDate column
+        reporters: ISO codes of the bloc members
+        prefix: Column prefix, e.g. 'BRICS_Gold'
+        flow: Trade flow to aggregate
+        nowcast: Fill not-yet-reported members (False = reported rows only,
+                 still flagged)
+
+    Returns:
+        DataFrame with Date, <prefix>_Qty_kg, <prefix>_Value_USD,
+        <prefix>_Reported_Share (reported / estimated bloc value),
+        <prefix>_Is_Partial, <prefix>_Nowcast_Reporters and
+        <prefix>_Imputed_Reporters (rows flagged Is_Imputed by
+        reporter_imputation are summed but do not count as reported)
+    """
+    is_imputed = _imputed_rows(trade_df)
+    panels = reporter_month_panel(trade_df[~is_imputed], reporters, tuple(MEASURES), flow)
+    imputed = reporter_month_panel(trade_df[is_imputed], reporters, tuple(MEASURES), flow,
+                                   calendar=panels['primaryValue'].columns) \
+        if is_imputed.any() else {col: panel * np.nan for col, panel in panels.items()}
+    completeness = reporting_completeness(panels['primaryValue'])
+    levels = {col: recent_level(panel) for col, panel in panels.items()}
+
+    result = pd.DataFrame({'Date': panels['primaryValue'].columns})
+    nowcast_mask = pd.DataFrame(False, index=completeness.index,
+                                columns=completeness.columns)
+    for col, suffix in MEASURES.items():
+        filled = panels[col]
+        if nowcast:
+            filled, nowcast_mask = nowcast_panel(panels[col], completeness, levels[col])
+        total = filled.sum(axis=0) + imputed[col].sum(axis=0)
+        result[f'{prefix}_{suffix}'] = total.to_numpy()
+
+    # Share of the bloc value reported, counting every expected or imputed member
+    missing_value = levels['primaryValue'].where(completeness == 0).sum(axis=0) \
+        + imputed['primaryValue'].sum(axis=0)
+    reported_value = panels['primaryValue'].sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        share = (reported_value / (reported_value + missing_value)).to_numpy()
+    result[f'{prefix}_Reported_Share'] = np.where(np.isfinite(share), share, 0.0)
+    result[f'{prefix}_Is_Partial'] = (completeness == 0).any(axis=0).to_numpy()
+    result[f'{prefix}_Nowcast_Reporters'] = [
+        ', '.join(nowcast_mask.index[nowcast_mask[month]]) for month in nowcast_mask.columns]
+    imputed_mask = imputed['primaryValue'].notna()
+    result[f'{prefix}_Imputed_Reporters'] = [
+        ', '.join(imputed_mask.index[imputed_mask[month]]) for month in imputed_mask.columns]
+
+    # Keep months with at least one reported or nowcast member
+    has_data = (panels['primaryValue'].notna() | nowcast_mask).any(axis=0).to_numpy()
+    return result[has_data].reset_index(drop=True)
+
+
+def completeness_table(trade_df, blocs, flow='Import', n_months=24):
+    """
+    Reporter x month completeness index for the workbook sheet.
+
+    Args:
+        trade_df: Comtrade DataFrame with a parsed refDate column
+        blocs: Dict mapping bloc name to reporter codes
+        flow: Trade flow
+        n_months: Number of most recent months shown
+
+    Returns:
+        DataFrame indexed by (Bloc, Reporter) with one column per month
+        (index values as in reporting_completeness(), plus -1 for months
+        imputed by reporter_imputation)
+    """
+    is_imputed = _imputed_rows(trade_df)
+    tables = []
+    for bloc, codes in blocs.items():
+        panel = reporter_month_panel(trade_df[~is_imputed], codes, ('primaryValue',),
+                                     flow)['primaryValue']
+        table = reporting_completeness(panel)
+        if is_imputed.any():
+            imputed = reporter_month_panel(trade_df[is_imputed], codes, ('primaryValue',),
+                                           flow, calendar=panel.columns)['primaryValue']
+            table = table.mask(imputed.notna(), -1.0)
+        table = table.iloc[:, -n_months:]
+        table.index = pd.MultiIndex.from_product([[bloc], table.index],
+                                                 names=['Bloc', 'Reporter'])
+        tables.append(table)
+    return pd.concat(tables)
+
+
+def partial_month_label(row, prefix):
+    """
+    Forecast-type label for a partial month in the forecast sheets.
+
+    Args:
+        row: Row of a DataFrame from aggregate_bloc_monthly()
+        prefix: Column prefix used for that DataFrame
+
+    Returns:
+        String such as 'Partial (nowcast: IND, CHN)' or 'Partial'
+    """
+    reporters = row[f'{prefix}_Nowcast_Reporters']
+    return f'Partial (nowcast: {reporters})' if reporters else 'Partial'
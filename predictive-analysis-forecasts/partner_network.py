@@ -0,0 +1,334 @@
+"""
+Bilateral Partner Network
+Who the reporters buy gold and oil from, from bilateral Comtrade extracts
+(one row per reporter x partner x month instead of partnerDesc == 'World').
+
+Each commodity is held as a sparse reporter x partner x month tensor,
+stored as a scipy.sparse CSR matrix with one row per (month, reporter)
+and one column per partner. Every metric is a sparse product over that
+matrix, so all reporters and months (and the blocs, summed with a
+sparse block-diagonal aggregation matrix) are computed at once:
+
+- Partner_HHI:         sum of squared partner shares (1 = single supplier)
+- Effective_Partners:  1 / HHI
+- Intra_BRICS_Share:   share bought from BRICS members
+- USD_Pegged_Share:    share bought from partners with a USD peg or
+                       dollarised currency (USD_PEGGED)
+- Sanctioned_Share:    share bought from partners under broad US/EU
+                       sanctions programmes (SANCTIONED)
+- Top_Partner / Top_Partner_Share
+
+A reporter's own code is never counted as a partner (re-imports), and
+aggregate partners (World, areas n.e.s.) are dropped.
+
+The bilateral extracts are optional (BILATERAL_SOURCES, see
+DATA_SETUP.md); the World-level files used everywhere else are unchanged.
+
+Usage:
+    from partner_network import load_bilateral_frames, network_metrics
+
+    frames = load_bilateral_frames()              # {} if no extracts
+    metrics = network_metrics(frames)
+
+    python partner_network.py [output.csv]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from reconciliation import BLOCS
+
+
+BILATERAL_SOURCES = {
+    'Gold': 'Gold_TradeData_Bilateral.csv',
+    'Oil': 'Oil_TradeData_Bilateral.csv',
+}
+
+# Partner rows that are aggregates, not countries
+AGGREGATE_PARTNERS = ('World', 'W00', '_X', 'X1', 'XX')
+AGGREGATE_PREFIXES = ('Areas, nes', 'Other ', 'Bunkers', 'Free Zones', 'Special Categories')
+
+# Currencies pegged to (or replaced by) the USD, as ISO3 country codes
+USD_PEGGED = ['ARE', 'BHR', 'DJI', 'ECU', 'HKG', 'JOR', 'OMN', 'PAN', 'QAT', 'SAU', 'SLV']
+
+# Partners under broad US/EU sanctions programmes
+SANCTIONED = ['BLR', 'CUB', 'IRN', 'MMR', 'PRK', 'RUS', 'SYR', 'VEN']
+
+PARTNER_GROUPS = {
+    'Intra_BRICS': BLOCS['BRICS'],
+    'USD_Pegged': USD_PEGGED,
+    'Sanctioned': SANCTIONED,
+}
+
+METRIC_COLUMNS = ['Commodity', 'Reporter', 'Level', 'Date', 'Total_Value_USD',
+                  'N_Partners', 'Partner_HHI', 'Effective_Partners', 'Top_Partner',
+                  'Top_Partner_Share', 'Intra_BRICS_Share', 'USD_Pegged_Share',
+                  'Sanctioned_Share']
+
+
+def _partner_key(trade_df):
+    """Partner ISO code where the extract has one, else the partner name."""
+    if 'partnerISO' in trade_df.columns:
+        return trade_df['partnerISO'].fillna(trade_df['partnerDesc'])
+    return trade_df['partnerDesc']
+
+
+def country_partner_rows(trade_df, flow='Import', measure='primaryValue'):
+    """
+    Rows of one flow with a country partner other than the reporter.
+
+    Args:
+        trade_df: Bilateral Comtrade DataFrame
+        flow: Trade flow to keep
+        measure: Rows need a positive value in this column
+
+    Returns:
+        Tuple of (filtered DataFrame, partner key Series aligned with it)
+    """
+    df = trade_df[(trade_df['flowDesc'] == flow) & (trade_df[measure] > 0)]
+    partner = _partner_key(df)
+
+    # Aggregate partners are recognised on the unique labels, not per row
+    partner_codes, partners = pd.factorize(partner)
+    labels = pd.Index(partners).astype(str)
+    country = ~labels.isin(AGGREGATE_PARTNERS) & ~labels.str.startswith(AGGREGATE_PREFIXES)
+    keep = np.where(partner_codes >= 0, country[partner_codes], False) \
+        & (partner.to_numpy() != df['reporterISO'].to_numpy())
+    return df[keep], partner[keep]
+
+
+def load_bilateral_frames(sources=BILATERAL_SOURCES):
+    """
+    Read the bilateral extracts that exist.
+
+    Args:
+        sources: Dict mapping commodity to CSV path
+
+    Returns:
+        Dict mapping commodity to DataFrame (missing files are left out)
+    """
+    frames = {}
+    for commodity, path in sources.items():
+        if os.path.exists(path):
+            df = pd.read_csv(path)
+            df['refDate'] = pd.to_datetime(df['refDate'])
+            frames[commodity] = df
+    return frames
+
+
+def build_partner_tensor(trade_df, measure='primaryValue', flow='Import'):
+    """
+    Sparse reporter x partner x month tensor of one commodity.
+
+    Args:
+        trade_df: Bilateral Comtrade DataFrame (refDate, reporterISO,
+                  partnerISO or partnerDesc, flowDesc, measure column)
+        measure: Column to sum ('primaryValue' or 'qty')
+        flow: Trade flow to keep
+
+    Returns:
+        Dict with 'matrix' (CSR, rows month-major (month, reporter), columns
+        partners), 'reporters', 'partners' and 'months' (month starts)
+    """
+    df, partner = country_partner_rows(trade_df, flow, measure)
+    partner_codes, partners = pd.factorize(partner, sort=True)
+    reporter_codes, reporters = pd.factorize(df['reporterISO'], sort=True)
+    dates = pd.to_datetime(df['refDate'])
+    month_index = (dates.dt.year * 12 + dates.dt.month - 1).to_numpy()
+    month_codes = month_index - month_index.min()
+    calendar = pd.period_range(dates.min(), dates.max(), freq='M')
+
+    rows = month_codes * len(reporters) + reporter_codes
+    matrix = sparse.csr_matrix(
+        (df[measure].to_numpy(dtype=float), (rows, partner_codes)),
+        shape=(len(calendar) * len(reporters), len(partners)))
+    matrix.sum_duplicates()
+    return {
+        'matrix': matrix,
+        'reporters': list(reporters),
+        'partners': list(partners),
+        'months': calendar.to_timestamp(),
+    }
+
+
+def bloc_aggregation(reporters, n_months, blocs=BLOCS):
+    """
+    Sparse matrix summing (month, reporter) rows into (month, bloc) rows.
+
+    Args:
+        reporters: Reporter codes of the tensor rows
+        n_months: Months in the tensor
+        blocs: Dict mapping bloc name to reporter codes
+
+    Returns:
+        CSR matrix (months * blocs, months * reporters)
+    """
+    membership = sparse.csr_matrix(
+        np.array([[code in members for code in reporters] for members in blocs.values()],
+                 dtype=float).reshape(len(blocs), len(reporters)))
+    return sparse.kron(sparse.identity(n_months, format='csr'), membership, format='csr')
+
+
+def _row_metrics(matrix, partners, partner_groups):
+    """Concentration and partner-group shares of every row of a flow matrix."""
+    total = np.asarray(matrix.sum(axis=1)).ravel()
+    squares = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+    counts = np.diff(matrix.indptr)
+    top = np.asarray(matrix.argmax(axis=1)).ravel()
+    top_value = np.asarray(matrix.max(axis=1).todense()).ravel()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hhi = np.where(total > 0, squares / total ** 2, np.nan)
+        metrics = {
+            'Total_Value_USD': total,
+            'N_Partners': counts,
+            'Partner_HHI': hhi,
+            'Effective_Partners': 1.0 / hhi,
+            'Top_Partner': np.where(total > 0, np.asarray(partners, dtype=object)[top], None),
+            'Top_Partner_Share': np.where(total > 0, top_value / total, np.nan),
+        }
+        partners = np.asarray(partners)
+        indicators = sparse.csr_matrix(np.column_stack(
+            [np.isin(partners, members) for members in partner_groups.values()]).astype(float))
+        group_flows = np.asarray((matrix @ indicators).todense())
+        for j, name in enumerate(partner_groups):
+            metrics[f'{name}_Share'] = np.where(total > 0, group_flows[:, j] / total, np.nan)
+    return metrics
+
+
+def partner_metrics(tensor, commodity, blocs=BLOCS, partner_groups=PARTNER_GROUPS):
+    """
+    Network metrics per reporter and bloc for every month of one tensor.
+
+    Args:
+        tensor: Dict from build_partner_tensor()
+        commodity: Commodity label
+        blocs: Dict mapping bloc name to reporter codes
+        partner_groups: Dict mapping share name to partner codes
+
+    Returns:
+        DataFrame with METRIC_COLUMNS (Level 'Reporter' or 'Bloc'); rows
+        without any flow are dropped
+    """
+    matrix, reporters, months = tensor['matrix'], tensor['reporters'], tensor['months']
+    n_months = len(months)
+    bloc_matrix = bloc_aggregation(reporters, n_months, blocs) @ matrix
+
+    frames = []
+    for level, flows, names in (('Reporter', matrix, reporters),
+                                ('Bloc', bloc_matrix.tocsr(), list(blocs))):
+        metrics = _row_metrics(flows, tensor['partners'], partner_groups)
+        frame = pd.DataFrame(metrics)
+        frame.insert(0, 'Date', np.repeat(months, len(names)))
+        frame.insert(0, 'Level', level)
+        frame.insert(0, 'Reporter', np.tile(names, n_months))
+        frame.insert(0, 'Commodity', commodity)
+        frames.append(frame[frame['Total_Value_USD'] > 0])
+    return pd.concat(frames, ignore_index=True)[METRIC_COLUMNS]
+
+
+def network_metrics(frames, blocs=BLOCS, partner_groups=PARTNER_GROUPS):
+    """
+    partner_metrics() for several commodities.
+
+    Args:
+        frames: Dict mapping commodity to a bilateral Comtrade DataFrame
+        blocs: Dict mapping bloc name to reporter codes
+        partner_groups: Dict mapping share name to partner codes
+
+    Returns:
+        Concatenated DataFrame (empty with METRIC_COLUMNS if no frames)
+    """
+    tables = [partner_metrics(build_partner_tensor(df), commodity, blocs, partner_groups)
+              for commodity, df in frames.items()]
+    if not tables:
+        return pd.DataFrame(columns=METRIC_COLUMNS)
+    return pd.concat(tables, ignore_index=True)
+
+
+def top_partners(tensor, reporters, months=12, n_top=10):
+    """
+    Largest partners of a set of reporters over the last months.
+
+    Args:
+        tensor: Dict from build_partner_tensor()
+        reporters: Reporter codes summed together (e.g. BLOCS['BRICS'])
+        months: Trailing months to add up
+        n_top: Partners to return
+
+    Returns:
+        DataFrame with Partner, Value_USD and Share
+    """
+    n_reporters = len(tensor['reporters'])
+    n_months = len(tensor['months'])
+    selected = np.isin(tensor['reporters'], list(reporters))
+    rows = (np.arange(max(n_months - months, 0), n_months)[:, None] * n_reporters
+            + np.flatnonzero(selected)[None, :]).ravel()
+    totals = np.asarray(tensor['matrix'][rows].sum(axis=0)).ravel()
+    order = np.argsort(totals)[::-1][:n_top]
+    order = order[totals[order] > 0]
+    return pd.DataFrame({
+        'Partner': np.asarray(tensor['partners'])[order],
+        'Value_USD': totals[order],
+        'Share': totals[order] / totals.sum() if totals.sum() > 0 else np.nan,
+    })
+
+
+def summarize_network(metrics, bloc='BRICS'):
+    """
+    Latest-month bloc metrics per commodity, one line each.
+
+    Args:
+        metrics: DataFrame from network_metrics()
+        bloc: Bloc name
+
+    Returns:
+        List of strings
+    """
+    lines = []
+    rows = metrics[(metrics['Level'] == 'Bloc') & (metrics['Reporter'] == bloc)]
+    for commodity, group in rows.groupby('Commodity', sort=False):
+        latest = group.sort_values('Date').iloc[-1]
+        lines.append(f"{bloc} {commodity} {latest['Date']:%Y-%m}: "
+                     f"{latest['Effective_Partners']:.1f} effective partners, "
+                     f"top {latest['Top_Partner']} {latest['Top_Partner_Share']:.0%}, "
+                     f"intra-BRICS {latest['Intra_BRICS_Share']:.0%}, "
+                     f"USD-pegged {latest['USD_Pegged_Share']:.0%}, "
+                     f"sanctioned {latest['Sanctioned_Share']:.0%}")
+    return lines
+
+
+def main():
+    """
+    Compute partner network metrics from the bilateral extracts.
+
+    Usage:
+        python partner_network.py [output.csv]
+    """
+    import time
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else 'Partner_Network.csv'
+    frames = load_bilateral_frames()
+    if not frames:
+        print("No bilateral extracts found (expected "
+              f"{', '.join(BILATERAL_SOURCES.values())}); see DATA_SETUP.md")
+        return 1
+
+    start = time.perf_counter()
+    metrics = network_metrics(frames)
+    elapsed = time.perf_counter() - start
+    metrics.to_csv(output_path, index=False, date_format='%Y-%m')
+
+    print(f"✓ {len(metrics)} reporter/bloc months over {len(frames)} commodities "
+          f"in {elapsed:.2f} s -> {output_path}")
+    for line in summarize_network(metrics):
+        print(f"   {line}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
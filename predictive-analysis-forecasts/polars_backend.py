@@ -0,0 +1,179 @@
+"""
+Polars Execution Backend
+Optional multithreaded CSV loading for the aggregation pipeline.
+
+With backend='polars' the input CSVs are read as lazy Polars queries:
+- projection pushdown: only the columns the pipeline uses are parsed
+- predicate pushdown: Comtrade rows are filtered to the trade flow while
+  the file is scanned
+- dates are parsed inside the query, and the scan runs on every core
+  (POLARS_MAX_THREADS limits it)
+
+The collected frame is handed to the same validation, screening,
+imputation, nowcasting and monthly aggregation code as the pandas path,
+so both backends produce the same monthly frames; only the load differs.
+Pick the faster one per deployment with benchmark_backends().
+
+Polars is optional (pip install polars); without it backend='pandas' is
+the only choice. The conversion to pandas goes through numpy, so pyarrow
+is not needed.
+
+Usage:
+    from polars_backend import read_trade_csv
+
+    trade_df = read_trade_csv('Gold_TradeData_Cleaned.csv', backend='polars')
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    pl = None
+    POLARS_AVAILABLE = False
+
+
+BACKENDS = ('pandas', 'polars')
+DEFAULT_BACKEND = 'pandas'
+
+# Comtrade columns used downstream (value_per_unit only where the file has it)
+TRADE_COLUMNS = ['refDate', 'reporterISO', 'flowDesc', 'partnerDesc', 'cmdCode',
+                 'qty', 'primaryValue', 'value_per_unit']
+
+# Date formats tried in order (Bitcoinity writes '2020-12-21 00:00:00 UTC')
+DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S %Z', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d']
+
+
+def check_backend(backend):
+    """
+    Validate a backend name.
+
+    Args:
+        backend: 'pandas' or 'polars'
+
+    Raises:
+        ValueError for unknown names, ImportError when Polars is requested
+        but not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}' (use one of {BACKENDS})")
+    if backend == 'polars' and not POLARS_AVAILABLE:
+        raise ImportError("backend='polars' requires Polars (pip install polars)")
+
+
+def _parse_datetime(column):
+    """Polars expression parsing a string column with the first matching format."""
+    return pl.coalesce([pl.col(column).str.to_datetime(fmt, strict=False, time_unit='us')
+                        for fmt in DATETIME_FORMATS]).alias(column)
+
+
+def scan_csv(path, columns=None, filters=None, datetime_columns=()):
+    """
+    Build a lazy Polars query over a CSV file.
+
+    Args:
+        path: CSV path
+        columns: Columns to keep (names missing from the file are skipped)
+        filters: Dict mapping column to the value rows must equal
+        datetime_columns: Columns parsed as datetimes (naive, as written)
+
+    Returns:
+        polars.LazyFrame
+    """
+    check_backend('polars')
+    lazy = pl.scan_csv(path, infer_schema_length=10000)
+    names = lazy.collect_schema().names()
+    if columns is not None:
+        lazy = lazy.select([c for c in columns if c in names])
+        names = [c for c in columns if c in names]
+    for column, value in (filters or {}).items():
+        if column in names:
+            lazy = lazy.filter(pl.col(column) == value)
+    parse = [c for c in datetime_columns if c in names]
+    if parse:
+        lazy = lazy.with_columns([_parse_datetime(c) for c in parse])
+    return lazy
+
+
+def to_pandas(frame):
+    """
+    Convert a collected Polars DataFrame to pandas without pyarrow.
+
+    Args:
+        frame: polars.DataFrame
+
+    Returns:
+        pandas DataFrame with the same columns (nulls become NaN / None)
+    """
+    return pd.DataFrame({name: frame.get_column(name).to_numpy() for name in frame.columns})
+
+
+def read_trade_csv(path, backend=DEFAULT_BACKEND, flow='Import'):
+    """
+    Read a Comtrade CSV with the selected backend.
+
+    Args:
+        path: Path to the cleaned Comtrade CSV
+        backend: 'pandas' (whole file, dates parsed during validation) or
+                 'polars' (pipeline columns and one trade flow, dates parsed
+                 in the scan)
+        flow: Trade flow kept by the Polars scan
+
+    Returns:
+        pandas DataFrame
+    """
+    check_backend(backend)
+    if backend == 'pandas':
+        return pd.read_csv(path)
+    query = scan_csv(path, columns=TRADE_COLUMNS, filters={'flowDesc': flow},
+                     datetime_columns=['refDate'])
+    return to_pandas(query.collect())
+
+
+def read_btc_csv(path, backend=DEFAULT_BACKEND):
+    """
+    Read the BTC CSV (wide or long layout) with the selected backend.
+
+    Args:
+        path: Path to BTC cleaned CSV
+        backend: 'pandas' or 'polars'
+
+    Returns:
+        pandas DataFrame (the Polars path returns the time column parsed,
+        as naive UTC timestamps)
+    """
+    check_backend(backend)
+    if backend == 'pandas':
+        return pd.read_csv(path)
+    query = scan_csv(path, datetime_columns=['Time', 'time'])
+    return to_pandas(query.collect())
+
+
+def benchmark_backends(load, repeats=3, backends=None):
+    """
+    Time a loader under every available backend.
+
+    Args:
+        load: Callable taking backend= (e.g. a functools.partial of
+              load_and_process_data)
+        repeats: Runs per backend (the fastest is reported)
+        backends: Backends to time (default: all installed)
+
+    Returns:
+        Dict mapping backend to its best wall-clock time in seconds
+    """
+    if backends is None:
+        backends = [b for b in BACKENDS if b != 'polars' or POLARS_AVAILABLE]
+    timings = {}
+    for backend in backends:
+        runs = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            load(backend=backend)
+            runs.append(time.perf_counter() - start)
+        timings[backend] = float(np.min(runs))
+    return timings
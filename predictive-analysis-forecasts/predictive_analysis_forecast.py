@@ -6,7 +6,7 @@ University of Europe & Avron Global Consultancy Initiative
 Winter Semester 2025
 
 This script generates 3-month moving average forecasts for:
-- Bitcoin (USD) Trading Volume
+- Bitcoin (USD) Trading Volume (monthly, plus daily/weekly views)
 - BRICS Gold Imports
 - BRICS Crude Oil Imports
 - USD Dominance Analysis (Post-July 2027)
@@ -21,13 +21,49 @@ import pandas as pd
 import numpy as np
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from datetime import datetime, timedelta
+from btc_frequency import (load_btc_daily, resample_btc_volume,
+                           forecast_btc_frequencies, FREQUENCY_SETTINGS)
+from polars_backend import DEFAULT_BACKEND
+from anomaly_screening import (load_screened_trade_data, summarize_anomalies,
+                               ANOMALY_POLICY, Z_THRESHOLD)
+from currency_shares import (compute_currency_shares, forecast_currency_shares,
+                             summarize_currency_share, describe_currency_share)
+from dominance_index import (compute_dominance_index, summarize_dominance_index,
+                             DEFAULT_WEIGHTS, COMPONENT_LABELS)
+from monte_carlo import simulate_dominance_probability
+from bootstrap_intervals import compute_forecast_intervals, DEFAULT_LEVELS
+from reconciliation import (build_reporter_panel, reconcile_hierarchy, bloc_forecasts,
+                            RECONCILIATION_METHODS, BLOCS)
+from reporter_imputation import (impute_missing_reporters, append_imputed_rows,
+                                 summarize_imputation)
+from nowcasting import (aggregate_bloc_monthly, completeness_table,
+                        partial_month_label)
+from hyperparameter_search import (load_or_search_configs, forecast_from_config,
+                                   describe_config)
+from forecast_exports import (build_forecast_table, build_metadata, bloc_partial_flags,
+                              write_forecast_exports, DEFAULT_FORMATS)
+from var_granger import (build_var_panel, granger_causality, summarize_granger,
+                         significant_causes, SIGNIFICANCE)
+from change_points import (fit_series_for_mode, describe_change_points,
+                           DEFAULT_REGIME_MODE)
+from seasonal_decomposition import (seasonally_adjusted_inputs, reseasonalize,
+                                    reseasonalize_intervals,
+                                    seasonal_moving_average_forecast, MIN_STRENGTH)
+from price_volume import price_volume_decomposition, summarize_price_volume
+from partner_network import (load_bilateral_frames, network_metrics, build_partner_tensor,
+                             top_partners, summarize_network, BILATERAL_SOURCES)
+from mirror_reconciliation import (reconcile_mirror_flows, bloc_mirror_summary,
+                                   has_mirror_flows, MAX_RATIO)
 import warnings
 warnings.filterwarnings('ignore')
 
 
-def load_and_process_data(btc_path, gold_path, oil_path):
+def load_and_process_data(btc_path, gold_path, oil_path,
+                          anomaly_policy=ANOMALY_POLICY, nowcast=True,
+                          impute=True, backend=DEFAULT_BACKEND, return_inputs=False):
     """
     Load and process the cleaned CSV datasets.
     
@@ -35,29 +71,50 @@ def load_and_process_data(btc_path, gold_path, oil_path):
         btc_path: Path to BTC cleaned CSV
         gold_path: Path to Gold cleaned CSV
         oil_path: Path to Oil cleaned CSV
+        anomaly_policy: Outlier policy for Comtrade rows ('flag', 'cap' or 'exclude')
+        nowcast: Fill bloc members that have not reported recent months yet
+        impute: Impute reporters that stopped reporting for long periods
+        backend: CSV reader, 'pandas' or 'polars' (same frames either way)
+        return_inputs: Also return the loaded inputs, so the caller reuses
+                       them instead of reading and screening the files again
     
     Returns:
         Tuple of processed dataframes (btc_monthly, gold_brics_monthly, 
                                        gold_us_eu_monthly, oil_brics_monthly, 
-                                       oil_us_eu_monthly)
+                                       oil_us_eu_monthly), followed with
+        return_inputs=True by a dict with 'trade' (screened Comtrade frames
+        by commodity), 'anomalies' (anomaly reports by commodity),
+        'imputed' (impute_missing_reporters() rows, None without impute),
+        'imputed_trade' (screened frames with the imputed rows appended)
+        and 'btc_daily'
     """
-    # Load datasets
-    btc_df = pd.read_csv(btc_path)
-    gold_df = pd.read_csv(gold_path)
-    oil_df = pd.read_csv(oil_path)
+    # Load datasets (outlier rows are screened before any aggregation)
+    gold_df, gold_anomalies = load_screened_trade_data(gold_path, anomaly_policy,
+                                                       backend=backend)
+    oil_df, oil_anomalies = load_screened_trade_data(oil_path, anomaly_policy,
+                                                     backend=backend)
     
     # Parse dates
-    btc_df['time'] = pd.to_datetime(btc_df['time'])
     gold_df['refDate'] = pd.to_datetime(gold_df['refDate'])
     oil_df['refDate'] = pd.to_datetime(oil_df['refDate'])
+    inputs = {'trade': {'Gold': gold_df, 'Oil': oil_df},
+              'anomalies': {'Gold': gold_anomalies, 'Oil': oil_anomalies}}
+    
+    # Structurally absent reporters (e.g. RUS after 2021) are imputed for
+    # all commodities at once; imputed rows carry Is_Imputed
+    inputs['imputed'] = None
+    if impute:
+        imputed, _ = impute_missing_reporters({'Gold': gold_df, 'Oil': oil_df})
+        gold_df = append_imputed_rows(gold_df, imputed, 'Gold')
+        oil_df = append_imputed_rows(oil_df, imputed, 'Oil')
+        inputs['imputed'] = imputed
+    inputs['imputed_trade'] = {'Gold': gold_df, 'Oil': oil_df}
     
     # === BTC ANALYSIS ===
-    # Aggregate USD trading volume by month
-    btc_usd = btc_df[btc_df['currency'] == 'USD'].copy()
-    btc_usd['year_month'] = btc_usd['time'].dt.to_period('M')
-    btc_monthly = btc_usd.groupby('year_month')['trading_volume_btc'].sum().reset_index()
-    btc_monthly['year_month'] = btc_monthly['year_month'].dt.to_timestamp()
-    btc_monthly = btc_monthly.sort_values('year_month')
+    # Aggregate USD trading volume by month (daily resolution is kept in
+    # btc_frequency for the multi-frequency forecasts)
+    btc_daily = inputs['btc_daily'] = load_btc_daily(btc_path, backend)
+    btc_monthly = resample_btc_volume(btc_daily, 'M', per_day=False)[['Date', 'USD']]
     btc_monthly.columns = ['Date', 'BTC_Volume']
     
     # === GOLD ANALYSIS ===
@@ -65,62 +122,103 @@ def load_and_process_data(btc_path, gold_path, oil_path):
     brics_codes = ['BRA', 'RUS', 'IND', 'CHN', 'ZAF']
     us_eu_codes = ['USA', 'DEU', 'FRA', 'ITA', 'ESP', 'NLD', 'BEL']
     
-    gold_df['year_month'] = gold_df['refDate'].dt.to_period('M')
-    
-    # BRICS Gold Imports
-    gold_brics = gold_df[gold_df['reporterISO'].isin(brics_codes) & 
-                         (gold_df['flowDesc'] == 'Import')]
-    gold_brics_monthly = gold_brics.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    gold_brics_monthly['year_month'] = gold_brics_monthly['year_month'].dt.to_timestamp()
-    gold_brics_monthly.columns = ['Date', 'BRICS_Gold_Qty_kg', 'BRICS_Gold_Value_USD']
-    
-    # US/EU Gold Imports
-    gold_us_eu = gold_df[gold_df['reporterISO'].isin(us_eu_codes) & 
-                         (gold_df['flowDesc'] == 'Import')]
-    gold_us_eu_monthly = gold_us_eu.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    gold_us_eu_monthly['year_month'] = gold_us_eu_monthly['year_month'].dt.to_timestamp()
-    gold_us_eu_monthly.columns = ['Date', 'US_EU_Gold_Qty_kg', 'US_EU_Gold_Value_USD']
+    # Gold Imports (members that have not reported the latest months yet
+    # are nowcast before the bloc totals are summed)
+    gold_brics_monthly = aggregate_bloc_monthly(gold_df, brics_codes, 'BRICS_Gold',
+                                                nowcast=nowcast)
+    gold_us_eu_monthly = aggregate_bloc_monthly(gold_df, us_eu_codes, 'US_EU_Gold',
+                                                nowcast=nowcast)
     
     # === OIL ANALYSIS ===
-    oil_df['year_month'] = oil_df['refDate'].dt.to_period('M')
-    
-    # BRICS Oil Imports
-    oil_brics = oil_df[oil_df['reporterISO'].isin(brics_codes) & 
-                       (oil_df['flowDesc'] == 'Import')]
-    oil_brics_monthly = oil_brics.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    oil_brics_monthly['year_month'] = oil_brics_monthly['year_month'].dt.to_timestamp()
-    oil_brics_monthly.columns = ['Date', 'BRICS_Oil_Qty_kg', 'BRICS_Oil_Value_USD']
-    
-    # US/EU Oil Imports
-    oil_us_eu = oil_df[oil_df['reporterISO'].isin(us_eu_codes) & 
-                       (oil_df['flowDesc'] == 'Import')]
-    oil_us_eu_monthly = oil_us_eu.groupby('year_month').agg({
-        'qty': 'sum',
-        'primaryValue': 'sum'
-    }).reset_index()
-    oil_us_eu_monthly['year_month'] = oil_us_eu_monthly['year_month'].dt.to_timestamp()
-    oil_us_eu_monthly.columns = ['Date', 'US_EU_Oil_Qty_kg', 'US_EU_Oil_Value_USD']
-    
-    return (btc_monthly, gold_brics_monthly, gold_us_eu_monthly, 
-            oil_brics_monthly, oil_us_eu_monthly)
-
-
-def create_btc_forecast_sheet(wb, btc_monthly):
+    oil_brics_monthly = aggregate_bloc_monthly(oil_df, brics_codes, 'BRICS_Oil',
+                                               nowcast=nowcast)
+    oil_us_eu_monthly = aggregate_bloc_monthly(oil_df, us_eu_codes, 'US_EU_Oil',
+                                               nowcast=nowcast)
+    
+    monthly = (btc_monthly, gold_brics_monthly, gold_us_eu_monthly, 
+               oil_brics_monthly, oil_us_eu_monthly)
+    return monthly + (inputs,) if return_inputs else monthly
+
+
+def write_interval_columns(ws, start_col, first_row, interval_df, label='',
+                           number_format='#,##0.00', header_row=5):
+    """
+    Write bootstrap prediction interval columns next to a forecast table.
+    
+    Args:
+        ws: Worksheet object
+        start_col: First column number to write to
+        first_row: Row of the first forecast month
+        interval_df: DataFrame from compute_forecast_intervals()
+        label: Prefix for the column headers (e.g. 'Qty ')
+        number_format: Excel number format for the bounds
+        header_row: Row holding the table headers
+    
+    Returns:
+        Next free column number
+    """
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='C00000', end_color='C00000', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    col = start_col
+    levels = [int(c.split('_')[1]) for c in interval_df.columns if c.endswith('_Low')]
+    for level in levels:
+        for bound in ('Low', 'High'):
+            cell = ws.cell(row=header_row, column=col)
+            cell.value = f'{label}PI {level}% {bound}'
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+            for offset, value in enumerate(interval_df[f'PI_{level}_{bound}']):
+                ws.cell(row=first_row + offset, column=col, value=float(value))
+                ws.cell(row=first_row + offset, column=col).number_format = number_format
+            ws.column_dimensions[ws.cell(row=header_row, column=col).column_letter].width = 14
+            col += 1
+    return col
+
+
+def write_reconciled_column(ws, col, first_row, forecast_dates, forecasts, header,
+                            number_format='#,##0.00', header_row=5):
+    """
+    Write a reconciled bloc forecast column next to a forecast table.
+    
+    Args:
+        ws: Worksheet object
+        col: Column number to write to
+        first_row: Row of the first forecast month
+        forecast_dates: Dates of the forecast rows
+        forecasts: Series from bloc_forecasts() indexed by Date
+        header: Column header
+        number_format: Excel number format
+        header_row: Row holding the table headers
+    
+    Returns:
+        Next free column number
+    """
+    cell = ws.cell(row=header_row, column=col, value=header)
+    cell.font = Font(bold=True, color='FFFFFF', size=11)
+    cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    values = forecasts.reindex(pd.DatetimeIndex(forecast_dates))
+    for offset, value in enumerate(values):
+        if pd.notna(value):
+            ws.cell(row=first_row + offset, column=col, value=float(value))
+            ws.cell(row=first_row + offset, column=col).number_format = number_format
+    ws.column_dimensions[cell.column_letter].width = 16
+    return col + 1
+
+
+def create_btc_forecast_sheet(wb, btc_monthly, usd_share, intervals):
     """
     Create BTC forecast sheet with 3-month moving average.
     
     Args:
         wb: Openpyxl workbook object
         btc_monthly: DataFrame with BTC monthly data
+        usd_share: Dict from summarize_currency_share() for USD
+        intervals: Dict from compute_forecast_intervals() (uses 'BTC_Volume')
     
     Returns:
         Worksheet object
@@ -180,6 +278,7 @@ def create_btc_forecast_sheet(wb, btc_monthly):
         row_num += 1
     
     # Forecast next 3 months
+    forecast_row = row_num
     last_date = btc_data['Date'].max()
     for i in range(1, 4):
         forecast_date = last_date + pd.DateOffset(months=i)
@@ -199,6 +298,9 @@ def create_btc_forecast_sheet(wb, btc_monthly):
         
         row_num += 1
     
+    # Bootstrap prediction intervals for the forecast months
+    write_interval_columns(ws, 7, forecast_row, intervals['BTC_Volume'])
+    
     # Insights section
     ws[f'A{row_num+2}'] = 'Key Insights:'
     ws[f'A{row_num+2}'].font = Font(bold=True, size=11)
@@ -206,7 +308,7 @@ def create_btc_forecast_sheet(wb, btc_monthly):
     insights = [
         'The 3-month moving average smooths out short-term volatility in BTC trading volume',
         'Forecast assumes continuation of recent trends in USD-denominated Bitcoin trading',
-        'USD remains dominant in BTC trading, accounting for majority of global volume',
+        describe_currency_share(usd_share),
         'Any significant forecast deviation may signal shifts in BTC market dynamics'
     ]
     
@@ -225,13 +327,17 @@ def create_btc_forecast_sheet(wb, btc_monthly):
     return ws
 
 
-def create_gold_forecast_sheet(wb, gold_brics_monthly):
+def create_gold_forecast_sheet(wb, gold_brics_monthly, intervals, reconciled=None):
     """
     Create Gold BRICS forecast sheet with 3-month moving average.
     
     Args:
         wb: Openpyxl workbook object
         gold_brics_monthly: DataFrame with Gold BRICS monthly data
+        intervals: Dict from compute_forecast_intervals() (uses the
+            BRICS_Gold_Qty_kg and BRICS_Gold_Value_USD entries)
+        reconciled: Optional dict from bloc_forecasts() (MinT forecasts that
+            add up with the reporter and world forecasts)
     
     Returns:
         Worksheet object
@@ -277,7 +383,12 @@ def create_gold_forecast_sheet(wb, gold_brics_monthly):
         ws.cell(row=row_num, column=2, value=row['Date'].strftime('%Y-%m'))
         ws.cell(row=row_num, column=3, value=row['BRICS_Gold_Qty_kg'])
         ws.cell(row=row_num, column=4, value=row['BRICS_Gold_Value_USD'])
-        ws.cell(row=row_num, column=7, value='Historical')
+        if row['BRICS_Gold_Is_Partial']:
+            # Some members have not reported this month yet
+            ws.cell(row=row_num, column=7, value=partial_month_label(row, 'BRICS_Gold'))
+            ws.cell(row=row_num, column=7).font = Font(italic=True, color='C65911')
+        else:
+            ws.cell(row=row_num, column=7, value='Historical')
         
         # 3-Month MA formulas
         if row_num >= 8:
@@ -296,6 +407,7 @@ def create_gold_forecast_sheet(wb, gold_brics_monthly):
         row_num += 1
     
     # Forecast next 3 months
+    forecast_row = row_num
     last_date = gold_data['Date'].max()
     for i in range(1, 4):
         forecast_date = last_date + pd.DateOffset(months=i)
@@ -316,6 +428,23 @@ def create_gold_forecast_sheet(wb, gold_brics_monthly):
         
         row_num += 1
     
+    # Bootstrap prediction intervals for the forecast months
+    next_col = write_interval_columns(ws, 8, forecast_row,
+                                      intervals['BRICS_Gold_Qty_kg'], 'Qty ')
+    next_col = write_interval_columns(ws, next_col, forecast_row,
+                                      intervals['BRICS_Gold_Value_USD'], 'Value ',
+                                      '$#,##0')
+    
+    # Reconciled (coherent) bloc forecasts from the reporter hierarchy
+    if reconciled is not None:
+        forecast_dates = [last_date + pd.DateOffset(months=i) for i in range(1, 4)]
+        next_col = write_reconciled_column(ws, next_col, forecast_row, forecast_dates,
+                                           reconciled['BRICS_Gold_Qty_kg'],
+                                           'Reconciled Qty (MinT)')
+        write_reconciled_column(ws, next_col, forecast_row, forecast_dates,
+                                reconciled['BRICS_Gold_Value_USD'],
+                                'Reconciled Value (MinT)', '$#,##0')
+    
     # Insights section
     ws[f'A{row_num+2}'] = 'Key Insights:'
     ws[f'A{row_num+2}'].font = Font(bold=True, size=11)
@@ -343,13 +472,17 @@ def create_gold_forecast_sheet(wb, gold_brics_monthly):
     return ws
 
 
-def create_oil_forecast_sheet(wb, oil_brics_monthly):
+def create_oil_forecast_sheet(wb, oil_brics_monthly, intervals, reconciled=None):
     """
     Create Oil BRICS forecast sheet with 3-month moving average.
     
     Args:
         wb: Openpyxl workbook object
         oil_brics_monthly: DataFrame with Oil BRICS monthly data
+        intervals: Dict from compute_forecast_intervals() (uses the
+            BRICS_Oil_Qty_kg and BRICS_Oil_Value_USD entries)
+        reconciled: Optional dict from bloc_forecasts() (MinT forecasts that
+            add up with the reporter and world forecasts)
     
     Returns:
         Worksheet object
@@ -395,7 +528,12 @@ def create_oil_forecast_sheet(wb, oil_brics_monthly):
         ws.cell(row=row_num, column=2, value=row['Date'].strftime('%Y-%m'))
         ws.cell(row=row_num, column=3, value=row['BRICS_Oil_Qty_kg'])
         ws.cell(row=row_num, column=4, value=row['BRICS_Oil_Value_USD'])
-        ws.cell(row=row_num, column=7, value='Historical')
+        if row['BRICS_Oil_Is_Partial']:
+            # Some members have not reported this month yet
+            ws.cell(row=row_num, column=7, value=partial_month_label(row, 'BRICS_Oil'))
+            ws.cell(row=row_num, column=7).font = Font(italic=True, color='C65911')
+        else:
+            ws.cell(row=row_num, column=7, value='Historical')
         
         # 3-Month MA formulas
         if row_num >= 8:
@@ -414,6 +552,7 @@ def create_oil_forecast_sheet(wb, oil_brics_monthly):
         row_num += 1
     
     # Forecast next 3 months
+    forecast_row = row_num
     last_date = oil_data['Date'].max()
     for i in range(1, 4):
         forecast_date = last_date + pd.DateOffset(months=i)
@@ -434,6 +573,23 @@ def create_oil_forecast_sheet(wb, oil_brics_monthly):
         
         row_num += 1
     
+    # Bootstrap prediction intervals for the forecast months
+    next_col = write_interval_columns(ws, 8, forecast_row,
+                                      intervals['BRICS_Oil_Qty_kg'], 'Qty ')
+    next_col = write_interval_columns(ws, next_col, forecast_row,
+                                      intervals['BRICS_Oil_Value_USD'], 'Value ',
+                                      '$#,##0')
+    
+    # Reconciled (coherent) bloc forecasts from the reporter hierarchy
+    if reconciled is not None:
+        forecast_dates = [last_date + pd.DateOffset(months=i) for i in range(1, 4)]
+        next_col = write_reconciled_column(ws, next_col, forecast_row, forecast_dates,
+                                           reconciled['BRICS_Oil_Qty_kg'],
+                                           'Reconciled Qty (MinT)')
+        write_reconciled_column(ws, next_col, forecast_row, forecast_dates,
+                                reconciled['BRICS_Oil_Value_USD'],
+                                'Reconciled Value (MinT)', '$#,##0')
+    
     # Insights section
     ws[f'A{row_num+2}'] = 'Key Insights:'
     ws[f'A{row_num+2}'].font = Font(bold=True, size=11)
@@ -461,12 +617,934 @@ def create_oil_forecast_sheet(wb, oil_brics_monthly):
     return ws
 
 
-def create_usd_dominance_sheet(wb):
+def create_btc_frequency_sheet(wb, frequency_forecasts):
+    """
+    Create BTC multi-frequency sheet (daily, weekly, monthly per-day average).
+    
+    Args:
+        wb: Openpyxl workbook object
+        frequency_forecasts: Dict from forecast_btc_frequencies()
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('BTC_Multi_Frequency')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    section_font = Font(bold=True, size=12, color='366092')
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Bitcoin (USD) Volume by Frequency'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:E1')
+    
+    ws['A2'] = 'All values are average BTC volume per day within each period'
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:E2')
+    
+    row_num = 4
+    for freq, forecast_df in frequency_forecasts.items():
+        settings = FREQUENCY_SETTINGS[freq]
+        ws.cell(row=row_num, column=1,
+                value=f"{settings['label']} - {settings['window']}-period MA Forecast")
+        ws.cell(row=row_num, column=1).font = section_font
+        ws.merge_cells(f'A{row_num}:E{row_num}')
+        row_num += 1
+        
+        headers = ['Date', 'Actual (BTC/day)', 'Moving Average', 'Forecast', 'Type']
+        for col_num, header in enumerate(headers, 1):
+            cell = ws.cell(row=row_num, column=col_num)
+            cell.value = header
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+        row_num += 1
+        
+        # Recent history plus the forecast horizon
+        n_rows = settings['window'] * 2 + settings['horizon']
+        value_col = forecast_df.columns[1]
+        for _, row in forecast_df.tail(n_rows).iterrows():
+            is_forecast = pd.notna(row['Forecast'])
+            ws.cell(row=row_num, column=1, value=row['Date'])
+            ws.cell(row=row_num, column=1).number_format = 'yyyy-mm-dd'
+            if is_forecast:
+                ws.cell(row=row_num, column=4, value=row['Forecast'])
+                ws.cell(row=row_num, column=5, value='Forecast')
+                ws.cell(row=row_num, column=5).font = Font(bold=True, color='FF0000')
+            else:
+                ws.cell(row=row_num, column=2, value=row[value_col])
+                ws.cell(row=row_num, column=3, value=row['MA'])
+                ws.cell(row=row_num, column=5, value='Historical')
+            for col in (2, 3, 4):
+                ws.cell(row=row_num, column=col).number_format = '#,##0.00'
+            row_num += 1
+        
+        row_num += 2
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 15
+    ws.column_dimensions['B'].width = 18
+    ws.column_dimensions['C'].width = 18
+    ws.column_dimensions['D'].width = 15
+    ws.column_dimensions['E'].width = 12
+    
+    return ws
+
+
+def create_currency_share_sheet(wb, shares_monthly, share_forecast):
+    """
+    Create BTC currency share sheet (monthly share of volume per currency).
+    
+    Args:
+        wb: Openpyxl workbook object
+        shares_monthly: DataFrame from compute_currency_shares(freq='M')
+        share_forecast: DataFrame from forecast_currency_shares()
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('BTC_Currency_Shares')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    currencies = [c for c in shares_monthly.columns if c != 'Date']
+    last_col = get_column_letter(len(currencies) + 2)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - BTC Trading Volume Share by Currency'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells(f'A1:{last_col}1')
+    
+    ws['A3'] = 'Monthly share of total volume; forecast = 3-month MA of log-ratios (shares sum to 100%)'
+    ws['A3'].font = Font(bold=True, size=12)
+    ws.merge_cells(f'A3:{last_col}3')
+    
+    # Column headers
+    headers = ['Date'] + currencies + ['Type']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=5, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 6
+    for frame, row_type in [(shares_monthly, 'Historical'), (share_forecast, 'Forecast')]:
+        for _, row in frame.iterrows():
+            ws.cell(row=row_num, column=1, value=row['Date'])
+            ws.cell(row=row_num, column=1).number_format = 'yyyy-mm'
+            for col_num, currency in enumerate(currencies, 2):
+                if pd.notna(row[currency]):
+                    ws.cell(row=row_num, column=col_num, value=float(row[currency]))
+                ws.cell(row=row_num, column=col_num).number_format = '0.0%'
+            ws.cell(row=row_num, column=len(currencies) + 2, value=row_type)
+            if row_type == 'Forecast':
+                ws.cell(row=row_num, column=len(currencies) + 2).font = \
+                    Font(bold=True, color='FF0000')
+            row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    for col_num in range(2, len(currencies) + 3):
+        ws.column_dimensions[get_column_letter(col_num)].width = 10
+    
+    return ws
+
+
+def create_dominance_index_sheet(wb, index_df, weights=DEFAULT_WEIGHTS):
+    """
+    Create composite USD dominance index sheet (monthly history).
+    
+    Args:
+        wb: Openpyxl workbook object
+        index_df: DataFrame from compute_dominance_index()
+        weights: Dict of component weights used for the index
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('USD_Dominance_Index')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Composite USD Dominance Index (0-100)'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:G1')
+    
+    ws['A2'] = 'Weights: ' + ', '.join(
+        f'{COMPONENT_LABELS[c]} {w:.0%}' for c, w in weights.items())
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:G2')
+    
+    # Column headers
+    components = list(weights)
+    headers = ['Date', 'Dominance Index'] + [COMPONENT_LABELS[c] for c in components]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for _, row in index_df.iterrows():
+        ws.cell(row=row_num, column=1, value=row['Date'])
+        ws.cell(row=row_num, column=1).number_format = 'yyyy-mm'
+        values = [row['Dominance_Index']] + [row[f'Score_{c}'] for c in components]
+        for col_num, value in enumerate(values, 2):
+            if pd.notna(value):
+                ws.cell(row=row_num, column=col_num, value=float(value))
+            ws.cell(row=row_num, column=col_num).number_format = '0.0'
+        ws.cell(row=row_num, column=2).font = Font(bold=True)
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    for col_num in range(2, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 18
+    
+    return ws
+
+
+def create_anomaly_report_sheet(wb, anomaly_report, max_rows=500):
+    """
+    Create sheet listing Comtrade rows flagged by the outlier screening.
+    
+    Args:
+        wb: Openpyxl workbook object
+        anomaly_report: DataFrame from screen_trade_data() with a Commodity column
+        max_rows: Maximum number of rows listed (most severe first)
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Anomaly_Report')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Comtrade Anomaly Screening'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:K1')
+    
+    counts = summarize_anomalies(anomaly_report) if len(anomaly_report) else {}
+    ws['A2'] = (f'{len(anomaly_report):,} rows flagged (robust z > {Z_THRESHOLD:g} per '
+                f'reporter x commodity): ' +
+                ', '.join(f'{reason} {n:,}' for reason, n in counts.items()))
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:K2')
+    
+    # Column headers
+    columns = ['Commodity', 'refDate', 'reporterISO', 'cmdCode', 'qty', 'primaryValue',
+               'value_per_unit', 'Reasons', 'Severity', 'Action']
+    headers = ['Commodity', 'Date', 'Reporter', 'HS Code', 'Qty (kg)', 'Value (USD)',
+               'Value per kg', 'Reasons', 'Max |z|', 'Action']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    shown = anomaly_report.sort_values('Severity', ascending=False).head(max_rows)
+    for _, row in shown.iterrows():
+        for col_num, col in enumerate(columns, 1):
+            value = row[col]
+            if isinstance(value, float) and not np.isfinite(value):
+                value = None
+            ws.cell(row=row_num, column=col_num, value=value)
+        ws.cell(row=row_num, column=2).number_format = 'yyyy-mm'
+        for col_num in (5, 6, 7):
+            ws.cell(row=row_num, column=col_num).number_format = '#,##0.00'
+        ws.cell(row=row_num, column=9).number_format = '0.0'
+        row_num += 1
+    
+    # Set column widths
+    widths = [12, 10, 10, 10, 16, 18, 14, 34, 10, 10]
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    return ws
+
+
+def create_reporting_completeness_sheet(wb, completeness_by_commodity):
+    """
+    Create sheet with the reporting-completeness index per reporter x month.
+    
+    Args:
+        wb: Openpyxl workbook object
+        completeness_by_commodity: Dict mapping commodity name to a DataFrame
+            from completeness_table()
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Reporting_Completeness')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    status_fills = {
+        1.0: PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'),
+        0.0: PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid'),
+        -1.0: PatternFill(start_color='BDD7EE', end_color='BDD7EE', fill_type='solid'),
+    }
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Comtrade Reporting Completeness'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:H1')
+    
+    ws['A2'] = ('1 = reported, 0 = expected but not yet reported (nowcast from the '
+                'reporter\'s last 3 reported months), I = imputed (reporter absent for '
+                'a long period), blank = not a regular reporter')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:H2')
+    
+    row_num = 4
+    for commodity, table in completeness_by_commodity.items():
+        headers = [commodity, 'Reporter'] + [d.strftime('%Y-%m') for d in table.columns]
+        for col_num, header in enumerate(headers, 1):
+            cell = ws.cell(row=row_num, column=col_num)
+            cell.value = header
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
+        row_num += 1
+        
+        for (bloc, reporter), values in table.iterrows():
+            ws.cell(row=row_num, column=1, value=bloc)
+            ws.cell(row=row_num, column=2, value=reporter)
+            for col_num, value in enumerate(values, 3):
+                if np.isnan(value):
+                    continue
+                cell = ws.cell(row=row_num, column=col_num,
+                               value='I' if value < 0 else int(value))
+                cell.fill = status_fills[value]
+                cell.alignment = Alignment(horizontal='center')
+            row_num += 1
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    ws.column_dimensions['B'].width = 10
+    n_cols = max(table.shape[1] for table in completeness_by_commodity.values()) + 2
+    for col_num in range(3, n_cols + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 9
+    
+    return ws
+
+
+def create_reconciliation_sheet(wb, reconciled):
+    """
+    Create sheet comparing base and reconciled reporter/bloc/world forecasts.
+    
+    Args:
+        wb: Openpyxl workbook object
+        reconciled: DataFrame from reconcile_hierarchy()
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('BRICS_Reconciliation')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    bloc_fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Coherent Reporter, Bloc and World Forecasts'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:G1')
+    
+    ws['A2'] = ('Base = each node\'s own tuned model; reconciled forecasts add up '
+                'from reporters to blocs to world (MinT weights = squared backtest MAE)')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:G2')
+    
+    # Column headers
+    method_labels = {'bottom_up': 'Bottom-Up', 'top_down': 'Top-Down', 'mint': 'MinT'}
+    headers = ['Series', 'Level', 'Node', 'Model', 'Month', 'Base Forecast'] + \
+        [method_labels[m] for m in RECONCILIATION_METHODS]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    # World and bloc totals plus the individual BRICS reporters
+    shown = reconciled[(reconciled['Level'] != 'Reporter') |
+                       (reconciled['Bloc'] == 'BRICS')]
+    level_order = {'World': 0, 'Bloc': 1, 'Reporter': 2}
+    shown = shown.assign(_order=shown['Level'].map(level_order)) \
+        .sort_values(['Group', '_order', 'Node', 'Date'], kind='stable')
+    
+    row_num = 5
+    for _, row in shown.iterrows():
+        values = [row['Group'], row['Level'], row['Node'], row['Model'],
+                  row['Date'].strftime('%Y-%m'), row['Base_Forecast']] + \
+            [row[m] for m in RECONCILIATION_METHODS]
+        for col_num, value in enumerate(values, 1):
+            cell = ws.cell(row=row_num, column=col_num, value=value)
+            if col_num >= 6:
+                cell.number_format = '#,##0'
+            if row['Level'] != 'Reporter':
+                cell.fill = bloc_fill
+                cell.font = Font(bold=True)
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 18
+    ws.column_dimensions['B'].width = 10
+    ws.column_dimensions['C'].width = 10
+    ws.column_dimensions['D'].width = 22
+    ws.column_dimensions['E'].width = 10
+    for col_num in range(6, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 20
+    
+    return ws
+
+
+def create_model_selection_sheet(wb, series_by_name, model_configs,
+                                 tuned_forecasts=None):
+    """
+    Create sheet listing the tuned forecast model per series.
+    
+    Args:
+        wb: Openpyxl workbook object
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        model_configs: Dict from load_or_search_configs()
+        tuned_forecasts: Optional dict mapping name to its 3-month tuned
+            forecast (computed with forecast_from_config() when omitted)
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Model_Selection')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Tuned Forecast Models'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:I1')
+    
+    ws['A2'] = ('Best of SMA windows, EMA alphas and seasonal averages per series, '
+                'scored by rolling-origin MAE over 1-3 month horizons')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:I2')
+    
+    # Column headers
+    headers = ['Series', 'Best Model', 'Rolling-Origin MAE', '3-Month MA MAE',
+               'Improvement', 'Origins', 'Forecast +1', 'Forecast +2', 'Forecast +3']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for name, config in model_configs.items():
+        if tuned_forecasts is not None:
+            forecast = tuned_forecasts[name]
+        else:
+            values = series_by_name[name].dropna().sort_index().to_numpy(dtype=float)
+            forecast = forecast_from_config(values, config, n_forecast=3)
+        
+        ws.cell(row=row_num, column=1, value=name)
+        ws.cell(row=row_num, column=2, value=describe_config(config))
+        ws.cell(row=row_num, column=3, value=config['mae'])
+        ws.cell(row=row_num, column=4, value=config['baseline_mae'])
+        ws.cell(row=row_num, column=5, value=f'=IF(D{row_num}>0,1-C{row_num}/D{row_num},"")')
+        ws.cell(row=row_num, column=6, value=config['n_origins'])
+        for i, value in enumerate(forecast):
+            ws.cell(row=row_num, column=7 + i, value=float(value))
+            ws.cell(row=row_num, column=7 + i).number_format = '#,##0.00'
+        
+        ws.cell(row=row_num, column=2).font = Font(bold=True)
+        ws.cell(row=row_num, column=3).number_format = '#,##0.00'
+        ws.cell(row=row_num, column=4).number_format = '#,##0.00'
+        ws.cell(row=row_num, column=5).number_format = '0.0%'
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 24
+    ws.column_dimensions['B'].width = 22
+    for col_num in range(3, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 18
+    
+    return ws
+
+
+def create_granger_causality_sheet(wb, granger_table):
+    """
+    Create sheet with the VAR Granger-causality tests.
+    
+    Args:
+        wb: Openpyxl workbook object
+        granger_table: DataFrame from granger_causality()
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Granger_Causality')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    significant_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Granger Causality (VAR)'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:J1')
+    
+    ws['A2'] = ('F-test of dropping all lags of the cause from the effect equation of a VAR '
+                'on monthly changes (share differences, log flow changes); lag order by BIC, '
+                f'significant rows (Benjamini-Hochberg q < {SIGNIFICANCE:g}) highlighted')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:J2')
+    
+    # Column headers
+    headers = ['Cause', 'Effect', 'Conditioning On', 'Lag Order', 'F-Statistic',
+               'DF (num, den)', 'p-Value', 'q-Value', 'Significant', 'Months']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for _, row in granger_table.iterrows():
+        ws.cell(row=row_num, column=1, value=row['Cause'])
+        ws.cell(row=row_num, column=2, value=row['Effect'])
+        ws.cell(row=row_num, column=3, value=row['Conditioning'] or '-')
+        ws.cell(row=row_num, column=4, value=int(row['Lag_Order']))
+        ws.cell(row=row_num, column=5, value=float(row['F_Stat']))
+        ws.cell(row=row_num, column=6, value=f"{row['DF_Num']}, {row['DF_Den']}")
+        ws.cell(row=row_num, column=7, value=float(row['P_Value']))
+        ws.cell(row=row_num, column=8, value=float(row['Q_Value']))
+        ws.cell(row=row_num, column=9, value='Yes' if row['Significant'] else 'No')
+        ws.cell(row=row_num, column=10, value=int(row['N_Obs']))
+        
+        ws.cell(row=row_num, column=5).number_format = '0.00'
+        ws.cell(row=row_num, column=7).number_format = '0.000'
+        ws.cell(row=row_num, column=8).number_format = '0.000'
+        if row['Significant']:
+            for col_num in range(1, len(headers) + 1):
+                ws.cell(row=row_num, column=col_num).fill = significant_fill
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 24
+    ws.column_dimensions['B'].width = 24
+    ws.column_dimensions['C'].width = 50
+    for col_num in range(4, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 14
+    ws.freeze_panes = 'A5'
+    
+    return ws
+
+
+def create_seasonal_adjustment_sheet(wb, series_by_name, seasonal_indices,
+                                     seasonal_strength, adjusted_fit=False):
+    """
+    Create sheet with the seasonal indices and seasonal 3-month MA forecasts.
+    
+    Args:
+        wb: Openpyxl workbook object
+        series_by_name: Dict mapping name to a pandas Series indexed by Date
+        seasonal_indices: Indices DataFrame from seasonally_adjusted_inputs()
+        seasonal_strength: Strength Series from seasonally_adjusted_inputs()
+        adjusted_fit: Whether intervals and tuned models were fitted on the
+            seasonally adjusted series
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Seasonal_Adjustment')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Seasonal Adjustment'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:S1')
+    
+    ws['A2'] = ('Classical multiplicative decomposition (centered 2x12 moving-average trend); '
+                f'series with seasonal strength below {MIN_STRENGTH:g} keep neutral indices. '
+                'Intervals and tuned models fitted on '
+                + ('seasonally adjusted series' if adjusted_fit else 'unadjusted series'))
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:S2')
+    
+    # Column headers
+    month_names = [f'{month:%b}' for month in pd.date_range('2000-01-01', periods=12, freq='MS')]
+    headers = (['Series', 'Seasonal Strength', 'Adjusted'] + month_names
+               + ['3-Month MA Forecast', 'Seasonal MA +1', 'Seasonal MA +2', 'Seasonal MA +3'])
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for name, series in series_by_name.items():
+        factors = seasonal_indices.loc[name]
+        _, seasonal_forecast = seasonal_moving_average_forecast(series, factors)
+        
+        ws.cell(row=row_num, column=1, value=name)
+        ws.cell(row=row_num, column=2, value=float(seasonal_strength[name]))
+        ws.cell(row=row_num, column=3,
+                value='Yes' if seasonal_strength[name] >= MIN_STRENGTH else 'No')
+        for month in range(1, 13):
+            ws.cell(row=row_num, column=3 + month, value=float(factors[month]))
+            ws.cell(row=row_num, column=3 + month).number_format = '0.000'
+        ws.cell(row=row_num, column=16, value=float(series.dropna().sort_index().tail(3).mean()))
+        for i, value in enumerate(seasonal_forecast):
+            ws.cell(row=row_num, column=17 + i, value=float(value))
+        
+        ws.cell(row=row_num, column=1).font = Font(bold=True)
+        ws.cell(row=row_num, column=2).number_format = '0.00'
+        for col_num in range(16, 20):
+            ws.cell(row=row_num, column=col_num).number_format = '#,##0.00'
+        row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 24
+    ws.column_dimensions['B'].width = 14
+    ws.column_dimensions['C'].width = 11
+    for col_num in range(4, 16):
+        ws.column_dimensions[get_column_letter(col_num)].width = 8
+    for col_num in range(16, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 18
+    ws.freeze_panes = 'B5'
+    
+    return ws
+
+def create_price_volume_sheet(wb, price_volume, groups=('BRICS', 'US_EU'), n_months=24):
+    """
+    Create sheet splitting monthly import value growth into price and volume.
+    
+    Args:
+        wb: Openpyxl workbook object
+        price_volume: DataFrame from price_volume_decomposition()
+        groups: Groups to list
+        n_months: Months per commodity and group
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Price_Volume')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = 'SECTION D: PREDICTIVE ANALYSIS - Price / Volume Decomposition'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:O1')
+    
+    ws['A2'] = ('Month-over-month index numbers over reporter x HS code items reported in both '
+                'months; log value growth = price effect (log Fisher price) + volume effect '
+                '(log Fisher volume) + coverage effect (items entering or leaving)')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:O2')
+    
+    # Column headers
+    headers = ['Commodity', 'Group', 'Date', 'Unit Value (USD/kg)', 'Value Growth',
+               'Laspeyres Price', 'Paasche Price', 'Fisher Price', 'Fisher Volume',
+               'Price Effect', 'Volume Effect', 'Coverage Effect', 'Matched Share',
+               'Price Index', 'Volume Index']
+    columns = ['Unit_Value', 'Value_Growth', 'Price_Laspeyres', 'Price_Paasche',
+               'Price_Fisher', 'Volume_Fisher', 'Price_Effect', 'Volume_Effect',
+               'Coverage_Effect', 'Matched_Share', 'Price_Index', 'Volume_Index']
+    formats = ['#,##0.00', '0.0%', '0.000', '0.000', '0.000', '0.000', '0.000', '0.000',
+               '0.000', '0.0%', '0.0', '0.0']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for (commodity, group), rows in price_volume.groupby(['Commodity', 'Group'], sort=False):
+        if group not in groups:
+            continue
+        for _, row in rows.sort_values('Date').tail(n_months).iterrows():
+            ws.cell(row=row_num, column=1, value=commodity)
+            ws.cell(row=row_num, column=2, value=group)
+            ws.cell(row=row_num, column=3, value=row['Date'].strftime('%Y-%m'))
+            for i, (col, number_format) in enumerate(zip(columns, formats)):
+                value = row[col]
+                cell = ws.cell(row=row_num, column=4 + i,
+                               value=float(value) if pd.notna(value) else None)
+                cell.number_format = number_format
+            row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    ws.column_dimensions['B'].width = 10
+    ws.column_dimensions['C'].width = 10
+    for col_num in range(4, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 14
+    ws.freeze_panes = 'D5'
+    
+    return ws
+
+def create_partner_network_sheet(wb, metrics, top_partners_by_commodity, bloc='BRICS',
+                                 n_months=24):
+    """
+    Create sheet with the bloc's partner concentration and partner-group shares.
+    
+    Args:
+        wb: Openpyxl workbook object
+        metrics: DataFrame from network_metrics()
+        top_partners_by_commodity: Dict mapping commodity to a DataFrame
+            from top_partners()
+        bloc: Bloc whose imports are listed
+        n_months: Months per commodity
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Partner_Network')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = f'SECTION D: PREDICTIVE ANALYSIS - {bloc} Import Partner Network'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:K1')
+    
+    ws['A2'] = ('From bilateral Comtrade extracts (reporter x partner x month); HHI = sum of '
+                'squared partner shares of import value, effective partners = 1 / HHI')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:K2')
+    
+    # Column headers
+    headers = ['Commodity', 'Date', 'Import Value (USD)', 'Partners', 'Partner HHI',
+               'Effective Partners', 'Top Partner', 'Top Partner Share',
+               'Intra-BRICS Share', 'USD-Pegged Share', 'Sanctioned Share']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    rows = metrics[(metrics['Level'] == 'Bloc') & (metrics['Reporter'] == bloc)]
+    for commodity, group in rows.groupby('Commodity', sort=False):
+        for _, row in group.sort_values('Date').tail(n_months).iterrows():
+            ws.cell(row=row_num, column=1, value=commodity)
+            ws.cell(row=row_num, column=2, value=row['Date'].strftime('%Y-%m'))
+            ws.cell(row=row_num, column=3, value=float(row['Total_Value_USD']))
+            ws.cell(row=row_num, column=4, value=int(row['N_Partners']))
+            ws.cell(row=row_num, column=5, value=float(row['Partner_HHI']))
+            ws.cell(row=row_num, column=6, value=float(row['Effective_Partners']))
+            ws.cell(row=row_num, column=7, value=row['Top_Partner'])
+            ws.cell(row=row_num, column=8, value=float(row['Top_Partner_Share']))
+            ws.cell(row=row_num, column=9, value=float(row['Intra_BRICS_Share']))
+            ws.cell(row=row_num, column=10, value=float(row['USD_Pegged_Share']))
+            ws.cell(row=row_num, column=11, value=float(row['Sanctioned_Share']))
+            
+            ws.cell(row=row_num, column=3).number_format = '#,##0'
+            ws.cell(row=row_num, column=5).number_format = '0.000'
+            ws.cell(row=row_num, column=6).number_format = '0.0'
+            for col_num in range(8, 12):
+                ws.cell(row=row_num, column=col_num).number_format = '0.0%'
+            row_num += 1
+    
+    # Largest partners over the last 12 months
+    row_num += 1
+    ws.cell(row=row_num, column=1, value=f'Top {bloc} Partners (last 12 months)').font = \
+        Font(bold=True, size=12, color='366092')
+    row_num += 1
+    for col_num, header in enumerate(['Commodity', 'Partner', 'Import Value (USD)', 'Share'], 1):
+        cell = ws.cell(row=row_num, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    row_num += 1
+    for commodity, partners in top_partners_by_commodity.items():
+        for _, row in partners.iterrows():
+            ws.cell(row=row_num, column=1, value=commodity)
+            ws.cell(row=row_num, column=2, value=row['Partner'])
+            ws.cell(row=row_num, column=3, value=float(row['Value_USD']))
+            ws.cell(row=row_num, column=4, value=float(row['Share']))
+            ws.cell(row=row_num, column=3).number_format = '#,##0'
+            ws.cell(row=row_num, column=4).number_format = '0.0%'
+            row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    ws.column_dimensions['B'].width = 12
+    ws.column_dimensions['C'].width = 20
+    for col_num in range(4, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 14
+    ws.freeze_panes = 'A5'
+    
+    return ws
+
+def create_mirror_reconciliation_sheet(wb, mirror_summaries, reliabilities, bloc='BRICS',
+                                       n_months=24):
+    """
+    Create sheet comparing reported imports with partner-reported exports.
+    
+    Args:
+        wb: Openpyxl workbook object
+        mirror_summaries: Dict mapping commodity to a DataFrame from
+            bloc_mirror_summary()
+        reliabilities: Dict mapping commodity to the reliability DataFrame
+            from reconcile_mirror_flows()
+        bloc: Bloc whose imports are listed
+        n_months: Months per commodity
+    
+    Returns:
+        Worksheet object
+    """
+    ws = wb.create_sheet('Mirror_Reconciliation')
+    
+    # Styles
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    # Title
+    ws['A1'] = f'SECTION D: PREDICTIVE ANALYSIS - {bloc} Mirror-Statistics Reconciliation'
+    ws['A1'].font = Font(bold=True, size=14, color='366092')
+    ws.merge_cells('A1:H1')
+    
+    ws['A2'] = ('Reported imports vs partner-reported exports (CIF-adjusted) per importer, '
+                'exporter, HS code and month; reconciled value weights each side by its '
+                f'reporter reliability, flows differing by more than {MAX_RATIO:g}x counted')
+    ws['A2'].font = Font(italic=True, size=10)
+    ws.merge_cells('A2:H2')
+    
+    # Column headers
+    headers = ['Commodity', 'Date', 'Reported Imports (USD)', 'Mirror Exports CIF (USD)',
+               'Reconciled Imports (USD)', 'Reconciled vs Reported', 'Matched Share',
+               'Large Discrepancies']
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    
+    row_num = 5
+    for commodity, summary in mirror_summaries.items():
+        rows = summary[summary['Bloc'] == bloc].sort_values('Date').tail(n_months)
+        for _, row in rows.iterrows():
+            ws.cell(row=row_num, column=1, value=commodity)
+            ws.cell(row=row_num, column=2, value=row['Date'].strftime('%Y-%m'))
+            for col_num, col in enumerate(['Reported_Imports', 'Mirror_Exports_CIF',
+                                           'Reconciled_Imports', 'Reconciled_vs_Reported',
+                                           'Matched_Share'], 3):
+                value = row[col]
+                ws.cell(row=row_num, column=col_num,
+                        value=float(value) if pd.notna(value) else None)
+            ws.cell(row=row_num, column=8, value=int(row['Large_Discrepancies']))
+            
+            for col_num in range(3, 6):
+                ws.cell(row=row_num, column=col_num).number_format = '#,##0'
+            ws.cell(row=row_num, column=6).number_format = '+0.0%;-0.0%'
+            ws.cell(row=row_num, column=7).number_format = '0.0%'
+            row_num += 1
+    
+    # Reporter reliability of the bloc members as importers
+    row_num += 1
+    ws.cell(row=row_num, column=1, value=f'{bloc} Importer Reliability').font = \
+        Font(bold=True, size=12, color='366092')
+    row_num += 1
+    for col_num, header in enumerate(['Commodity', 'Importer', 'Matched Flows',
+                                      'Median |Log Discrepancy|', 'Reliability'], 1):
+        cell = ws.cell(row=row_num, column=col_num)
+        cell.value = header
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+    row_num += 1
+    for commodity, reliability in reliabilities.items():
+        importers = reliability.loc['Importer'] if 'Importer' in reliability.index else None
+        if importers is None:
+            continue
+        for country in [c for c in BLOCS[bloc] if c in importers.index]:
+            stats = importers.loc[country]
+            ws.cell(row=row_num, column=1, value=commodity)
+            ws.cell(row=row_num, column=2, value=country)
+            ws.cell(row=row_num, column=3, value=int(stats['Matched_Flows']))
+            ws.cell(row=row_num, column=4, value=float(stats['Median_Abs_Log_Discrepancy']))
+            ws.cell(row=row_num, column=5, value=float(stats['Reliability']))
+            ws.cell(row=row_num, column=4).number_format = '0.000'
+            ws.cell(row=row_num, column=5).number_format = '0.00'
+            row_num += 1
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 12
+    ws.column_dimensions['B'].width = 12
+    for col_num in range(3, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = 20
+    ws.freeze_panes = 'A5'
+    
+    return ws
+
+def create_usd_dominance_sheet(wb, usd_share, dominance, simulation,
+                               weights=DEFAULT_WEIGHTS, granger_lines=None,
+                               change_point_lines=None, granger_causes=None):
     """
     Create USD Dominance Analysis summary sheet.
     
+    All figures in the summary and KPI table are computed on each run from
+    the currency shares and the composite dominance index.
+    
     Args:
         wb: Openpyxl workbook object
+        usd_share: Dict from summarize_currency_share() for USD
+        dominance: Dict from summarize_dominance_index()
+        simulation: Dict from simulate_dominance_probability()
+        weights: Dict of component weights used for the index
+        granger_lines: Optional list from summarize_granger() (tests of the
+            flows on the BTC USD share)
+        change_point_lines: Optional list from describe_change_points()
+        granger_causes: Optional dict from significant_causes() (flows that
+            Granger-cause the BTC USD share)
     
     Returns:
         Worksheet object
@@ -498,22 +1576,36 @@ def create_usd_dominance_sheet(wb):
     summary_points = [
         ('Based on 3-month moving average forecasts across BTC, Gold, and Oil:', ''),
         ('', ''),
-        ('1. BTC Trading Volume Trends:', 'USD maintains 60-70% dominance in BTC trading volume'),
-        ('', '     - Forecast shows stable USD-BTC trading patterns through Q1 2026'),
-        ('', '     - Alternative currencies (EUR, KRW) show modest but not disruptive growth'),
+        ('1. BTC Trading Volume Trends:', describe_currency_share(usd_share)),
+        ('', f"     - Latest month ({usd_share['latest_date']:%Y-%m}): {usd_share['latest']:.1%}, "
+             f"3-month forecast: {usd_share['forecast']:.1%}"),
+        ('', f"     - Largest alternative currency: {usd_share['runner_up']} "
+             f"({usd_share['runner_up_share']:.1%} average share)"),
         ('', ''),
-        ('2. BRICS Gold Accumulation:', 'Accelerating reserves signal USD hedging strategy'),
-        ('', '     - BRICS gold imports forecast to continue rising (+8-12% next 3 months)'),
-        ('', '     - Central bank diversification away from USD assets is evident'),
+        ('2. BRICS Gold Accumulation:',
+         f"BRICS gold import volume {dominance['gold_brics_yoy']:+.1%} YoY "
+         f"(3 months to {dominance['gold_yoy_date']:%Y-%m})"),
+        ('', f"     - 3-month MA forecast vs prior 3 months: "
+             f"{dominance['gold_brics_forecast_change']:+.1%}"),
+        ('', f"     - US/EU share of BRICS + US/EU gold import value: "
+             f"{dominance['gold_us_eu_ratio']:.1%}"),
         ('', ''),
-        ('3. BRICS Oil Imports:', 'Energy trade increasingly settling outside USD'),
-        ('', '     - China/India petroyuan settlements growing but still minority share'),
-        ('', '     - Forecast shows continued high oil demand from BRICS nations'),
+        ('3. BRICS Oil Imports:',
+         f"BRICS crude oil import volume {dominance['oil_brics_yoy']:+.1%} YoY "
+         f"(3 months to {dominance['oil_yoy_date']:%Y-%m})"),
+        ('', f"     - 3-month MA forecast vs prior 3 months: "
+             f"{dominance['oil_brics_forecast_change']:+.1%}"),
+        ('', f"     - US/EU share of BRICS + US/EU oil import value: "
+             f"{dominance['oil_us_eu_ratio']:.1%}"),
         ('', ''),
-        ('CONCLUSION:', 'USD will likely remain dominant through 2027, but its monopoly is weakening'),
-        ('', '     - Short-term (2025-2027): USD dominance continues but erodes 5-10%'),
-        ('', '     - Medium-term (2027-2030): Multi-currency system emerges with USD at ~50-60%'),
-        ('', '     - Key trigger: Successful BRICS payment system launch could accelerate shift'),
+        ('CONCLUSION:',
+         f"Composite USD dominance index {dominance['index_latest']:.1f}/100 "
+         f"({dominance['index_date']:%Y-%m}), {dominance['index_change']:+.1f} pts over 12 months"),
+        ('', f"     - 3-month MA of the index: {dominance['index_forecast']:.1f}/100"),
+        ('', f"     - Strongest component: {COMPONENT_LABELS[dominance['strongest_component']]} "
+             f"({dominance['component_scores'][dominance['strongest_component']]:.1f})"),
+        ('', f"     - Weakest component: {COMPONENT_LABELS[dominance['weakest_component']]} "
+             f"({dominance['component_scores'][dominance['weakest_component']]:.1f})"),
     ]
     
     row = 5
@@ -552,6 +1644,16 @@ def create_usd_dominance_sheet(wb):
         '  - Formula: Forecast = (Month-3 + Month-2 + Month-1) / 3',
         '  - Assumes recent patterns continue in near term',
         '',
+        'Composite USD Dominance Index (0-100, higher = stronger USD):',
+        '  - ' + ', '.join(f'{COMPONENT_LABELS[c]} {w:.0%}' for c, w in weights.items()),
+        '  - Growth components map 0% YoY growth to 50; BRICS growth lowers the score',
+        '',
+    ]
+    if granger_lines:
+        methodology += ['Granger Causality on BTC USD Share (VAR, see Granger_Causality sheet):']
+        methodology += [f'  - {line}' for line in granger_lines]
+        methodology += ['']
+    methodology += [
         'Data Sources:',
         '  - Bitcoin: Trading volume by currency (2020-2025) from Bitcoinity.org',
         '  - Gold: UN Comtrade import data for BRICS vs US/EU (2021-2025)',
@@ -562,6 +1664,10 @@ def create_usd_dominance_sheet(wb):
         '  - Does not account for geopolitical events (wars, sanctions, BRICS expansion)',
         '  - Linear extrapolation may miss accelerating trends or reversals',
     ]
+    if change_point_lines:
+        methodology += ['  - Structural breaks (PELT change points); intervals and tuned '
+                        'models use the latest regime:']
+        methodology += [f'  - {line}' for line in change_point_lines]
     
     for point in methodology:
         ws[f'A{row}'] = point
@@ -580,7 +1686,7 @@ def create_usd_dominance_sheet(wb):
     
     row += 1
     # Table headers
-    headers = ['Indicator', 'Current Trend', 'Q1 2026 Forecast', 'Impact on USD']
+    headers = ['Indicator', 'Current', 'Next 3 Months (3-MA)', 'Impact on USD']
     for col, header in enumerate(headers, 1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
@@ -590,16 +1696,28 @@ def create_usd_dominance_sheet(wb):
     
     row += 1
     indicators = [
-        ('BTC USD Trading %', 'Stable 60-70%', 'Stable 60-70%', 
-         'Neutral - USD holds BTC gateway'),
-        ('BRICS Gold Reserves', 'Rising +10%/yr', 'Continue Rising', 
-         'Negative - Diversification'),
-        ('BRICS Oil Imports', 'Growing +5%/yr', 'Sustained Growth', 
-         'Negative - Alt settlements'),
-        ('USD in SWIFT', '~42% (2024)', '~40% (est)', 
-         'Negative - Declining share'),
-        ('BRICS Payment System', 'Development', 'Early Testing', 
-         'Risk - Could accelerate shift'),
+        ('BTC USD Trading %', f"{usd_share['latest']:.1%} ({usd_share['latest_date']:%Y-%m})",
+         f"{usd_share['forecast']:.1%}",
+         'Neutral - USD holds BTC gateway' if usd_share['forecast'] >= 0.5
+         else 'Negative - USD below majority'),
+        ('BRICS Gold Imports', f"{dominance['gold_brics_yoy']:+.1%}/yr",
+         f"{dominance['gold_brics_forecast_change']:+.1%}",
+         'Negative - Diversification' if dominance['gold_brics_yoy'] > 0
+         else 'Neutral - Accumulation slowing'),
+        ('BRICS Oil Imports', f"{dominance['oil_brics_yoy']:+.1%}/yr",
+         f"{dominance['oil_brics_forecast_change']:+.1%}",
+         'Negative - Alt settlements' if dominance['oil_brics_yoy'] > 0
+         else 'Neutral - Demand slowing'),
+        ('US/EU Gold Import Share', f"{dominance['gold_us_eu_ratio']:.1%}", '-',
+         'Negative - BRICS majority' if dominance['gold_us_eu_ratio'] < 0.5
+         else 'Neutral - US/EU majority'),
+        ('US/EU Oil Import Share', f"{dominance['oil_us_eu_ratio']:.1%}", '-',
+         'Negative - BRICS majority' if dominance['oil_us_eu_ratio'] < 0.5
+         else 'Neutral - US/EU majority'),
+        ('USD Dominance Index', f"{dominance['index_latest']:.1f}",
+         f"{dominance['index_forecast']:.1f}",
+         'Negative - Declining index' if dominance['index_change'] < 0
+         else 'Neutral - Index stable or rising'),
     ]
     
     for indicator, current, forecast, impact in indicators:
@@ -623,23 +1741,58 @@ def create_usd_dominance_sheet(wb):
     ws[f'A{row}'].fill = highlight_fill
     
     row += 1
+    verdict = ('USD REMAINS DOMINANT' if simulation['probability'] >= 0.5
+               else 'USD DOMINANCE AT RISK')
+    percentiles = simulation['index_percentiles']
+    
+    # Evidence bullets that depend on this run's data
+    supporting, concerning = [], []
+    if granger_causes:
+        concerning.append('- ' + ', '.join(
+            f"{cause.replace('_', ' ')} (q={q:.3f})" for cause, q in granger_causes.items())
+            + ' Granger-cause the BTC USD share')
+    elif granger_causes is not None:
+        supporting.append(' No trade flow Granger-causes the BTC USD share '
+                          f'(all q >= {SIGNIFICANCE:g})')
+    if dominance['gold_brics_yoy'] > 0:
+        trend = ('and the 3-MA forecast is still rising'
+                 if dominance['gold_brics_forecast_change'] > 0
+                 else 'but the 3-MA forecast is slowing')
+        concerning.append(f"- BRICS gold imports {dominance['gold_brics_yoy']:+.1%} YoY "
+                          f"(hedging behavior) {trend} "
+                          f"({dominance['gold_brics_forecast_change']:+.1%})")
+    drift = percentiles[50] - dominance['index_latest']
+    outlook = (f"{dominance['index_date']:%Y}-{simulation['target_date']:%Y}: "
+               f"index {dominance['index_change']:+.1f} pts over 12 months, simulated "
+               f"median {drift:+.1f} pts by {simulation['target_date']:%Y-%m}"
+               + (' - gradual USD erosion continues' if drift < 0
+                  else ' - status quo holds'))
+    
     assessment = [
-        'Probability: 75% - USD REMAINS DOMINANT but with REDUCED POWER',
+        f"Probability: {simulation['probability']:.0%} - {verdict} "
+        f"(95% CI {simulation['ci_low']:.1%}-{simulation['ci_high']:.1%})",
+        f"  - Monte Carlo: {simulation['n_paths']:,} simulated paths to "
+        f"{simulation['target_date']:%Y-%m} ({simulation['horizon_months']} months), "
+        f"residuals resampled from the fitted 3-MA models",
+        f"  - Dominance rule: {simulation['rule_description']}",
+        f"  - Simulated index at {simulation['target_date']:%Y-%m}: median "
+        f"{percentiles[50]:.1f}, 90% range {percentiles[5]:.1f}-{percentiles[95]:.1f}",
         '',
         'Supporting Evidence:',
         ' BTC forecasts show USD maintaining crypto trading leadership',
+        *supporting,
         ' No viable alternative single currency emerges by 2027',
         ' US economic fundamentals still strongest globally',
         ' SWIFT infrastructure deeply embedded in global trade',
         '',
         'Concerning Trends:',
-        '- BRICS gold accumulation accelerating (hedging behavior)',
+        *concerning,
         '- Alternative payment systems gaining traction',
         '- Energy markets diversifying settlement currencies',
         '- US fiscal position deteriorating (debt concerns)',
         '',
         'Critical Timeline:',
-        '2025-2026: Status quo holds, gradual USD erosion continues',
+        outlook,
         '2027: BRICS payment system launch - potential inflection point',
         '2027-2030: Multi-polar currency system likely emerges',
         '',
@@ -688,6 +1841,8 @@ def main():
     
     Outputs:
         - Predictive_Analysis_Forecasts.xlsx
+        - Anomaly_Report.csv
+        - Forecast_Export.parquet (or .csv) and Forecast_Export_metadata.json
     """
     print("="*70)
     print("SECTION D: PREDICTIVE ANALYSIS - 3-Month Moving Average Forecasts")
@@ -698,38 +1853,269 @@ def main():
     gold_path = 'Gold_TradeData_Cleaned.csv'
     oil_path = 'Oil_TradeData_Cleaned.csv'
     output_path = 'Predictive_Analysis_Forecasts.xlsx'
+    anomaly_report_path = 'Anomaly_Report.csv'
+    
+    # Outlier policy for Comtrade rows: 'flag', 'cap' or 'exclude'
+    anomaly_policy = ANOMALY_POLICY
+    
+    # CSV loading backend: 'pandas' or 'polars' (multithreaded, needs Polars)
+    backend = DEFAULT_BACKEND
+    
+    # Machine-readable exports of the forecast series ('parquet' needs pyarrow)
+    export_formats = DEFAULT_FORMATS
+    
+    # Fit intervals and tuned models on 'full' history or 'post_break' (the
+    # regime after the last detected structural break)
+    regime_mode = DEFAULT_REGIME_MODE
+    
+    # Fit intervals and tuned models on seasonally adjusted series; their
+    # forecasts are reseasonalized with the calendar-month indices
+    seasonal_adjustment = False
+    
+    # Monte Carlo settings for the post-July 2027 probability
+    n_paths = 1_000_000
+    n_workers = 1
+    
+    # Checkpoint the search, VAR and simulation tasks in this SQLite file
+    # (e.g. 'run_state.sqlite') so an interrupted run resumes where it stopped
+    run_store = None
     
     print("\n[1/5] Loading and processing data...")
     btc_monthly, gold_brics_monthly, gold_us_eu_monthly, \
-        oil_brics_monthly, oil_us_eu_monthly = load_and_process_data(
-            btc_path, gold_path, oil_path)
+        oil_brics_monthly, oil_us_eu_monthly, inputs = load_and_process_data(
+            btc_path, gold_path, oil_path, anomaly_policy, backend=backend,
+            return_inputs=True)
     
     print(f"   BTC data: {len(btc_monthly)} months")
     print(f"   Gold BRICS data: {len(gold_brics_monthly)} months")
     print(f"   Oil BRICS data: {len(oil_brics_monthly)} months")
     
+    forecast_series = {
+        'BTC_Volume': btc_monthly.set_index('Date')['BTC_Volume'],
+        'BRICS_Gold_Qty_kg': gold_brics_monthly.set_index('Date')['BRICS_Gold_Qty_kg'],
+        'BRICS_Gold_Value_USD': gold_brics_monthly.set_index('Date')['BRICS_Gold_Value_USD'],
+        'BRICS_Oil_Qty_kg': oil_brics_monthly.set_index('Date')['BRICS_Oil_Qty_kg'],
+        'BRICS_Oil_Value_USD': oil_brics_monthly.set_index('Date')['BRICS_Oil_Value_USD'],
+    }
+    adjusted_series, seasonal_indices, seasonal_strength = \
+        seasonally_adjusted_inputs(forecast_series)
+    for name, strength in seasonal_strength.items():
+        print(f"   Seasonal strength - {name}: {strength:.2f}")
+    model_inputs = adjusted_series if seasonal_adjustment else forecast_series
+    fit_series, change_points = fit_series_for_mode(model_inputs, regime_mode)
+    change_point_lines = describe_change_points(change_points, fit_series)
+    for line in change_point_lines:
+        print(f"   Structural breaks - {line}")
+    forecast_intervals = compute_forecast_intervals(
+        fit_series, n_forecast=3, levels=DEFAULT_LEVELS, method='block')
+    if seasonal_adjustment:
+        forecast_intervals = reseasonalize_intervals(forecast_intervals, seasonal_indices)
+    
+    # Best model per series (stored in forecast_model_config.json and
+    # reused until the series' data or fit settings change)
+    model_configs = load_or_search_configs(
+        fit_series, n_workers=n_workers, run_store=run_store,
+        fit_settings={'regime_mode': regime_mode,
+                      'seasonal_adjustment': seasonal_adjustment})
+    for name, config in model_configs.items():
+        print(f"   {name}: {describe_config(config)}")
+    tuned_forecasts = {
+        name: forecast_from_config(series.dropna().sort_index().to_numpy(dtype=float),
+                                   model_configs[name], n_forecast=3)
+        for name, series in fit_series.items()}
+    if seasonal_adjustment:
+        tuned_forecasts = {
+            name: reseasonalize(values, forecast_intervals[name]['Date'],
+                                seasonal_indices.loc[name])
+            for name, values in tuned_forecasts.items()}
+    
+    btc_daily = inputs['btc_daily']
+    btc_frequency_forecasts = forecast_btc_frequencies(btc_daily, currency='USD')
+    print(f"   BTC daily data: {len(btc_daily)} days")
+    
+    shares_monthly = compute_currency_shares(btc_daily, freq='M')
+    share_forecast = forecast_currency_shares(shares_monthly, n_forecast=3)
+    usd_share = summarize_currency_share(shares_monthly, share_forecast, 'USD')
+    print(f"   USD share of BTC volume: {usd_share['latest']:.1%} (latest month)")
+    
+    # Screened Comtrade rows and the anomaly report (from load_and_process_data)
+    gold_df, oil_df = inputs['trade']['Gold'], inputs['trade']['Oil']
+    gold_anomalies, oil_anomalies = inputs['anomalies']['Gold'], inputs['anomalies']['Oil']
+    anomaly_report = pd.concat([gold_anomalies.assign(Commodity='Gold'),
+                                oil_anomalies.assign(Commodity='Oil')],
+                               ignore_index=True)
+    anomaly_report.to_csv(anomaly_report_path, index=False)
+    print(f"   Anomalies ({anomaly_policy}): {len(gold_anomalies)} gold rows, "
+          f"{len(oil_anomalies)} oil rows -> {anomaly_report_path}")
+    
+    # Structurally absent reporters, imputed once in load_and_process_data
+    imputed = inputs['imputed']
+    print("   Imputed reporter months: " + ', '.join(
+        f"{commodity} {source} {n:,}"
+        for (commodity, source), n in summarize_imputation(imputed).items()))
+    gold_imputed_df = inputs['imputed_trade']['Gold']
+    oil_imputed_df = inputs['imputed_trade']['Oil']
+    
+    # Reporter -> bloc -> world forecasts, reconciled to add up (late
+    # reporters nowcast and absent ones imputed, like the bloc series)
+    reporter_panel = pd.concat([
+        build_reporter_panel(gold_imputed_df,
+                             {'qty': 'Gold_Qty_kg', 'primaryValue': 'Gold_Value_USD'}),
+        build_reporter_panel(oil_imputed_df,
+                             {'qty': 'Oil_Qty_kg', 'primaryValue': 'Oil_Value_USD'}),
+    ]).fillna(0.0)
+    reconciled = reconcile_hierarchy(reporter_panel)
+    brics_reconciled = bloc_forecasts(reconciled, 'BRICS')
+    print(f"   Reconciled forecasts: {len(reporter_panel)} reporter series, BRICS gold "
+          f"{brics_reconciled['BRICS_Gold_Qty_kg'].iloc[0]:,.0f} kg next month (MinT)")
+    
+    # Value growth split into unit-value (price) and volume effects
+    price_volume = price_volume_decomposition({'Gold': gold_df, 'Oil': oil_df})
+    for line in summarize_price_volume(price_volume):
+        print(f"   Price/volume - {line}")
+    
+    # Partner network from the optional bilateral extracts
+    bilateral_frames = load_bilateral_frames()
+    partner_network = None
+    if bilateral_frames:
+        partner_network = network_metrics(bilateral_frames)
+        brics_top_partners = {
+            commodity: top_partners(build_partner_tensor(df), BLOCS['BRICS'])
+            for commodity, df in bilateral_frames.items()}
+        for line in summarize_network(partner_network):
+            print(f"   Partner network - {line}")
+        # Reported imports checked against the exports partners reported
+        mirror_summaries, mirror_reliability = {}, {}
+        for commodity, df in bilateral_frames.items():
+            if has_mirror_flows(df):
+                pairs, mirror_reliability[commodity] = reconcile_mirror_flows(df)
+                mirror_summaries[commodity] = bloc_mirror_summary(pairs)
+                brics = mirror_summaries[commodity]
+                brics = brics[brics['Bloc'] == 'BRICS']
+                change = brics['Reconciled_Imports'].sum() / brics['Reported_Imports'].sum() - 1
+                print(f"   Mirror reconciliation - BRICS {commodity}: reconciled {change:+.1%} "
+                      f"vs reported ({int(pairs['Large_Discrepancy'].sum()):,} flows differ "
+                      f"> {MAX_RATIO:g}x)")
+    else:
+        mirror_summaries = {}
+        print(f"   Partner network: no bilateral extracts "
+              f"({', '.join(BILATERAL_SOURCES.values())})")
+    
+    # Which members have reported the latest months (late ones are nowcast,
+    # structurally absent ones imputed)
+    completeness = {
+        'Gold': completeness_table(gold_imputed_df, BLOCS),
+        'Oil': completeness_table(oil_imputed_df, BLOCS),
+    }
+    n_partial = int(gold_brics_monthly['BRICS_Gold_Is_Partial'].sum())
+    print(f"   Reporting completeness: {n_partial} partial BRICS gold months")
+    
+    dominance_index_df = compute_dominance_index(
+        shares_monthly, gold_brics_monthly, gold_us_eu_monthly,
+        oil_brics_monthly, oil_us_eu_monthly, weights=DEFAULT_WEIGHTS)
+    dominance = summarize_dominance_index(dominance_index_df)
+    print(f"   USD dominance index: {dominance['index_latest']:.1f}/100 "
+          f"({dominance['index_date']:%Y-%m})")
+    
+    var_panel = build_var_panel(shares_monthly, gold_brics_monthly, gold_us_eu_monthly,
+                                oil_brics_monthly, oil_us_eu_monthly)
+    granger_table = granger_causality(var_panel, max_lag=6, n_workers=n_workers,
+                                      run_store=run_store)
+    print(f"   Granger causality: {int(granger_table['Significant'].sum())} of "
+          f"{len(granger_table)} tests significant at {SIGNIFICANCE:.0%} FDR")
+    
+    simulation = simulate_dominance_probability(
+        dominance_index_df, n_paths=n_paths, weights=DEFAULT_WEIGHTS,
+        n_workers=n_workers, run_store=run_store)
+    print(f"   P(USD dominant, {simulation['target_date']:%Y-%m}): "
+          f"{simulation['probability']:.1%} ({n_paths:,} paths)")
+    
     # Create workbook
     print("\n[2/5] Creating Excel workbook...")
     wb = Workbook()
     wb.remove(wb.active)  # Remove default sheet
     
     print("\n[3/5] Generating forecast sheets...")
-    create_usd_dominance_sheet(wb)
+    create_usd_dominance_sheet(wb, usd_share, dominance, simulation, DEFAULT_WEIGHTS,
+                               summarize_granger(granger_table), change_point_lines,
+                               significant_causes(granger_table))
     print("   USD Dominance Analysis sheet created")
     
-    create_btc_forecast_sheet(wb, btc_monthly)
+    create_btc_forecast_sheet(wb, btc_monthly, usd_share, forecast_intervals)
     print("   BTC Forecast sheet created")
     
-    create_gold_forecast_sheet(wb, gold_brics_monthly)
+    create_gold_forecast_sheet(wb, gold_brics_monthly, forecast_intervals, brics_reconciled)
     print("   Gold BRICS Forecast sheet created")
     
-    create_oil_forecast_sheet(wb, oil_brics_monthly)
+    create_oil_forecast_sheet(wb, oil_brics_monthly, forecast_intervals, brics_reconciled)
     print("   Oil BRICS Forecast sheet created")
     
+    create_btc_frequency_sheet(wb, btc_frequency_forecasts)
+    print("   BTC Multi-Frequency sheet created")
+    
+    create_currency_share_sheet(wb, shares_monthly, share_forecast)
+    print("   BTC Currency Shares sheet created")
+    
+    create_dominance_index_sheet(wb, dominance_index_df, DEFAULT_WEIGHTS)
+    print("   USD Dominance Index sheet created")
+    
+    create_model_selection_sheet(wb, fit_series, model_configs, tuned_forecasts)
+    print("   Model Selection sheet created")
+    
+    create_reconciliation_sheet(wb, reconciled)
+    print("   BRICS Reconciliation sheet created")
+    
+    create_granger_causality_sheet(wb, granger_table)
+    print("   Granger Causality sheet created")
+    
+    create_seasonal_adjustment_sheet(wb, forecast_series, seasonal_indices,
+                                     seasonal_strength, seasonal_adjustment)
+    print("   Seasonal Adjustment sheet created")
+    
+    create_price_volume_sheet(wb, price_volume)
+    print("   Price Volume sheet created")
+    
+    if partner_network is not None:
+        create_partner_network_sheet(wb, partner_network, brics_top_partners)
+        print("   Partner Network sheet created")
+    
+    if mirror_summaries:
+        create_mirror_reconciliation_sheet(wb, mirror_summaries, mirror_reliability)
+        print("   Mirror Reconciliation sheet created")
+    
+    create_anomaly_report_sheet(wb, anomaly_report)
+    print("   Anomaly Report sheet created")
+    
+    create_reporting_completeness_sheet(wb, completeness)
+    print("   Reporting Completeness sheet created")
+    
     print("\n[4/5] Saving workbook...")
     wb.save(output_path)
     print(f"   Workbook saved: {output_path}")
     
+    # Same series, intervals and tuned forecasts as the sheets, as tidy files
+    partial_flags = {
+        f'BRICS_{commodity}_{measure}': bloc_partial_flags(monthly, f'BRICS_{commodity}')
+        for commodity, monthly in (('Gold', gold_brics_monthly), ('Oil', oil_brics_monthly))
+        for measure in ('Qty_kg', 'Value_USD')}
+    forecast_table = build_forecast_table(forecast_series, forecast_intervals,
+                                          tuned_forecasts, window=3,
+                                          flags_by_name=partial_flags,
+                                          reconciled_forecasts=brics_reconciled)
+    export_metadata = build_metadata(
+        forecast_series, model_configs, window=3, n_forecast=3,
+        interval_levels=list(DEFAULT_LEVELS), interval_method='block',
+        anomaly_policy=anomaly_policy, sources=[btc_path, gold_path, oil_path],
+        workbook=output_path, regime_mode=regime_mode,
+        seasonal_adjustment=seasonal_adjustment,
+        change_points={name: [f'{d:%Y-%m}' for d in dates]
+                       for name, dates in change_points.items()},
+        fit_start={name: f'{series.dropna().index.min():%Y-%m}'
+                   for name, series in fit_series.items()})
+    export_paths = write_forecast_exports(forecast_table, export_metadata,
+                                          formats=export_formats)
+    print(f"   Forecast exports saved: {', '.join(export_paths.values())}")
+    
     print("\n[5/5] Formula recalculation...")
     print("  ! Run: python recalc.py Predictive_Analysis_Forecasts.xlsx")
     print("  ! Or open in Excel/LibreOffice to recalculate formulas")
@@ -742,10 +2128,24 @@ def main():
     print("  2. BTC_Forecast - Bitcoin USD trading volume forecast")
     print("  3. Gold_BRICS_Forecast - BRICS gold import forecast")
     print("  4. Oil_BRICS_Forecast - BRICS crude oil import forecast")
+    print("  5. BTC_Multi_Frequency - Daily, weekly and monthly BTC forecasts")
+    print("  6. BTC_Currency_Shares - Share of BTC volume by currency")
+    print("  7. USD_Dominance_Index - Composite monthly USD dominance index")
+    print("  8. Model_Selection - Tuned forecast model per series")
+    print("  9. BRICS_Reconciliation - Coherent reporter/bloc/world forecasts")
+    print("  10. Granger_Causality - VAR Granger tests on the BTC USD share")
+    print("  11. Seasonal_Adjustment - Seasonal indices and seasonal MA forecasts")
+    print("  12. Price_Volume - Import value growth split into price and volume")
+    if partner_network is not None:
+        print("      Partner_Network - BRICS import partners (bilateral extracts)")
+    if mirror_summaries:
+        print("      Mirror_Reconciliation - Reported imports vs partner-reported exports")
+    print("  13. Anomaly_Report - Comtrade rows flagged by outlier screening")
+    print("  14. Reporting_Completeness - Which Comtrade reporters are in each month")
     print("\nAll sheets include:")
     print("    - 24 months of historical data")
     print("    - 3-month moving averages")
-    print("    - 3-month ahead forecasts")
+    print("    - 3-month ahead forecasts with 50/80/95% bootstrap intervals")
     print("    - Key insights and analysis")
     print("="*70)
 
@@ -0,0 +1,329 @@
+"""
+Hierarchical Forecast Reconciliation
+Makes reporter, bloc and world forecasts add up.
+
+Each commodity measure (e.g. Gold_Qty_kg) forms a hierarchy:
+
+    World
+    ├── BRICS  (BRA, RUS, IND, CHN, ZAF)
+    ├── US_EU  (USA, DEU, FRA, ITA, ESP, NLD, BEL)
+    └── Other  (every other reporter)
+
+All hierarchies are stacked into one sparse summing matrix S (nodes x
+reporter series, aggregates first). Every node - reporter, bloc and world
+series alike - gets its own base forecast from its own tuned model (the
+hyperparameter_search grid, picked by rolling-origin MAE). A 3-month
+moving average of every node would already add up (the average of a sum
+is the sum of the averages), so there would be nothing to reconcile.
+The base forecasts are reconciled with:
+
+- bottom_up: sum the reporter forecasts
+- top_down:  split the world forecast by historical reporter proportions
+- mint:      minimum-trace (MinT) projection with a diagonal weight matrix
+             ('ols', 'wls_struct' or 'wls_var': each node's squared
+             rolling-origin MAE)
+
+MinT is computed in its projection form
+    y_tilde = y_hat - W C' (C W C')^-1 C y_hat,    C = [I  -A]
+so only a small sparse system with one row per aggregate node is solved,
+no matter how many reporter series there are.
+
+Usage:
+    from reconciliation import build_reporter_panel, reconcile_hierarchy
+
+    panel = build_reporter_panel(gold_df, {'qty': 'Gold_Qty_kg'})
+    reconciled = reconcile_hierarchy(panel)
+    brics = bloc_forecasts(reconciled, 'BRICS')    # {'BRICS_Gold_Qty_kg': ...}
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from hyperparameter_search import (search_best_configs, forecast_from_config,
+                                   describe_config)
+from nowcasting import (nowcast_panel, recent_level, reporter_month_panel,
+                        reporting_completeness)
+
+
+BLOCS = {
+    'BRICS': ['BRA', 'RUS', 'IND', 'CHN', 'ZAF'],
+    'US_EU': ['USA', 'DEU', 'FRA', 'ITA', 'ESP', 'NLD', 'BEL'],
+}
+OTHER_BLOC = 'Other'
+WORLD = 'World'
+
+RECONCILIATION_METHODS = ('bottom_up', 'top_down', 'mint')
+
+
+def build_reporter_panel(trade_df, measures, flow='Import', nowcast=True):
+    """
+    Pivot Comtrade rows into a (series x month) reporter panel.
+
+    Reporter months are filled the way aggregate_bloc_monthly() fills the
+    bloc totals: members that have not reported the latest months yet are
+    nowcast from their recent level and rows imputed by reporter_imputation
+    (Is_Imputed) are added, so each bloc node sums to the bloc series of the
+    forecast sheets. Months a reporter is neither reported, nowcast nor
+    imputed are 0; months nobody reported or nowcast are dropped.
+
+    Args:
+        trade_df: Comtrade DataFrame with a parsed refDate column, optionally
+                  with the rows from append_imputed_rows()
+        measures: Dict mapping value column to series group name,
+                  e.g. {'qty': 'Gold_Qty_kg', 'primaryValue': 'Gold_Value_USD'}
+        flow: Trade flow to keep
+        nowcast: Fill not-yet-reported reporter months
+
+    Returns:
+        DataFrame indexed by (Group, Reporter) with one column per month
+    """
+    is_imputed = trade_df['Is_Imputed'].fillna(False).astype(bool) \
+        if 'Is_Imputed' in trade_df.columns else pd.Series(False, index=trade_df.index)
+    reporters = sorted(trade_df.loc[trade_df['flowDesc'] == flow, 'reporterISO'].unique())
+    value_cols = tuple(measures)
+    reported = reporter_month_panel(trade_df[~is_imputed], reporters, value_cols, flow)
+    calendar = reported[value_cols[0]].columns
+    imputed = reporter_month_panel(trade_df[is_imputed], reporters, value_cols, flow,
+                                   calendar=calendar) if is_imputed.any() else None
+
+    # Expected-but-missing months follow the reported value, as in the bloc totals
+    completeness = reporting_completeness(reported.get('primaryValue',
+                                                       reported[value_cols[0]]))
+    has_data = reported[value_cols[0]].notna().any(axis=0)
+
+    panels = []
+    for value_col, group in measures.items():
+        panel = reported[value_col]
+        if nowcast:
+            panel, nowcast_mask = nowcast_panel(panel, completeness, recent_level(panel))
+            has_data |= nowcast_mask.any(axis=0)
+        panel = panel.fillna(0.0)
+        if imputed is not None:
+            panel = panel + imputed[value_col].fillna(0.0)
+        panel.index = pd.MultiIndex.from_product([[group], panel.index],
+                                                 names=['Group', 'Reporter'])
+        panels.append(panel)
+    return pd.concat(panels).loc[:, has_data.to_numpy()]
+
+
+def summing_matrix(bottom_index, blocs=BLOCS):
+    """
+    Build the sparse summing matrix for the reporter -> bloc -> world hierarchy.
+
+    Args:
+        bottom_index: MultiIndex of (Group, Reporter) bottom series
+        blocs: Dict mapping bloc name to reporter codes (others -> 'Other')
+
+    Returns:
+        Tuple of (S as scipy.sparse CSR matrix, node DataFrame with Group,
+        Level and Node columns, number of aggregate nodes)
+    """
+    reporter_bloc = {code: bloc for bloc, codes in blocs.items() for code in codes}
+    groups = bottom_index.get_level_values('Group')
+    reporters = bottom_index.get_level_values('Reporter')
+    bottom_blocs = np.array([reporter_bloc.get(r, OTHER_BLOC) for r in reporters])
+    bloc_order = list(blocs) + [OTHER_BLOC]
+
+    # Aggregate nodes: one World and one node per bloc in every group
+    agg_nodes = [(g, 'World', WORLD) for g in groups.unique()] + \
+        [(g, 'Bloc', b) for g in groups.unique() for b in bloc_order
+         if ((groups == g) & (bottom_blocs == b)).any()]
+    agg_index = {(g, node): i for i, (g, _, node) in enumerate(agg_nodes)}
+    n_agg, n_bottom = len(agg_nodes), len(bottom_index)
+
+    bottom_pos = np.arange(n_bottom)
+    world_rows = np.array([agg_index[(g, WORLD)] for g in groups])
+    bloc_rows = np.array([agg_index[(g, b)] for g, b in zip(groups, bottom_blocs)])
+    rows = np.concatenate([world_rows, bloc_rows, n_agg + bottom_pos])
+    cols = np.concatenate([bottom_pos, bottom_pos, bottom_pos])
+    S = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                          shape=(n_agg + n_bottom, n_bottom))
+
+    nodes = pd.DataFrame(agg_nodes + [(g, 'Reporter', r) for g, r in zip(groups, reporters)],
+                         columns=['Group', 'Level', 'Node'])
+    nodes['Bloc'] = [WORLD] * len(agg_nodes) + list(bottom_blocs)
+    nodes.loc[nodes['Level'] == 'Bloc', 'Bloc'] = nodes['Node']
+    return S, nodes, n_agg
+
+
+def base_forecasts(node_values, window=3):
+    """
+    Independent moving-average forecasts and residual variances per node.
+
+    Args:
+        node_values: 2D numpy array (nodes x months)
+        window: Moving-average window
+
+    Returns:
+        Tuple of (forecast per node, one-step residual variance per node)
+    """
+    csum = np.concatenate([np.zeros((len(node_values), 1)),
+                           np.cumsum(node_values, axis=1)], axis=1)
+    trailing_mean = (csum[:, window:-1] - csum[:, :-window - 1]) / window
+    residuals = node_values[:, window:] - trailing_mean
+    forecast = node_values[:, -window:].mean(axis=1)
+    variance = residuals.var(axis=1) if residuals.shape[1] else np.ones(len(node_values))
+    return forecast, variance
+
+
+def tuned_base_forecasts(node_values, dates, names, horizon=3):
+    """
+    Base forecasts from each node's own tuned model.
+
+    Args:
+        node_values: 2D numpy array (nodes x months)
+        dates: Month start dates of the columns
+        names: Unique name per node
+        horizon: Number of months to forecast
+
+    Returns:
+        Tuple of (forecasts (nodes x horizon), squared rolling-origin MAE
+        per node (NaN where the series is too short to score), list of
+        configuration records)
+    """
+    series = {name: pd.Series(values, index=dates) for name, values in zip(names, node_values)}
+    configs = search_best_configs(series, horizon=horizon)
+    forecasts = np.array([forecast_from_config(values, configs[name], n_forecast=horizon)
+                          for name, values in zip(names, node_values)])
+    mse = np.array([configs[name]['mae'] for name in names], dtype=float) ** 2
+    return forecasts, mse, [configs[name] for name in names]
+
+
+def reconcile(base, S, n_agg, method='mint', weights='wls_var', variance=None,
+              proportions=None, top_rows=None):
+    """
+    Reconcile base forecasts so every aggregate equals the sum of its parts.
+
+    Args:
+        base: numpy array of base forecasts (nodes) or (nodes x horizons)
+        S: Sparse summing matrix from summing_matrix()
+        n_agg: Number of aggregate nodes (the first rows of S)
+        method: 'bottom_up', 'top_down' or 'mint'
+        weights: MinT weight matrix - 'ols', 'wls_struct' or 'wls_var'
+        variance: Residual variance per node (required for 'wls_var')
+        proportions: Share of its group's World total per bottom series
+                     (required for 'top_down')
+        top_rows: Row of the group's World node per bottom series
+                  (required for 'top_down')
+
+    Returns:
+        numpy array of coherent forecasts with the shape of base
+    """
+    base = np.asarray(base, dtype=float)
+    A = S[:n_agg]
+
+    if method == 'bottom_up':
+        return S @ base[n_agg:]
+
+    if method == 'top_down':
+        # Each bottom series takes its proportion of its group's World forecast
+        scale = proportions[:, None] if base.ndim == 2 else proportions
+        return S @ (base[top_rows] * scale)
+
+    if method == 'mint':
+        if weights == 'ols':
+            w = np.ones(S.shape[0])
+        elif weights == 'wls_struct':
+            w = np.asarray(S.sum(axis=1)).ravel()
+        elif weights == 'wls_var':
+            w = np.asarray(variance, dtype=float)
+            positive = w[w > 0]
+            w = np.maximum(w, positive.min() * 1e-6 if len(positive) else 1.0)
+        else:
+            raise ValueError(f"Unknown MinT weights '{weights}' "
+                             "(use 'ols', 'wls_struct' or 'wls_var')")
+        W = sparse.diags(w)
+        C = sparse.hstack([sparse.identity(n_agg), -A]).tocsc()
+        lhs = (C @ W @ C.T).tocsc()
+        correction = spsolve(lhs, C @ base)
+        if correction.ndim == 1 and base.ndim == 2:
+            correction = correction[:, None]
+        return base - W @ (C.T @ correction)
+
+    raise ValueError(f"Unknown reconciliation method '{method}' "
+                     f"(use one of {RECONCILIATION_METHODS})")
+
+
+def reconcile_hierarchy(panel, window=3, blocs=BLOCS, lookback=12,
+                        methods=RECONCILIATION_METHODS, weights='wls_var', horizon=3):
+    """
+    Forecast every node of the reporter -> bloc -> world hierarchy with its
+    own tuned model and reconcile the forecasts with each method.
+
+    Args:
+        panel: DataFrame from build_reporter_panel()
+        window: Moving-average window of the residual variance used for
+                nodes too short to score in the model search
+        blocs: Dict mapping bloc name to reporter codes
+        lookback: Months used for the top-down proportions
+        methods: Reconciliation methods to run
+        weights: MinT weight matrix ('ols', 'wls_struct' or 'wls_var')
+        horizon: Number of months to forecast
+
+    Returns:
+        DataFrame with Group, Level, Node, Bloc, Model, Date, Base_Forecast
+        and one forecast column per method, one row per node and month
+    """
+    S, nodes, n_agg = summing_matrix(panel.index, blocs)
+    bottom = panel.to_numpy(dtype=float)
+    node_values = S @ bottom
+
+    names = [f'{group}/{node}' for group, node in zip(nodes['Group'], nodes['Node'])]
+    base, mse, configs = tuned_base_forecasts(node_values, panel.columns, names, horizon)
+    _, ma_variance = base_forecasts(node_values, window)
+    variance = np.where(np.isfinite(mse), mse, ma_variance)
+
+    # Historical share of each reporter in its group's World total
+    world_of_group = {g: i for i, g in nodes.loc[nodes['Level'] == 'World', 'Group'].items()}
+    world_rows = nodes['Group'].iloc[n_agg:].map(world_of_group).to_numpy()
+    recent = node_values[:, -lookback:].sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        proportions = np.nan_to_num(recent[n_agg:] / recent[world_rows])
+
+    dates = pd.date_range(panel.columns[-1] + pd.DateOffset(months=1), periods=horizon,
+                          freq='MS')
+    result = nodes.loc[nodes.index.repeat(horizon)].reset_index(drop=True)
+    result['Model'] = np.repeat([describe_config(c) for c in configs], horizon)
+    result['Date'] = np.tile(dates, len(nodes))
+    result['Base_Forecast'] = base.ravel()
+    for method in methods:
+        result[method] = reconcile(base, S, n_agg, method, weights=weights,
+                                   variance=variance, proportions=proportions,
+                                   top_rows=world_rows).ravel()
+    return result
+
+
+def bloc_forecasts(reconciled, bloc='BRICS', method='mint'):
+    """
+    Reconciled forecasts of a bloc, named like the bloc forecast series.
+
+    Args:
+        reconciled: DataFrame from reconcile_hierarchy()
+        bloc: Bloc name
+        method: Reconciliation method column
+
+    Returns:
+        Dict mapping series name (e.g. 'BRICS_Gold_Qty_kg') to a pandas
+        Series of forecasts indexed by Date
+    """
+    rows = reconciled[(reconciled['Level'] == 'Bloc') & (reconciled['Node'] == bloc)]
+    return {f'{bloc}_{group}': group_rows.set_index('Date')[method]
+            for group, group_rows in rows.groupby('Group', sort=False)}
+
+
+def coherence_gap(forecasts, S, n_agg):
+    """
+    Largest absolute gap between aggregate forecasts and the sum of their parts.
+
+    Args:
+        forecasts: numpy array of forecasts for every node
+        S: Sparse summing matrix from summing_matrix()
+        n_agg: Number of aggregate nodes
+
+    Returns:
+        float (0 for coherent forecasts)
+    """
+    forecasts = np.asarray(forecasts, dtype=float)
+    return float(np.abs(S[:n_agg] @ forecasts[n_agg:] - forecasts[:n_agg]).max())
@@ -0,0 +1,248 @@
+"""
+Missing-Reporter Imputation
+Some reporters stop sending data to Comtrade for long periods (Russia has
+not reported gold or oil imports since 2021). A plain groupby().sum() then
+drops their volume and the bloc series shows a false decline.
+
+All commodities are stacked into one (commodity x reporter x month) cube
+in a single pass, and every reporter is handled at once:
+
+- coverage matrix: reported, nowcast (a regular reporter that is only
+  late, see nowcasting.py), imputed, or not covered
+- structural absence: a run of at least MIN_ABSENCE missing months after
+  the reporter's first report that the nowcast does not cover
+- imputation, per absent cell:
+    mirror: partner-reported exports to the country (optional mirror
+            frames), values converted from FOB to CIF with CIF_FOB_FACTOR
+    model:  the reporter's mean share of the commodity total over its last
+            SHARE_WINDOW reported months, times the current total (lagging
+            reporters nowcast first, so late months are not understated)
+  Mirror data is used where it exists, the model everywhere else.
+
+Imputed cells come back as extra rows flagged Is_Imputed with their
+Imputation_Source, so bloc aggregation can sum them and still tell them
+apart from reported data.
+
+Usage:
+    from reporter_imputation import impute_missing_reporters, append_imputed_rows
+
+    imputed, coverage = impute_missing_reporters({'Gold': gold_df, 'Oil': oil_df})
+    gold_df = append_imputed_rows(gold_df, imputed, 'Gold')
+"""
+
+import numpy as np
+import pandas as pd
+
+from nowcasting import nowcast_panel, recent_level, reporting_completeness
+
+
+# Shortest run of missing months treated as a structural absence
+MIN_ABSENCE = 3
+
+# Reported months needed before an absence to estimate a share
+MIN_HISTORY = 6
+
+# Reported months averaged for a reporter's share of the commodity total
+SHARE_WINDOW = 12
+
+# Imports are valued CIF, partner exports FOB (IMF rule of thumb: +6%)
+CIF_FOB_FACTOR = 1.06
+
+MEASURES = ['qty', 'primaryValue']
+
+COVERAGE_LABELS = {
+    'reported': 'R',
+    'nowcast': 'N',
+    'mirror': 'M',
+    'model': 'E',
+    'missing': '-',
+    'not_covered': '',
+}
+
+
+def build_cube(frames, reporter_col='reporterISO', flow='Import', calendar=None):
+    """
+    Stack Comtrade frames into one (measure x commodity x reporter x month) cube.
+
+    Args:
+        frames: Dict mapping commodity name to a Comtrade DataFrame
+        reporter_col: Column identifying the country (partnerISO for mirror data)
+        flow: Trade flow to keep
+        calendar: Month start dates (default: every month in the frames)
+
+    Returns:
+        Dict with 'values' (measures x commodities x reporters x months),
+        'reported' (commodities x reporters x months), 'commodities',
+        'reporters' and 'months'
+    """
+    rows = pd.concat([df.loc[df['flowDesc'] == flow, ['refDate', reporter_col] + MEASURES]
+                      .assign(Commodity=name) for name, df in frames.items()],
+                     ignore_index=True)
+    months = rows['refDate'].dt.to_period('M')
+    if calendar is None:
+        calendar = pd.period_range(months.min(), months.max(), freq='M').to_timestamp()
+
+    commodity_codes, commodities = pd.factorize(rows['Commodity'])
+    reporter_codes, reporters = pd.factorize(rows[reporter_col], sort=True)
+    month_codes = pd.Index(calendar).get_indexer(months.dt.to_timestamp())
+    keep = month_codes >= 0
+
+    shape = (len(commodities), len(reporters), len(calendar))
+    flat = np.ravel_multi_index((commodity_codes[keep], reporter_codes[keep],
+                                 month_codes[keep]), shape)
+    size = int(np.prod(shape))
+    values = np.stack([np.bincount(flat, rows.loc[keep, col].to_numpy(dtype=float),
+                                   minlength=size).reshape(shape) for col in MEASURES])
+    reported = np.bincount(flat, minlength=size).reshape(shape) > 0
+
+    return {
+        'values': np.where(reported, values, np.nan),
+        'reported': reported,
+        'commodities': list(commodities),
+        'reporters': list(reporters),
+        'months': pd.DatetimeIndex(calendar),
+    }
+
+
+def _align(cube, commodities, reporters):
+    """Reindex a cube's values onto other commodity / reporter axes."""
+    values = np.full((len(MEASURES), len(commodities), len(reporters),
+                      len(cube['months'])), np.nan)
+    c_idx = pd.Index(cube['commodities']).get_indexer(commodities)
+    r_idx = pd.Index(cube['reporters']).get_indexer(reporters)
+    c_ok, r_ok = c_idx >= 0, r_idx >= 0
+    values[:, np.flatnonzero(c_ok)[:, None], np.flatnonzero(r_ok)] = \
+        cube['values'][:, c_idx[c_ok][:, None], r_idx[r_ok]]
+    return values
+
+
+def _run_lengths(missing):
+    """Length of the run of consecutive missing months each cell belongs to."""
+    n_rows, n_months = missing.shape
+    # A new run id starts at every non-missing month
+    run_id = np.cumsum(~missing, axis=1) + np.arange(n_rows)[:, None] * (n_months + 1)
+    lengths = np.bincount(run_id[missing].ravel(), minlength=run_id.max() + 1)
+    return np.where(missing, lengths[run_id], 0)
+
+
+def impute_missing_reporters(frames, mirror_frames=None, min_absence=MIN_ABSENCE,
+                             min_history=MIN_HISTORY, share_window=SHARE_WINDOW):
+    """
+    Impute structurally absent reporters for every commodity in one pass.
+
+    Args:
+        frames: Dict mapping commodity name to a screened Comtrade DataFrame
+        mirror_frames: Optional dict mapping commodity name to partner-reported
+                       exports (refDate, partnerISO, flowDesc='Export', qty,
+                       primaryValue)
+        min_absence: Shortest run of missing months that is imputed
+        min_history: Reported months needed before an absence
+        share_window: Reported months averaged for the share model
+
+    Returns:
+        Tuple of (imputed rows DataFrame with refDate, reporterISO, flowDesc,
+        partnerDesc, qty, primaryValue, Commodity, Is_Imputed and
+        Imputation_Source; coverage matrix DataFrame indexed by (Commodity,
+        Reporter) with one code per month, see COVERAGE_LABELS)
+    """
+    cube = build_cube(frames)
+    values, reported = cube['values'], cube['reported']
+    n_measures, n_commodities, n_reporters, n_months = values.shape
+
+    # Commodity x reporter rows as 2D panels, so the nowcasting helpers
+    # (which work on reporter x month panels) run over the whole cube
+    def panel(array):
+        return pd.DataFrame(array.reshape(n_commodities * n_reporters, n_months))
+
+    completeness = reporting_completeness(panel(values[1]))
+    history = np.cumsum(reported, axis=2)
+
+    # Commodity totals with lagging reporters nowcast
+    totals = np.empty((n_measures, n_commodities, n_months))
+    for m in range(n_measures):
+        filled, nowcast_mask = nowcast_panel(panel(values[m]), completeness,
+                                             recent_level(panel(values[m])))
+        totals[m] = np.nansum(filled.to_numpy().reshape(reported.shape), axis=1)
+    nowcast = nowcast_mask.to_numpy().reshape(reported.shape)
+
+    # Structurally absent cells: long runs of missing months after the
+    # first report that are not nowcast, with enough history for a share
+    missing = ~reported & (history > 0)
+    absent = missing & ~nowcast \
+        & (_run_lengths(missing.reshape(-1, n_months)).reshape(reported.shape) >= min_absence) \
+        & (history >= min_history)
+
+    # Model estimate: mean recent share of the commodity total x current total
+    estimates = np.empty_like(values)
+    for m in range(n_measures):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            share = values[m] / totals[m][:, None, :]
+        share_level = recent_level(panel(share), window=share_window).to_numpy()
+        estimates[m] = share_level.reshape(reported.shape) * totals[m][:, None, :]
+    source = np.where(absent & np.isfinite(estimates[1]), 'model', '')
+
+    # Mirror data takes precedence where partners reported exports
+    if mirror_frames:
+        mirror = build_cube(mirror_frames, reporter_col='partnerISO', flow='Export',
+                            calendar=cube['months'])
+        mirror_values = _align(mirror, cube['commodities'], cube['reporters'])
+        mirror_values[1] *= CIF_FOB_FACTOR
+        use_mirror = absent & (mirror_values[1] > 0)
+        estimates = np.where(use_mirror, mirror_values, estimates)
+        source = np.where(use_mirror, 'mirror', source)
+
+    imputed_cells = source != ''
+    c_idx, r_idx, m_idx = np.nonzero(imputed_cells)
+    imputed = pd.DataFrame({
+        'refDate': cube['months'][m_idx],
+        'reporterISO': np.asarray(cube['reporters'])[r_idx],
+        'flowDesc': 'Import',
+        'partnerDesc': 'World',
+        'qty': estimates[0][imputed_cells],
+        'primaryValue': estimates[1][imputed_cells],
+        'Commodity': np.asarray(cube['commodities'])[c_idx],
+        'Is_Imputed': True,
+        'Imputation_Source': source[imputed_cells],
+    })
+
+    codes = np.full(reported.shape, COVERAGE_LABELS['not_covered'], dtype=object)
+    codes[missing] = COVERAGE_LABELS['missing']
+    codes[nowcast] = COVERAGE_LABELS['nowcast']
+    codes[source == 'model'] = COVERAGE_LABELS['model']
+    codes[source == 'mirror'] = COVERAGE_LABELS['mirror']
+    codes[reported] = COVERAGE_LABELS['reported']
+    coverage = pd.DataFrame(
+        codes.reshape(-1, n_months), columns=cube['months'],
+        index=pd.MultiIndex.from_product([cube['commodities'], cube['reporters']],
+                                         names=['Commodity', 'Reporter']))
+    return imputed, coverage
+
+
+def append_imputed_rows(trade_df, imputed, commodity):
+    """
+    Add a commodity's imputed rows to its Comtrade frame.
+
+    Args:
+        trade_df: Screened Comtrade DataFrame
+        imputed: Imputed rows from impute_missing_reporters()
+        commodity: Commodity name used in impute_missing_reporters()
+
+    Returns:
+        DataFrame with the imputed rows appended and an Is_Imputed flag
+        on every row
+    """
+    rows = imputed[imputed['Commodity'] == commodity].drop(columns='Commodity')
+    return pd.concat([trade_df.assign(Is_Imputed=False), rows], ignore_index=True)
+
+
+def summarize_imputation(imputed):
+    """
+    Count imputed reporter months per commodity and source.
+
+    Args:
+        imputed: Imputed rows from impute_missing_reporters()
+
+    Returns:
+        Dict mapping (commodity, source) to number of imputed cells
+    """
+    return imputed.groupby(['Commodity', 'Imputation_Source']).size().to_dict()
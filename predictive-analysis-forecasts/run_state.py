@@ -0,0 +1,270 @@
+"""
+Checkpointed Sweep Execution
+Runs a sweep (models x windows, subsets x lag orders, blocs x scenarios)
+as independent tasks and stores every finished result in a local SQLite
+file, so a run that crashes or is stopped resumes with only the missing
+tasks instead of starting over.
+
+- task key: SHA-1 of the pickled (function, arguments), so a task is
+  identified by what it computes; the same task is never run twice, and
+  a task whose input data changed gets a new key and is run again
+- store: one row per (run, task key) with status ('done' or 'failed'),
+  attempts, the pickled result or the error, written as soon as the task
+  finishes (WAL journal, only the calling process writes)
+- executor: at most n_workers tasks at a time in a process pool (1 = run
+  in this process); failed tasks, including those lost with a crashed
+  worker, are retried up to max_retries times in fresh pools
+
+Results are pickled, so the store must be trusted like any local cache.
+
+Usage:
+    from run_state import run_tasks
+
+    results = run_tasks(_evaluate_family, tasks, run='hyperparameter_search',
+                        n_workers=4)
+
+    python run_state.py [store.sqlite] [--clear RUN]
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+import hashlib
+import pickle
+import sqlite3
+import sys
+import traceback
+
+import pandas as pd
+
+
+RUN_STATE_PATH = 'run_state.sqlite'
+MAX_RETRIES = 2
+TASK_STATUSES = ('done', 'failed')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    run         TEXT NOT NULL,
+    task_key    TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    attempts    INTEGER NOT NULL,
+    result      BLOB,
+    error       TEXT,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (run, task_key)
+)
+"""
+
+
+def task_key(fn, args):
+    """
+    Stable identifier of a task.
+
+    Args:
+        fn: Top-level task function
+        args: Its (picklable) argument
+
+    Returns:
+        Hex SHA-1 string
+    """
+    payload = pickle.dumps((fn.__module__, fn.__qualname__, args), protocol=4)
+    return hashlib.sha1(payload).hexdigest()
+
+
+def open_store(store_path=RUN_STATE_PATH):
+    """
+    Open (and create if needed) the SQLite run-state store.
+
+    Args:
+        store_path: SQLite file
+
+    Returns:
+        sqlite3.Connection
+    """
+    con = sqlite3.connect(store_path)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute(SCHEMA)
+    con.commit()
+    return con
+
+
+def _record(con, run, key, status, attempts, result=None, error=None):
+    """Write one task outcome and commit it."""
+    con.execute(
+        "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (run, key, status, attempts,
+         pickle.dumps(result, protocol=4) if status == 'done' else None, error,
+         datetime.now(timezone.utc).isoformat(timespec='seconds')))
+    con.commit()
+
+
+def completed_results(con, run, keys):
+    """
+    Stored results of the finished tasks among keys.
+
+    Args:
+        con: Connection from open_store()
+        run: Run name
+        keys: Task keys to look up
+
+    Returns:
+        Dict mapping task key to its result
+    """
+    done = {}
+    keys = list(keys)
+    # SQLite limits the number of bound parameters per statement
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        rows = con.execute(
+            f"SELECT task_key, result FROM tasks WHERE run = ? AND status = 'done' "
+            f"AND task_key IN ({', '.join('?' * len(chunk))})", [run, *chunk])
+        done.update({key: pickle.loads(blob) for key, blob in rows})
+    return done
+
+
+def _call(fn, args):
+    """Run one task, returning (result, None) or (None, traceback text)."""
+    try:
+        return fn(args), None
+    except Exception:
+        return None, traceback.format_exc()
+
+
+def _outcomes(fn, pending, n_workers):
+    """Yield (key, result, error) for every pending task as it finishes."""
+    if n_workers <= 1:
+        for key, args in pending.items():
+            yield (key, *_call(fn, args))
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {executor.submit(fn, args): key for key, args in pending.items()}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception:
+                # Includes BrokenProcessPool when a worker died
+                yield futures[future], None, traceback.format_exc()
+
+
+def run_tasks(fn, tasks, run, store_path=RUN_STATE_PATH, n_workers=1,
+              max_retries=MAX_RETRIES, raise_on_failure=True):
+    """
+    Run tasks with checkpointing, skipping those already done in this run.
+
+    Args:
+        fn: Top-level task function taking one argument
+        tasks: List of task arguments
+        run: Run name (groups the tasks of one sweep in the store)
+        store_path: SQLite file
+        n_workers: Maximum tasks running at once (1 = run in this process)
+        max_retries: Extra attempts for a failing task
+        raise_on_failure: Raise RuntimeError when tasks still fail after the
+                          retries (their failures are stored first)
+
+    Returns:
+        List of results in task order (None for failed tasks when
+        raise_on_failure is False)
+    """
+    keys = [task_key(fn, args) for args in tasks]
+    con = open_store(store_path)
+    try:
+        results = completed_results(con, run, set(keys))
+        pending = {key: args for key, args in zip(keys, tasks) if key not in results}
+        attempts = dict.fromkeys(pending, 0)
+        errors = {}
+
+        while pending:
+            retry = {}
+            for key, result, error in _outcomes(fn, pending, n_workers):
+                attempts[key] += 1
+                if error is None:
+                    results[key] = result
+                    errors.pop(key, None)
+                    _record(con, run, key, 'done', attempts[key], result=result)
+                else:
+                    errors[key] = error
+                    _record(con, run, key, 'failed', attempts[key], error=error)
+                    if attempts[key] <= max_retries:
+                        retry[key] = pending[key]
+            pending = retry
+    finally:
+        con.close()
+
+    if errors and raise_on_failure:
+        first = next(iter(errors.values())).strip().splitlines()[-1]
+        raise RuntimeError(f"{len(errors)} of {len(set(keys))} tasks of run '{run}' failed "
+                           f"after {max_retries + 1} attempts (first error: {first}); "
+                           f"rerun to retry only these")
+    return [results.get(key) for key in keys]
+
+
+def run_status(store_path=RUN_STATE_PATH, run=None):
+    """
+    Task counts per run and status.
+
+    Args:
+        store_path: SQLite file
+        run: Optional run name to restrict to
+
+    Returns:
+        DataFrame with Run, Status, Tasks, Attempts and Last_Update
+    """
+    con = open_store(store_path)
+    try:
+        query = ("SELECT run, status, COUNT(*), SUM(attempts), MAX(updated_at) FROM tasks "
+                 + ("WHERE run = ? " if run else "") + "GROUP BY run, status ORDER BY run, status")
+        rows = con.execute(query, [run] if run else []).fetchall()
+    finally:
+        con.close()
+    return pd.DataFrame(rows, columns=['Run', 'Status', 'Tasks', 'Attempts', 'Last_Update'])
+
+
+def clear_run(run, store_path=RUN_STATE_PATH):
+    """
+    Delete every stored task of a run.
+
+    Args:
+        run: Run name
+        store_path: SQLite file
+
+    Returns:
+        Number of deleted tasks
+    """
+    con = open_store(store_path)
+    try:
+        deleted = con.execute("DELETE FROM tasks WHERE run = ?", [run]).rowcount
+        con.commit()
+    finally:
+        con.close()
+    return deleted
+
+
+def main():
+    """
+    Show (or clear) the stored runs.
+
+    Usage:
+        python run_state.py [store.sqlite] [--clear RUN]
+    """
+    args = sys.argv[1:]
+    clear = None
+    if '--clear' in args:
+        position = args.index('--clear')
+        if position + 1 >= len(args):
+            print("Usage: python run_state.py [store.sqlite] [--clear RUN]")
+            return 1
+        clear = args[position + 1]
+        del args[position:position + 2]
+    store_path = args[0] if args else RUN_STATE_PATH
+
+    if clear is not None:
+        print(f"✓ Cleared {clear_run(clear, store_path)} tasks of run '{clear}'")
+    status = run_status(store_path)
+    if status.empty:
+        print(f"No tasks stored in {store_path}")
+    else:
+        print(status.to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""
+Input Schema Validation
+Declarative schemas for the three input CSVs (see DATA_FORMAT.md) and a
+vectorized validator that runs before the pipeline, so a wrong file fails
+with a short report instead of a KeyError deep inside pandas.
+
+Each schema is a dict:
+- columns:  column name -> spec with
+            dtype ('datetime', 'numeric', 'integer', 'string' or 'boolean'),
+            utc (parse dates as UTC), nullable, min / max (inclusive),
+            gt (exclusive minimum), allowed (set of values), aliases
+            (accepted alternative names) and severity ('error' blocks the
+            run, 'warning' is reported)
+- extra_columns: spec applied to every column not listed (wide BTC layout)
+- unique:   key columns that must not repeat
+- monotonic: column that must be sorted ascending
+- required_values: column -> values that must appear at least once
+
+Checks are whole-column numpy/pandas operations. Hashing strings is the
+expensive part, so a string column is only factorized when an allowed /
+required value check needs it (nulls come from isna()). Duplicate keys
+are first checked on integer codes of the date, numeric and already
+factorized key columns combined into one integer; the remaining string
+key columns are factorized only on the rows whose partial key repeats.
+Validation also coerces dtypes (dates parsed once, numeric text
+converted), so the loaders reuse the parsed columns instead of parsing
+them again.
+
+Usage:
+    python schema_validation.py            # validate the three default CSVs
+
+    from schema_validation import validate_frame, TRADE_SCHEMA
+    df, report = validate_frame(pd.read_csv(path), TRADE_SCHEMA, raise_on_error=True)
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+BRICS_CODES = ['BRA', 'RUS', 'IND', 'CHN', 'ZAF']
+
+BTC_LONG_SCHEMA = {
+    'name': 'BTC (long layout)',
+    'columns': {
+        'time': {'dtype': 'datetime', 'nullable': False, 'utc': True},
+        'currency': {'dtype': 'string', 'nullable': False},
+        'trading_volume_btc': {'dtype': 'numeric', 'min': 0, 'severity': 'warning'},
+    },
+    'unique': ['time', 'currency'],
+    'required_values': {'currency': ['USD']},
+}
+
+BTC_WIDE_SCHEMA = {
+    'name': 'BTC (wide layout)',
+    'columns': {
+        'Time': {'dtype': 'datetime', 'nullable': False, 'utc': True,
+                 'aliases': ['time']},
+        'USD': {'dtype': 'numeric', 'min': 0, 'severity': 'warning'},
+    },
+    'extra_columns': {'dtype': 'numeric', 'min': 0, 'severity': 'warning'},
+    'unique': ['Time'],
+    'monotonic': 'Time',
+}
+
+TRADE_SCHEMA = {
+    'name': 'Comtrade',
+    'columns': {
+        'refDate': {'dtype': 'datetime', 'nullable': False},
+        'reporterISO': {'dtype': 'string', 'nullable': False},
+        'flowDesc': {'dtype': 'string', 'nullable': False,
+                     'allowed': {'Import', 'Export'}},
+        'partnerDesc': {'dtype': 'string', 'nullable': False},
+        'cmdCode': {'dtype': 'integer', 'nullable': False},
+        'qty': {'dtype': 'numeric', 'nullable': False, 'min': 0, 'severity': 'warning'},
+        'primaryValue': {'dtype': 'numeric', 'nullable': False, 'gt': 0,
+                         'severity': 'warning'},
+    },
+    'unique': ['refDate', 'reporterISO', 'flowDesc', 'partnerDesc', 'cmdCode'],
+    'monotonic': 'refDate',
+    'required_values': {'reporterISO': BRICS_CODES, 'flowDesc': ['Import']},
+}
+
+# Number of example row numbers listed per violation
+MAX_EXAMPLES = 5
+
+
+class SchemaValidationError(ValueError):
+    """Raised when an input file violates its schema (error severity)."""
+
+
+def _violation(check, column, severity, mask=None, message='', n_rows=None):
+    """One report row; mask marks violating rows (line = index + 2 in the CSV)."""
+    rows = np.flatnonzero(mask) if mask is not None else np.array([], dtype=int)
+    return {
+        'Check': check,
+        'Column': column,
+        'Severity': severity,
+        'Rows': int(n_rows if n_rows is not None else len(rows)),
+        'Example_Lines': ', '.join(str(r + 2) for r in rows[:MAX_EXAMPLES]),
+        'Message': message,
+    }
+
+
+def _coerce(series, dtype, utc=False):
+    """
+    Convert a column to the schema dtype (dates in one consistent format).
+
+    Returns:
+        Tuple of (converted series, mask of non-null values that failed)
+    """
+    if dtype == 'datetime':
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series, np.zeros(len(series), dtype=bool)
+        converted = pd.to_datetime(series, errors='coerce', utc=utc)
+    elif dtype in ('numeric', 'integer'):
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            converted = series
+        else:
+            converted = pd.to_numeric(series, errors='coerce')
+        if dtype == 'integer':
+            values = converted.to_numpy(dtype=float)
+            bad = np.isfinite(values) & (values != np.round(values))
+            return converted, bad | (converted.isna() & series.notna()).to_numpy()
+    elif dtype == 'boolean':
+        if pd.api.types.is_bool_dtype(series):
+            return series, np.zeros(len(series), dtype=bool)
+        converted = series.map({'True': True, 'False': False, True: True, False: False})
+    else:
+        return series, np.zeros(len(series), dtype=bool)
+    # Only the (usually few) rows that came out missing need the slower
+    # notna() on the raw values
+    failed = converted.isna().to_numpy().copy()
+    if failed.any():
+        failed[failed] = series[failed].notna().to_numpy()
+    return converted, failed
+
+
+def _factorize(series):
+    """Integer codes (-1 for missing) and unique values of one column."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        codes, uniques = pd.factorize(pd.DatetimeIndex(series).asi8)
+        return codes, uniques
+    return pd.factorize(series)
+
+
+def _duplicate_mask(key_codes, keep='first'):
+    """
+    Rows repeating an earlier row's composite key (keep=False: every row
+    of a repeated key).
+
+    The key codes are combined into one integer; when that key space is
+    small (the usual case) a bincount rules out duplicates without hashing
+    every row, and the hashed duplicated() only runs when there are some.
+    """
+    # Missing values (code -1) only take a slot in columns that have them
+    key_codes = [c - c.min() if len(c) and c.min() < 0 else c for c in key_codes]
+    sizes = [int(c.max()) + 1 if len(c) else 1 for c in key_codes]
+    if np.prod(sizes, dtype=float) >= 2 ** 62:
+        return pd.DataFrame(dict(enumerate(key_codes))).duplicated(keep=keep).to_numpy()
+    combined = np.ravel_multi_index(key_codes, sizes)
+    if np.prod(sizes, dtype=float) <= 4 * len(combined) + 1_000_000:
+        repeated = np.bincount(combined)[combined] > 1
+        if keep is False or not repeated.any():
+            return repeated
+    return pd.Series(combined).duplicated(keep=keep).to_numpy()
+
+
+def _duplicate_keys(df, keys, specs, factorized):
+    """
+    Duplicate-key mask, hashing string key columns only where needed.
+
+    Rows whose key is unique on the integer-coded columns (dates, numbers
+    and strings factorized for other checks) cannot be duplicates, so the
+    other string columns are factorized on the remaining rows only.
+    """
+    coded = [k for k in keys if k in factorized or specs[k]['dtype'] != 'string']
+    pending = [k for k in keys if k not in coded]
+    codes = [factorized[k][0] if k in factorized else _factorize(df[k])[0] for k in coded]
+    if not pending:
+        return _duplicate_mask(codes)
+
+    rows = np.flatnonzero(_duplicate_mask(codes, keep=False)) if codes \
+        else np.arange(len(df))
+    duplicated = np.zeros(len(df), dtype=bool)
+    if len(rows):
+        duplicated[rows] = _duplicate_mask(
+            [c[rows] for c in codes] + [_factorize(df[k].iloc[rows])[0] for k in pending])
+    return duplicated
+
+
+def validate_frame(df, schema, raise_on_error=False):
+    """
+    Validate (and coerce) a DataFrame against a schema.
+
+    Args:
+        df: DataFrame as read by pd.read_csv()
+        schema: Schema dict (BTC_LONG_SCHEMA, BTC_WIDE_SCHEMA, TRADE_SCHEMA)
+        raise_on_error: Raise SchemaValidationError if any error is found
+
+    Returns:
+        Tuple of (DataFrame with coerced dtypes, report DataFrame with one
+        row per failed check)
+    """
+    df = df.copy(deep=False)
+    violations = []
+
+    # Column presence (aliases are renamed to the schema name)
+    for name, spec in schema['columns'].items():
+        if name in df.columns:
+            continue
+        alias = next((a for a in spec.get('aliases', []) if a in df.columns), None)
+        if alias:
+            df = df.rename(columns={alias: name})
+        elif spec.get('required', True):
+            violations.append(_violation(
+                'missing_column', name, 'error',
+                message=f"required column '{name}' not found "
+                        f"(columns: {', '.join(map(str, df.columns[:12]))})"))
+
+    specs = {name: spec for name, spec in schema['columns'].items() if name in df.columns}
+    if 'extra_columns' in schema:
+        specs.update({c: schema['extra_columns'] for c in df.columns if c not in specs})
+
+    # String columns with allowed / required values are factorized once:
+    # those checks run on the uniques and the duplicate-key check reuses
+    # the codes
+    factorized = {}
+    for name, spec in specs.items():
+        severity = spec.get('severity', 'error')
+        converted, bad_type = _coerce(df[name], spec['dtype'], spec.get('utc', False))
+        df[name] = converted
+        if bad_type.any():
+            violations.append(_violation('dtype', name, 'error', bad_type,
+                                         f"values not parseable as {spec['dtype']}"))
+
+        if spec['dtype'] == 'string' and \
+                ('allowed' in spec or name in schema.get('required_values', {})):
+            factorized[name] = _factorize(converted)
+        if name in factorized:
+            missing = factorized[name][0] < 0
+        else:
+            missing = converted.isna().to_numpy() & ~bad_type
+        if not spec.get('nullable', True) and missing.any():
+            violations.append(_violation('null', name, 'error', missing, 'missing values'))
+
+        if 'allowed' in spec:
+            codes, uniques = factorized.get(name) or _factorize(converted)
+            outside_codes = np.flatnonzero(~pd.Index(uniques).isin(spec['allowed']))
+            if len(outside_codes):
+                violations.append(_violation(
+                    'allowed_values', name, severity, np.isin(codes, outside_codes),
+                    f"values outside {sorted(spec['allowed'])}"))
+
+        if spec['dtype'] in ('numeric', 'integer'):
+            values = converted.to_numpy(dtype=float)
+            with np.errstate(invalid='ignore'):
+                for key, test, text in [('min', values < spec.get('min', -np.inf), '<'),
+                                        ('max', values > spec.get('max', np.inf), '>'),
+                                        ('gt', values <= spec.get('gt', -np.inf), '<=')]:
+                    if key in spec and test.any():
+                        violations.append(_violation(
+                            'range', name, severity, test,
+                            f"values {text} {spec[key]}"))
+
+    # Duplicate keys
+    keys = [k for k in schema.get('unique', []) if k in df.columns]
+    if keys and len(keys) == len(schema['unique']):
+        duplicated = _duplicate_keys(df, keys, specs, factorized)
+        if duplicated.any():
+            violations.append(_violation('duplicate_key', '+'.join(keys), 'error',
+                                         duplicated, 'duplicate key rows'))
+
+    # Date monotonicity
+    date_col = schema.get('monotonic')
+    if date_col in df.columns and pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        stamps = pd.DatetimeIndex(df[date_col]).asi8
+        backwards = np.r_[False, stamps[1:] < stamps[:-1]]
+        if backwards.any():
+            violations.append(_violation('monotonic', date_col, 'warning', backwards,
+                                         'dates not in ascending order'))
+
+    # Values that must appear somewhere in the file
+    for name, required in schema.get('required_values', {}).items():
+        if name in df.columns:
+            present = factorized[name][1] if name in factorized else df[name].dropna().unique()
+            absent = sorted(pd.Index(required)[~pd.Index(required).isin(present)])
+            if absent:
+                violations.append(_violation('required_values', name, 'warning',
+                                             message=f"missing {', '.join(absent)}"))
+
+    report = pd.DataFrame(violations, columns=['Check', 'Column', 'Severity', 'Rows',
+                                               'Example_Lines', 'Message'])
+    if raise_on_error and (report['Severity'] == 'error').any():
+        raise SchemaValidationError(format_validation_report(report, schema['name']))
+    return df, report
+
+
+def detect_btc_schema(columns):
+    """
+    Pick the BTC schema matching a file's columns.
+
+    Args:
+        columns: Column names of the BTC CSV
+
+    Returns:
+        BTC_LONG_SCHEMA if a 'currency' column exists, else BTC_WIDE_SCHEMA
+        when a Time/time column exists, else BTC_LONG_SCHEMA (so the report
+        names the documented columns)
+    """
+    if 'currency' in columns:
+        return BTC_LONG_SCHEMA
+    if 'Time' in columns or 'time' in columns:
+        return BTC_WIDE_SCHEMA
+    return BTC_LONG_SCHEMA
+
+
+def format_validation_report(report, name):
+    """
+    Concise text version of a validation report.
+
+    Args:
+        report: Report DataFrame from validate_frame()
+        name: File or schema name for the heading
+
+    Returns:
+        Multi-line string (one line per failed check)
+    """
+    if report.empty:
+        return f"{name}: OK"
+    n_errors = int((report['Severity'] == 'error').sum())
+    lines = [f"{name}: {n_errors} error(s), {len(report) - n_errors} warning(s)"]
+    for _, row in report.iterrows():
+        where = f" (lines {row['Example_Lines']}" + \
+            (', ...)' if row['Rows'] > MAX_EXAMPLES else ')') if row['Example_Lines'] else ''
+        rows = f"{row['Rows']:,} rows: " if row['Rows'] else ''
+        lines.append(f"  [{row['Severity']}] {row['Check']} {row['Column']}: "
+                     f"{rows}{row['Message']}{where}")
+    return '\n'.join(lines)
+
+
+def main():
+    """
+    Validate the three default input CSVs and print the reports.
+
+    Usage:
+        python schema_validation.py [btc.csv gold.csv oil.csv]
+    """
+    paths = sys.argv[1:4] if len(sys.argv) > 3 else [
+        'Btc_5y_Cleaned.csv', 'Gold_TradeData_Cleaned.csv', 'Oil_TradeData_Cleaned.csv']
+
+    n_errors = 0
+    for i, path in enumerate(paths):
+        df = pd.read_csv(path)
+        schema = detect_btc_schema(df.columns) if i == 0 else TRADE_SCHEMA
+        _, report = validate_frame(df, schema)
+        print(format_validation_report(report, f"{path} [{schema['name']}]"))
+        n_errors += int((report['Severity'] == 'error').sum())
+    return 1 if n_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
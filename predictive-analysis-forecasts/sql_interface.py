@@ -0,0 +1,288 @@
+"""
+SQL Analytics Interface
+Ad-hoc SQL over the trade and BTC extracts with an embedded DuckDB engine.
+
+connect() opens an in-process database and registers the input files as
+views, so nothing is loaded up front:
+
+    gold, oil      one row per Comtrade record (CSV or cached Parquet file)
+    trade          gold and oil stacked, with a Commodity column
+    btc            daily BTC volume in long layout (Time, currency,
+                   trading_volume_btc), whatever layout the CSV uses
+    bloc_members   Bloc, reporterISO (reconciliation.BLOCS)
+    hs_codes       cmdCode, Commodity, HS_Heading, HS_Digits, Description
+    trade_blocs    trade joined to both mappings (Bloc 'Other' for
+                   reporters outside the blocs)
+
+DuckDB scans the files in parallel on every core (threads=) and streams
+them, so aggregations over full extracts stay within memory_limit; larger
+intermediates spill to temp_directory.
+
+Results come back as pandas DataFrames. query_series() turns a result into
+Date-indexed monthly Series, the input of compute_forecast_intervals()
+and load_or_search_configs().
+
+DuckDB is optional (pip install duckdb); results are fetched through
+numpy, so pyarrow is not needed.
+
+Usage:
+    from sql_interface import connect, query
+
+    con = connect()
+    df = query("SELECT date_trunc('month', refDate) AS Date, Bloc, sum(qty) AS Qty_kg "
+               "FROM trade_blocs WHERE Commodity = 'Gold' GROUP BY ALL ORDER BY ALL", con=con)
+
+    python sql_interface.py "SELECT count(*) FROM trade" [result.csv]
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+from reconciliation import BLOCS
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    duckdb = None
+    DUCKDB_AVAILABLE = False
+
+
+DEFAULT_SOURCES = {
+    'btc': 'Btc_5y_Cleaned.csv',
+    'gold': 'Gold_TradeData_Cleaned.csv',
+    'oil': 'Oil_TradeData_Cleaned.csv',
+}
+
+# HS codes in the extracts: code -> (commodity, description)
+HS_CODES = {
+    7108: ('Gold', 'Gold unwrought, semi-manufactured or in powder form'),
+    710811: ('Gold', 'Gold, non-monetary, powder'),
+    710812: ('Gold', 'Gold, non-monetary, unwrought (but not powder)'),
+    710813: ('Gold', 'Gold, non-monetary, semi-manufactured'),
+    284330: ('Gold', 'Gold compounds'),
+    2709: ('Oil', 'Petroleum oils and oils from bituminous minerals; crude'),
+}
+
+# Timestamp formats of the BTC time column (Bitcoinity writes '... UTC')
+BTC_TIME_FORMATS = ['%Y-%m-%d %H:%M:%S UTC', '%Y-%m-%d %H:%M:%S%z',
+                    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d']
+
+
+def _check_duckdb():
+    """Raise ImportError when DuckDB is not installed."""
+    if not DUCKDB_AVAILABLE:
+        raise ImportError("sql_interface requires DuckDB (pip install duckdb)")
+
+
+def _quote(value):
+    """SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _scan(path):
+    """Table function reading a CSV or a cached Parquet file."""
+    if path.lower().endswith('.parquet'):
+        return f"read_parquet({_quote(path)})"
+    return f"read_csv({_quote(path)}, header=true)"
+
+
+def _resolve_source(path):
+    """Prefer a Parquet cache next to a CSV (same name, .parquet) when present."""
+    cached = os.path.splitext(path)[0] + '.parquet'
+    return cached if path.lower().endswith('.csv') and os.path.exists(cached) else path
+
+
+def _btc_view(con, path):
+    """SELECT reading the BTC file in long layout, wide or long on disk."""
+    source = _scan(path)
+    columns = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+
+    time_col = 'Time' if 'Time' in columns else 'time'
+    formats = '[' + ', '.join(_quote(f) for f in BTC_TIME_FORMATS) + ']'
+    parsed = f"strptime(CAST(\"{time_col}\" AS VARCHAR), {formats})"
+    if 'currency' in columns:
+        return (f"SELECT CAST({parsed} AS TIMESTAMP) AS Time, currency, "
+                f"CAST(trading_volume_btc AS DOUBLE) AS trading_volume_btc FROM {source}")
+    currencies = ', '.join(f'"{c}"' for c in columns if c != time_col)
+    return (f"SELECT CAST({parsed} AS TIMESTAMP) AS Time, currency, "
+            f"CAST(trading_volume_btc AS DOUBLE) AS trading_volume_btc "
+            f"FROM (UNPIVOT (SELECT * FROM {source}) ON {currencies} "
+            f"INTO NAME currency VALUE trading_volume_btc)")
+
+
+def register_mappings(con, blocs=BLOCS, hs_codes=HS_CODES):
+    """
+    Create the bloc_members and hs_codes tables.
+
+    Args:
+        con: DuckDB connection
+        blocs: Dict mapping bloc name to reporter ISO codes
+        hs_codes: Dict mapping HS code to (commodity, description)
+    """
+    members = pd.DataFrame([(bloc, code) for bloc, codes in blocs.items() for code in codes],
+                           columns=['Bloc', 'reporterISO'])
+    codes = pd.DataFrame([(code, commodity, int(str(code)[:4]), len(str(code)), desc)
+                          for code, (commodity, desc) in hs_codes.items()],
+                         columns=['cmdCode', 'Commodity', 'HS_Heading', 'HS_Digits',
+                                  'Description'])
+    for name, frame in (('bloc_members', members), ('hs_codes', codes)):
+        con.register(f'_{name}_df', frame)
+        con.execute(f"CREATE OR REPLACE TABLE {name} AS SELECT * FROM _{name}_df")
+        con.unregister(f'_{name}_df')
+
+
+def connect(sources=None, database=':memory:', threads=None, memory_limit=None,
+            temp_directory=None):
+    """
+    Open a DuckDB connection with the extracts registered as views.
+
+    Args:
+        sources: Dict with 'btc', 'gold' and 'oil' file paths (CSV or
+                 Parquet; default DEFAULT_SOURCES, missing files are skipped)
+        database: ':memory:' or a database file that keeps tables created
+                  in the session
+        threads: Worker threads (default: every core)
+        memory_limit: e.g. '4GB'; operators spill to disk beyond it
+        temp_directory: Spill directory (default: DuckDB's own)
+
+    Returns:
+        duckdb.DuckDBPyConnection
+    """
+    _check_duckdb()
+    sources = {**DEFAULT_SOURCES, **(sources or {})}
+
+    con = duckdb.connect(database)
+    if threads is not None:
+        con.execute(f"SET threads = {int(threads)}")
+    if memory_limit is not None:
+        con.execute(f"SET memory_limit = {_quote(memory_limit)}")
+    if temp_directory is not None:
+        con.execute(f"SET temp_directory = {_quote(temp_directory)}")
+    # Row order is not needed for aggregations and lets scans stream
+    con.execute("SET preserve_insertion_order = false")
+    con.execute("SET enable_progress_bar = false")
+
+    register_mappings(con)
+
+    commodities = []
+    for name in ('gold', 'oil'):
+        path = _resolve_source(sources[name])
+        if os.path.exists(path):
+            con.execute(f"CREATE OR REPLACE VIEW {name} AS SELECT * FROM {_scan(path)}")
+            commodities.append(name)
+    if commodities:
+        union = ' UNION ALL BY NAME '.join(
+            f"SELECT *, {_quote(name.capitalize())} AS Commodity FROM {name}"
+            for name in commodities)
+        con.execute(f"CREATE OR REPLACE VIEW trade AS {union}")
+        con.execute("""
+            CREATE OR REPLACE VIEW trade_blocs AS
+            SELECT t.*, coalesce(b.Bloc, 'Other') AS Bloc,
+                   h.HS_Heading, h.HS_Digits
+            FROM trade t
+            LEFT JOIN bloc_members b USING (reporterISO)
+            LEFT JOIN hs_codes h ON h.cmdCode = t.cmdCode
+        """)
+
+    btc_path = _resolve_source(sources['btc'])
+    if os.path.exists(btc_path):
+        con.execute(f"CREATE OR REPLACE VIEW btc AS {_btc_view(con, btc_path)}")
+    return con
+
+
+def list_views(con):
+    """
+    Tables and views available in a connection.
+
+    Args:
+        con: Connection from connect()
+
+    Returns:
+        DataFrame with name, type and column list
+    """
+    return con.execute("""
+        SELECT table_name AS name, table_type AS type,
+               string_agg(column_name, ', ' ORDER BY ordinal_position) AS columns
+        FROM information_schema.columns JOIN information_schema.tables
+             USING (table_catalog, table_schema, table_name)
+        WHERE table_schema = 'main'
+        GROUP BY ALL ORDER BY name
+    """).df()
+
+
+def query(sql, params=None, con=None, **connect_kwargs):
+    """
+    Run a SQL statement and return the result as a pandas DataFrame.
+
+    Args:
+        sql: SQL text (views as listed in the module docstring)
+        params: Optional positional ($1 / ?) or named parameters
+        con: Connection from connect() (default: a new one, closed after)
+        **connect_kwargs: Passed to connect() when con is None
+
+    Returns:
+        pandas DataFrame
+    """
+    own = con is None
+    if own:
+        con = connect(**connect_kwargs)
+    try:
+        return con.execute(sql, params).df()
+    finally:
+        if own:
+            con.close()
+
+
+def query_series(result, value_cols=None, date_col='Date'):
+    """
+    Convert a query result into monthly Series for the forecasting functions.
+
+    Args:
+        result: DataFrame from query() (or SQL text, run with query())
+        value_cols: Columns to convert (default: every numeric column)
+        date_col: Column holding the month
+
+    Returns:
+        Dict mapping column name to a float Series indexed by month start
+        Date (rows in the same month are summed), as expected by
+        compute_forecast_intervals() and load_or_search_configs()
+    """
+    if isinstance(result, str):
+        result = query(result)
+    if value_cols is None:
+        value_cols = [c for c in result.select_dtypes('number').columns if c != date_col]
+
+    months = pd.to_datetime(result[date_col]).dt.to_period('M').dt.to_timestamp()
+    grouped = result[value_cols].astype(float).groupby(months.rename('Date')).sum(min_count=1)
+    return {col: grouped[col].sort_index() for col in value_cols}
+
+
+def main():
+    """
+    Run one SQL statement against the default extracts.
+
+    Usage:
+        python sql_interface.py                       (list views)
+        python sql_interface.py "SELECT ..." [out.csv]
+    """
+    con = connect()
+    if len(sys.argv) < 2:
+        with pd.option_context('display.max_colwidth', 120, 'display.width', 160):
+            print(list_views(con).to_string(index=False))
+        return 0
+
+    result = query(sys.argv[1], con=con)
+    if len(sys.argv) > 2:
+        result.to_csv(sys.argv[2], index=False)
+        print(f"✓ {len(result):,} rows written to {sys.argv[2]}")
+    else:
+        with pd.option_context('display.max_rows', 100, 'display.width', 160):
+            print(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
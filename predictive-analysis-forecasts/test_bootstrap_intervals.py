@@ -0,0 +1,46 @@
+"""
+Bootstrap intervals of positive series stay non-negative.
+
+Run with:
+    python -m pytest test_bootstrap_intervals.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bootstrap_intervals import DEFAULT_LEVELS, bootstrap_intervals, compute_forecast_intervals
+
+
+def regime_series(rng, n_months=60, levels=(5e7, 1e4)):
+    """Positive series whose level drops by orders of magnitude mid-sample."""
+    level = np.repeat(levels, n_months // len(levels))
+    return level * np.exp(rng.normal(0, 0.6, len(level)))
+
+
+@pytest.mark.parametrize('method', ['residual', 'block'])
+def test_positive_series_bounds_are_non_negative(method):
+    rng = np.random.default_rng(7)
+    values = np.vstack([regime_series(rng) for _ in range(20)])
+    bands = bootstrap_intervals(values, method=method)
+    for level in DEFAULT_LEVELS:
+        assert (bands['low'][level] >= 0).all()
+        assert (bands['low'][level] <= bands['high'][level]).all()
+
+
+def test_intervals_scale_with_current_level():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range('2020-01-01', periods=60, freq='MS')
+    series = pd.Series(regime_series(rng), index=dates)
+    interval = compute_forecast_intervals({'s': series}, method='block')['s']
+    # Residuals from the 5e7 regime must not swamp the 1e4 level
+    assert (interval['PI_95_Low'] >= 0).all()
+    assert (interval['PI_95_High'] < 100 * interval['Forecast']).all()
+
+
+def test_non_negative_series_with_zeros_is_truncated():
+    rng = np.random.default_rng(11)
+    values = np.abs(rng.normal(0, 5, (10, 40)))
+    values[:, ::7] = 0.0
+    bands = bootstrap_intervals(values, method='residual')
+    assert all((bands['low'][level] >= 0).all() for level in DEFAULT_LEVELS)
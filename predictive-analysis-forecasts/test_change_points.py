@@ -0,0 +1,82 @@
+"""
+PELT checked against brute-force optimal partitioning.
+
+Run with:
+    python -m pytest test_change_points.py
+"""
+
+import numpy as np
+import pytest
+
+from change_points import COST_MODELS, VARIANCE_FLOOR, pelt
+
+
+def segment_cost(segment, cost):
+    """Cost of one segment computed directly from its observed values."""
+    observed = segment[np.isfinite(segment)]
+    if not len(observed):
+        return 0.0
+    rss = float(((observed - observed.mean()) ** 2).sum())
+    if cost == 'mean':
+        return rss
+    variance = max(rss / len(observed), VARIANCE_FLOOR)
+    return len(observed) * np.log(variance) + rss / variance
+
+
+def penalized_cost(values, breaks, cost, penalty):
+    """Segmentation cost of a break set plus one penalty per break."""
+    edges = [0] + list(breaks) + [len(values)]
+    return sum(segment_cost(values[a:b], cost) for a, b in zip(edges[:-1], edges[1:])) \
+        + penalty * len(breaks)
+
+
+def optimal_partitioning(values, cost, penalty, min_size):
+    """Minimum penalized cost over all segmentations (O(n^2), no pruning)."""
+    n = len(values)
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    for end in range(min_size, n + 1):
+        for start in range(0, end - min_size + 1):
+            if 0 < start < min_size:
+                continue
+            best[end] = min(best[end],
+                            best[start] + segment_cost(values[start:end], cost) + penalty)
+    return best[n]
+
+
+def random_panel(rng, n_months, n_series, missing_share):
+    """Series with random level and variance shifts and missing months."""
+    panel = np.empty((n_months, n_series))
+    for i in range(n_series):
+        edges = np.sort(rng.choice(np.arange(1, n_months), size=rng.integers(0, 5),
+                                   replace=False))
+        levels = rng.normal(0, 3, size=len(edges) + 1)
+        scales = rng.choice([0.05, 0.3, 1.0, 2.0], size=len(edges) + 1)
+        segment = np.searchsorted(edges, np.arange(n_months), side='right')
+        panel[:, i] = levels[segment] + scales[segment] * rng.normal(size=n_months)
+    panel[rng.random(panel.shape) < missing_share] = np.nan
+    return panel
+
+
+@pytest.mark.parametrize('cost', COST_MODELS)
+@pytest.mark.parametrize('min_size', [1, 3, 6])
+@pytest.mark.parametrize('missing_share', [0.0, 0.2])
+def test_pelt_matches_optimal_partitioning(cost, min_size, missing_share):
+    rng = np.random.default_rng(2012 + min_size)
+    panel = random_panel(rng, n_months=40, n_series=60, missing_share=missing_share)
+    penalties = rng.uniform(1.0, 15.0, size=panel.shape[1])
+
+    found = pelt(panel, cost=cost, penalty=penalties, min_size=min_size)
+    for i, breaks in enumerate(found):
+        values = panel[:, i]
+        edges = [0] + breaks + [len(values)]
+        assert all(b - a >= min_size for a, b in zip(edges[:-1], edges[1:]))
+        optimum = optimal_partitioning(values, cost, penalties[i], min_size)
+        assert penalized_cost(values, breaks, cost, penalties[i]) == \
+            pytest.approx(optimum, rel=1e-9, abs=1e-9)
+
+
+def test_pelt_finds_level_shift():
+    values = np.r_[np.zeros(24), np.full(24, 5.0)] + \
+        np.random.default_rng(0).normal(0, 0.5, 48)
+    assert pelt(values[:, None]) == [[24]]
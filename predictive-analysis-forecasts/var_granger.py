@@ -0,0 +1,377 @@
+"""
+VAR / Granger-Causality Analysis
+Tests whether BRICS and US/EU gold and oil flows help predict the BTC
+currency shares (and each other), instead of asserting the link in the
+USD_Dominance_Analysis narrative.
+
+Variables (build_var_panel):
+- BTC_<currency>_Share: monthly change of the currency's BTC volume share
+- <Bloc>_<Commodity>_Qty_kg: monthly log change of bloc import volume
+Differencing keeps trending levels from producing spurious causality.
+
+For every variable subset (pairs, triples, ..., the full system) and every
+lag order 1..max_lag, a VAR is fitted by least squares on one common
+sample (months where all variables and their lags exist), so information
+criteria and tests are comparable across models. The lag order of each
+subset is chosen by BIC (or AIC), and within that VAR "cause Granger-
+causes effect" is tested with the F-test of dropping all lags of the
+cause from the effect's equation, conditioning on the other variables in
+the subset. q-values (Benjamini-Hochberg) correct for the many tests,
+and a test is flagged significant when its q-value is below SIGNIFICANCE.
+
+Models with the same lag order and subset size share one design shape,
+so they are stacked and solved with one batched QR least-squares call;
+restricted models (one cause dropped) are batched the same way. Lag
+orders are spread over a process pool.
+
+Usage:
+    from var_granger import build_var_panel, granger_causality
+
+    panel = build_var_panel(shares_monthly, gold_brics_monthly, gold_us_eu_monthly,
+                            oil_brics_monthly, oil_us_eu_monthly)
+    table = granger_causality(panel, max_lag=6, n_workers=4)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from bootstrap_intervals import align_monthly
+from run_state import run_tasks
+
+
+MAX_LAG = 6
+LAG_CRITERIA = ('bic', 'aic')
+SUBSET_MODES = ('pairwise', 'full', 'all')
+SIGNIFICANCE = 0.05
+
+# Lag orders leaving fewer residual degrees of freedom per equation are skipped
+MIN_DF_RESID = 10
+
+
+def build_var_panel(shares_monthly, gold_brics_monthly, gold_us_eu_monthly,
+                    oil_brics_monthly, oil_us_eu_monthly, currencies=('USD',),
+                    measure='Qty_kg'):
+    """
+    Stationary monthly panel of BTC currency shares and bloc trade flows.
+
+    Args:
+        shares_monthly: DataFrame from compute_currency_shares(freq='M')
+        gold_brics_monthly, gold_us_eu_monthly, oil_brics_monthly,
+        oil_us_eu_monthly: Bloc DataFrames from load_and_process_data()
+        currencies: Currency share columns to include
+        measure: 'Qty_kg' or 'Value_USD'
+
+    Returns:
+        DataFrame indexed by month with BTC_<currency>_Share (first
+        difference) and <Bloc>_<Commodity>_<measure> (log change) columns
+    """
+    shares = shares_monthly.set_index('Date')
+    share_panel = align_monthly({f'BTC_{c}_Share': shares[c] for c in currencies},
+                                transform='diff')
+
+    flows = {}
+    for prefix, monthly in (('BRICS_Gold', gold_brics_monthly),
+                            ('US_EU_Gold', gold_us_eu_monthly),
+                            ('BRICS_Oil', oil_brics_monthly),
+                            ('US_EU_Oil', oil_us_eu_monthly)):
+        name = f'{prefix}_{measure}'
+        flows[name] = monthly.set_index('Date')[name]
+    flow_panel = align_monthly(flows, transform='log_diff')
+    return share_panel.join(flow_panel, how='outer').sort_index()
+
+
+def lagged_sample(panel, max_lag=MAX_LAG):
+    """
+    Common estimation sample with lags.
+
+    Args:
+        panel: DataFrame (months x variables)
+        max_lag: Largest lag order that will be fitted
+
+    Returns:
+        Tuple of (targets array (T, variables), lags array
+        (T, variables, max_lag) with lags[:, j, l - 1] = value of j at t - l,
+        DatetimeIndex of the T months)
+    """
+    values = panel.to_numpy(dtype=float)
+    n_months = len(values)
+    lags = np.stack([values[max_lag - l:n_months - l] for l in range(1, max_lag + 1)], axis=2)
+    targets = values[max_lag:]
+    keep = np.isfinite(targets).all(axis=1) & np.isfinite(lags).all(axis=(1, 2))
+    return targets[keep], lags[keep], panel.index[max_lag:][keep]
+
+
+def _design(lags, subset, p, drop=None):
+    """Constant plus lags 1..p of the subset's variables (optionally minus one)."""
+    columns = [j for j in subset if j != drop]
+    block = lags[:, columns, :p].reshape(len(lags), -1)
+    return np.column_stack([np.ones(len(lags)), block])
+
+
+def batched_lstsq(X, Y):
+    """
+    Least squares for a stack of problems with one shape.
+
+    Args:
+        X: Designs (batch, T, k)
+        Y: Targets (batch, T, m)
+
+    Returns:
+        Tuple of (coefficients (batch, k, m), residuals (batch, T, m))
+    """
+    Q, R = np.linalg.qr(X)
+    coef = np.linalg.solve(R, np.swapaxes(Q, 1, 2) @ Y)
+    return coef, Y - X @ coef
+
+
+def _fit_lag_order(args):
+    """
+    Fit every subset VAR of one lag order plus the restricted models.
+
+    Returns:
+        List of dicts (subset, p, aic, bic, rss, restricted_rss by cause)
+    """
+    targets, lags, p, subsets = args
+    n_obs = len(targets)
+    records = []
+
+    by_size = {}
+    for subset in subsets:
+        by_size.setdefault(len(subset), []).append(subset)
+
+    for m, group in by_size.items():
+        k = 1 + m * p
+        if n_obs - k < MIN_DF_RESID:
+            continue
+        X = np.stack([_design(lags, subset, p) for subset in group])
+        Y = np.stack([targets[:, list(subset)] for subset in group])
+        _, resid = batched_lstsq(X, Y)
+        rss = (resid ** 2).sum(axis=1)
+        sigma = np.einsum('bti,btj->bij', resid, resid) / n_obs
+        _, logdet = np.linalg.slogdet(sigma)
+        n_params = m * k
+
+        # Restricted models: every subset x every cause dropped, one batch
+        pairs = [(s, cause) for s in group for cause in s]
+        Xr = np.stack([_design(lags, s, p, drop=cause) for s, cause in pairs])
+        Yr = np.stack([targets[:, list(s)] for s, _ in pairs])
+        _, resid_r = batched_lstsq(Xr, Yr)
+        rss_r = (resid_r ** 2).sum(axis=1)
+
+        for b, subset in enumerate(group):
+            records.append({
+                'subset': subset,
+                'p': p,
+                'n_obs': n_obs,
+                'aic': logdet[b] + 2.0 * n_params / n_obs,
+                'bic': logdet[b] + np.log(n_obs) * n_params / n_obs,
+                'rss': rss[b],
+                'restricted_rss': {cause: rss_r[pairs.index((subset, cause))]
+                                   for cause in subset},
+            })
+    return records
+
+
+def variable_subsets(n_variables, mode='all'):
+    """
+    Variable index subsets to fit.
+
+    Args:
+        n_variables: Number of variables
+        mode: 'pairwise' (all pairs), 'full' (all variables) or 'all'
+              (every subset with at least two variables)
+
+    Returns:
+        List of index tuples
+    """
+    if mode not in SUBSET_MODES:
+        raise ValueError(f"Unknown subset mode '{mode}' (use one of {SUBSET_MODES})")
+    sizes = {'pairwise': [2], 'full': [n_variables],
+             'all': range(2, n_variables + 1)}[mode]
+    return [s for size in sizes for s in combinations(range(n_variables), size)]
+
+
+def benjamini_hochberg(p_values):
+    """Benjamini-Hochberg q-values (NaN p-values stay NaN)."""
+    p_values = np.asarray(p_values, dtype=float)
+    q_values = np.full_like(p_values, np.nan)
+    finite = np.flatnonzero(np.isfinite(p_values))
+    if len(finite):
+        order = finite[np.argsort(p_values[finite])]
+        ranked = p_values[order] * len(finite) / np.arange(1, len(finite) + 1)
+        q_values[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q_values
+
+
+def fit_var_models(panel, max_lag=MAX_LAG, subsets='all', n_workers=1, run_store=None):
+    """
+    Fit every subset VAR at every lag order on the common sample.
+
+    Args:
+        panel: DataFrame from build_var_panel()
+        max_lag: Largest lag order
+        subsets: Subset mode (see variable_subsets()) or list of column-name tuples
+        n_workers: Number of worker processes (1 = run in this process)
+        run_store: Optional run-state SQLite file; fitted lag orders are
+                   checkpointed there and skipped when the fit is rerun
+
+    Returns:
+        List of model records (subset as column indices, lag order, AIC,
+        BIC, residual sums of squares of the full and restricted models)
+    """
+    targets, lags, _ = lagged_sample(panel, max_lag)
+    if isinstance(subsets, str):
+        subsets = variable_subsets(panel.shape[1], subsets)
+    else:
+        columns = list(panel.columns)
+        subsets = [tuple(columns.index(c) for c in subset) for subset in subsets]
+
+    tasks = [(targets, lags, p, subsets) for p in range(1, max_lag + 1)]
+    if run_store is not None:
+        results = run_tasks(_fit_lag_order, tasks, 'var_granger', run_store, n_workers)
+    elif n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_fit_lag_order, tasks))
+    else:
+        results = [_fit_lag_order(task) for task in tasks]
+    return [record for records in results for record in records]
+
+
+def granger_causality(panel, max_lag=MAX_LAG, subsets='all', criterion='bic',
+                      n_workers=1, run_store=None):
+    """
+    Granger-causality F-tests for every ordered pair within every subset VAR.
+
+    Args:
+        panel: DataFrame from build_var_panel()
+        max_lag: Largest lag order considered
+        subsets: Subset mode (see variable_subsets()) or list of column-name tuples
+        criterion: 'bic' or 'aic' for the lag order of each subset
+        n_workers: Number of worker processes
+        run_store: Optional run-state SQLite file for the VAR fits
+
+    Returns:
+        DataFrame with Cause, Effect, Conditioning, Subset_Size, Lag_Order,
+        F_Stat, DF_Num, DF_Den, P_Value, Q_Value, Significant (Q_Value below
+        SIGNIFICANCE) and N_Obs, sorted by P_Value
+    """
+    if criterion not in LAG_CRITERIA:
+        raise ValueError(f"Unknown criterion '{criterion}' (use one of {LAG_CRITERIA})")
+    names = list(panel.columns)
+
+    best = {}
+    for record in fit_var_models(panel, max_lag, subsets, n_workers, run_store):
+        current = best.get(record['subset'])
+        if current is None or record[criterion] < current[criterion]:
+            best[record['subset']] = record
+
+    rows = []
+    for subset, record in best.items():
+        p, n_obs = record['p'], record['n_obs']
+        df_den = n_obs - (1 + len(subset) * p)
+        for cause in subset:
+            for position, effect in enumerate(subset):
+                if effect == cause:
+                    continue
+                rss_u = record['rss'][position]
+                rss_r = record['restricted_rss'][cause][position]
+                f_stat = ((rss_r - rss_u) / p) / (rss_u / df_den)
+                rows.append({
+                    'Cause': names[cause],
+                    'Effect': names[effect],
+                    'Conditioning': ', '.join(names[j] for j in subset
+                                              if j not in (cause, effect)),
+                    'Subset_Size': len(subset),
+                    'Lag_Order': p,
+                    'F_Stat': f_stat,
+                    'DF_Num': p,
+                    'DF_Den': df_den,
+                    'P_Value': stats.f.sf(f_stat, p, df_den),
+                    'N_Obs': n_obs,
+                })
+
+    columns = ['Cause', 'Effect', 'Conditioning', 'Subset_Size', 'Lag_Order', 'F_Stat',
+               'DF_Num', 'DF_Den', 'P_Value', 'Q_Value', 'Significant', 'N_Obs']
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    table = pd.DataFrame(rows)
+    table['Q_Value'] = benjamini_hochberg(table['P_Value'])
+    table['Significant'] = table['Q_Value'] < SIGNIFICANCE
+    return table[columns].sort_values(['P_Value', 'Subset_Size']).reset_index(drop=True)
+
+
+def fit_var(panel, p, columns=None):
+    """
+    Fit one VAR(p) and return its coefficients.
+
+    Args:
+        panel: DataFrame from build_var_panel()
+        p: Lag order
+        columns: Variables to include (default: all)
+
+    Returns:
+        Dict with 'coef' (DataFrame, rows const and <variable>_L<lag>, one
+        column per equation), 'sigma' (residual covariance DataFrame),
+        'aic', 'bic' and 'n_obs'
+    """
+    columns = list(panel.columns) if columns is None else list(columns)
+    targets, lags, _ = lagged_sample(panel[columns], p)
+    subset = tuple(range(len(columns)))
+    X = _design(lags, subset, p)
+    coef, resid = batched_lstsq(X[None], targets[None])
+    n_obs, m = targets.shape
+    sigma = resid[0].T @ resid[0] / n_obs
+    n_params = m * X.shape[1]
+    logdet = np.linalg.slogdet(sigma)[1]
+    index = ['const'] + [f'{c}_L{l}' for c in columns for l in range(1, p + 1)]
+    return {
+        'coef': pd.DataFrame(coef[0], index=index, columns=columns),
+        'sigma': pd.DataFrame(sigma, index=columns, columns=columns),
+        'aic': logdet + 2.0 * n_params / n_obs,
+        'bic': logdet + np.log(n_obs) * n_params / n_obs,
+        'n_obs': n_obs,
+    }
+
+
+def summarize_granger(table, effect='BTC_USD_Share'):
+    """
+    One line per cause of the tests on an effect in the full-system VAR.
+
+    Args:
+        table: DataFrame from granger_causality()
+        effect: Effect variable to summarize
+
+    Returns:
+        List of strings like 'BRICS Gold Qty kg -> BTC USD Share: F=1.20,
+        p=0.312, q=0.624 (lag 2)'
+    """
+    if table.empty:
+        return []
+    rows = table[(table['Effect'] == effect) &
+                 (table['Subset_Size'] == table['Subset_Size'].max())]
+    return [f"{row['Cause'].replace('_', ' ')} -> {effect.replace('_', ' ')}: "
+            f"F={row['F_Stat']:.2f}, p={row['P_Value']:.3f}, q={row['Q_Value']:.3f} "
+            f"(lag {row['Lag_Order']}){' - significant' if row['Significant'] else ''}"
+            for _, row in rows.iterrows()]
+
+
+def significant_causes(table, effect='BTC_USD_Share'):
+    """
+    Causes that Granger-cause an effect in the full-system VAR.
+
+    Args:
+        table: DataFrame from granger_causality()
+        effect: Effect variable
+
+    Returns:
+        Dict mapping cause name to its q-value, for the significant tests
+    """
+    if table.empty:
+        return {}
+    rows = table[(table['Effect'] == effect) & table['Significant'] &
+                 (table['Subset_Size'] == table['Subset_Size'].max())]
+    return dict(zip(rows['Cause'], rows['Q_Value']))